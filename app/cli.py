@@ -292,6 +292,64 @@ def sync_issues_command(
     click.echo("Issue synchronization completed.")
 
 
+@click.command("reconcile-issues")
+@click.option(
+    "--integration-id",
+    type=int,
+    default=None,
+    help="Limit reconciliation to a specific tenant integration ID.",
+)
+@with_appcontext
+def reconcile_issues_command(integration_id: Optional[int]) -> None:
+    """Tombstone and archive issues that were deleted or moved upstream."""
+    from .services.issues.reconcile import reconcile_integrations
+
+    query = ProjectIntegration.query.join(ProjectIntegration.integration).filter(
+        TenantIntegration.enabled.is_(True)
+    )
+    if integration_id is not None:
+        query = query.filter(ProjectIntegration.integration_id == integration_id)
+
+    project_integrations = query.all()
+    if not project_integrations:
+        click.echo("No project integrations matched the filters.")
+        return
+
+    results = reconcile_integrations(project_integrations)
+    for project_integration in project_integrations:
+        project_name = (
+            project_integration.project.name
+            if project_integration.project
+            else "Unknown project"
+        )
+        result = results.get(project_integration.id)
+        if result is None:
+            click.echo(f"{project_name}: failed (see logs)")
+        elif result.skipped:
+            click.echo(f"{project_name}: skipped ({result.skipped})")
+        else:
+            click.echo(
+                f"{project_name}: {result.upstream} upstream, "
+                f"{result.marked_missing} newly missing, {result.restored} restored, "
+                f"{result.archived} archived"
+            )
+
+
+@click.command("rebuild-issue-stats")
+@with_appcontext
+def rebuild_issue_stats_command() -> None:
+    """Recompute the daily resolution rollup used by the statistics page."""
+    from .services.statistics_service import rebuild_issue_daily_stats
+
+    rows = rebuild_issue_daily_stats()
+    click.echo(f"Rebuilt issue_daily_stats with {rows} daily rows.")
+    if not current_app.config.get("ISSUE_STATS_ROLLUP_ENABLED"):
+        click.echo(
+            "ISSUE_STATS_ROLLUP_ENABLED is off: the rollup is not kept up to date "
+            "or read until it is enabled."
+        )
+
+
 @click.command("create-issue")
 @click.option(
     "--project-integration-id",
@@ -412,6 +470,41 @@ def init_workspace_command(
         raise click.ClickException(str(exc)) from exc
 
 
+@click.command("jobs-worker")
+@click.option(
+    "--concurrency",
+    type=int,
+    default=None,
+    help="Jobs run in parallel (defaults to JOB_QUEUE_WORKER_CONCURRENCY).",
+)
+@click.option(
+    "--poll-interval",
+    type=float,
+    default=2.0,
+    show_default=True,
+    help="Seconds between queue polls when idle.",
+)
+@click.option("--drain", is_flag=True, help="Exit once the queue is empty.")
+@with_appcontext
+def jobs_worker_command(
+    concurrency: Optional[int], poll_interval: float, drain: bool
+) -> None:
+    """Run queued background jobs (issue syncs, backups, git pulls)."""
+    from .services.job_queue import run_worker
+
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    workers = concurrency or int(app.config.get("JOB_QUEUE_WORKER_CONCURRENCY", 2))
+    click.echo(f"Starting job worker (concurrency={workers})...")
+    try:
+        processed = run_worker(
+            app, concurrency=workers, poll_interval=poll_interval, drain=drain
+        )
+    except KeyboardInterrupt:
+        click.echo("Job worker interrupted.")
+        return
+    click.echo(f"Job worker stopped after {processed} job(s).")
+
+
 @click.command("test-sudo")
 @click.option("--user-email", help="Email of user to test sudo access for")
 @with_appcontext
@@ -556,7 +649,10 @@ def register_cli_commands(app) -> None:
     app.cli.add_command(seed_data_command)
     app.cli.add_command(seed_identities_command)
     app.cli.add_command(sync_issues_command)
+    app.cli.add_command(reconcile_issues_command)
+    app.cli.add_command(rebuild_issue_stats_command)
     app.cli.add_command(create_issue_command)
     app.cli.add_command(system_cli_group)
     app.cli.add_command(init_workspace_command)
     app.cli.add_command(test_sudo_command)
+    app.cli.add_command(jobs_worker_command)
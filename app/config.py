@@ -240,6 +240,79 @@ class Config:
         "yes",
     }
     ISSUE_SYNC_MAX_CONCURRENT = _get_int_env_var("ISSUE_SYNC_MAX_CONCURRENT", 3)
+    # Concurrent fetches allowed against a single provider host (e.g. one Jira instance)
+    ISSUE_SYNC_MAX_PER_HOST = _get_int_env_var("ISSUE_SYNC_MAX_PER_HOST", 2)
+    # Provider API request rate per tenant integration; slowed further when the
+    # provider's rate-limit headers report a low remaining budget
+    ISSUE_SYNC_MAX_REQUESTS_PER_SECOND = _get_int_env_var(
+        "ISSUE_SYNC_MAX_REQUESTS_PER_SECOND", 10
+    )
+    # Longest a single request waits for a throttled provider before being sent anyway
+    ISSUE_SYNC_RATE_LIMIT_MAX_WAIT = _get_int_env_var("ISSUE_SYNC_RATE_LIMIT_MAX_WAIT", 300)
+    # Reconciliation pass that tombstones issues deleted or transferred upstream
+    # (0 disables the scheduled pass); tombstoned issues are archived once they have
+    # been missing for the grace period
+    ISSUE_RECONCILE_INTERVAL = _get_int_env_var("ISSUE_RECONCILE_INTERVAL", 86400)
+    ISSUE_RECONCILE_GRACE_HOURS = _get_int_env_var("ISSUE_RECONCILE_GRACE_HOURS", 24)
+    # Keep per-day resolution totals in issue_daily_stats while syncing, so resolution
+    # statistics read the rollup instead of scanning issues (seed it with
+    # `flask rebuild-issue-stats` when enabling)
+    ISSUE_STATS_ROLLUP_ENABLED = os.getenv(
+        "ISSUE_STATS_ROLLUP_ENABLED", "false"
+    ).lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+    # Provider clients are shared by projects with the same credentials and dropped
+    # after this many idle seconds (0 disables client reuse)
+    ISSUE_SYNC_CLIENT_TTL = _get_int_env_var("ISSUE_SYNC_CLIENT_TTL", 600)
+    # Fetch listing pages and comments on an asyncio event loop over shared keep-alive
+    # connections instead of one thread per request (integrations can override this
+    # with the async_fetch and fetch_concurrency settings)
+    ISSUE_SYNC_ASYNC_FETCH = os.getenv("ISSUE_SYNC_ASYNC_FETCH", "false").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+    ISSUE_SYNC_FETCH_CONCURRENCY = _get_int_env_var("ISSUE_SYNC_FETCH_CONCURRENCY", 16)
+    # External identity -> user index: rebuilt immediately when this process edits
+    # identity mappings, and re-validated against the database at this interval so
+    # edits made by other workers are picked up
+    IDENTITY_INDEX_CHECK_SECONDS = _get_int_env_var("IDENTITY_INDEX_CHECK_SECONDS", 30)
+    # Adaptive scheduling: the sync job ticks every ISSUE_SYNC_TICK_SECONDS and only
+    # syncs integrations that are due. ISSUE_SYNC_INTERVAL is the starting interval; it
+    # shrinks while an integration keeps changing and backs off while it stays idle,
+    # within the min/max bounds (overridable per project integration in its config as
+    # sync_min_interval / sync_max_interval)
+    ISSUE_SYNC_ADAPTIVE = os.getenv("ISSUE_SYNC_ADAPTIVE", "true").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+    ISSUE_SYNC_TICK_SECONDS = _get_int_env_var("ISSUE_SYNC_TICK_SECONDS", 60)
+    ISSUE_SYNC_MIN_INTERVAL = _get_int_env_var("ISSUE_SYNC_MIN_INTERVAL", 120)
+    ISSUE_SYNC_MAX_INTERVAL = _get_int_env_var("ISSUE_SYNC_MAX_INTERVAL", 21600)  # 6 hours
+    # Only the worker holding this lock file runs scheduled jobs (default:
+    # instance/scheduler.lock); standby workers retry it at this interval
+    SCHEDULER_LOCK_FILE = os.getenv("SCHEDULER_LOCK_FILE")
+    SCHEDULER_LEADER_RETRY_SECONDS = _get_int_env_var("SCHEDULER_LEADER_RETRY_SECONDS", 30)
+
+    # Background job queue: when enabled, syncs, backups and git pulls are queued
+    # for the `flask jobs-worker` process instead of running inside the request
+    JOB_QUEUE_ENABLED = os.getenv("JOB_QUEUE_ENABLED", "false").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+    JOB_QUEUE_WORKER_CONCURRENCY = _get_int_env_var("JOB_QUEUE_WORKER_CONCURRENCY", 2)
+    # Running jobs without a worker heartbeat for this long are re-queued (or failed,
+    # for jobs run inline by a web process) by the worker and the scheduler leader
+    JOB_QUEUE_STALE_SECONDS = _get_int_env_var("JOB_QUEUE_STALE_SECONDS", 600)
+    JOB_QUEUE_MAX_ATTEMPTS = _get_int_env_var("JOB_QUEUE_MAX_ATTEMPTS", 3)
+    # Job event streams hold a (sync) gunicorn worker; they end after this many
+    # seconds and clients reconnect
+    JOB_EVENTS_MAX_SECONDS = _get_int_env_var("JOB_EVENTS_MAX_SECONDS", 60)
 
     # Slack Polling Configuration
     SLACK_POLL_ENABLED = os.getenv("SLACK_POLL_ENABLED", "false").lower() in {
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import secrets
-from datetime import datetime
+from datetime import date, datetime, timezone
 from typing import Any, Optional
 
 import bcrypt
 from sqlalchemy import (
     Boolean,
+    Date,
     DateTime,
+    Float,
     ForeignKey,
     Integer,
     String,
@@ -253,6 +255,19 @@ class ExternalIssue(BaseModel, TimestampMixin):
         UniqueConstraint(
             "project_integration_id", "external_id", name="uq_external_issue_identifier"
         ),
+        # Keyset pagination order for the issues API
+        db.Index("ix_external_issues_updated_at_id", "updated_at", "id"),
+        db.Index(
+            "ix_external_issues_integration_status_key",
+            "project_integration_id",
+            "status_key",
+        ),
+        db.Index(
+            "ix_external_issues_integration_status_category",
+            "project_integration_id",
+            "status_category",
+            "updated_at",
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -262,22 +277,41 @@ class ExternalIssue(BaseModel, TimestampMixin):
     external_id: Mapped[str] = mapped_column(String(128), nullable=False)
     title: Mapped[str] = mapped_column(String(512), nullable=False)
     status: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    # normalize_issue_status() / get_status_category() of ``status``, stored on write
+    # so status filters and statistics run in SQL
+    status_key: Mapped[str] = mapped_column(
+        String(128), default="__none__", nullable=False, server_default="__none__"
+    )
+    status_category: Mapped[str] = mapped_column(
+        String(32), default="Open", nullable=False, server_default="Open"
+    )
     assignee: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     url: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
     labels: Mapped[list[str]] = mapped_column(db.JSON, default=list, nullable=False)
+    # The JSON blobs are deferred: list views read description_excerpt and the
+    # issue_comments table, and detail views undefer what they render
     comments: Mapped[list[dict[str, Any]]] = mapped_column(
-        db.JSON, default=list, nullable=False
+        db.JSON, default=list, nullable=False, deferred=True
     )
     external_updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime, nullable=True
     )
     last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     raw_payload: Mapped[Optional[dict[str, Any]]] = mapped_column(
-        db.JSON, nullable=True
+        db.JSON, nullable=True, deferred=True
+    )
+    # Plain-text start of the description in raw_payload, stored on write
+    description_excerpt: Mapped[Optional[str]] = mapped_column(
+        String(512), nullable=True
     )
     manually_assigned: Mapped[bool] = mapped_column(
         db.Boolean, default=False, nullable=False, server_default=db.false()
     )
+    # SHA-256 of the synced columns; lets issue sync skip rows that did not change
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    # Set by reconciliation when the issue no longer exists upstream; rows still
+    # missing after the grace period are moved to archived_external_issues
+    missing_since: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     # Slack context for issues created from Slack messages
     slack_channel_id: Mapped[Optional[str]] = mapped_column(
         String(32), nullable=True
@@ -294,6 +328,120 @@ class ExternalIssue(BaseModel, TimestampMixin):
     )
 
 
+class IssueComment(BaseModel):
+    """One comment of an external issue, kept in step with ``ExternalIssue.comments``.
+
+    The JSON list stays the per-issue source for detail views; this table lets the
+    communications feed, author lists and pinned comments query comments directly.
+    """
+
+    __tablename__ = "issue_comments"
+    __table_args__ = (
+        db.Index("ix_issue_comments_issue_created", "issue_id", "created_at"),
+        db.Index("ix_issue_comments_author", "author"),
+        db.Index("ix_issue_comments_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    issue_id: Mapped[int] = mapped_column(
+        ForeignKey("external_issues.id", ondelete="CASCADE"), nullable=False
+    )
+    # Provider comment ID; None for comments the provider returned without one
+    external_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    # Index in the issue's comment list, which is the provider's order
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    author: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    body: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    body_html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    url: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    issue: Mapped["ExternalIssue"] = relationship("ExternalIssue")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the comment in the ``ExternalIssue.comments`` JSON shape."""
+        entry: dict[str, Any] = {
+            "id": self.external_id,
+            "author": self.author,
+            "body": self.body,
+            "url": self.url,
+            "created_at": (
+                self.created_at.replace(tzinfo=timezone.utc).isoformat()
+                if self.created_at
+                else None
+            ),
+        }
+        if self.body_html:
+            entry["body_html"] = self.body_html
+        return entry
+
+
+class ArchivedExternalIssue(BaseModel):
+    """Snapshot of an issue that was deleted or transferred away upstream."""
+
+    __tablename__ = "archived_external_issues"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_integration_id: Mapped[int] = mapped_column(
+        ForeignKey("project_integrations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    original_issue_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    external_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    title: Mapped[str] = mapped_column(String(512), nullable=False)
+    status: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    url: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    # Remaining columns of the original row (labels, comments, raw payload, ...)
+    snapshot: Mapped[dict[str, Any]] = mapped_column(
+        db.JSON, default=dict, nullable=False
+    )
+    missing_since: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            "id": self.id,
+            "project_integration_id": self.project_integration_id,
+            "original_issue_id": self.original_issue_id,
+            "external_id": self.external_id,
+            "title": self.title,
+            "status": self.status,
+            "url": self.url,
+            "missing_since": self.missing_since.isoformat() if self.missing_since else None,
+            "archived_at": self.archived_at.isoformat() if self.archived_at else None,
+        }
+
+
+class IssueDailyStat(BaseModel):
+    """Issues resolved per day and project integration, for the statistics page.
+
+    Only maintained while ``ISSUE_STATS_ROLLUP_ENABLED`` is set: sync and ORM status
+    changes add each observed closure to its day, and ``flask rebuild-issue-stats``
+    recomputes the table from the stored issues.
+    """
+
+    __tablename__ = "issue_daily_stats"
+    __table_args__ = (
+        UniqueConstraint(
+            "project_integration_id", "day", name="uq_issue_daily_stats_integration_day"
+        ),
+        db.Index("ix_issue_daily_stats_day", "day"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_integration_id: Mapped[int] = mapped_column(
+        ForeignKey("project_integrations.id", ondelete="CASCADE"), nullable=False
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    resolved_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Sum of created -> resolved durations, so averages can be taken over any range
+    resolution_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
 class PinnedIssue(BaseModel):
     __tablename__ = "pinned_issues"
     __table_args__ = (UniqueConstraint("user_id", "issue_id", name="uq_user_issue"),)
@@ -1068,6 +1216,64 @@ class SyncHistory(BaseModel):
         }
 
 
+class BackgroundJob(BaseModel):
+    """Long-running operation queued for the ``jobs-worker`` process."""
+
+    __tablename__ = "background_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(32), nullable=False, default="queued", index=True
+    )  # 'queued', 'running', 'succeeded', 'failed', 'cancelled'
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        db.JSON, default=dict, nullable=False
+    )
+    result: Mapped[Optional[dict[str, Any]]] = mapped_column(db.JSON, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    progress_message: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    worker_id: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    cancel_requested: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=db.false(), nullable=False
+    )
+    created_by_user_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    created_by: Mapped[Optional["User"]] = relationship("User")
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in {"succeeded", "failed", "cancelled"}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "payload": self.payload,
+            "result": self.result,
+            "error_message": self.error_message,
+            "progress": self.progress,
+            "progress_message": self.progress_message,
+            "attempts": self.attempts,
+            "cancel_requested": self.cancel_requested,
+            "created_by_user_id": self.created_by_user_id,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
 @login_manager.user_loader
 def load_user(user_id: str) -> Optional[LoginUser]:
     user = User.query.get(int(user_id))
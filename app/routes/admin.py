@@ -25,7 +25,7 @@ from flask import (
 )
 from flask_login import current_user, login_required  # type: ignore
 from markupsafe import Markup, escape
-from sqlalchemy import or_
+from sqlalchemy import func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
@@ -74,7 +74,9 @@ from ..forms.admin import (
 )
 from ..models import (
     APIKey,
+    BackgroundJob,
     ExternalIssue,
+    IssueComment,
     Project,
     ProjectIntegration,
     SSHKey,
@@ -129,7 +131,16 @@ from ..services.issues import (
 from ..services.issues import (
     update_issue_status as update_issue_status_service,
 )
+from ..services.issues.client_pool import invalidate_clients
+from ..services.issues.comments import find_issue_comments
+from ..services.issues.rate_limit import reset_governor
 from ..services.issues.utils import normalize_issue_status
+from ..services.job_queue import (
+    JOB_STATUS_SUCCEEDED,
+    enqueue_job,
+    is_job_queue_enabled,
+    start_job,
+)
 from ..services.key_service import (
     compute_fingerprint,
     format_private_key_path,
@@ -633,9 +644,6 @@ def dashboard():
         selectinload(Project.issue_integrations).selectinload(
             ProjectIntegration.integration
         ),
-        selectinload(Project.issue_integrations).selectinload(
-            ProjectIntegration.issues
-        ),
     )
     if tenant_filter_id is not None:
         project_query = project_query.filter(Project.tenant_id == tenant_filter_id)
@@ -645,6 +653,28 @@ def dashboard():
     projects = (
         project_query.order_by(Project.created_at.desc()).limit(project_limit).all()
     )
+    # Issue status counts per integration link, grouped in SQL on the stored status_key
+    link_status_rows: dict[int, list[tuple[str, str | None, int]]] = {}
+    link_ids = [link.id for project in projects for link in project.issue_integrations]
+    if link_ids:
+        for link_id, status_key, status_value, count in db.session.execute(
+            select(
+                ExternalIssue.project_integration_id,
+                ExternalIssue.status_key,
+                ExternalIssue.status,
+                func.count(),
+            )
+            .where(ExternalIssue.project_integration_id.in_(link_ids))
+            .group_by(
+                ExternalIssue.project_integration_id,
+                ExternalIssue.status_key,
+                ExternalIssue.status,
+            )
+            .order_by(func.min(ExternalIssue.id))
+        ):
+            link_status_rows.setdefault(link_id, []).append(
+                (status_key, status_value, count)
+            )
     project_cards: list[dict[str, Any]] = []
     tracked_tmux_targets: set[str] = set()
     recent_tmux_windows: list[dict[str, Any]] = []
@@ -796,11 +826,11 @@ def dashboard():
             )
             status_counts: Counter[str] = Counter()
             status_labels: dict[str, str] = {}
-            for issue in link.issues:
-                status_key, status_label = normalize_issue_status(issue.status)
-                status_counts[status_key] += 1
+            for status_key, status_value, count in link_status_rows.get(link.id, []):
+                status_label = normalize_issue_status(status_value)[1]
+                status_counts[status_key] += count
                 status_labels.setdefault(status_key, status_label)
-                aggregate_counts[status_key] += 1
+                aggregate_counts[status_key] += count
                 aggregate_labels.setdefault(status_key, status_label)
             total_issues = sum(status_counts.values())
             status_entries: list[dict[str, Any]] = []
@@ -1113,14 +1143,13 @@ def dashboard():
     )
 
     # Enrich pinned comments with actual comment data
+    comments = find_issue_comments(
+        (pinned.issue_id, pinned.comment_id) for pinned in pinned_comments_raw
+    )
     pinned_comments = []
     for pinned in pinned_comments_raw:
         issue = pinned.issue
-        comment_data = None
-        for c in (issue.comments or []):
-            if str(c.get("id")) == str(pinned.comment_id):
-                comment_data = c
-                break
+        comment_data = comments.get((pinned.issue_id, pinned.comment_id))
         project = issue.project_integration.project if issue.project_integration else None
         pinned_comments.append({
             "id": pinned.id,
@@ -2534,6 +2563,38 @@ def create_assisted_issue():
         # On GET, leave empty and let JavaScript populate it
         form.integration_id.choices = []
 
+    def _render_preview(preview_data, generation_time):
+        integration = db.session.get(ProjectIntegration, preview_data["integration_id"])
+        return render_template(
+            "admin/preview_assisted_issue.html",
+            issue_data=preview_data["issue_data"],
+            preview_json=json.dumps(preview_data),
+            project=db.session.get(Project, preview_data["project_id"]),
+            integration=integration.integration,
+            current_user=current_user,
+            ai_tool=preview_data["ai_tool"],
+            generation_time=generation_time,
+        )
+
+    # Show the preview generated by a background job, once it has finished
+    preview_job_id = request.args.get("preview_job", type=int)
+    if request.method == "GET" and preview_job_id:
+        job = db.session.get(BackgroundJob, preview_job_id)
+        if job is None or job.kind != "ai_issue_preview":
+            flash(f"Preview job #{preview_job_id} not found.", "error")
+        elif job.status == JOB_STATUS_SUCCEEDED:
+            result = job.result or {}
+            preview_data = {**job.payload, "issue_data": result["issue_data"]}
+            return _render_preview(preview_data, result.get("generation_time"))
+        elif job.is_finished:
+            flash(f"AI generation failed: {job.error_message or job.status}", "error")
+        else:
+            flash(
+                f"Issue preview is still being generated by job #{job.id}; "
+                "refresh this page in a moment.",
+                "info",
+            )
+
     # Check if form is submitted and valid
     if form.validate_on_submit():
         # Handle form submission - generate preview
@@ -2562,6 +2623,22 @@ def create_assisted_issue():
                 project_integrations_json=json.dumps(project_integrations),
             )
 
+        if request.form.get("background") or is_job_queue_enabled():
+            job = start_job(
+                "ai_issue_preview",
+                {
+                    "project_id": project_id,
+                    "integration_id": integration.id,
+                    "ai_tool": ai_tool,
+                    "issue_type": issue_type,
+                    "description": description,
+                    "creator_user_id": form.creator_user_id.data,
+                },
+                user_id=current_user.id,
+            )
+            flash(f"Generating issue preview as background job #{job.id}.", "success")
+            return redirect(url_for("admin.create_assisted_issue", preview_job=job.id))
+
         try:
             # Step 1: Generate issue preview
             import time
@@ -2593,18 +2670,7 @@ def create_assisted_issue():
                 "description": description,
                 "creator_user_id": creator_user_id,
             }
-            preview_json = json.dumps(preview_data)
-
-            return render_template(
-                "admin/preview_assisted_issue.html",
-                issue_data=issue_data,
-                preview_json=preview_json,
-                project=project,
-                integration=integration.integration,
-                current_user=current_user,
-                ai_tool=ai_tool,
-                generation_time=generation_time,
-            )
+            return _render_preview(preview_data, generation_time)
 
         except Exception as e:
             flash(f"Failed to generate issue preview: {e}", "error")
@@ -2950,8 +3016,27 @@ def manage_issues():
     default_ai_shell = current_app.config.get("DEFAULT_AI_SHELL", "/bin/bash")
     codex_command = ai_tool_commands.get("codex", default_ai_shell)
 
+    # Cards show the stored description excerpt and a comment count; only the
+    # issue opened via ?issue_id= loads its deferred payload and comments
+    target_issue_id = request.args.get("issue_id")
+    comment_counts: dict[int, int] = {}
+    rendered_ids = [issue.id for issue in sorted_issues]
+    # Count only the rendered issues' comments, in bind-parameter friendly chunks
+    for start in range(0, len(rendered_ids), 500):
+        comment_counts.update(
+            db.session.query(IssueComment.issue_id, func.count(IssueComment.id))
+            .filter(IssueComment.issue_id.in_(rendered_ids[start : start + 500]))
+            .group_by(IssueComment.issue_id)
+            .all()
+        )
+
+    # status_key is stored on the row; labels are derived once per raw status
+    status_label_cache: dict[str | None, str] = {}
     for issue in sorted_issues:
-        status_key, status_label = normalize_issue_status(issue.status)
+        status_key = issue.status_key
+        if issue.status not in status_label_cache:
+            status_label_cache[issue.status] = normalize_issue_status(issue.status)[1]
+        status_label = status_label_cache[issue.status]
         status_counts[status_key] += 1
         status_labels.setdefault(status_key, status_label)
 
@@ -2972,9 +3057,18 @@ def manage_issues():
             issue.external_updated_at or issue.updated_at or issue.created_at
         )
 
-        description_text = extract_issue_description(issue)
-        description_html = extract_issue_description_html(issue)
-        comment_entries = _prepare_comment_entries(getattr(issue, "comments", []))
+        if str(issue.id) == target_issue_id:
+            description_text = extract_issue_description(issue)
+            description_html = extract_issue_description_html(issue)
+            comment_entries = _prepare_comment_entries(getattr(issue, "comments", []))
+            comment_count = len(comment_entries)
+            description_is_excerpt = False
+        else:
+            description_text = issue.description_excerpt
+            description_html = None
+            comment_entries = []
+            comment_count = comment_counts.get(issue.id, 0)
+            description_is_excerpt = bool(description_text)
 
         # Check if issue has a plan
         has_plan = issue.id in plans_by_issue_id
@@ -3005,8 +3099,9 @@ def manage_issues():
                 "description_html": description_html,
                 "description_available": bool(description_text or description_html),
                 "description_fallback": MISSING_ISSUE_DETAILS_MESSAGE,
+                "description_is_excerpt": description_is_excerpt,
                 "comments": comment_entries,
-                "comment_count": len(comment_entries),
+                "comment_count": comment_count,
                 "is_pinned": issue.id in pinned_issue_ids,
                 "has_plan": has_plan,
                 "prepare_endpoint": url_for(
@@ -3075,7 +3170,6 @@ def manage_issues():
     raw_sort = (request.args.get("sort") or "").strip().lower()
     sort_key = raw_sort if raw_sort in ISSUE_SORT_META else ISSUE_SORT_DEFAULT_KEY
     raw_direction = (request.args.get("direction") or "").strip().lower()
-    target_issue_id = request.args.get("issue_id")
 
     if raw_direction not in {"asc", "desc"}:
         sort_direction = ISSUE_SORT_META[sort_key]["default_direction"]
@@ -3461,6 +3555,13 @@ def update_issue_status(issue_id: int):
 @admin_required
 def refresh_all_issues():
     force_full = bool(request.form.get("force_full"))
+    if request.form.get("background") or is_job_queue_enabled():
+        job = start_job(
+            "issue_sync", {"force_full": force_full}, user_id=current_user.id
+        )
+        flash(f"Issue refresh started as background job #{job.id}.", "success")
+        return redirect(url_for("admin.manage_issues"))
+
     try:
         integrations = ProjectIntegration.query.options(
             selectinload(ProjectIntegration.integration)
@@ -3846,6 +3947,8 @@ def manage_integrations():
         name_display = integration.name
         db.session.delete(integration)
         db.session.commit()
+        invalidate_clients(integration_id)
+        reset_governor(integration_id)
         flash(f"Integration '{name_display}' removed.", "success")
         return redirect(url_for("admin.manage_integrations"))
 
@@ -4216,6 +4319,8 @@ def update_project_integration(project_integration_id: int):
     link.auto_sync_enabled = form.auto_sync_enabled.data
 
     db.session.commit()
+    invalidate_clients(link.integration_id)
+    reset_governor(link.integration_id)
 
     flash("Project integration updated.", "success")
     return redirect(url_for("admin.manage_integrations"))
@@ -4279,6 +4384,8 @@ def update_tenant_integration(integration_id: int):
         integration.api_token = new_token
 
     db.session.commit()
+    invalidate_clients(integration.id)
+    reset_governor(integration.id)
     flash(f"Integration '{integration.name}' updated successfully.", "success")
     return redirect(url_for("admin.manage_integrations"))
 
@@ -4753,6 +4860,13 @@ def create_backup_web():
         flash("Invalid backup creation request.", "danger")
         return redirect(url_for("admin.manage_settings"))
 
+    if is_job_queue_enabled():
+        job = enqueue_job(
+            "backup", {"description": form.description.data}, user_id=current_user.id
+        )
+        flash(f"Backup queued as background job #{job.id}.", "success")
+        return redirect(url_for("admin.manage_settings"))
+
     try:
         backup = create_backup(
             description=form.description.data,
@@ -9,6 +9,7 @@ from typing import Any
 
 from flask import Blueprint, current_app, g, jsonify, request
 from flask_login import current_user  # type: ignore
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from werkzeug.utils import secure_filename
@@ -24,7 +25,14 @@ from ..ai_sessions import (
 )
 from ..constants import DEFAULT_TENANT_COLOR, sanitize_tenant_color
 from ..extensions import csrf, db
-from ..models import ExternalIssue, Project, ProjectIntegration, Tenant, User
+from ..models import (
+    ExternalIssue,
+    Project,
+    ProjectIntegration,
+    Tenant,
+    TenantIntegration,
+    User,
+)
 from ..services.git_service import ensure_repo_checkout, get_repo_status, run_git_action
 from ..services.tmux_service import session_name_for_user
 from ..services.issues.utils import normalize_issue_status
@@ -379,23 +387,21 @@ def list_issues():
             ProjectIntegration.integration
         ),
     )
+    if project_id is not None or provider_filter:
+        query = query.join(ProjectIntegration)
     if project_id is not None:
-        query = query.join(ProjectIntegration).filter(
-            ProjectIntegration.project_id == project_id
+        query = query.filter(ProjectIntegration.project_id == project_id)
+    if provider_filter:
+        query = query.join(TenantIntegration).filter(
+            func.lower(TenantIntegration.provider) == provider_filter
         )
-
-    issues = query.all()
-    payload: list[dict[str, Any]] = []
-    for issue in issues:
-        issue_payload = _issue_to_dict(issue)
-        if status_filter and issue_payload["status_key"] != status_filter:
-            continue
-        if provider_filter and issue_payload.get("provider_key") != provider_filter:
-            continue
-        payload.append(issue_payload)
-
+    if status_filter:
+        query = query.filter(ExternalIssue.status_key == status_filter)
+    query = query.order_by(ExternalIssue.id)
     if isinstance(limit, int) and limit > 0:
-        payload = payload[:limit]
+        query = query.limit(limit)
+
+    payload = [_issue_to_dict(issue) for issue in query.all()]
 
     return jsonify({"count": len(payload), "issues": payload})
 
@@ -17,6 +17,7 @@ from . import (  # noqa: E402, F401
     git,
     issues,
     jira_proxy,
+    jobs,
     notifications,
     projects,
     semaphore,
@@ -25,5 +26,6 @@ from . import (  # noqa: E402, F401
     system,
     tenants,
     users,
+    webhooks,
     workflows,
 )
@@ -6,16 +6,19 @@ from datetime import datetime, timezone
 from typing import Any
 
 from flask import current_app, jsonify, request
-from sqlalchemy import desc, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import selectinload, undefer
 
+from ...extensions import db
 from ...models import (
     ExternalIssue,
+    IssueComment,
     Project,
     ProjectIntegration,
-    UserIdentityMap,
+    TenantIntegration,
 )
 from ...services.api_auth import audit_api_request, require_api_auth
+from ...services.identity_index import lookup_identity
 from ...services.issues.utils import normalize_issue_status
 from ...utils.text_rendering import render_issue_rich_text
 from . import api_v1_bp
@@ -45,7 +48,7 @@ def _map_comment_author(
     Returns:
         dict with author info including local user mapping if available
     """
-    author_info = {
+    author_info: dict[str, Any] = {
         "remote_name": author_name,
         "display_name": author_name,
         "local_user_id": None,
@@ -55,27 +58,16 @@ def _map_comment_author(
     if not author_name:
         return author_info
 
-    # Map remote username to local user via UserIdentityMap
-    provider_lower = provider.lower()
-    identity_filter = None
-
-    if provider_lower == "github":
-        identity_filter = UserIdentityMap.github_username == author_name
-    elif provider_lower == "gitlab":
-        identity_filter = UserIdentityMap.gitlab_username == author_name
-    elif provider_lower == "jira":
-        identity_filter = UserIdentityMap.jira_account_id == author_name
-
-    if identity_filter is not None:
-        try:
-            identity_map = UserIdentityMap.query.filter(identity_filter).first()
-            if identity_map and identity_map.user:
-                author_info["local_user_id"] = identity_map.user_id
-                author_info["local_user_name"] = identity_map.user.name or identity_map.user.email
-                author_info["display_name"] = author_info["local_user_name"]
-        except Exception:  # noqa: BLE001
-            # If mapping fails, just use remote name
-            pass
+    # Map remote username to local user via the shared identity index
+    try:
+        match = lookup_identity(provider, author_name)
+    except Exception:  # noqa: BLE001
+        # If mapping fails, just use remote name
+        match = None
+    if match is not None:
+        author_info["local_user_id"] = match.user_id
+        author_info["local_user_name"] = match.display_name
+        author_info["display_name"] = match.display_name
 
     return author_info
 
@@ -235,6 +227,22 @@ def _comment_to_dict(
     }
 
 
+def _apply_scope_filters(query, tenant_id: int | None, project_id: int | None):
+    """Restrict a query that already selects from external_issues to a tenant/project."""
+    if tenant_id or project_id:
+        query = query.join(
+            ProjectIntegration,
+            ExternalIssue.project_integration_id == ProjectIntegration.id,
+        )
+        if tenant_id:
+            query = query.join(Project, ProjectIntegration.project_id == Project.id).filter(
+                Project.tenant_id == tenant_id
+            )
+        if project_id:
+            query = query.filter(ProjectIntegration.project_id == project_id)
+    return query
+
+
 @api_v1_bp.get("/communications")
 @require_api_auth(scopes=["read"])
 @audit_api_request
@@ -244,10 +252,10 @@ def get_communications():
     Query Parameters:
         tenant_id (int, optional): Filter by tenant
         project_id (int, optional): Filter by project
-        user_id (int, optional): Filter comments by author (local user mapping)
+        author (str, optional): Filter by remote comment author
         limit (int, default=100): Number of comments to return
         offset (int, default=0): Pagination offset
-        sort (str, default='recent'): Sort order (recent, oldest, updated)
+        sort (str, default='recent'): Sort order (recent, oldest)
 
     Returns:
         200: List of comments with thread context
@@ -267,68 +275,59 @@ def get_communications():
         if offset < 0:
             offset = 0
 
-        # Build query
-        query = ExternalIssue.query.options(
-            selectinload(ExternalIssue.project_integration).selectinload(
-                ProjectIntegration.integration
-            ),
-            selectinload(ExternalIssue.project_integration).selectinload(
-                ProjectIntegration.project
-            ).selectinload(Project.tenant),
+        author = (request.args.get("author") or "").strip()
+
+        # Page over comment rows so limit/offset count comments, not issues
+        query = IssueComment.query.join(ExternalIssue).options(
+            selectinload(IssueComment.issue)
+            .selectinload(ExternalIssue.project_integration)
+            .selectinload(ProjectIntegration.integration),
+            selectinload(IssueComment.issue)
+            .selectinload(ExternalIssue.project_integration)
+            .selectinload(ProjectIntegration.project)
+            .selectinload(Project.tenant),
         )
+        query = _apply_scope_filters(query, tenant_id, project_id)
+        if author:
+            query = query.filter(IssueComment.author == author)
 
-        # Apply filters - handle joins to avoid duplicates
-        if tenant_id or project_id:
-            query = query.join(ProjectIntegration)
-            if tenant_id:
-                query = query.join(Project).filter(Project.tenant_id == tenant_id)
-            if project_id:
-                query = query.filter(ProjectIntegration.project_id == project_id)
-
-        # Only include issues with comments
-        query = query.filter(func.json_array_length(ExternalIssue.comments) > 0)
+        total_count = query.order_by(None).count()
 
-        # Apply sorting
         if sort_by == "oldest":
-            query = query.order_by(ExternalIssue.created_at)
+            query = query.order_by(IssueComment.created_at, IssueComment.id)
         else:  # Default to recent
-            query = query.order_by(desc(ExternalIssue.external_updated_at or ExternalIssue.created_at))
+            query = query.order_by(desc(IssueComment.created_at), desc(IssueComment.id))
 
-        # Get total count before pagination
-        total_count = query.count()
-
-        # Apply pagination
-        issues = query.limit(limit).offset(offset).all()
+        comments = query.limit(limit).offset(offset).all()
 
-        # Build response - flatten comments with issue context
+        # Build response - one entry per comment with its issue context
         communications = []
-        for issue in issues:
+        for comment in comments:
+            issue = comment.issue
             integration = issue.project_integration.integration
             project = issue.project_integration.project
             tenant = project.tenant if project else None
             status_key, status_label = normalize_issue_status(issue.status)
 
-            comments = issue.comments or []
-            for comment in comments:
-                communications.append({
-                    "issue_id": issue.id,
-                    "issue_external_id": issue.external_id,
-                    "issue_title": issue.title,
-                    "issue_status": issue.status,
-                    "issue_status_key": status_key,
-                    "issue_status_label": status_label,
-                    "issue_url": issue.url,
-                    "issue_assignee": issue.assignee,
-                    "comment": _comment_to_dict(comment, issue),
-                    "provider": integration.provider.lower() if integration else None,
-                    "provider_name": integration.provider if integration else None,
-                    "integration_id": integration.id if integration else None,
-                    "integration_name": integration.name if integration else None,
-                    "project_id": project.id if project else None,
-                    "project_name": project.name if project else None,
-                    "tenant_id": tenant.id if tenant else None,
-                    "tenant_name": tenant.name if tenant else None,
-                })
+            communications.append({
+                "issue_id": issue.id,
+                "issue_external_id": issue.external_id,
+                "issue_title": issue.title,
+                "issue_status": issue.status,
+                "issue_status_key": status_key,
+                "issue_status_label": status_label,
+                "issue_url": issue.url,
+                "issue_assignee": issue.assignee,
+                "comment": _comment_to_dict(comment.to_dict(), issue),
+                "provider": integration.provider.lower() if integration else None,
+                "provider_name": integration.provider if integration else None,
+                "integration_id": integration.id if integration else None,
+                "integration_name": integration.name if integration else None,
+                "project_id": project.id if project else None,
+                "project_name": project.name if project else None,
+                "tenant_id": tenant.id if tenant else None,
+                "tenant_name": tenant.name if tenant else None,
+            })
 
         return jsonify({
             "communications": communications,
@@ -375,8 +374,9 @@ def get_communication_threads():
         if offset < 0:
             offset = 0
 
-        # Build query
+        # Build query; each thread renders the description from raw_payload
         query = ExternalIssue.query.options(
+            undefer(ExternalIssue.raw_payload),
             selectinload(ExternalIssue.project_integration).selectinload(
                 ProjectIntegration.integration
             ),
@@ -385,20 +385,18 @@ def get_communication_threads():
             ).selectinload(Project.tenant),
         )
 
-        # Apply filters - handle joins to avoid duplicates
-        if tenant_id or project_id:
-            query = query.join(ProjectIntegration)
-            if tenant_id:
-                query = query.join(Project).filter(Project.tenant_id == tenant_id)
-            if project_id:
-                query = query.filter(ProjectIntegration.project_id == project_id)
+        query = _apply_scope_filters(query, tenant_id, project_id)
 
         # Filter by specific issue ID (for deep linking from pinned comments)
         if issue_id:
             query = query.filter(ExternalIssue.id == issue_id)
 
         # Only include issues with comments
-        query = query.filter(func.json_array_length(ExternalIssue.comments) > 0)
+        query = query.filter(
+            select(IssueComment.id)
+            .where(IssueComment.issue_id == ExternalIssue.id)
+            .exists()
+        )
 
         # Sort by most recently updated
         query = query.order_by(
@@ -406,11 +404,20 @@ def get_communication_threads():
         )
 
         # Get total count before pagination
-        total_count = query.count()
+        total_count = query.order_by(None).count()
 
         # Apply pagination
         issues = query.limit(limit).offset(offset).all()
 
+        comments_by_issue: dict[int, list[IssueComment]] = {
+            issue.id: [] for issue in issues
+        }
+        if comments_by_issue:
+            for comment in IssueComment.query.filter(
+                IssueComment.issue_id.in_(comments_by_issue)
+            ).order_by(IssueComment.issue_id, IssueComment.position):
+                comments_by_issue[comment.issue_id].append(comment)
+
         # Build thread response
         threads = []
         for issue in issues:
@@ -419,7 +426,7 @@ def get_communication_threads():
             tenant = project.tenant if project else None
             status_key, status_label = normalize_issue_status(issue.status)
 
-            comments = issue.comments or []
+            comments = comments_by_issue[issue.id]
             issue_body, issue_body_html = _get_issue_body(issue)
 
             threads.append({
@@ -443,7 +450,7 @@ def get_communication_threads():
                 "tenant_id": tenant.id if tenant else None,
                 "tenant_name": tenant.name if tenant else None,
                 "comment_count": len(comments),
-                "comments": [_comment_to_dict(c, issue) for c in comments],
+                "comments": [_comment_to_dict(c.to_dict(), issue) for c in comments],
                 "created_at": _serialize_timestamp(issue.created_at),
                 "updated_at": _serialize_timestamp(
                     issue.external_updated_at or issue.updated_at or issue.created_at
@@ -485,60 +492,69 @@ def get_communication_authors():
         tenant_id = request.args.get("tenant_id", type=int)
         project_id = request.args.get("project_id", type=int)
 
-        # Build query for all issues with comments
-        query = ExternalIssue.query.options(
-            selectinload(ExternalIssue.project_integration).selectinload(
-                ProjectIntegration.project
-            ),
+        # Comment counts per remote author, grouped in SQL
+        comment_counts = (
+            db.session.query(
+                IssueComment.author,
+                TenantIntegration.id,
+                TenantIntegration.provider,
+                func.count(IssueComment.id),
+            )
+            .join(ExternalIssue, IssueComment.issue_id == ExternalIssue.id)
+            .join(
+                ProjectIntegration,
+                ExternalIssue.project_integration_id == ProjectIntegration.id,
+            )
+            .join(
+                TenantIntegration,
+                ProjectIntegration.integration_id == TenantIntegration.id,
+            )
+            .filter(IssueComment.author.is_not(None), IssueComment.author != "")
+        )
+        if tenant_id:
+            comment_counts = comment_counts.join(
+                Project, ProjectIntegration.project_id == Project.id
+            ).filter(Project.tenant_id == tenant_id)
+        if project_id:
+            comment_counts = comment_counts.filter(
+                ProjectIntegration.project_id == project_id
+            )
+        comment_counts = comment_counts.group_by(
+            IssueComment.author, TenantIntegration.id, TenantIntegration.provider
         )
 
-        # Apply filters
-        if tenant_id or project_id:
-            query = query.join(ProjectIntegration)
-            if tenant_id:
-                query = query.join(Project).filter(Project.tenant_id == tenant_id)
-            if project_id:
-                query = query.filter(ProjectIntegration.project_id == project_id)
-
-        # Only include issues with comments
-        query = query.filter(func.json_array_length(ExternalIssue.comments) > 0)
-
-        issues = query.all()
-
-        # Extract unique authors
         authors_map: dict[str, dict[str, Any]] = {}
 
-        for issue in issues:
-            # Add issue assignee
-            if issue.assignee:
-                key = issue.assignee.lower()
-                if key not in authors_map:
-                    authors_map[key] = {
-                        "display_name": issue.assignee,
-                        "remote_name": None,
-                        "comment_count": 0,
-                    }
-
-            # Add comment authors
-            for comment in issue.comments or []:
-                author = comment.get("author", {})
-                if not author:
-                    continue
-
-                display_name = author.get("display_name") or author.get("remote_name")
-                remote_name = author.get("remote_name")
-
-                if not display_name:
-                    continue
-
-                key = display_name.lower()
-                if key not in authors_map:
-                    authors_map[key] = {
-                        "display_name": display_name,
-                        "remote_name": remote_name,
-                        "comment_count": 0,
-                    }
-                authors_map[key]["comment_count"] += 1
+        for remote_name, integration_id, provider, count in comment_counts:
+            author_info = _map_comment_author(
+                remote_name, integration_id, provider.lower()
+            )
+            display_name = author_info["display_name"]
+            key = display_name.lower()
+            if key not in authors_map:
+                authors_map[key] = {
+                    "display_name": display_name,
+                    "remote_name": remote_name,
+                    "comment_count": 0,
+                }
+            authors_map[key]["comment_count"] += count
+
+        # Assignees of commented issues are listed even without comments
+        assignees = (
+            db.session.query(ExternalIssue.assignee)
+            .filter(
+                ExternalIssue.assignee.is_not(None),
+                select(IssueComment.id)
+                .where(IssueComment.issue_id == ExternalIssue.id)
+                .exists(),
+            )
+            .distinct()
+        )
+        for (assignee,) in _apply_scope_filters(assignees, tenant_id, project_id):
+            authors_map.setdefault(
+                assignee.lower(),
+                {"display_name": assignee, "remote_name": None, "comment_count": 0},
+            )
 
         # Convert to list and sort by display name
         authors = sorted(
@@ -9,6 +9,7 @@ from ...models import Project
 from ...services.activity_service import ActivityType, ResourceType, log_activity
 from ...services.api_auth import audit_api_request, require_api_auth
 from ...services.git_service import get_repo_status, run_git_action
+from ...services.job_queue import enqueue_job, is_job_queue_enabled
 from ...services.workspace_service import (
     WorkspaceError,
     get_workspace_path,
@@ -16,6 +17,7 @@ from ...services.workspace_service import (
     initialize_workspace,
 )
 from . import api_v1_bp
+from .jobs import job_accepted_response
 
 
 def _ensure_project_access(project: Project) -> bool:
@@ -41,6 +43,7 @@ def git_pull(project_id: int):
 
     Returns:
         200: Pull output
+        202: Pull queued as a background job (when the job queue is enabled)
         403: Access denied
         404: Project not found
     """
@@ -51,13 +54,21 @@ def git_pull(project_id: int):
     ref = request.args.get("ref")
     clean = request.args.get("clean", "false").lower() == "true"
     user = g.api_user
+    user_agent = request.headers.get("User-Agent", "").lower()
+    source = "cli" if any(x in user_agent for x in ["python", "requests", "curl", "httpx"]) else "web"
+
+    if is_job_queue_enabled():
+        job = enqueue_job(
+            "git_pull",
+            {"project_id": project.id, "ref": ref, "clean": clean, "source": source},
+            user_id=user.id,
+        )
+        return job_accepted_response(job)
 
     try:
         output = run_git_action(project, "pull", ref=ref, clean=clean, user=user)
 
         # Log activity
-        user_agent = request.headers.get("User-Agent", "").lower()
-        source = "cli" if any(x in user_agent for x in ["python", "requests", "curl", "httpx"]) else "web"
         log_activity(
             action_type=ActivityType.GIT_PULL,
             user_id=user.id,
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 from datetime import datetime, timezone
 from typing import Any
 
 from flask import current_app, g, jsonify, request
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_, cast, func, or_
+from sqlalchemy.orm import selectinload, undefer
 
 from ...extensions import db
-from ...models import ExternalIssue, Project, ProjectIntegration, TenantIntegration
+from ...models import (
+    BackgroundJob,
+    ExternalIssue,
+    Project,
+    ProjectIntegration,
+    TenantIntegration,
+)
 from ...services.api_auth import audit_api_request, require_api_auth
 from ...services.issues.providers import (
     GitHubIssueProvider,
@@ -21,9 +31,12 @@ from ...services.issues import (
     serialize_issue_comments,
     sync_tenant_integrations,
 )
+from ...services.issues.comments import find_issue_comments
 from ...services.issues.utils import normalize_issue_status, user_has_integration_credentials
+from ...services.job_queue import JOB_STATUS_SUCCEEDED, is_job_queue_enabled, start_job
 from ...services.user_identity_service import get_user_identity  # type: ignore
 from . import api_v1_bp
+from .jobs import job_accepted_response
 
 
 def _serialize_timestamp(value: datetime | None) -> str | None:
@@ -71,6 +84,7 @@ def _issue_to_dict(issue: ExternalIssue) -> dict[str, Any]:
         "assignee": issue.assignee,
         "url": issue.url,
         "labels": issue.labels or [],
+        "description_excerpt": issue.description_excerpt,
         "comments": issue.comments or [],
         "provider": integration.provider if integration else None,
         "provider_key": provider_key,
@@ -82,6 +96,8 @@ def _issue_to_dict(issue: ExternalIssue) -> dict[str, Any]:
         "tenant_name": tenant.name if tenant else None,
         "updated_at": _serialize_timestamp(updated_reference),
         "created_at": _serialize_timestamp(issue.created_at),
+        # Set when the issue was deleted or moved upstream; archived after a grace period
+        "missing_since": _serialize_timestamp(issue.missing_since),
     }
 
 
@@ -114,6 +130,10 @@ def _get_issue_provider(integration: TenantIntegration):
 def list_issues():
     """List all issues with filtering options.
 
+    Issues are returned newest first, ordered by ``(updated_at, id)``. Every
+    filter runs in SQL; pass ``limit`` and then the returned ``next_cursor`` as
+    ``cursor`` to walk the result set page by page.
+
     Query params:
         status (str, optional): Filter by status (open, closed, all)
         provider (str, optional): Filter by provider (github, gitlab, jira)
@@ -122,10 +142,12 @@ def list_issues():
         assignee (str, optional): Filter by assignee
         labels (str, optional): Comma-separated list of labels
         limit (int, optional): Limit number of results
-        offset (int, optional): Offset for pagination
+        cursor (str, optional): ``next_cursor`` from the previous page
+        offset (int, optional): Offset for pagination (ignored with ``cursor``)
 
     Returns:
         200: List of issues
+        400: Invalid cursor
     """
     # Parse query parameters
     status_filter = (request.args.get("status") or "").strip().lower()
@@ -138,73 +160,130 @@ def list_issues():
 
     project_id = request.args.get("project_id", type=int)
     tenant_id = request.args.get("tenant_id", type=int)
-    assignee = request.args.get("assignee")
+    assignee = (request.args.get("assignee") or "").strip()
     labels_str = request.args.get("labels")
-    labels_filter = [label.strip() for label in labels_str.split(",")] if labels_str else []
+    labels_filter = (
+        [label.strip() for label in labels_str.split(",") if label.strip()]
+        if labels_str
+        else []
+    )
     limit = request.args.get("limit", type=int)
-    offset = request.args.get("offset", type=int, default=0)
+    if limit is not None and limit <= 0:
+        limit = None
+    offset = request.args.get("offset", type=int, default=0) or 0
+    cursor_param = request.args.get("cursor")
+    cursor = None
+    if cursor_param:
+        try:
+            cursor = _decode_cursor(cursor_param)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
 
     # Build query
-    query = ExternalIssue.query.options(
+    query = ExternalIssue.query
+
+    if project_id is not None or tenant_id is not None or provider_filter:
+        query = query.join(ProjectIntegration)
+    if project_id is not None:
+        query = query.filter(ProjectIntegration.project_id == project_id)
+    if tenant_id is not None:
+        query = query.join(Project).filter(Project.tenant_id == tenant_id)
+    if provider_filter:
+        query = query.join(TenantIntegration).filter(
+            func.lower(TenantIntegration.provider) == provider_filter
+        )
+    if status_filter:
+        query = query.filter(ExternalIssue.status_key == status_filter)
+    if assignee:
+        query = query.filter(
+            ExternalIssue.assignee.ilike(f"%{_escape_like(assignee)}%", escape="\\")
+        )
+    if labels_filter:
+        query = query.filter(or_(*(_label_clause(label) for label in labels_filter)))
+
+    total = query.order_by(None).count()
+
+    # Keyset pagination over (updated_at, id), newest first
+    if cursor is not None:
+        cursor_updated_at, cursor_id = cursor
+        query = query.filter(
+            or_(
+                ExternalIssue.updated_at < cursor_updated_at,
+                and_(
+                    ExternalIssue.updated_at == cursor_updated_at,
+                    ExternalIssue.id < cursor_id,
+                ),
+            )
+        )
+    elif offset:
+        query = query.offset(offset)
+
+    query = query.options(
+        # Listed issues carry their comments; raw_payload stays deferred
+        undefer(ExternalIssue.comments),
         selectinload(ExternalIssue.project_integration)
         .selectinload(ProjectIntegration.project)
         .selectinload(Project.tenant),
         selectinload(ExternalIssue.project_integration).selectinload(
             ProjectIntegration.integration
         ),
-    )
-
-    if project_id is not None:
-        query = query.join(ProjectIntegration).filter(
-            ProjectIntegration.project_id == project_id
-        )
+    ).order_by(ExternalIssue.updated_at.desc(), ExternalIssue.id.desc())
 
-    if tenant_id is not None:
-        query = (
-            query.join(ProjectIntegration)
-            .join(Project)
-            .filter(Project.tenant_id == tenant_id)
-        )
+    if limit is not None:
+        # One extra row tells us whether another page follows
+        issues = query.limit(limit + 1).all()
+        has_more = len(issues) > limit
+        issues = issues[:limit]
+    else:
+        issues = query.all()
+        has_more = False
 
-    # Fetch and filter issues
-    issues = query.all()
-    payload: list[dict[str, Any]] = []
-
-    for issue in issues:
-        issue_payload = _issue_to_dict(issue)
-
-        # Apply filters
-        if status_filter and issue_payload["status_key"] != status_filter:
-            continue
-        if provider_filter and issue_payload.get("provider_key") != provider_filter:
-            continue
-        if assignee:
-            issue_assignee = issue_payload.get("assignee") or ""
-            if assignee.lower() not in issue_assignee.lower():
-                continue
-        if labels_filter:
-            issue_labels = set(issue_payload.get("labels", []))
-            if not any(label in issue_labels for label in labels_filter):
-                continue
-
-        payload.append(issue_payload)
-
-    # Apply pagination
-    total = len(payload)
-    if offset:
-        payload = payload[offset:]
-    if isinstance(limit, int) and limit > 0:
-        payload = payload[:limit]
+    next_cursor = _encode_cursor(issues[-1]) if has_more else None
 
     return jsonify({
-        "issues": payload,
-        "count": len(payload),
+        "issues": [_issue_to_dict(issue) for issue in issues],
+        "count": len(issues),
         "total": total,
-        "offset": offset,
+        "offset": 0 if cursor is not None else offset,
         "limit": limit,
+        "next_cursor": next_cursor,
     })
 
 
+def _encode_cursor(issue: ExternalIssue) -> str:
+    """Encode the keyset position after ``issue`` as an opaque cursor."""
+    raw = json.dumps([issue.updated_at.isoformat(), issue.id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(value: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by :func:`_encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        updated_at, issue_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(updated_at), int(issue_id)
+    except (TypeError, ValueError, binascii.Error) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _label_clause(label: str):
+    """Match issues whose JSON ``labels`` array contains ``label``.
+
+    Labels are stored as a JSON array of strings, so the quoted label is
+    matched against the column text; this works on SQLite and PostgreSQL alike.
+    """
+    pattern = f"%{_escape_like(json.dumps(label))}%"
+    return cast(ExternalIssue.labels, db.Text).like(pattern, escape="\\")
+
+
 @api_v1_bp.get("/issues/pinned")
 @require_api_auth(scopes=["read"])
 @audit_api_request
@@ -224,6 +303,7 @@ def list_pinned_issues():
         .join(ExternalIssue)
         .join(ProjectIntegration)
         .options(
+            selectinload(PinnedIssue.issue).undefer(ExternalIssue.comments),
             selectinload(PinnedIssue.issue)
             .selectinload(ExternalIssue.project_integration)
             .selectinload(ProjectIntegration.project)
@@ -716,7 +796,7 @@ def add_issue_comment(issue_id: int):
         return jsonify({"error": f"Failed to add comment: {str(exc)}"}), 500
 
     # Update local comments cache
-    comments = issue.comments or []
+    comments = list(issue.comments or [])
     comments.append(comment_data)
     issue.comments = comments
     issue.last_seen_at = datetime.utcnow()
@@ -794,7 +874,7 @@ def update_issue_comment(issue_id: int, comment_id: str):
 
     # Update local comments cache
     # Find and update the comment in the cached list
-    comments = issue.comments or []
+    comments = list(issue.comments or [])
     for i, comment in enumerate(comments):
         # Match by comment body or other identifier if available
         # Note: This is a best-effort update since we don't store comment IDs locally
@@ -913,9 +993,13 @@ def sync_issues():
         integration_id (int, optional): Limit sync to a specific tenant integration
         project_id (int, optional): Limit sync to a specific project
         force_full (bool, optional): Force full sync (default: False)
+        background (bool, optional): Run as a tracked background job whose progress
+            can be followed at ``/jobs/<id>/events`` and cancelled (default: False)
 
     Returns:
         200: Sync completed successfully with statistics
+        202: Sync started as a background job (when requested or the job queue
+            is enabled)
         400: Invalid request
         404: Tenant or integration not found
         500: Sync failed
@@ -926,6 +1010,7 @@ def sync_issues():
     integration_id = data.get("integration_id")
     project_id = data.get("project_id")
     force_full = data.get("force_full", False)
+    background = bool(data.get("background", False))
 
     # Validate tenant and integration relationship if both provided
     if tenant_id is not None and integration_id is not None:
@@ -961,6 +1046,17 @@ def sync_issues():
             "projects": [],
         })
 
+    if background or is_job_queue_enabled():
+        job = start_job(
+            "issue_sync",
+            {
+                "project_integration_ids": [pi.id for pi in project_integrations],
+                "force_full": bool(force_full),
+            },
+            user_id=g.api_user.id,
+        )
+        return job_accepted_response(job)
+
     # Perform sync - now gracefully handles failures
     results = sync_tenant_integrations(project_integrations, force_full=force_full)
 
@@ -1053,6 +1149,8 @@ def preview_assisted_issue():
         description (str): Natural language description of what to work on
         ai_tool (str): AI tool to use for generation (claude, codex, gemini)
         issue_type (str, optional): Hint about issue type (feature, bug)
+        background (bool, optional): Generate in a background job and return
+            202; confirm with the job's id as ``preview_job_id``
 
     Returns:
         JSON response with:
@@ -1095,6 +1193,20 @@ def preview_assisted_issue():
     if not integration or integration.project_id != project_id:
         return jsonify({"error": f"Integration {integration_id} not found for project"}), 404
 
+    if data.get("background") or is_job_queue_enabled():
+        job = start_job(
+            "ai_issue_preview",
+            {
+                "project_id": project_id,
+                "integration_id": integration_id,
+                "description": description,
+                "ai_tool": ai_tool,
+                "issue_type": issue_type,
+            },
+            user_id=g.api_user.id,
+        )
+        return job_accepted_response(job)
+
     try:
         # Generate issue content using AI
         import time
@@ -1155,6 +1267,7 @@ def create_assisted_issue():
 
     Request body:
         preview_token (str): Token from preview_assisted endpoint
+        preview_job_id (int): ID of a finished preview job, instead of preview_token
         create_branch (bool, optional): Whether to create a feature branch (default: false)
         start_session (bool, optional): Whether to start an AI session (default: false)
         assignee_user_id (int, optional): User ID to assign the issue to
@@ -1176,16 +1289,38 @@ def create_assisted_issue():
 
     # Validate required fields
     preview_token = data.get("preview_token")
-    if not preview_token:
-        return jsonify({"error": "preview_token is required"}), 400
-
-    # Retrieve preview from session
-    preview_key = f"issue_preview_{preview_token}"
-    if preview_key not in flask_session:
-        return jsonify({"error": "Preview token expired or invalid"}), 400
+    preview_job_id = data.get("preview_job_id")
+    assignee_user_id = data.get("assignee_user_id")
+    preview_job = None
+    if preview_job_id:
+        preview_job = db.session.get(BackgroundJob, preview_job_id)
+        if (
+            preview_job is None
+            or preview_job.kind != "ai_issue_preview"
+            or preview_job.created_by_user_id != g.api_user.id
+        ):
+            return jsonify({"error": f"Preview job {preview_job_id} not found"}), 404
+        if preview_job.status != JOB_STATUS_SUCCEEDED:
+            return jsonify({
+                "error": f"Preview job {preview_job_id} is {preview_job.status}",
+                "job": preview_job.to_dict(),
+            }), 409
+        if (preview_job.result or {}).get("issue_id"):
+            return jsonify({"error": f"Preview job {preview_job_id} was already used"}), 409
+        preview_data = {
+            **(preview_job.payload or {}),
+            "issue_data": preview_job.result["issue_data"],
+        }
+    elif preview_token:
+        # Retrieve preview from session
+        preview_key = f"issue_preview_{preview_token}"
+        if preview_key not in flask_session:
+            return jsonify({"error": "Preview token expired or invalid"}), 400
 
-    preview_data = flask_session.pop(preview_key)
-    flask_session.permanent = True
+        preview_data = flask_session.pop(preview_key)
+        flask_session.permanent = True
+    else:
+        return jsonify({"error": "preview_token or preview_job_id is required"}), 400
 
     project_id = preview_data["project_id"]
     integration_id = preview_data["integration_id"]
@@ -1234,6 +1369,10 @@ def create_assisted_issue():
                 comments=serialize_issue_comments(issue_payload.comments or []),
             )
             db.session.add(issue)
+            if preview_job is not None:
+                db.session.flush()
+                # Mark the preview as used so it cannot create a second issue
+                preview_job.result = {**preview_job.result, "issue_id": issue.id}
             db.session.commit()
         except Exception as e:
             db.session.rollback()
@@ -1404,9 +1543,7 @@ def pin_comment(issue_id: int, comment_id: str):
     user = g.api_user
 
     # Verify comment exists in issue
-    comments = issue.comments or []
-    comment_exists = any(str(c.get("id")) == str(comment_id) for c in comments)
-    if not comment_exists:
+    if not find_issue_comments([(issue.id, comment_id)]):
         return jsonify({"error": f"Comment {comment_id} not found in issue"}), 404
 
     # Check if already pinned
@@ -1495,15 +1632,14 @@ def list_pinned_comments():
         .all()
     )
 
+    comments = find_issue_comments(
+        (pinned.issue_id, pinned.comment_id) for pinned in pinned_comments
+    )
+
     result = []
     for pinned in pinned_comments:
         issue = pinned.issue
-        # Find the comment in the issue's comments
-        comment_data = None
-        for c in (issue.comments or []):
-            if str(c.get("id")) == str(pinned.comment_id):
-                comment_data = c
-                break
+        comment_data = comments.get((pinned.issue_id, pinned.comment_id))
 
         result.append({
             "id": pinned.id,
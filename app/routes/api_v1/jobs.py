@@ -0,0 +1,192 @@
+"""Background job API endpoints.
+
+Long-running operations (issue sync, backups, git pulls, AI issue previews, Semaphore
+runs) return a job ID when the job queue is enabled; these endpoints report the job's
+status and progress, stream it as server-sent events and cancel running jobs.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from flask import (
+    Response,
+    current_app,
+    g,
+    jsonify,
+    request,
+    stream_with_context,
+    url_for,
+)
+
+from ...extensions import db
+from ...models import BackgroundJob
+from ...services.api_auth import audit_api_request, require_api_auth
+from ...services.job_queue import (
+    FINISHED_JOB_STATUSES,
+    request_cancel,
+)
+from . import api_v1_bp
+
+# Seconds between keep-alive comments on an idle event stream
+_EVENT_KEEPALIVE_SECONDS = 15.0
+
+
+def job_accepted_response(job: BackgroundJob):
+    """Return the 202 response used by endpoints that enqueue a job."""
+    return (
+        jsonify(
+            {
+                "message": f"Job #{job.id} queued",
+                "job_id": job.id,
+                "status_url": url_for("api_v1.get_job", job_id=job.id),
+                "events_url": url_for("api_v1.stream_job_events", job_id=job.id),
+                "job": job.to_dict(),
+            }
+        ),
+        202,
+    )
+
+
+def _can_view(job: BackgroundJob) -> bool:
+    user = g.api_user
+    return bool(user.is_admin or job.created_by_user_id == user.id)
+
+
+@api_v1_bp.get("/jobs")
+@require_api_auth(scopes=["read"])
+def list_jobs():
+    """List background jobs, newest first.
+
+    Admins see every job; other users see the jobs they queued.
+
+    Query parameters:
+        status: Filter by status (queued, running, succeeded, failed, cancelled)
+        kind: Filter by job kind (issue_sync, backup, git_pull, ai_issue_preview,
+            semaphore_run)
+        limit: Maximum number of results (default: 50, max: 200)
+
+    Returns:
+        200: List of jobs
+    """
+    user = g.api_user
+    limit = min(request.args.get("limit", 50, type=int) or 50, 200)
+    query = BackgroundJob.query
+    if not user.is_admin:
+        query = query.filter(BackgroundJob.created_by_user_id == user.id)
+    if request.args.get("status"):
+        query = query.filter(BackgroundJob.status == request.args["status"])
+    if request.args.get("kind"):
+        query = query.filter(BackgroundJob.kind == request.args["kind"])
+
+    jobs = query.order_by(BackgroundJob.id.desc()).limit(limit).all()
+    return jsonify({"jobs": [job.to_dict() for job in jobs], "count": len(jobs)})
+
+
+@api_v1_bp.get("/jobs/<int:job_id>")
+@require_api_auth(scopes=["read"])
+def get_job(job_id: int):
+    """Get a background job's status, progress and result.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        200: Job details
+        404: Job not found
+    """
+    job = db.session.get(BackgroundJob, job_id)
+    if job is None or not _can_view(job):
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify({"job": job.to_dict()})
+
+
+@api_v1_bp.post("/jobs/<int:job_id>/cancel")
+@require_api_auth(scopes=["write"])
+@audit_api_request
+def cancel_job(job_id: int):
+    """Cancel a background job.
+
+    Queued jobs are cancelled immediately; running jobs stop before their next page
+    of work and then report status ``cancelled``.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        202: Cancellation requested
+        404: Job not found
+        409: Job already finished
+    """
+    job = db.session.get(BackgroundJob, job_id)
+    if job is None or not _can_view(job):
+        return jsonify({"error": "Job not found"}), 404
+    if job.status in FINISHED_JOB_STATUSES:
+        return jsonify({"error": f"Job #{job.id} already {job.status}"}), 409
+    job = request_cancel(job)
+    return (
+        jsonify(
+            {
+                "message": f"Cancellation requested for job #{job.id}",
+                "job": job.to_dict(),
+            }
+        ),
+        202,
+    )
+
+
+@api_v1_bp.get("/jobs/<int:job_id>/events")
+@require_api_auth(scopes=["read"])
+def stream_job_events(job_id: int):
+    """Stream a job's progress as server-sent events until it finishes.
+
+    A ``progress`` event carrying the job is sent whenever its progress changes and a
+    final ``done`` event once it has succeeded, failed or been cancelled. Each stream
+    ties up a web worker, so after ``JOB_EVENTS_MAX_SECONDS`` it ends with a
+    ``reconnect`` event and clients open a new one to keep following the job.
+
+    Query parameters:
+        interval: Poll interval in seconds (default: 1, min: 0.2, max: 10)
+
+    Returns:
+        200: text/event-stream of job updates
+        404: Job not found
+    """
+    job = db.session.get(BackgroundJob, job_id)
+    if job is None or not _can_view(job):
+        return jsonify({"error": "Job not found"}), 404
+    interval = min(max(request.args.get("interval", 1.0, type=float) or 1.0, 0.2), 10.0)
+    max_seconds = float(current_app.config.get("JOB_EVENTS_MAX_SECONDS", 60) or 60)
+
+    def generate():
+        last_sent = None
+        opened = last_write = time.monotonic()
+        while True:
+            # End the read transaction so each poll sees the worker's latest commit
+            db.session.rollback()
+            current = db.session.get(BackgroundJob, job_id)
+            if current is None:
+                yield "event: error\ndata: {\"error\": \"Job not found\"}\n\n"
+                return
+            data = current.to_dict()
+            if current.status in FINISHED_JOB_STATUSES:
+                yield f"event: done\ndata: {json.dumps(data)}\n\n"
+                return
+            snapshot = json.dumps(data, sort_keys=True)
+            if snapshot != last_sent:
+                last_sent = snapshot
+                last_write = time.monotonic()
+                yield f"event: progress\ndata: {json.dumps(data)}\n\n"
+            elif time.monotonic() - last_write >= _EVENT_KEEPALIVE_SECONDS:
+                last_write = time.monotonic()
+                yield ": keep-alive\n\n"
+            if time.monotonic() - opened >= max_seconds:
+                yield f"event: reconnect\ndata: {json.dumps(data)}\n\n"
+                return
+            time.sleep(interval)
+
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
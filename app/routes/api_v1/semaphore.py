@@ -10,6 +10,7 @@ from flask import g, jsonify, request
 from ...extensions import db
 from ...models import Project
 from ...services.api_auth import require_api_auth
+from ...services.job_queue import is_job_queue_enabled, start_job
 from ...services.semaphore_service import (
     SemaphoreConfigError,
     SemaphoreError,
@@ -31,6 +32,7 @@ from ...services.semaphore_service import (
     wait_for_task,
 )
 from . import api_v1_bp
+from .jobs import job_accepted_response
 
 
 def _get_project_or_404(project_id: int) -> Project | None:
@@ -156,9 +158,12 @@ def project_semaphore_run(project_id: int):
         skip_tags: str - Optional Ansible tags to skip (comma-separated)
         dry_run: bool - Run in check mode (--check), no changes made
         diff: bool - Show diff of changes (--diff)
+        background: bool - Run and follow the task as a background job
 
     Returns:
-        JSON task details
+        201: JSON task details
+        202: Background job that starts the task and waits for it to finish
+            (with ``background`` or when the job queue is enabled)
     """
     project = _get_project_or_404(project_id)
     if not project:
@@ -172,6 +177,23 @@ def project_semaphore_run(project_id: int):
 
     variables = data.get("variables")
 
+    if data.get("background") or is_job_queue_enabled():
+        job = start_job(
+            "semaphore_run",
+            {
+                "project_id": project.id,
+                "template_id": template_id,
+                "variables": variables,
+                "limit": data.get("limit"),
+                "tags": data.get("tags"),
+                "skip_tags": data.get("skip_tags"),
+                "dry_run": bool(data.get("dry_run", False)),
+                "diff": bool(data.get("diff", False)),
+            },
+            user_id=g.api_user.id,
+        )
+        return job_accepted_response(job)
+
     try:
         task = run_template(
             project,
@@ -290,9 +312,12 @@ def project_semaphore_task_wait(project_id: int, task_id: int):
     Request body:
         timeout: int - Maximum seconds to wait (default 600)
         poll_interval: float - Seconds between checks (default 2)
+        background: bool - Wait in a background job instead of this request
 
     Returns:
-        JSON final task details
+        200: JSON final task details
+        202: Background job waiting for the task (with ``background`` or when the
+            job queue is enabled)
     """
     project = _get_project_or_404(project_id)
     if not project:
@@ -302,6 +327,19 @@ def project_semaphore_task_wait(project_id: int, task_id: int):
     timeout = data.get("timeout", 600)
     poll_interval = data.get("poll_interval", 2.0)
 
+    if data.get("background") or is_job_queue_enabled():
+        job = start_job(
+            "semaphore_run",
+            {
+                "project_id": project.id,
+                "task_id": task_id,
+                "timeout": timeout,
+                "poll_interval": poll_interval,
+            },
+            user_id=g.api_user.id,
+        )
+        return job_accepted_response(job)
+
     try:
         task = wait_for_task(
             project,
@@ -8,7 +8,7 @@ import threading
 import time
 from pathlib import Path
 
-from flask import current_app, jsonify, request, send_file
+from flask import current_app, g, jsonify, request, send_file
 
 from ...services.api_auth import audit_api_request, require_api_auth
 from ...services.ai_cli_update_service import CLICommandError, run_ai_tool_update
@@ -497,14 +497,27 @@ def create_system_backup():
 
     Returns:
         201: Backup created successfully
+        202: Backup queued as a background job (when the job queue is enabled)
         500: Backup creation failed
     """
+    from ...services.job_queue import enqueue_job, is_job_queue_enabled
+    from .jobs import job_accepted_response
+
     data = request.get_json(silent=True) or {}
     description = data.get("description")
 
     # Get user ID from API auth context if available
     user_id = getattr(request, "api_user_id", None)
 
+    if is_job_queue_enabled():
+        api_user = getattr(g, "api_user", None)
+        job = enqueue_job(
+            "backup",
+            {"description": description},
+            user_id=user_id or (api_user.id if api_user else None),
+        )
+        return job_accepted_response(job)
+
     try:
         backup = create_backup(description=description, user_id=user_id)
         return jsonify({
@@ -890,9 +903,10 @@ def get_sync_status():
     Returns:
         200: Sync scheduler status
     """
-    from ...services.sync_scheduler import get_scheduler_status
+    from ...services.sync_scheduler import get_scheduler_status, get_sync_schedule
 
     status = get_scheduler_status()
+    status["schedule"] = get_sync_schedule(current_app._get_current_object())
 
     # Add configuration info
     status["config"] = {
@@ -900,6 +914,15 @@ def get_sync_status():
         "interval_seconds": current_app.config.get("ISSUE_SYNC_INTERVAL", 900),
         "sync_on_startup": current_app.config.get("ISSUE_SYNC_ON_STARTUP", True),
         "max_concurrent": current_app.config.get("ISSUE_SYNC_MAX_CONCURRENT", 3),
+        "max_per_host": current_app.config.get("ISSUE_SYNC_MAX_PER_HOST", 2),
+        "max_requests_per_second": current_app.config.get(
+            "ISSUE_SYNC_MAX_REQUESTS_PER_SECOND", 10
+        ),
+        "client_ttl_seconds": current_app.config.get("ISSUE_SYNC_CLIENT_TTL", 600),
+        "adaptive": current_app.config.get("ISSUE_SYNC_ADAPTIVE", False),
+        "tick_seconds": current_app.config.get("ISSUE_SYNC_TICK_SECONDS", 60),
+        "min_interval_seconds": current_app.config.get("ISSUE_SYNC_MIN_INTERVAL", 120),
+        "max_interval_seconds": current_app.config.get("ISSUE_SYNC_MAX_INTERVAL", 21600),
     }
 
     return jsonify(status)
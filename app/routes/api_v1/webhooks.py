@@ -0,0 +1,90 @@
+"""API v1 webhook receivers for external issue providers.
+
+Deliveries are authenticated with the integration's ``webhook_secret`` instead of an
+API key, so these endpoints intentionally skip ``require_api_auth``.
+"""
+
+from __future__ import annotations
+
+from flask import current_app, jsonify, request
+
+from ...extensions import db
+from ...models import TenantIntegration
+from ...services.issues import IssueSyncError
+from ...services.issues.webhooks import (
+    SUPPORTED_WEBHOOK_PROVIDERS,
+    WebhookVerificationError,
+    apply_webhook_event,
+    parse_webhook_event,
+    verify_webhook_signature,
+)
+from . import api_v1_bp
+
+
+@api_v1_bp.post("/webhooks/<provider>/<int:integration_id>")
+def receive_issue_webhook(provider: str, integration_id: int):
+    """Ingest an issue or comment event pushed by GitHub, GitLab or Jira.
+
+    Args:
+        provider: Provider key (github, gitlab, jira)
+        integration_id: TenantIntegration the webhook was registered for
+
+    Returns:
+        200: Event applied to matching project integrations
+        202: Event accepted but ignored (not an issue event)
+        400: Malformed payload
+        401: Signature verification failed
+        404: Unknown or disabled integration
+    """
+    provider_key = provider.lower()
+    integration = db.session.get(TenantIntegration, integration_id)
+    if (
+        provider_key not in SUPPORTED_WEBHOOK_PROVIDERS
+        or integration is None
+        or not integration.enabled
+        or (integration.provider or "").lower() != provider_key
+    ):
+        return jsonify({"error": "Webhook integration not found"}), 404
+
+    try:
+        verify_webhook_signature(
+            provider_key,
+            integration,
+            request.headers,
+            request.get_data(),
+            token=request.args.get("token"),
+        )
+    except WebhookVerificationError as exc:
+        current_app.logger.warning(
+            "Rejected %s webhook for integration %s: %s", provider_key, integration_id, exc
+        )
+        return jsonify({"error": str(exc)}), 401
+
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Webhook body must be a JSON object"}), 400
+
+    try:
+        event = parse_webhook_event(provider_key, integration, request.headers, payload)
+    except IssueSyncError as exc:
+        return jsonify({"error": str(exc)}), 400
+    if event is None:
+        return jsonify({"status": "ignored"}), 202
+
+    try:
+        issues = apply_webhook_event(integration, event)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        current_app.logger.exception(
+            "Failed to apply %s webhook for integration %s", provider_key, integration_id
+        )
+        return jsonify({"error": "Failed to apply webhook event"}), 500
+
+    return jsonify(
+        {
+            "status": "processed",
+            "external_id": event.issue.external_id,
+            "issue_ids": [issue.id for issue in issues],
+        }
+    )
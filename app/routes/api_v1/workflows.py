@@ -186,7 +186,7 @@ def update_progress():
         return jsonify({"error": f"Failed to update progress: {str(exc)}"}), 500
 
     # Update local comments cache
-    comments = issue.comments or []
+    comments = list(issue.comments or [])
     comments.append(comment_data)
     issue.comments = comments
     issue.last_seen_at = datetime.utcnow()
@@ -307,7 +307,7 @@ def submit_changes():
 
     # Update local comments cache
     if comment_data:
-        comments = issue.comments or []
+        comments = list(issue.comments or [])
         comments.append(comment_data)
         issue.comments = comments
         issue.last_seen_at = datetime.utcnow()
@@ -373,7 +373,7 @@ def request_approval():
         return jsonify({"error": f"Failed to request approval: {str(exc)}"}), 500
 
     # Update local comments cache
-    comments = issue.comments or []
+    comments = list(issue.comments or [])
     comments.append(comment_data)
     issue.comments = comments
     issue.last_seen_at = datetime.utcnow()
@@ -449,7 +449,7 @@ def complete_issue():
         return jsonify({"error": f"Failed to complete issue: {str(exc)}"}), 500
 
     # Update local database
-    comments = issue.comments or []
+    comments = list(issue.comments or [])
     comments.append(comment_data)
     issue.comments = comments
     issue.status = "closed"
@@ -19,7 +19,8 @@ from flask import (
     url_for,
 )
 from flask_login import current_user, login_required  # type: ignore
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload, undefer
 
 from ..ai_sessions import (
     close_session,
@@ -137,9 +138,6 @@ def project_detail(project_id: int):
             selectinload(Project.issue_integrations).selectinload(
                 ProjectIntegration.integration
             ),
-            selectinload(Project.issue_integrations).selectinload(
-                ProjectIntegration.issues
-            ),
         )
         .filter_by(id=project_id)
         .first()
@@ -363,9 +361,6 @@ def project_detail(project_id: int):
 
     issue_groups: list[dict[str, object]] = []
     total_issue_count = 0
-    all_project_issues = [
-        issue for link in project.issue_integrations for issue in link.issues
-    ]
 
     from ..models import PinnedIssue
 
@@ -374,14 +369,22 @@ def project_detail(project_id: int):
         for pinned in PinnedIssue.query.filter_by(user_id=_current_user_obj().id).all()
     }
 
+    # Counted in SQL from the stored status_key; only distinct raw statuses are
+    # normalized for their labels
     status_counts: Counter[str] = Counter()
     status_labels: dict[str, str] = {}
-    for issue in all_project_issues:
-        status_key, status_label = normalize_issue_status(issue.status)
-        status_counts[status_key] += 1
-        status_labels.setdefault(status_key, status_label)
+    status_rows = db.session.execute(
+        select(ExternalIssue.status_key, ExternalIssue.status, func.count())
+        .join(ProjectIntegration)
+        .where(ProjectIntegration.project_id == project.id)
+        .group_by(ExternalIssue.status_key, ExternalIssue.status)
+        .order_by(func.min(ExternalIssue.id))
+    )
+    for status_key, raw_status, count in status_rows:
+        status_counts[status_key] += count
+        status_labels.setdefault(status_key, normalize_issue_status(raw_status)[1])
 
-    total_issue_full_count = len(all_project_issues)
+    total_issue_full_count = sum(status_counts.values())
 
     raw_filter = (request.args.get("issue_status") or "").strip().lower()
     has_open_issues = status_counts.get("open", 0) > 0
@@ -401,12 +404,6 @@ def project_detail(project_id: int):
     ):
         issue_status_filter = "all"
 
-    def _issue_matches_filter(issue: ExternalIssue) -> bool:
-        if issue_status_filter == "all":
-            return True
-        issue_status_key, _ = normalize_issue_status(issue.status)
-        return issue_status_key == issue_status_filter
-
     issue_status_filter_label = (
         "All statuses"
         if issue_status_filter == "all"
@@ -433,15 +430,21 @@ def project_detail(project_id: int):
 
     for link in project.issue_integrations:
         integration = link.integration
-        sorted_issues = sorted(link.issues, key=_issue_sort_key, reverse=True)
+        # The page renders each issue's conversation; raw_payload stays deferred
+        link_issues = ExternalIssue.query.options(
+            undefer(ExternalIssue.comments)
+        ).filter(ExternalIssue.project_integration_id == link.id)
+        if issue_status_filter != "all":
+            link_issues = link_issues.filter(
+                ExternalIssue.status_key == issue_status_filter
+            )
+        sorted_issues = sorted(link_issues.all(), key=_issue_sort_key, reverse=True)
         issue_entries: list[dict[str, object]] = []
         for record in sorted_issues:
-            if not _issue_matches_filter(record):
-                continue
             updated_display = _format_timestamp(
                 record.external_updated_at or record.updated_at or record.created_at
             )
-            status_key, _ = normalize_issue_status(record.status)
+            status_key = record.status_key
             provider_key_lower = (
                 (integration.provider or "").lower()
                 if integration and integration.provider
@@ -263,8 +263,12 @@ def _extract_issue_description(
     issue: ExternalIssue, provider: str | None
 ) -> str | None:
     """Pull a human-readable issue description from stored payload metadata."""
-    payload = issue.raw_payload or {}
-    if not payload:
+    return extract_payload_description(issue.raw_payload, provider)
+
+
+def extract_payload_description(payload: Any, provider: str | None) -> str | None:
+    """Pull a human-readable description out of a provider's raw issue payload."""
+    if not payload or not isinstance(payload, dict):
         return None
 
     provider_key = (provider or "").lower()
@@ -1038,7 +1042,7 @@ def _render_git_identity_section(identity_user: User | None) -> str:
         ## Git Identity
         Use this identity for commits created while working on this issue.
 
-        {"\n".join(details)}
+        {chr(10).join(details)}
 
         {command_block}
         """
@@ -0,0 +1,177 @@
+"""Shared index of external provider identities to local users.
+
+Issue sync, notifications, the communications API and comment rendering all map a
+GitHub login, GitLab username or Jira account ID to an aiops user. They used to run a
+``UserIdentityMap`` query (plus a ``User`` lookup) per name, or keep their own
+process-global caches that never noticed edits. They now share one index built from
+a single join and kept in ``app.extensions``.
+
+The index is versioned. Committing a change to ``UserIdentityMap`` (or to a user's
+name) in this process bumps the version, so the next lookup rebuilds it. Edits made
+by other processes are picked up by comparing a cheap count/``updated_at``
+fingerprint at most every ``IDENTITY_INDEX_CHECK_SECONDS``.
+
+GitHub and GitLab usernames are case-insensitive; Jira account IDs match exactly or,
+for rendering, by their numeric prefix.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from ..extensions import db
+from ..models import User, UserIdentityMap
+
+DEFAULT_CHECK_SECONDS = 30
+_EXTENSION_KEY = "identity_index"
+_SESSION_FLAG = "identity_index_dirty"
+
+# Provider name -> UserIdentityMap column holding that provider's username
+PROVIDER_IDENTITY_COLUMNS = {
+    "github": "github_username",
+    "gitlab": "gitlab_username",
+    "jira": "jira_account_id",
+}
+_CASE_INSENSITIVE_PROVIDERS = frozenset({"github", "gitlab"})
+
+_version = 0
+_version_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class IdentityMatch:
+    """A local user an external identity maps to."""
+
+    user_id: int
+    display_name: str
+
+
+def _normalize(provider: str, username: str) -> str:
+    return username.lower() if provider in _CASE_INSENSITIVE_PROVIDERS else username
+
+
+@dataclass
+class IdentityIndex:
+    """Immutable snapshot of every identity mapping, keyed by provider."""
+
+    version: int
+    fingerprint: tuple
+    by_provider: dict[str, dict[str, IdentityMatch]] = field(default_factory=dict)
+    jira_prefixes: dict[str, IdentityMatch] = field(default_factory=dict)
+    checked_at: float = field(default_factory=time.monotonic)
+
+    def lookup(self, provider: str, username: Optional[str]) -> Optional[IdentityMatch]:
+        if not username:
+            return None
+        provider = provider.lower()
+        entries = self.by_provider.get(provider)
+        if not entries:
+            return None
+        return entries.get(_normalize(provider, username))
+
+    def lookup_jira(self, account_id: str) -> Optional[IdentityMatch]:
+        """Match a Jira account ID exactly, then by its numeric ``557058:`` prefix."""
+        match = self.lookup("jira", account_id)
+        if match is None and account_id:
+            match = self.jira_prefixes.get(account_id.split(":")[0])
+        return match
+
+
+def _fingerprint() -> tuple:
+    row = db.session.execute(
+        select(
+            func.count(UserIdentityMap.id),
+            func.max(UserIdentityMap.updated_at),
+            func.max(User.updated_at),
+        ).join(User, User.id == UserIdentityMap.user_id)
+    ).one()
+    return tuple(row)
+
+
+def _build_index(version: int) -> IdentityIndex:
+    index = IdentityIndex(version=version, fingerprint=_fingerprint())
+    rows = db.session.execute(
+        select(
+            UserIdentityMap.user_id,
+            UserIdentityMap.github_username,
+            UserIdentityMap.gitlab_username,
+            UserIdentityMap.jira_account_id,
+            User.name,
+            User.email,
+        )
+        .join(User, User.id == UserIdentityMap.user_id)
+        .order_by(UserIdentityMap.id)
+    )
+    for user_id, github, gitlab, jira, name, email in rows:
+        usernames = {"github": github, "gitlab": gitlab, "jira": jira}
+        for provider, username in usernames.items():
+            if not username:
+                continue
+            match = IdentityMatch(user_id, name or email or username)
+            entries = index.by_provider.setdefault(provider, {})
+            # The first mapping wins, as with the old per-name queries
+            entries.setdefault(_normalize(provider, username), match)
+            if provider == "jira" and ":" in username:
+                index.jira_prefixes.setdefault(username.split(":")[0], match)
+    return index
+
+
+def get_identity_index() -> Optional[IdentityIndex]:
+    """Return the current index, rebuilding it if it is stale; None outside an app."""
+    if not has_app_context():
+        return None
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    index: Optional[IdentityIndex] = app.extensions.get(_EXTENSION_KEY)
+    check_seconds = app.config.get("IDENTITY_INDEX_CHECK_SECONDS", DEFAULT_CHECK_SECONDS)
+    version = _version
+
+    if index is not None and index.version == version:
+        if time.monotonic() - index.checked_at < check_seconds:
+            return index
+        # Another process may have edited mappings since the last check
+        if _fingerprint() == index.fingerprint:
+            index.checked_at = time.monotonic()
+            return index
+
+    index = _build_index(version)
+    app.extensions[_EXTENSION_KEY] = index
+    return index
+
+
+def lookup_identity(provider: str, username: Optional[str]) -> Optional[IdentityMatch]:
+    """Return the local user an external username maps to, if any."""
+    index = get_identity_index()
+    return index.lookup(provider, username) if index is not None else None
+
+
+def invalidate_identity_index() -> None:
+    """Force the next lookup in every app of this process to rebuild the index."""
+    global _version
+    with _version_lock:
+        _version += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_identity_changes(session: Session, flush_context: Any) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (UserIdentityMap, User)):
+            session.info[_SESSION_FLAG] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_version_on_commit(session: Session) -> None:
+    if session.info.pop(_SESSION_FLAG, False):
+        invalidate_identity_index()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_flag_on_rollback(session: Session) -> None:
+    session.info.pop(_SESSION_FLAG, None)
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass, field
+from itertools import islice
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
 
 from flask import current_app
+from sqlalchemy import event, insert, inspect, select, update
+from sqlalchemy.orm import InstanceState, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ...extensions import db
 from ...models import ExternalIssue, Project, ProjectIntegration, TenantIntegration
@@ -48,6 +65,15 @@ class IssueCreateRequest:
     custom_fields: Optional[Dict[str, Any]] = None
 
 
+@dataclass(slots=True)
+class SyncedIssue:
+    """Lightweight reference to an issue processed by a sync (avoids loading ORM rows)."""
+
+    id: int
+    external_id: str
+    changed: bool = True
+
+
 class IssueSyncError(Exception):
     """Raised when an external issue provider cannot be queried."""
 
@@ -59,6 +85,10 @@ class IssueUpdateError(Exception):
 ProviderFunc = Callable[
     [TenantIntegration, ProjectIntegration, Optional[datetime]], List[IssuePayload]
 ]
+PagedProviderFunc = Callable[
+    [TenantIntegration, ProjectIntegration, Optional[datetime]],
+    Iterator[List[IssuePayload]],
+]
 CreateProviderFunc = Callable[
     [TenantIntegration, ProjectIntegration, IssueCreateRequest], IssuePayload
 ]
@@ -66,24 +96,68 @@ CloseProviderFunc = Callable[[TenantIntegration, ProjectIntegration, str], Issue
 AssignProviderFunc = Callable[
     [TenantIntegration, ProjectIntegration, str, List[str]], IssuePayload
 ]
+# Listers receive the effective integration (TenantIntegration or IntegrationLike)
+ListIdsProviderFunc = Callable[[Any, ProjectIntegration], List[str]]
+# Called after each page is upserted; raising aborts the sync before the next page
+PageCallback = Callable[[List["SyncedIssue"]], None]
+
+
+def deserialize_issue_comments(
+    entries: Optional[List[Dict[str, Any]]],
+) -> List[IssueCommentPayload]:
+    """Rebuild comment payloads from the JSON stored on ``ExternalIssue.comments``."""
+    from .utils import parse_datetime
+
+    comments: List[IssueCommentPayload] = []
+    for entry in entries or []:
+        if not isinstance(entry, dict):
+            continue
+        comments.append(
+            IssueCommentPayload(
+                author=entry.get("author"),
+                body=entry.get("body") or "",
+                created_at=parse_datetime(entry.get("created_at")),
+                url=entry.get("url"),
+                id=entry.get("id"),
+                body_html=entry.get("body_html"),
+            )
+        )
+    return comments
+
 
 from . import (  # noqa: E402  (import depends on IssuePayload declaration)
     github,
     gitlab,
     jira,
 )
+from .comments import replace_issue_comments  # noqa: E402
+from .rollups import (  # noqa: E402
+    CLOSED_CATEGORY,
+    Resolution,
+    record_resolutions,
+    resolution,
+    rollups_enabled,
+)
 from .utils import (  # noqa: E402
     ProviderTestError,
     get_effective_integration,
+    issue_description_excerpt,
+    issue_status_columns,
     test_provider_credentials,
 )
 
 PROVIDER_REGISTRY: Dict[str, ProviderFunc] = {
     "gitlab": gitlab.fetch_issues,
-    "github": github.fetch_issues,
+    "github": github.fetch_issues_graphql,
     "jira": jira.fetch_issues,
 }
 
+# Providers that can stream results page by page so syncs upsert as pages arrive
+PAGED_PROVIDER_REGISTRY: Dict[str, PagedProviderFunc] = {
+    "github": github.iter_issue_pages,
+    "jira": jira.iter_issue_pages,
+}
+
 CREATE_PROVIDER_REGISTRY: Dict[str, CreateProviderFunc] = {
     "github": github.create_issue,
     "gitlab": gitlab.create_issue,
@@ -100,6 +174,13 @@ ASSIGN_PROVIDER_REGISTRY: Dict[str, AssignProviderFunc] = {
     "github": github.assign_issue,
 }
 
+# ID-only listings used by the reconciliation pass (see reconcile.py)
+LIST_IDS_PROVIDER_REGISTRY: Dict[str, ListIdsProviderFunc] = {
+    "github": github.list_issue_ids,
+    "gitlab": gitlab.list_issue_ids,
+    "jira": jira.list_issue_ids,
+}
+
 
 def utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -152,12 +233,31 @@ def update_issue_status(issue_id: int, status: Optional[str]) -> ExternalIssue:
     return issue
 
 
-def sync_project_integration(
+@dataclass(slots=True)
+class IssueFetchJob:
+    """Everything a provider fetcher needs, resolved up front on the caller's thread."""
+
+    project_integration_id: int
+    provider: str
+    fetcher: ProviderFunc
+    integration: Any  # Effective IntegrationLike with credential overrides applied
+    project_integration: Any  # ProjectIntegration or a detached snapshot of it
+    since: Optional[datetime]
+    pager: Optional[PagedProviderFunc] = None
+
+
+def prepare_issue_fetch(
     project_integration: ProjectIntegration,
     since: Optional[datetime] = None,
     *,
     force_full: bool = False,
-) -> List[ExternalIssue]:
+    detach: bool = False,
+) -> IssueFetchJob:
+    """Resolve the provider fetcher, credentials and cursor for a project integration.
+
+    With ``detach=True`` the project integration is replaced by a plain snapshot so the
+    job can be executed on a worker thread without touching the ORM session.
+    """
     integration = project_integration.integration
     if integration is None:
         raise IssueSyncError(
@@ -177,26 +277,157 @@ def sync_project_integration(
     # Use effective integration with project-level credential overrides
     effective_integration = get_effective_integration(integration, project_integration)
 
+    target: Any = project_integration
+    if detach:
+        target = SimpleNamespace(
+            id=project_integration.id,
+            project_id=project_integration.project_id,
+            integration_id=project_integration.integration_id,
+            external_identifier=project_integration.external_identifier,
+            config=dict(project_integration.config or {}),
+            last_synced_at=project_integration.last_synced_at,
+        )
+
+    return IssueFetchJob(
+        project_integration_id=project_integration.id,
+        provider=provider_key,
+        fetcher=fetcher,
+        integration=effective_integration,
+        project_integration=target,
+        since=effective_since,
+        pager=PAGED_PROVIDER_REGISTRY.get(provider_key),
+    )
+
+
+def iter_issue_pages(job: IssueFetchJob) -> Iterator[List[IssuePayload]]:
+    """Yield payload pages for a prepared fetch job, normalizing provider failures.
+
+    Providers without a paged fetcher yield their whole result as a single page.
+    """
     try:
-        payloads = fetcher(effective_integration, project_integration, effective_since)  # type: ignore[arg-type]
+        if job.pager is not None:
+            yield from job.pager(job.integration, job.project_integration, job.since)
+        else:
+            yield job.fetcher(job.integration, job.project_integration, job.since)
     except IssueSyncError:
         raise
     except Exception as exc:  # noqa: BLE001
         current_app.logger.exception(
             "Issue synchronization failed for project_integration=%s provider=%s",
-            project_integration.id,
-            provider_key,
+            job.project_integration_id,
+            job.provider,
         )
         error_msg = str(exc) or f"Unknown error: {type(exc).__name__}"
         raise IssueSyncError(error_msg) from exc
 
-    existing_issues = {
-        issue.external_id: issue
-        for issue in ExternalIssue.query.filter_by(
-            project_integration_id=project_integration.id
-        ).all()
+
+def sync_project_integration(
+    project_integration: ProjectIntegration,
+    since: Optional[datetime] = None,
+    *,
+    force_full: bool = False,
+    on_page: Optional[PageCallback] = None,
+) -> List[SyncedIssue]:
+    job = prepare_issue_fetch(project_integration, since, force_full=force_full)
+    # Pages are upserted as they arrive; last_synced_at only advances once the
+    # provider has been read to the end, so a failed page is retried next sync.
+    pages = iter_issue_pages(job)
+    return apply_issue_pages(
+        project_integration, pages, on_page=on_page, force_full=force_full
+    )
+
+
+# Payloads are upserted in chunks so memory stays flat for very large projects
+UPSERT_CHUNK_SIZE = 500
+_CONTENT_COLUMNS = (
+    "title",
+    "status",
+    "assignee",
+    "url",
+    "labels",
+    "external_updated_at",
+    "raw_payload",
+    "comments",
+)
+# Derived from status and raw_payload, so they are written with them but never hashed
+_DERIVED_COLUMNS = ("status_key", "status_category", "description_excerpt")
+_WRITTEN_COLUMNS = (
+    *_CONTENT_COLUMNS,
+    *_DERIVED_COLUMNS,
+    "content_hash",
+    "last_seen_at",
+    "updated_at",
+)
+
+
+@event.listens_for(ExternalIssue, "before_update")
+def _clear_stale_content_hash(mapper, connection, target: ExternalIssue) -> None:
+    # A local edit (e.g. a status set in the UI) leaves the stored hash describing
+    # content the row no longer has; without clearing it, the next sync would see an
+    # unchanged upstream payload and never restore the row
+    state: InstanceState[ExternalIssue] = inspect(target)
+    if any(state.attrs[column].history.has_changes() for column in _CONTENT_COLUMNS):
+        target.content_hash = None
+
+
+def _issue_row_values(payload: IssuePayload) -> Dict[str, Any]:
+    return {
+        "title": payload.title,
+        "status": payload.status,
+        **issue_status_columns(payload.status),
+        "assignee": payload.assignee,
+        "url": payload.url,
+        "labels": list(payload.labels),
+        "external_updated_at": payload.external_updated_at,
+        "raw_payload": payload.raw,
+        "comments": serialize_issue_comments(payload.comments),
     }
 
+
+def compute_issue_content_hash(values: Mapping[str, Any]) -> str:
+    """Hash the synced columns of an issue so unchanged rows can be skipped."""
+    normalized = {column: values.get(column) for column in _CONTENT_COLUMNS}
+    updated_at = normalized["external_updated_at"]
+    if isinstance(updated_at, datetime):
+        if updated_at.tzinfo is not None:
+            updated_at = updated_at.astimezone(_UTC).replace(tzinfo=None)
+        normalized["external_updated_at"] = updated_at.isoformat()
+    encoded = json.dumps(normalized, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def apply_issue_payloads(
+    project_integration: ProjectIntegration,
+    payloads: Iterable[IssuePayload],
+    *,
+    mark_synced: bool = True,
+) -> List[SyncedIssue]:
+    """Upsert fetched payloads into ``external_issues`` for a project integration.
+
+    This is the database half of :func:`sync_project_integration`; it must run on the
+    thread that owns the session. Pass ``mark_synced=False`` for partial updates (such
+    as webhook deliveries) that must not advance the incremental sync cursor.
+    """
+    return apply_issue_pages(project_integration, [payloads], mark_synced=mark_synced)
+
+
+def apply_issue_pages(
+    project_integration: ProjectIntegration,
+    pages: Iterable[Iterable[IssuePayload]],
+    *,
+    mark_synced: bool = True,
+    on_page: Optional[PageCallback] = None,
+    force_full: bool = False,
+) -> List[SyncedIssue]:
+    """Upsert payload pages, writing each page as soon as it arrives.
+
+    Pages are split into chunks of at most ``UPSERT_CHUNK_SIZE``: each chunk loads only
+    the stored rows it touches, skips rows whose content hash is unchanged and writes
+    the rest with a single bulk upsert, so memory stays flat for very large projects.
+    With ``force_full`` every row is rewritten, hash or not.
+    ``on_page`` receives each page's synced issues before the next page is fetched,
+    which is where progress is reported and cancellation is checked.
+    """
     # Get the tenant ID to check for manually assigned issues across projects
     tenant_id = None
     if project_integration.project and project_integration.project.tenant:
@@ -206,130 +437,289 @@ def sync_project_integration(
     # These should not be synced to this project to avoid duplicates
     manually_assigned_external_ids: set[str] = set()
     if tenant_id:
-        manually_assigned_issues = (
-            ExternalIssue.query
-            .join(ProjectIntegration)
-            .join(Project)
-            .filter(
-                Project.tenant_id == tenant_id,
-                ExternalIssue.manually_assigned == True,  # noqa: E712
-                ExternalIssue.project_integration_id != project_integration.id,
+        manually_assigned_external_ids = set(
+            db.session.scalars(
+                select(ExternalIssue.external_id)
+                .join(ProjectIntegration)
+                .join(Project)
+                .where(
+                    Project.tenant_id == tenant_id,
+                    ExternalIssue.manually_assigned == True,  # noqa: E712
+                    ExternalIssue.project_integration_id != project_integration.id,
+                )
             )
-            .all()
         )
-        manually_assigned_external_ids = {i.external_id for i in manually_assigned_issues}
 
     now = utcnow()
-    updated_issues: List[ExternalIssue] = []
-    for payload in payloads:
-        # Skip issues that have been manually assigned to another project
-        if payload.external_id in manually_assigned_external_ids:
-            current_app.logger.debug(
-                "Skipping issue %s - manually assigned to another project",
-                payload.external_id,
+    synced: List[SyncedIssue] = []
+    # Collected per call, so a failed sync drops them and concurrent syncs never mix
+    notifications: List[tuple] = []
+    for page in pages:
+        page_start = len(synced)
+        payload_iter = iter(page)
+        while chunk := list(islice(payload_iter, UPSERT_CHUNK_SIZE)):
+            kept: List[IssuePayload] = []
+            for payload in chunk:
+                # Skip issues that have been manually assigned to another project
+                if payload.external_id in manually_assigned_external_ids:
+                    current_app.logger.debug(
+                        "Skipping issue %s - manually assigned to another project",
+                        payload.external_id,
+                    )
+                    continue
+                kept.append(payload)
+            synced.extend(
+                _upsert_issue_chunk(
+                    project_integration, kept, now, notifications, force_full=force_full
+                )
             )
+        if on_page is not None:
+            on_page(synced[page_start:])
+
+    if mark_synced:
+        project_integration.last_synced_at = now  # type: ignore[assignment]
+    db.session.flush()
+
+    # Write every notification of this sync in one batch after the flush
+    _send_issue_notifications(notifications)
+
+    return synced
+
+
+def _upsert_issue_chunk(
+    project_integration: ProjectIntegration,
+    payloads: List[IssuePayload],
+    now: datetime,
+    notifications: List[tuple],
+    *,
+    force_full: bool = False,
+) -> List[SyncedIssue]:
+    # A payload can repeat when an issue moves between pages mid-sync; keep the last
+    by_external_id = {payload.external_id: payload for payload in payloads}
+    if not by_external_id:
+        return []
+
+    # Only the hash and the fields notifications compare are read back, never the
+    # JSON payload/comment blobs
+    table = ExternalIssue.__table__
+    stored = {
+        row.external_id: row
+        for row in db.session.execute(
+            select(
+                table.c.id,
+                table.c.external_id,
+                table.c.content_hash,
+                table.c.assignee,
+                table.c.status,
+                table.c.status_category,
+                table.c.created_at,
+                table.c.updated_at,
+            ).where(
+                table.c.project_integration_id == project_integration.id,
+                table.c.external_id.in_(list(by_external_id)),
+            )
+        )
+    }
+
+    rows: List[Dict[str, Any]] = []
+    unchanged: List[SyncedIssue] = []
+    pending_notifications: List[tuple] = []
+    resolutions: List[Resolution] = []
+    integration = project_integration.integration
+    provider = integration.provider if integration else None
+    for external_id, payload in by_external_id.items():
+        values = _issue_row_values(payload)
+        content_hash = compute_issue_content_hash(values)
+        existing = stored.get(external_id)
+        if (
+            not force_full
+            and existing is not None
+            and existing.content_hash == content_hash
+        ):
+            unchanged.append(SyncedIssue(existing.id, external_id, changed=False))
             continue
 
-        issue = existing_issues.get(payload.external_id)
-        is_new_issue = issue is None
-        old_assignee = None
-        old_status = None
+        rows.append(
+            {
+                "project_integration_id": project_integration.id,
+                "external_id": external_id,
+                "last_seen_at": now,
+                "updated_at": now.replace(tzinfo=None),
+                "content_hash": content_hash,
+                # Only parsed for rows that are written
+                "description_excerpt": issue_description_excerpt(payload.raw, provider),
+                **values,
+            }
+        )
 
-        if issue is None:
-            issue = ExternalIssue(
-                project_integration_id=project_integration.id,
-                external_id=payload.external_id,
+        # Every written row moves its resolution to today, or drops it once reopened
+        written_at = now.replace(tzinfo=None)
+        if existing is not None and existing.status_category == CLOSED_CATEGORY:
+            resolutions.append(
+                resolution(
+                    project_integration.id,
+                    existing.created_at,
+                    existing.updated_at,
+                    -1,
+                )
             )
-            db.session.add(issue)
-            existing_issues[payload.external_id] = issue
-        else:
-            # Track changes for notifications
-            old_assignee = issue.assignee
-            old_status = issue.status
-            if issue.manually_assigned:
-                # Don't update issues that are manually assigned to this project
-                # (they should stay here but we might still want to update their data)
-                # For now, we DO update the data but preserve the assignment
-                pass
-
-        issue.title = payload.title
-        issue.status = payload.status
-        issue.assignee = payload.assignee
-        issue.url = payload.url
-        issue.labels = payload.labels
-        issue.external_updated_at = payload.external_updated_at
-        issue.last_seen_at = now
-        issue.raw_payload = payload.raw
-        issue.comments = serialize_issue_comments(payload.comments)
-        updated_issues.append(issue)
-
-        # Generate notifications for changes (after flush to ensure issue has ID)
-        # Queue notification events for processing after commit
+        if values["status_category"] == CLOSED_CATEGORY:
+            resolutions.append(
+                resolution(
+                    project_integration.id,
+                    existing.created_at if existing is not None else written_at,
+                    written_at,
+                )
+            )
+
+        # Generate notifications for changes
         # Use assignee_username for notification matching (falls back to assignee if not set)
         notification_username = payload.assignee_username or payload.assignee
-        if is_new_issue:
+        if existing is None:
             # New issue with assignee - notify the assignee
             if notification_username:
-                _queue_assignee_notification(issue, notification_username)
-        else:
-            # Assignee changed
-            if old_assignee != payload.assignee and notification_username:
-                _queue_assignee_notification(issue, notification_username)
-            # Status changed
-            if old_status and old_status != payload.status and payload.assignee:
-                _queue_status_notification(issue, old_status, payload.status)
-
-    project_integration.last_synced_at = now  # type: ignore[assignment]
-    db.session.flush()
-
-    # Process queued notifications after flush
-    _process_notification_queue()
-
-    return updated_issues
+                pending_notifications.append(("assignee", external_id, notification_username))
+            continue
+        # Assignee changed
+        if existing.assignee != payload.assignee and notification_username:
+            pending_notifications.append(("assignee", external_id, notification_username))
+        # Status changed
+        if existing.status and existing.status != payload.status and payload.assignee:
+            pending_notifications.append(
+                ("status", external_id, existing.status, payload.status)
+            )
 
+    written = _write_issue_rows(rows, {key: row.id for key, row in stored.items()})
+    _refresh_cached_issues(rows, written)
+    if resolutions and rollups_enabled():
+        record_resolutions(db.session.connection(), resolutions)
+    known_comment_ids = replace_issue_comments(
+        db.session.connection(),
+        {written[row["external_id"]]: row["comments"] for row in rows},
+    )
+    notifications.extend(
+        (kind, written[external_id], *details)
+        for kind, external_id, *details in pending_notifications
+    )
+    # New comments on issues we already had may mention local users
+    for row in rows:
+        if row["external_id"] not in stored:
+            continue
+        known = known_comment_ids.get(written[row["external_id"]], set())
+        for comment in row["comments"]:
+            comment_id = comment.get("id")
+            if comment_id is None or str(comment_id) in known:
+                continue
+            notifications.append(
+                (
+                    "mention",
+                    written[row["external_id"]],
+                    comment.get("author"),
+                    comment.get("body") or "",
+                )
+            )
+    return unchanged + [
+        SyncedIssue(written[row["external_id"]], row["external_id"]) for row in rows
+    ]
 
-# Notification queue for batch processing
-_notification_queue: List[tuple] = []
 
+def _write_issue_rows(
+    rows: List[Dict[str, Any]], stored_ids: Dict[str, int]
+) -> Dict[str, int]:
+    """Bulk upsert rows on ``uq_external_issue_identifier``; return external_id -> id."""
+    if not rows:
+        return {}
+    table = ExternalIssue.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect in {"sqlite", "postgresql"}:
+        from sqlalchemy.dialects import postgresql, sqlite
 
-def _queue_assignee_notification(issue: ExternalIssue, assignee: str) -> None:
-    """Queue an assignee notification for later processing."""
-    _notification_queue.append(("assignee", issue, assignee))
+        dialect_insert: Callable[..., Any] = (
+            sqlite.insert if dialect == "sqlite" else postgresql.insert
+        )
+        statement = dialect_insert(table)
+        upsert = statement.on_conflict_do_update(
+            index_elements=[table.c.project_integration_id, table.c.external_id],
+            set_={
+                column: statement.excluded[column]
+                for column in _WRITTEN_COLUMNS
+            },
+        ).returning(table.c.id, table.c.external_id)
+        result = db.session.execute(upsert, rows)
+        return {row.external_id: row.id for row in result}
+
+    # Portable fallback: bulk UPDATE by primary key, bulk INSERT for new rows
+    updates = [
+        {"id": stored_ids[row["external_id"]], **row}
+        for row in rows
+        if row["external_id"] in stored_ids
+    ]
+    inserts = [row for row in rows if row["external_id"] not in stored_ids]
+    if updates:
+        db.session.execute(update(ExternalIssue), updates)
+    if inserts:
+        db.session.execute(insert(ExternalIssue), inserts)
+    written = dict(stored_ids)
+    if inserts:
+        written.update(
+            db.session.execute(
+                select(table.c.external_id, table.c.id).where(
+                    table.c.project_integration_id == rows[0]["project_integration_id"],
+                    table.c.external_id.in_([row["external_id"] for row in inserts]),
+                )
+            ).tuples()
+        )
+    return written
 
 
-def _queue_status_notification(
-    issue: ExternalIssue, old_status: str, new_status: str
+def _refresh_cached_issues(
+    rows: List[Dict[str, Any]], written: Dict[str, int]
 ) -> None:
-    """Queue a status change notification for later processing."""
-    _notification_queue.append(("status", issue, old_status, new_status))
+    """Copy bulk-written values onto ORM instances already loaded in the session."""
+    if not rows:
+        return
+    rows_by_id = {written[row["external_id"]]: row for row in rows}
+    for instance in list(db.session.identity_map.values()):
+        if isinstance(instance, ExternalIssue) and instance.id in rows_by_id:
+            row = rows_by_id[instance.id]
+            for column in _WRITTEN_COLUMNS:
+                set_committed_value(instance, column, row[column])
 
 
-def _process_notification_queue() -> None:
-    """Process all queued notifications."""
-    global _notification_queue
-    if not _notification_queue:
-        return
+def _send_issue_notifications(notifications: List[tuple]) -> None:
+    """Generate the assignment, status and mention notifications collected during a sync.
 
+    Items are ``(kind, issue_id, *details)``; issues are loaded without their JSON
+    columns and handed to the batched notification writer.
+    """
+    if not notifications:
+        return
     try:
-        from ..notification_generator import (
-            notify_issue_assigned,
-            notify_issue_status_changed,
+        from ..notification_generator import notify_issue_changes
+
+        issue_ids = list({item[1] for item in notifications})
+        issues_by_id: Dict[int, ExternalIssue] = {}
+        for offset in range(0, len(issue_ids), UPSERT_CHUNK_SIZE):
+            chunk = issue_ids[offset : offset + UPSERT_CHUNK_SIZE]
+            issues_by_id.update(
+                (issue.id, issue)
+                for issue in ExternalIssue.query.options(
+                    load_only(
+                        ExternalIssue.id,
+                        ExternalIssue.project_integration_id,
+                        ExternalIssue.external_id,
+                        ExternalIssue.title,
+                        ExternalIssue.assignee,
+                    )
+                ).filter(ExternalIssue.id.in_(chunk))
+            )
+        notify_issue_changes(
+            (kind, issues_by_id[issue_id], *details)
+            for kind, issue_id, *details in notifications
+            if issue_id in issues_by_id
         )
-
-        for item in _notification_queue:
-            try:
-                if item[0] == "assignee":
-                    _, issue, assignee = item
-                    notify_issue_assigned(issue, assignee)
-                elif item[0] == "status":
-                    _, issue, old_status, new_status = item
-                    notify_issue_status_changed(issue, old_status, new_status)
-            except Exception as exc:  # noqa: BLE001
-                current_app.logger.warning(
-                    "Failed to generate notification: %s", exc
-                )
-    finally:
-        _notification_queue = []
+    except Exception as exc:  # noqa: BLE001
+        current_app.logger.warning("Failed to generate notifications: %s", exc)
 
 
 def close_issue_for_project_integration(
@@ -368,7 +758,7 @@ def sync_tenant_integrations(
     tenant_integrations: Iterable[ProjectIntegration],
     *,
     force_full: bool = False,
-) -> Dict[int, List[ExternalIssue]]:
+) -> Dict[int, List[SyncedIssue]]:
     """Sync issues from multiple project integrations.
 
     Gracefully handles failures from individual integrations - if one integration
@@ -382,7 +772,7 @@ def sync_tenant_integrations(
         Dict mapping project_integration_id to synced issues for successful syncs.
         Failed integrations are logged but not included in results.
     """
-    results: Dict[int, List[ExternalIssue]] = {}
+    results: Dict[int, List[SyncedIssue]] = {}
     failed_integrations: List[tuple[int, str, str]] = []
 
     for p_integration in tenant_integrations:
@@ -0,0 +1,265 @@
+"""Asynchronous fan-out of provider GET requests.
+
+python-gitlab, PyGithub and the JIRA client are synchronous, so a sync that needs one
+request per listing page or per issue's comments used to hold a worker thread per
+in-flight request. :class:`AsyncFetcher` runs those requests on an asyncio event loop
+instead: one ``httpx.AsyncClient`` per integration keeps its keep-alive connections
+open, and a semaphore caps how many requests are in flight at once
+(``ISSUE_SYNC_FETCH_CONCURRENCY`` or the integration's ``fetch_concurrency`` setting).
+
+Flask code stays synchronous. Each fetcher owns a daemon thread running its loop, and
+:meth:`AsyncFetcher.get_many` / :meth:`AsyncFetcher.get_pages` submit work to it and
+block until the batch is done, so they can be called from request handlers, scheduler
+jobs and sync worker threads alike. Fetchers are pooled like the provider clients
+(see ``client_pool.py``), so all pages and projects of an integration reuse the same
+connections.
+
+Every request still takes a token from the integration's rate-limit governor and
+throttled responses are retried, exactly as for the synchronous clients.
+
+The async path is opt-in through ``ISSUE_SYNC_ASYNC_FETCH`` or the integration's
+``async_fetch`` setting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence
+
+import httpx
+from flask import current_app, has_app_context
+
+from .client_pool import get_client, is_pooled
+from .rate_limit import (
+    DEFAULT_MAX_WAIT_SECONDS,
+    THROTTLE_RETRIES,
+    RateLimitGovernor,
+    _config_value,
+    get_governor,
+)
+from .utils import get_timeout
+
+DEFAULT_FETCH_CONCURRENCY = 16
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class FetchRequest:
+    """A GET request; ``url`` may be relative to the fetcher's ``base_url``."""
+
+    url: str
+    params: Optional[dict[str, Any]] = None
+    key: Any = None
+
+
+@dataclass
+class FetchResult:
+    """Decoded JSON body (or the error) of one :class:`FetchRequest`."""
+
+    request: FetchRequest
+    status_code: Optional[int] = None
+    data: Any = None
+    headers: Mapping[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class AsyncFetcher:
+    """Shared async HTTP client for one integration, driven from synchronous code."""
+
+    def __init__(
+        self,
+        base_url: str = "",
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        auth: Optional[tuple[str, str]] = None,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        governor: Optional[RateLimitGovernor] = None,
+        max_wait: float = DEFAULT_MAX_WAIT_SECONDS,
+    ) -> None:
+        self.concurrency = max(1, int(concurrency))
+        self.governor = governor
+        self.max_wait = max_wait
+        self._client_kwargs: dict[str, Any] = {
+            "base_url": base_url,
+            "headers": dict(headers or {}),
+            "auth": auth,
+            "timeout": timeout,
+            "limits": httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+        }
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="issue-fetch-loop", daemon=True
+        )
+        self._thread.start()
+        self._client: httpx.AsyncClient = self._run(self._open())
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._closed = False
+
+    async def _open(self) -> httpx.AsyncClient:
+        # Created on the loop thread so its connection pool belongs to that loop
+        return httpx.AsyncClient(**self._client_kwargs)
+
+    def _run(self, coroutine: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def get_many(self, requests: Sequence[FetchRequest]) -> list[FetchResult]:
+        """Send every request concurrently and return the results in input order."""
+        if not requests:
+            return []
+        return self._run(self._gather(requests))
+
+    def get_pages(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        *,
+        total_pages_header: str = "X-Total-Pages",
+        next_page_header: str = "X-Next-Page",
+    ) -> list[FetchResult]:
+        """Fetch every page of a page-numbered listing.
+
+        The first page reports the page count, so the remaining pages are requested
+        concurrently. Listings that omit the count (GitLab stops sending it past
+        10,000 results) are followed page by page instead.
+        """
+        first = self.get_many([FetchRequest(url, {**(params or {}), "page": 1}, key=1)])[0]
+        results = [first]
+        if not first.ok:
+            return results
+        total = _int_header(first.headers, total_pages_header)
+        if total is not None:
+            results.extend(
+                self.get_many(
+                    [
+                        FetchRequest(url, {**(params or {}), "page": page}, key=page)
+                        for page in range(2, total + 1)
+                    ]
+                )
+            )
+            return results
+        next_page = _int_header(first.headers, next_page_header)
+        while next_page:
+            result = self.get_many(
+                [FetchRequest(url, {**(params or {}), "page": next_page}, key=next_page)]
+            )[0]
+            results.append(result)
+            if not result.ok:
+                break
+            next_page = _int_header(result.headers, next_page_header)
+        return results
+
+    async def _gather(self, requests: Sequence[FetchRequest]) -> list[FetchResult]:
+        return list(await asyncio.gather(*(self._fetch(request) for request in requests)))
+
+    async def _fetch(self, request: FetchRequest) -> FetchResult:
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                if self.governor is not None:
+                    await self.governor.acquire_async(self.max_wait)
+                try:
+                    response = await self._client.get(request.url, params=request.params)
+                except httpx.HTTPError as exc:
+                    return FetchResult(
+                        request, error=str(exc) or f"Unknown error: {type(exc).__name__}"
+                    )
+                throttled = self.governor is not None and self.governor.observe(
+                    response.status_code, response.headers
+                )
+                if not throttled or attempt >= THROTTLE_RETRIES:
+                    break
+                attempt += 1
+
+        result = FetchResult(request, response.status_code, headers=response.headers)
+        if response.is_error:
+            result.error = f"HTTP {response.status_code}"
+            return result
+        try:
+            result.data = response.json()
+        except ValueError:
+            result.error = "Response was not valid JSON"
+        return result
+
+    def close(self) -> None:
+        """Close the connections and stop the event loop thread."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._run(self._client.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name) or 0) or None
+    except (TypeError, ValueError):
+        return None
+
+
+def async_fetch_enabled(integration: Any) -> bool:
+    """Return True when ``integration`` should use the async fetch layer."""
+    settings = getattr(integration, "settings", None) or {}
+    if "async_fetch" in settings:
+        return bool(settings.get("async_fetch"))
+    return has_app_context() and bool(current_app.config.get("ISSUE_SYNC_ASYNC_FETCH"))
+
+
+def fetch_concurrency(integration: Any) -> int:
+    """Return the in-flight request cap for an integration's async fetcher."""
+    default = DEFAULT_FETCH_CONCURRENCY
+    if has_app_context():
+        default = current_app.config.get("ISSUE_SYNC_FETCH_CONCURRENCY") or default
+    settings = getattr(integration, "settings", None) or {}
+    try:
+        return max(1, int(settings.get("fetch_concurrency") or default))
+    except (TypeError, ValueError):
+        return max(1, int(default))
+
+
+def build_fetcher(
+    integration: Any,
+    base_url: str,
+    *,
+    headers: Optional[Mapping[str, str]] = None,
+    auth: Optional[tuple[str, str]] = None,
+) -> AsyncFetcher:
+    """Build a fetcher paced by the integration's governor and timeout settings."""
+    return AsyncFetcher(
+        base_url,
+        headers=headers,
+        auth=auth,
+        concurrency=fetch_concurrency(integration),
+        timeout=get_timeout(integration),
+        governor=get_governor(integration),
+        max_wait=_config_value(
+            "ISSUE_SYNC_RATE_LIMIT_MAX_WAIT", DEFAULT_MAX_WAIT_SECONDS
+        ),
+    )
+
+
+@contextmanager
+def open_fetcher(
+    integration: Any, factory: Callable[[Any], AsyncFetcher]
+) -> Iterator[AsyncFetcher]:
+    """Yield the pooled fetcher for ``integration``, closing it if pooling is off."""
+    fetcher = get_client(integration, factory)
+    try:
+        yield fetcher
+    finally:
+        if not is_pooled():
+            fetcher.close()
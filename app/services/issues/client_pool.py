@@ -0,0 +1,191 @@
+"""Shared provider clients for issue sync.
+
+Building a PyGithub, python-gitlab or JIRA client costs a TLS handshake and usually an
+authentication round trip, and every fetch used to build its own. Fetchers now ask
+:func:`get_client` instead, which keeps one client per effective set of credentials
+(integration, base URL, token and the settings that shape the client) so all projects
+of a GitLab instance or Jira site reuse the same connection pool.
+
+Clients live in ``app.extensions`` and are dropped after ``ISSUE_SYNC_CLIENT_TTL``
+seconds without use. Changing a token or base URL yields a different key, so stale
+clients are never handed out; :func:`invalidate_clients` drops them eagerly when an
+integration is edited or removed. Outside an app context nothing is cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar
+
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_CLIENT_TTL_SECONDS = 600
+_EXTENSION_KEY = "issue_client_pool"
+
+
+def credentials_fingerprint(integration: Any) -> str:
+    """Return a digest of the credentials and settings a client is built from.
+
+    Tokens are hashed so they never appear in pool keys or logs.
+    """
+    material = json.dumps(
+        {
+            "provider": getattr(integration, "provider", None),
+            "base_url": getattr(integration, "base_url", None),
+            "api_token": getattr(integration, "api_token", None),
+            "settings": getattr(integration, "settings", None) or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _close_client(client: Any) -> None:
+    """Close a client's HTTP session on a best-effort basis."""
+    closer = getattr(client, "close", None)
+    if closer is None:
+        session = getattr(client, "session", None) or getattr(client, "_session", None)
+        closer = getattr(session, "close", None)
+    if callable(closer):
+        try:
+            closer()
+        except Exception:  # noqa: BLE001 - best effort cleanup
+            logger.debug("Failed to close pooled client %r", client, exc_info=True)
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    integration_id: Optional[int]
+    created_at: float
+    last_used: float
+    hits: int = 0
+
+
+@dataclass
+class ClientPool:
+    """TTL cache of provider clients keyed by factory and credentials fingerprint."""
+
+    ttl: float = DEFAULT_CLIENT_TTL_SECONDS
+    _entries: dict[tuple, _PooledClient] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _build_locks: dict[tuple, threading.Lock] = field(default_factory=dict)
+
+    def get(self, integration: Any, factory: Callable[[Any], T]) -> T:
+        key = (factory, getattr(integration, "id", None), credentials_fingerprint(integration))
+        now = time.monotonic()
+        with self._lock:
+            expired = self._evict_expired(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.last_used = now
+                entry.hits += 1
+                client = entry.client
+            else:
+                build_lock = self._build_locks.setdefault(key, threading.Lock())
+        for stale in expired:
+            _close_client(stale)
+        if entry is not None:
+            return client
+
+        # Sync threads missing on the same key wait for one build instead of each
+        # opening their own connection
+        with build_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.last_used = time.monotonic()
+                    return entry.client
+            client = factory(integration)
+            with self._lock:
+                self._entries[key] = _PooledClient(
+                    client=client,
+                    integration_id=getattr(integration, "id", None),
+                    created_at=now,
+                    last_used=time.monotonic(),
+                )
+                self._build_locks.pop(key, None)
+        return client
+
+    def _evict_expired(self, now: float) -> list[Any]:
+        expired = [
+            key for key, entry in self._entries.items() if now - entry.last_used > self.ttl
+        ]
+        return [self._entries.pop(key).client for key in expired]
+
+    def invalidate(self, integration_id: Optional[int] = None) -> int:
+        """Drop the clients of one integration, or every client; return the count."""
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if integration_id is None or entry.integration_id == integration_id
+            ]
+            dropped = [self._entries.pop(key).client for key in keys]
+        for client in dropped:
+            _close_client(client)
+        return len(dropped)
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "clients": len(self._entries),
+                "ttl_seconds": self.ttl,
+                "hits": sum(entry.hits for entry in self._entries.values()),
+                "oldest_age_seconds": round(
+                    max((now - e.created_at for e in self._entries.values()), default=0.0), 1
+                ),
+            }
+
+
+def _get_pool() -> Optional[ClientPool]:
+    if not has_app_context():
+        return None
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    pool = app.extensions.get(_EXTENSION_KEY)
+    if pool is None:
+        ttl = app.config.get("ISSUE_SYNC_CLIENT_TTL", DEFAULT_CLIENT_TTL_SECONDS)
+        pool = app.extensions.setdefault(
+            _EXTENSION_KEY, ClientPool(ttl=float(ttl or 0))
+        )
+    return pool
+
+
+def get_client(integration: Any, factory: Callable[[Any], T]) -> T:
+    """Return a shared client built by ``factory(integration)``.
+
+    A TTL of 0 (``ISSUE_SYNC_CLIENT_TTL=0``) disables pooling.
+    """
+    pool = _get_pool()
+    if pool is None or pool.ttl <= 0:
+        return factory(integration)
+    return pool.get(integration, factory)
+
+
+def is_pooled() -> bool:
+    """Return True when clients handed out by :func:`get_client` are shared."""
+    pool = _get_pool()
+    return pool is not None and pool.ttl > 0
+
+
+def invalidate_clients(integration_id: Optional[int] = None) -> int:
+    """Drop pooled clients after an integration's credentials changed or it was removed."""
+    pool = _get_pool()
+    return pool.invalidate(integration_id) if pool is not None else 0
+
+
+def client_pool_status() -> dict[str, Any]:
+    """Return pool size and hit counts for status endpoints."""
+    pool = _get_pool()
+    return pool.stats() if pool is not None else {"clients": 0}
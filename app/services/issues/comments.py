@@ -0,0 +1,139 @@
+"""Keep the ``issue_comments`` table in step with ``ExternalIssue.comments``.
+
+Each issue's comments are stored twice: as the JSON list on the issue, which detail
+views and agent context read in one go, and as ``issue_comments`` rows, which let the
+communications feed, author lists and pinned comments use indexed queries.
+
+Issue sync writes issues with bulk statements that bypass ORM events, so it calls
+:func:`replace_issue_comments` itself for the issues it changed. Every other write
+goes through the ORM and is mirrored by the mapper hooks at the bottom of this module.
+"""
+
+from __future__ import annotations
+
+from datetime import timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, insert, inspect, select
+from sqlalchemy.engine import Connection
+
+from ...models import ExternalIssue, IssueComment
+from .utils import parse_datetime
+
+# Bind-parameter friendly chunk size for issue_id IN (...) statements
+_CHUNK_SIZE = 500
+_COMMENT_ID_LENGTH = IssueComment.external_id.property.columns[0].type.length
+_AUTHOR_LENGTH = IssueComment.author.property.columns[0].type.length
+_URL_LENGTH = IssueComment.url.property.columns[0].type.length
+
+
+def _truncate(value: Any, length: int) -> Optional[str]:
+    if value is None:
+        return None
+    return str(value)[:length]
+
+
+def comment_rows(issue_id: int, comments: Optional[Iterable[Any]]) -> List[Dict[str, Any]]:
+    """Build ``issue_comments`` rows from an issue's serialized comment list."""
+    rows: List[Dict[str, Any]] = []
+    for position, comment in enumerate(comments or []):
+        if not isinstance(comment, Mapping):
+            continue
+        created_at = parse_datetime(comment.get("created_at"))
+        rows.append(
+            {
+                "issue_id": issue_id,
+                "external_id": _truncate(comment.get("id"), _COMMENT_ID_LENGTH),
+                "position": position,
+                "author": _truncate(comment.get("author"), _AUTHOR_LENGTH),
+                "body": comment.get("body") or "",
+                "body_html": comment.get("body_html"),
+                "url": _truncate(comment.get("url"), _URL_LENGTH),
+                "created_at": (
+                    created_at.astimezone(timezone.utc).replace(tzinfo=None)
+                    if created_at
+                    else None
+                ),
+            }
+        )
+    return rows
+
+
+def _chunks(values: Iterable[int]) -> Iterable[List[int]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, _CHUNK_SIZE)):
+        yield chunk
+
+
+def replace_issue_comments(
+    connection: Connection,
+    comments_by_issue: Mapping[int, Optional[Iterable[Any]]],
+) -> Dict[int, Set[str]]:
+    """Replace the stored comment rows of each issue with its serialized comments.
+
+    Returns the provider comment IDs each issue had before, so callers can tell
+    which comments are new.
+    """
+    if not comments_by_issue:
+        return {}
+    table = IssueComment.__table__
+    previous: Dict[int, Set[str]] = {issue_id: set() for issue_id in comments_by_issue}
+    for chunk in _chunks(comments_by_issue):
+        for issue_id, external_id in connection.execute(
+            select(table.c.issue_id, table.c.external_id).where(
+                table.c.issue_id.in_(chunk),
+                table.c.external_id.is_not(None),
+            )
+        ):
+            previous[issue_id].add(external_id)
+        connection.execute(delete(table).where(table.c.issue_id.in_(chunk)))
+
+    rows = [
+        row
+        for issue_id, comments in comments_by_issue.items()
+        for row in comment_rows(issue_id, comments)
+    ]
+    if rows:
+        connection.execute(insert(table), rows)
+    return previous
+
+
+def find_issue_comments(
+    keys: Iterable[Tuple[int, str]],
+) -> Dict[Tuple[int, str], Dict[str, Any]]:
+    """Look up comments by ``(issue_id, provider comment ID)`` in one query.
+
+    Returns the comments that exist in the ``ExternalIssue.comments`` JSON shape.
+    """
+    wanted = {(issue_id, str(comment_id)) for issue_id, comment_id in keys}
+    if not wanted:
+        return {}
+    rows = IssueComment.query.filter(
+        IssueComment.issue_id.in_({issue_id for issue_id, _ in wanted}),
+        IssueComment.external_id.in_({comment_id for _, comment_id in wanted}),
+    )
+    return {
+        (row.issue_id, row.external_id): row.to_dict()
+        for row in rows
+        if (row.issue_id, row.external_id) in wanted
+    }
+
+
+@event.listens_for(ExternalIssue, "after_insert")
+def _insert_issue_comments(mapper, connection: Connection, target: ExternalIssue) -> None:
+    if target.comments:
+        replace_issue_comments(connection, {target.id: target.comments})
+
+
+@event.listens_for(ExternalIssue, "after_update")
+def _update_issue_comments(mapper, connection: Connection, target: ExternalIssue) -> None:
+    if inspect(target).attrs.comments.history.has_changes():
+        replace_issue_comments(connection, {target.id: target.comments})
+
+
+@event.listens_for(ExternalIssue, "after_delete")
+def _delete_issue_comments(mapper, connection: Connection, target: ExternalIssue) -> None:
+    # SQLite does not enforce the ON DELETE CASCADE of issue_comments.issue_id
+    table = IssueComment.__table__
+    connection.execute(delete(table).where(table.c.issue_id == target.id))
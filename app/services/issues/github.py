@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
+
+import requests
 
 from ...models import ProjectIntegration
 from . import (
@@ -10,7 +13,10 @@ from . import (
     IssuePayload,
     IssueSyncError,
 )
-from .utils import ensure_base_url
+from .client_pool import get_client, is_pooled
+from .http_cache import probe_unchanged
+from .rate_limit import get_governor, govern_session
+from .utils import ensure_base_url, get_timeout, parse_datetime
 
 try:  # pragma: no cover - import guard for optional dependency
     from github.GithubException import GithubException as GithubAPIException
@@ -21,6 +27,53 @@ except Exception:  # pragma: no cover - fallback stub for type checking
         pass
 
 MAX_COMMENTS_PER_ISSUE = 20
+# Issues per GraphQL page; each issue also carries up to MAX_COMMENTS_PER_ISSUE comments
+GRAPHQL_PAGE_SIZE = 50
+
+# One round trip per page returns issues with labels, assignees and recent comments.
+# repository.issues never includes pull requests, so no client-side filtering is needed.
+ISSUES_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $cursor: String, $since: DateTime,
+      $pageSize: Int!, $commentCount: Int!) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $pageSize, after: $cursor, filterBy: {since: $since},
+           orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId
+        number
+        title
+        body
+        bodyHTML
+        state
+        url
+        createdAt
+        updatedAt
+        closedAt
+        author { login }
+        labels(first: 50) { nodes { name } }
+        assignees(first: 10) { nodes { login name } }
+        comments(last: $commentCount) {
+          totalCount
+          nodes { databaseId body bodyHTML createdAt url author { login } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Reconciliation only needs issue numbers, so pages can be as large as GitHub allows
+ISSUE_IDS_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { number }
+    }
+  }
+}
+"""
 
 
 def _resolve_milestone_number(repo: Any, reference: str | None) -> int | None:
@@ -98,7 +151,11 @@ def fetch_issues(
             "GitHub project integration requires an owner/repo identifier."
         )
 
-    client = _build_client(integration)
+    client = get_client(integration, _build_client)
+    governor = get_governor(integration)
+    # PyGithub paces and retries its own requests; the governor only holds the fetch
+    # back while the integration is throttled and records the budget afterwards
+    governor.acquire()
     try:
         repo = client.get_repo(repo_path)
         # Build kwargs for get_issues - only include 'since' if provided
@@ -122,9 +179,329 @@ def fetch_issues(
         if issue.pull_request is not None:
             continue
         payloads.append(_issue_to_payload(issue))
+    _record_client_budget(governor, client)
     return payloads
 
 
+def _record_client_budget(governor: Any, client: Any) -> None:
+    requester = getattr(client, "requester", None)
+    remaining, limit = getattr(requester, "rate_limiting", (-1, -1))
+    reset_at = getattr(requester, "rate_limiting_resettime", None)
+    if remaining >= 0:
+        governor.record_budget(remaining, limit, reset_at)
+
+
+class GraphQLUnavailableError(IssueSyncError):
+    """Raised when the GraphQL endpoint cannot serve the request and REST should be used."""
+
+
+def fetch_issues_graphql(
+    integration: Any,  # TenantIntegration or IntegrationLike
+    project_integration: ProjectIntegration,
+    since: Optional[datetime] = None,
+) -> List[IssuePayload]:
+    payloads: List[IssuePayload] = []
+    for page in iter_issue_pages(integration, project_integration, since):
+        payloads.extend(page)
+    return payloads
+
+
+def iter_issue_pages(
+    integration: Any,  # TenantIntegration or IntegrationLike
+    project_integration: ProjectIntegration,
+    since: Optional[datetime] = None,
+) -> Iterator[List[IssuePayload]]:
+    """Yield issue pages from the GraphQL API, falling back to the REST fetcher.
+
+    The REST path is used when the integration sets ``use_graphql: false`` or when the
+    GraphQL endpoint is unavailable before the first page (e.g. older GitHub Enterprise).
+    """
+    if _issues_unchanged(integration, project_integration, since):
+        return
+
+    settings = getattr(integration, "settings", None) or {}
+    if settings.get("use_graphql") is False:
+        yield fetch_issues(integration, project_integration, since)
+        return
+
+    pages = _iter_graphql_pages(integration, project_integration, since)
+    try:
+        first_page = next(pages)
+    except StopIteration:
+        return
+    except GraphQLUnavailableError:
+        yield fetch_issues(integration, project_integration, since)
+        return
+
+    yield first_page
+    yield from pages
+
+
+def _issues_unchanged(
+    integration: Any, project_integration: ProjectIntegration, since: Optional[datetime]
+) -> bool:
+    """Probe the most recently updated issue with a conditional request."""
+    repo_path = project_integration.external_identifier
+    if not repo_path:
+        return False
+    endpoint = ensure_base_url(integration, "https://api.github.com")
+    url = (
+        f"{endpoint}/repos/{repo_path}/issues"
+        "?state=all&sort=updated&direction=desc&per_page=1"
+    )
+    return probe_unchanged(
+        integration,
+        project_integration,
+        url,
+        headers={
+            "Authorization": f"token {integration.api_token}",
+            "Accept": "application/vnd.github+json",
+        },
+        since=since,
+    )
+
+
+def _graphql_endpoint(integration: Any) -> str:
+    endpoint = ensure_base_url(integration, "https://api.github.com")
+    # GitHub Enterprise serves REST under /api/v3 and GraphQL under /api/graphql
+    if endpoint.endswith("/api/v3"):
+        return endpoint[: -len("/v3")] + "/graphql"
+    return f"{endpoint}/graphql"
+
+
+def _iter_graphql_pages(
+    integration: Any,
+    project_integration: ProjectIntegration,
+    since: Optional[datetime],
+) -> Iterator[List[IssuePayload]]:
+    repo_path = project_integration.external_identifier
+    if not repo_path or "/" not in repo_path:
+        raise IssueSyncError(
+            "GitHub project integration requires an owner/repo identifier."
+        )
+    owner, name = repo_path.split("/", 1)
+
+    variables: dict[str, Any] = {
+        "owner": owner,
+        "name": name,
+        "cursor": None,
+        "since": None,
+        "pageSize": GRAPHQL_PAGE_SIZE,
+        "commentCount": MAX_COMMENTS_PER_ISSUE,
+    }
+    if since:
+        since_value = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+        variables["since"] = since_value.astimezone(timezone.utc).isoformat()
+
+    endpoint = _graphql_endpoint(integration)
+    timeout = get_timeout(integration)
+    session = get_client(integration, _build_graphql_session)
+    # A pooled session stays open for the next repository on the same credentials
+    with nullcontext(session) if is_pooled() else session:
+        while True:
+            data = _graphql_request(session, endpoint, variables, timeout)
+            repository = data.get("repository")
+            if not isinstance(repository, dict):
+                raise IssueSyncError(f"GitHub repository '{repo_path}' not found.")
+            connection = repository.get("issues") or {}
+            nodes = connection.get("nodes") or []
+            yield [_graphql_node_to_payload(node) for node in nodes if node]
+
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                return
+            variables["cursor"] = page_info["endCursor"]
+
+
+def list_issue_ids(
+    integration: Any,  # TenantIntegration or IntegrationLike
+    project_integration: ProjectIntegration,
+) -> List[str]:
+    """Return the number of every issue in the repository, without bodies or comments.
+
+    Falls back to the REST listing when GraphQL is disabled or unavailable.
+    """
+    repo_path = project_integration.external_identifier
+    if not repo_path or "/" not in repo_path:
+        raise IssueSyncError(
+            "GitHub project integration requires an owner/repo identifier."
+        )
+    settings = getattr(integration, "settings", None) or {}
+    if settings.get("use_graphql") is not False:
+        try:
+            return _list_issue_ids_graphql(integration, repo_path)
+        except GraphQLUnavailableError:
+            pass
+
+    client = get_client(integration, _build_client)
+    get_governor(integration).acquire()
+    try:
+        issues = client.get_repo(repo_path).get_issues(state="all")
+        numbers = [
+            str(issue.number) for issue in issues if issue.pull_request is None
+        ]
+    except GithubAPIException as exc:
+        raise IssueSyncError(_format_github_error(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        error_msg = str(exc) or f"Unknown error: {type(exc).__name__}"
+        raise IssueSyncError(error_msg) from exc
+    return numbers
+
+
+def _list_issue_ids_graphql(integration: Any, repo_path: str) -> List[str]:
+    owner, name = repo_path.split("/", 1)
+    variables: dict[str, Any] = {"owner": owner, "name": name, "cursor": None}
+    endpoint = _graphql_endpoint(integration)
+    timeout = get_timeout(integration)
+    numbers: List[str] = []
+    session = get_client(integration, _build_graphql_session)
+    with nullcontext(session) if is_pooled() else session:
+        while True:
+            data = _graphql_request(
+                session, endpoint, variables, timeout, query=ISSUE_IDS_GRAPHQL_QUERY
+            )
+            repository = data.get("repository")
+            if not isinstance(repository, dict):
+                raise IssueSyncError(f"GitHub repository '{repo_path}' not found.")
+            connection = repository.get("issues") or {}
+            numbers.extend(
+                str(node["number"])
+                for node in connection.get("nodes") or []
+                if node and node.get("number") is not None
+            )
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                return numbers
+            variables["cursor"] = page_info["endCursor"]
+
+
+def _build_graphql_session(integration: Any) -> requests.Session:
+    session = govern_session(requests.Session(), integration)
+    session.headers.update(
+        {
+            "Authorization": f"bearer {integration.api_token}",
+            "Accept": "application/json",
+        }
+    )
+    return session
+
+
+def _graphql_request(
+    session: Any,
+    endpoint: str,
+    variables: dict[str, Any],
+    timeout: float,
+    query: str = ISSUES_GRAPHQL_QUERY,
+) -> dict[str, Any]:
+    try:
+        response = session.post(
+            endpoint,
+            json={"query": query, "variables": variables},
+            timeout=timeout,
+        )
+    except requests.RequestException as exc:
+        raise GraphQLUnavailableError(f"GitHub GraphQL request failed: {exc}") from exc
+
+    if response.status_code in (401, 403):
+        raise IssueSyncError(f"GitHub API error {response.status_code}")
+    if response.status_code != 200:
+        raise GraphQLUnavailableError(
+            f"GitHub GraphQL endpoint returned {response.status_code}"
+        )
+    try:
+        body = response.json()
+    except ValueError as exc:
+        raise GraphQLUnavailableError("GitHub GraphQL returned invalid JSON") from exc
+
+    errors = body.get("errors") if isinstance(body, dict) else None
+    if errors:
+        messages = "; ".join(
+            str(error.get("message")) for error in errors if isinstance(error, dict)
+        )
+        raise IssueSyncError(f"GitHub GraphQL error: {messages or errors}")
+    data = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(data, dict):
+        raise GraphQLUnavailableError("GitHub GraphQL response missing data")
+    return data
+
+
+def _graphql_node_to_payload(node: dict[str, Any]) -> IssuePayload:
+    number = node.get("number")
+    if number is None:
+        raise IssueSyncError("GitHub issue payload missing identifier.")
+    from .utils import normalize_assignee_name
+
+    labels = [
+        str(label.get("name"))
+        for label in (node.get("labels") or {}).get("nodes") or []
+        if label and label.get("name")
+    ]
+    assignees = [
+        assignee
+        for assignee in (node.get("assignees") or {}).get("nodes") or []
+        if assignee
+    ]
+    primary = assignees[0] if assignees else None
+    assignee_username = primary.get("login") if primary else None
+    assignee_display = (
+        normalize_assignee_name(primary.get("name") or assignee_username)
+        if primary
+        else None
+    )
+
+    comments: List[IssueCommentPayload] = []
+    comment_block = node.get("comments") or {}
+    # GraphQL returns the last N comments oldest-first; store newest-first like REST
+    for comment in reversed(comment_block.get("nodes") or []):
+        if not comment:
+            continue
+        author = (comment.get("author") or {}).get("login")
+        comment_id = comment.get("databaseId")
+        comments.append(
+            IssueCommentPayload(
+                author=str(author) if author else None,
+                body=comment.get("body") or "",
+                created_at=parse_datetime(comment.get("createdAt")),
+                url=comment.get("url"),
+                id=str(comment_id) if comment_id else None,
+                body_html=comment.get("bodyHTML") or None,
+            )
+        )
+
+    state = str(node.get("state") or "").lower() or None
+    # Keep raw payload in REST shape so description/body lookups work unchanged
+    raw_payload = {
+        "id": node.get("databaseId"),
+        "number": number,
+        "title": node.get("title"),
+        "body": node.get("body"),
+        "body_html": node.get("bodyHTML"),
+        "state": state,
+        "html_url": node.get("url"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "closed_at": node.get("closedAt"),
+        "user": {"login": (node.get("author") or {}).get("login")},
+        "labels": [{"name": label} for label in labels],
+        "assignee": {"login": assignee_username} if assignee_username else None,
+        "assignees": [{"login": assignee.get("login")} for assignee in assignees],
+        "comments": comment_block.get("totalCount", len(comments)),
+    }
+
+    return IssuePayload(
+        external_id=str(number),
+        title=node.get("title") or "",
+        status=state,
+        assignee=assignee_display,
+        url=node.get("url"),
+        labels=labels,
+        external_updated_at=parse_datetime(node.get("updatedAt")),
+        raw=raw_payload,
+        comments=comments,
+        assignee_username=str(assignee_username) if assignee_username else None,
+    )
+
+
 def create_issue(
     integration: Any,  # TenantIntegration or IntegrationLike
     project_integration: ProjectIntegration,
@@ -297,6 +674,20 @@ def _resolve_assignee(issue: Any) -> tuple[Optional[str], Optional[str]]:
     return display_name, username
 
 
+def resolve_user_display_name(integration: Any, login: str) -> Optional[str]:
+    """Return the profile name of a GitHub user, as the poller reads it for assignees.
+
+    Webhook deliveries only carry the login. Returns None when the user has no
+    profile name or the lookup fails, so callers fall back to the login.
+    """
+    try:
+        client = get_client(integration, _build_client)
+        name = client.get_user(login).name
+    except (GithubAPIException, IssueSyncError, requests.RequestException):
+        return None
+    return str(name) if name else None
+
+
 def _collect_issue_comments(issue: Any) -> List[IssueCommentPayload]:
     comments: List[IssueCommentPayload] = []
     try:
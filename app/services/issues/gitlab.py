@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Mapping, Optional
+from urllib.parse import quote
 
 from ...models import ProjectIntegration
 from . import (
@@ -9,10 +11,29 @@ from . import (
     IssueCreateRequest,
     IssuePayload,
     IssueSyncError,
+    deserialize_issue_comments,
+)
+from .async_http import (
+    AsyncFetcher,
+    FetchRequest,
+    async_fetch_enabled,
+    build_fetcher,
+    open_fetcher,
+)
+from .client_pool import get_client
+from .http_cache import probe_unchanged
+from .rate_limit import govern_session
+from .utils import (
+    ensure_base_url,
+    get_timeout,
+    load_stored_issue_state,
+    parse_datetime,
+    same_timestamp,
 )
-from .utils import ensure_base_url, get_timeout, parse_datetime
 
 MAX_COMMENTS_PER_ISSUE = 20
+# Parallel notes.list() calls for issues whose comments need refreshing
+DEFAULT_COMMENT_WORKERS = 4
 
 
 def _resolve_gitlab_milestone(project: Any, reference: str | None, gitlab_exc: Any) -> int | None:
@@ -67,6 +88,7 @@ def _build_client(integration: Any, base_url: str | None = None):
             private_token=integration.api_token,
             timeout=get_timeout(integration),
         )
+        govern_session(client.session, integration)
         return client
     except gitlab_exc.GitlabError as exc:  # pragma: no cover - configuration failure
         raise IssueSyncError(f"Unable to configure GitLab client: {exc}") from exc
@@ -82,8 +104,11 @@ def fetch_issues(
         raise IssueSyncError(
             "GitLab project integration requires an external project path."
         )
+    if _issues_unchanged(integration, project_integration, since):
+        return []
 
-    client = _build_client(integration)
+    client = get_client(integration, _build_client)
+    use_async = async_fetch_enabled(integration)
     try:
         from gitlab import exceptions as gitlab_exc
 
@@ -100,7 +125,10 @@ def fetch_issues(
             else:
                 since_value = since.astimezone(timezone.utc)
             list_kwargs["updated_after"] = since_value.isoformat()
-        issues = project.issues.list(**list_kwargs)
+        if use_async:
+            issues = _list_issues_async(integration, project, list_kwargs)
+        else:
+            issues = project.issues.list(**list_kwargs)
     except (gitlab_exc.GitlabAuthenticationError, gitlab_exc.GitlabGetError) as exc:
         status = getattr(exc, "response_code", "unknown")
         raise IssueSyncError(f"GitLab API error: {status}") from exc
@@ -108,11 +136,15 @@ def fetch_issues(
         error_msg = str(exc) or f"Unknown error: {type(exc).__name__}"
         raise IssueSyncError(error_msg) from exc
 
+    issues = [issue for issue in issues if getattr(issue, "iid", None)]
+    stored = load_stored_issue_state(
+        project_integration, [str(issue.iid) for issue in issues]
+    )
+
     payloads: List[IssuePayload] = []
+    needs_comments: List[tuple[Any, IssuePayload]] = []
     for issue in issues:
-        external_id = getattr(issue, "iid", None)
-        if not external_id:
-            continue
+        external_id = issue.iid
 
         # Ensure raw payload includes description
         raw_payload = issue.attributes if hasattr(issue, "attributes") else {}
@@ -123,23 +155,168 @@ def fetch_issues(
                 raw_payload = {**raw_payload, "description": description}
 
         assignee_display, assignee_username = _resolve_assignee(issue)
-        payloads.append(
-            IssuePayload(
-                external_id=str(external_id),
-                title=getattr(issue, "title", "") or "",
-                status=getattr(issue, "state", None),
-                assignee=assignee_display,
-                url=getattr(issue, "web_url", None),
-                labels=[str(label) for label in getattr(issue, "labels", [])],
-                external_updated_at=parse_datetime(getattr(issue, "updated_at", None)),
-                raw=raw_payload,
-                comments=_collect_issue_comments(issue),
-                assignee_username=assignee_username,
-            )
+        payload = IssuePayload(
+            external_id=str(external_id),
+            title=getattr(issue, "title", "") or "",
+            status=getattr(issue, "state", None),
+            assignee=assignee_display,
+            url=getattr(issue, "web_url", None),
+            labels=[str(label) for label in getattr(issue, "labels", [])],
+            external_updated_at=parse_datetime(getattr(issue, "updated_at", None)),
+            raw=raw_payload,
+            assignee_username=assignee_username,
         )
+        payloads.append(payload)
+
+        existing = stored.get(payload.external_id)
+        if existing is not None and _comments_unchanged(existing, issue, payload):
+            payload.comments = deserialize_issue_comments(existing.comments)
+        else:
+            needs_comments.append((issue, payload))
+
+    if use_async:
+        _collect_comments_async(integration, project, needs_comments)
+    else:
+        _collect_comments_concurrently(needs_comments, _comment_workers(integration))
     return payloads
 
 
+def list_issue_ids(
+    integration: Any,  # TenantIntegration or IntegrationLike
+    project_integration: ProjectIntegration,
+) -> List[str]:
+    """Return the IID of every issue in the project.
+
+    GitLab cannot trim the issue representation, but the listing skips notes and
+    streams pages instead of materializing them all.
+    """
+    project_ref = project_integration.external_identifier
+    if not project_ref:
+        raise IssueSyncError(
+            "GitLab project integration requires an external project path."
+        )
+
+    client = get_client(integration, _build_client)
+    try:
+        from gitlab import exceptions as gitlab_exc
+
+        project = client.projects.get(project_ref, lazy=True)
+        issues = project.issues.list(
+            iterator=True, per_page=100, order_by="created_at", sort="asc"
+        )
+        return [str(issue.iid) for issue in issues if getattr(issue, "iid", None)]
+    except (gitlab_exc.GitlabAuthenticationError, gitlab_exc.GitlabListError) as exc:
+        status = getattr(exc, "response_code", "unknown")
+        raise IssueSyncError(f"GitLab API error: {status}") from exc
+    except gitlab_exc.GitlabError as exc:
+        error_msg = str(exc) or f"Unknown error: {type(exc).__name__}"
+        raise IssueSyncError(error_msg) from exc
+
+
+def _issues_unchanged(
+    integration: Any, project_integration: ProjectIntegration, since: Optional[datetime]
+) -> bool:
+    """Probe the most recently updated issue with a conditional request."""
+    endpoint = ensure_base_url(integration, "https://gitlab.com")
+    project_ref = quote(str(project_integration.external_identifier), safe="")
+    url = (
+        f"{endpoint}/api/v4/projects/{project_ref}/issues"
+        "?order_by=updated_at&sort=desc&per_page=1"
+    )
+    return probe_unchanged(
+        integration,
+        project_integration,
+        url,
+        headers={"PRIVATE-TOKEN": integration.api_token},
+        since=since,
+    )
+
+
+def _comments_unchanged(existing: Any, issue: Any, payload: IssuePayload) -> bool:
+    """Return True when neither updated_at nor the user note count has moved."""
+    if not same_timestamp(existing.external_updated_at, payload.external_updated_at):
+        return False
+    current_count = getattr(issue, "user_notes_count", None)
+    stored_raw = existing.raw_payload if isinstance(existing.raw_payload, dict) else {}
+    return current_count is not None and stored_raw.get("user_notes_count") == current_count
+
+
+def _build_async_fetcher(integration: Any) -> AsyncFetcher:
+    return build_fetcher(
+        integration,
+        f"{ensure_base_url(integration, 'https://gitlab.com')}/api/v4",
+        headers={"PRIVATE-TOKEN": integration.api_token},
+    )
+
+
+class _ListedIssue:
+    """Issue from a raw API listing, read like a python-gitlab object."""
+
+    def __init__(self, attributes: dict[str, Any]) -> None:
+        self.attributes = attributes
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.attributes[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _list_issues_async(
+    integration: Any, project: Any, list_kwargs: dict[str, Any]
+) -> List[Any]:
+    """List issues through the async fetcher, requesting all pages concurrently."""
+    params = {key: value for key, value in list_kwargs.items() if key != "all"}
+    url = f"projects/{project.id}/issues"
+    with open_fetcher(integration, _build_async_fetcher) as fetcher:
+        pages = fetcher.get_pages(url, params)
+
+    issues: List[Any] = []
+    for page in pages:
+        if not page.ok or not isinstance(page.data, list):
+            raise IssueSyncError(f"GitLab API error: {page.status_code or page.error}")
+        issues.extend(_ListedIssue(attrs) for attrs in page.data if isinstance(attrs, dict))
+    return issues
+
+
+def _collect_comments_async(
+    integration: Any, project: Any, pending: List[tuple[Any, IssuePayload]]
+) -> None:
+    """Fetch the latest notes of every changed issue in one concurrent batch."""
+    if not pending:
+        return
+    url = f"projects/{project.id}/issues"
+    params = {"order_by": "created_at", "sort": "desc", "per_page": 100}
+    requests = [FetchRequest(f"{url}/{issue.iid}/notes", params) for issue, _ in pending]
+    with open_fetcher(integration, _build_async_fetcher) as fetcher:
+        results = fetcher.get_many(requests)
+    for (_, payload), result in zip(pending, results):
+        notes = result.data if result.ok and isinstance(result.data, list) else []
+        payload.comments = _notes_to_comments(notes)
+
+
+def _comment_workers(integration: Any) -> int:
+    settings = getattr(integration, "settings", None) or {}
+    try:
+        workers = int(settings.get("hydration_concurrency") or DEFAULT_COMMENT_WORKERS)
+    except (TypeError, ValueError):
+        workers = DEFAULT_COMMENT_WORKERS
+    return max(1, workers)
+
+
+def _collect_comments_concurrently(
+    pending: List[tuple[Any, IssuePayload]], max_workers: int
+) -> None:
+    """Fetch notes for changed issues in parallel and attach them to their payloads."""
+    if not pending:
+        return
+    workers = min(max_workers, len(pending))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        collected = executor.map(_collect_issue_comments, [issue for issue, _ in pending])
+        for (_, payload), comments in zip(pending, collected):
+            payload.comments = comments
+
+
 def create_issue(
     integration: Any,  # TenantIntegration or IntegrationLike
     project_integration: ProjectIntegration,
@@ -689,20 +866,28 @@ def _collect_issue_comments(issue_payload: Any) -> List[IssueCommentPayload]:
             return comments
         return comments
 
+    return _notes_to_comments(
+        getattr(note, "attributes", None) or vars(note) for note in notes
+    )
+
+
+def _notes_to_comments(notes: Iterable[Mapping[str, Any]]) -> List[IssueCommentPayload]:
+    """Convert newest-first note attributes into comments, skipping system notes."""
+    comments: List[IssueCommentPayload] = []
     for note in notes:
-        if getattr(note, "system", False):
+        if not isinstance(note, Mapping) or note.get("system", False):
             continue
-        author = getattr(note, "author", None)
+        author = note.get("author")
         author_name = None
         if isinstance(author, dict):
             author_name = author.get("name") or author.get("username")
-        note_id = getattr(note, "id", None)
+        note_id = note.get("id")
         comments.append(
             IssueCommentPayload(
                 author=str(author_name) if author_name else None,
-                body=getattr(note, "body", "") or "",
-                created_at=parse_datetime(getattr(note, "created_at", None)),
-                url=getattr(note, "web_url", None),
+                body=note.get("body") or "",
+                created_at=parse_datetime(note.get("created_at")),
+                url=note.get("web_url"),
                 id=str(note_id) if note_id else None,
             )
         )
@@ -0,0 +1,155 @@
+"""Conditional request (ETag / Last-Modified) cache for provider issue listings.
+
+Before an incremental sync, fetchers issue a cheap probe for the most recently updated
+issue with ``If-None-Match``/``If-Modified-Since``. A ``304 Not Modified`` means
+nothing changed upstream, so the fetch and payload conversion are skipped entirely.
+GitHub does not charge 304 responses against the rate limit, which keeps idle projects
+close to free.
+
+Validators are stored per integration under ``instance/http_cache/`` and are only
+trusted once a sync that started after they were recorded has completed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+import requests
+from flask import current_app, has_app_context
+
+from .rate_limit import get_governor
+from .utils import get_timeout, parse_datetime
+
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_file(integration_id: Any) -> Optional[Path]:
+    if not has_app_context() or integration_id is None:
+        return None
+    return Path(current_app.instance_path) / "http_cache" / f"integration-{integration_id}.json"
+
+
+def _load_entries(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def get_validators(integration_id: Any, url: str) -> Optional[dict[str, Any]]:
+    """Return the stored validators for ``url`` or None when nothing is cached."""
+    path = _cache_file(integration_id)
+    if path is None:
+        return None
+    with _CACHE_LOCK:
+        entry = _load_entries(path).get(url)
+    return entry if isinstance(entry, dict) else None
+
+
+def store_validators(
+    integration_id: Any,
+    url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    recorded_at: Optional[datetime] = None,
+) -> None:
+    """Persist validators for ``url``; entries without validators are dropped."""
+    path = _cache_file(integration_id)
+    if path is None:
+        return
+    recorded = recorded_at or datetime.now(timezone.utc)
+    with _CACHE_LOCK:
+        entries = _load_entries(path)
+        if etag or last_modified:
+            entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "recorded_at": recorded.isoformat(),
+            }
+        else:
+            entries.pop(url, None)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename keeps readers in other workers from seeing partial JSON
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            current_app.logger.debug("Unable to write HTTP validator cache: %s", exc)
+
+
+def probe_unchanged(
+    integration: Any,
+    project_integration: Any,
+    url: str,
+    *,
+    headers: Mapping[str, str],
+    since: Optional[datetime],
+) -> bool:
+    """Return True when a conditional GET proves ``url`` unchanged since the last sync.
+
+    Only incremental syncs (``since`` set) use the cache; full syncs always refetch.
+    Any probe failure returns False so the caller falls back to a normal fetch.
+    """
+    settings = getattr(integration, "settings", None) or {}
+    if since is None or settings.get("conditional_requests") is False:
+        return False
+    integration_id = getattr(integration, "id", None)
+    if _cache_file(integration_id) is None:
+        return False
+
+    cached = get_validators(integration_id, url)
+    request_headers = dict(headers)
+    if cached:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    started_at = datetime.now(timezone.utc)
+    governor = get_governor(integration)
+    governor.acquire()
+    try:
+        response = requests.get(
+            url, headers=request_headers, timeout=get_timeout(integration)
+        )
+    except requests.RequestException as exc:
+        current_app.logger.debug("Conditional probe failed for %s: %s", url, exc)
+        return False
+    governor.observe(response.status_code, response.headers)
+
+    if response.status_code == 304 and cached:
+        if _validators_trusted(cached, project_integration):
+            return True
+        # The last sync after recording these validators did not complete; refetch
+        # and re-arm them so the next successful sync makes them trustworthy again.
+        store_validators(
+            integration_id, url, cached.get("etag"), cached.get("last_modified"), started_at
+        )
+        return False
+
+    if response.status_code == 200:
+        store_validators(
+            integration_id,
+            url,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            started_at,
+        )
+    return False
+
+
+def _validators_trusted(cached: Mapping[str, Any], project_integration: Any) -> bool:
+    recorded_at = parse_datetime(cached.get("recorded_at"))
+    last_synced_at = parse_datetime(getattr(project_integration, "last_synced_at", None))
+    if recorded_at is None or last_synced_at is None:
+        return False
+    return recorded_at <= last_synced_at
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 from ...models import ProjectIntegration
 from . import (
@@ -10,6 +11,9 @@ from . import (
     IssuePayload,
     IssueSyncError,
 )
+from .async_http import AsyncFetcher, FetchRequest, async_fetch_enabled, build_fetcher
+from .client_pool import get_client, is_pooled
+from .rate_limit import govern_session
 from .utils import ensure_base_url, get_timeout, parse_datetime
 
 DEFAULT_FIELDS = [
@@ -34,6 +38,10 @@ DEFAULT_CLOSE_TRANSITIONS = [
 
 
 MAX_COMMENTS_PER_ISSUE = 20
+# Issues requested per search call; Jira caps this at 100
+SEARCH_PAGE_SIZE = 100
+# Parallel issue() calls used to back-fill comments missing from search results
+DEFAULT_HYDRATION_WORKERS = 4
 
 
 def _issue_to_payload(base_url: str, issue: dict) -> IssuePayload:
@@ -71,6 +79,22 @@ def fetch_issues(
     project_integration: ProjectIntegration,
     since: Optional[datetime] = None,
 ) -> List[IssuePayload]:
+    payloads: List[IssuePayload] = []
+    for page in iter_issue_pages(integration, project_integration, since):
+        payloads.extend(page)
+    return payloads
+
+
+def iter_issue_pages(
+    integration: Any,  # TenantIntegration or IntegrationLike
+    project_integration: ProjectIntegration,
+    since: Optional[datetime] = None,
+) -> Iterator[List[IssuePayload]]:
+    """Yield converted issues one search page at a time until the result set is exhausted.
+
+    Follows ``nextPageToken`` on Jira Cloud's enhanced search and ``startAt``/``total``
+    on Jira Server/Data Center, so large projects are no longer truncated at 100 issues.
+    """
     base_url = integration.base_url  # type: ignore[assignment]
     if not base_url:
         raise IssueSyncError("Jira integration requires a base URL.")
@@ -81,20 +105,13 @@ def fetch_issues(
     if not username:
         raise IssueSyncError("Jira integration requires an account email.")
 
-    jql = project_integration.config.get("jql") if project_integration.config else None
-    if not jql:
-        project_key = project_integration.external_identifier
-        if not project_key:
-            raise IssueSyncError("Jira project integration needs a project key or JQL.")
-        jql = f'project = "{project_key}"'
-
+    jql = _base_jql(project_integration)
     if since:
         since_value = _format_jira_datetime(since)
         jql = f'{jql} AND updated >= "{since_value}"'
 
-    timeout = get_timeout(integration)
     try:
-        from jira import JIRA, JIRAError  # type: ignore[import-not-found]
+        from jira import JIRAError  # type: ignore[import-not-found]
     except ImportError as exc:  # pragma: no cover - environment misconfiguration
         missing = getattr(exc, "name", None) or "jira"
         raise IssueSyncError(
@@ -102,86 +119,192 @@ def fetch_issues(
         ) from exc
 
     client: Optional[Any] = None
+    fetcher: Optional[AsyncFetcher] = None
     try:
-        client = JIRA(
-            server=base_url,  # type: ignore[arg-type]
-            basic_auth=(username, integration.api_token),  # type: ignore[arg-type]
-            timeout=timeout,
-        )
-        data = client.search_issues(
-            jql,
-            startAt=0,
-            maxResults=100,
-            fields=",".join(DEFAULT_FIELDS),
-            expand=",".join(DEFAULT_EXPAND),
-            validate_query=True,
-            json_result=True,
-        )
+        # Projects on the same Jira site and credentials share one client
+        client = get_client(integration, _build_sync_client)
+        hydration_workers = _hydration_workers(settings)
+        if async_fetch_enabled(integration):
+            fetcher = get_client(integration, _build_async_fetcher)
+        for issues in _iter_search_pages(client, jql):
+            # The search already asks for the comment field and renderedFields, so
+            # most issues arrive fully hydrated and need no follow-up request.
+            _hydrate_issue_comments(client, issues, hydration_workers, fetcher=fetcher)
+
+            page: List[IssuePayload] = []
+            for issue in issues:
+                if not issue.get("key"):
+                    continue
+                try:
+                    page.append(_issue_to_payload(base_url, issue))  # type: ignore[arg-type]
+                except IssueSyncError:
+                    continue
+            yield page
     except JIRAError as exc:
         message = getattr(exc, "text", None) or str(exc)
         raise IssueSyncError(f"Jira API error: {message}") from exc
+    except IssueSyncError:
+        raise
     except Exception as exc:  # pragma: no cover - unexpected failures
         error_msg = str(exc) or f"Unknown error: {type(exc).__name__}"
         raise IssueSyncError(error_msg) from exc
     finally:
-        if client is not None:
+        if client is not None and not is_pooled():
             try:
                 client.close()
             except Exception:  # pragma: no cover - best effort cleanup
                 pass
+        if fetcher is not None and not is_pooled():
+            fetcher.close()
 
-    issues = data.get("issues", [])
-    if not isinstance(issues, list):
-        raise IssueSyncError("Unexpected Jira response payload.")
 
-    # Fetch each issue individually with renderedFields to get comment HTML
-    # search_issues doesn't include comments, and client.comments() doesn't return rendered HTML
-    client = JIRA(
-        server=base_url,  # type: ignore[arg-type]
-        basic_auth=(username, integration.api_token),  # type: ignore[arg-type]
-        timeout=timeout,
-    )
+def list_issue_ids(
+    integration: Any,  # TenantIntegration or IntegrationLike
+    project_integration: ProjectIntegration,
+) -> List[str]:
+    """Return the key of every issue matched by the integration's JQL.
+
+    Only the ``key`` is requested, so no fields, rendered bodies or comments are sent.
+    """
+    return _search_issue_keys(integration, _base_jql(project_integration))
+
+
+def jql_matches_issue(
+    integration: Any,  # TenantIntegration or IntegrationLike
+    project_integration: ProjectIntegration,
+    issue_key: str,
+) -> bool:
+    """Return True when the project integration's JQL selects the issue ``issue_key``.
+
+    Used for webhook deliveries, which only name the issue's Jira project.
+    """
+    escaped_key = issue_key.replace("\\", "\\\\").replace('"', '\\"')
+    jql = f'({_base_jql(project_integration)}) AND key = "{escaped_key}"'
+    return issue_key in _search_issue_keys(integration, jql)
+
+
+def _search_issue_keys(integration: Any, jql: str) -> List[str]:
+    if not integration.base_url:
+        raise IssueSyncError("Jira integration requires a base URL.")
+    settings: dict[str, Any] = integration.settings or {}  # type: ignore[assignment]
+    if not (settings.get("username") or "").strip():
+        raise IssueSyncError("Jira integration requires an account email.")
+
     try:
-        for issue in issues:
-            issue_key = issue.get("key")
-            if not issue_key:
-                continue
+        from jira import JIRAError  # type: ignore[import-not-found]
+    except ImportError as exc:  # pragma: no cover - environment misconfiguration
+        raise IssueSyncError("Jira support requires the 'jira' package.") from exc
+
+    client = get_client(integration, _build_sync_client)
+    try:
+        keys: List[str] = []
+        for issues in _iter_search_pages(client, jql, fields=["key"], expand=[]):
+            keys.extend(str(issue["key"]) for issue in issues if issue.get("key"))
+        return keys
+    except JIRAError as exc:
+        message = getattr(exc, "text", None) or str(exc)
+        raise IssueSyncError(f"Jira API error: {message}") from exc
+    finally:
+        if not is_pooled():
             try:
-                # Fetch full issue with rendered fields to get comment HTML
-                full_issue = client.issue(
-                    issue_key,
-                    fields=",".join(DEFAULT_FIELDS),
-                    expand=",".join(DEFAULT_EXPAND),
-                )
-                full_data = getattr(full_issue, "raw", {})
-                # Copy comments and renderedFields from full issue data
-                if isinstance(full_data, dict):
-                    fields = full_data.get("fields", {})
-                    if "comment" in fields:
-                        issue.setdefault("fields", {})["comment"] = fields["comment"]
-                    # Also copy renderedFields for comment HTML
-                    rendered_fields = full_data.get("renderedFields")
-                    if rendered_fields:
-                        issue["renderedFields"] = rendered_fields
-            except Exception:  # noqa: BLE001
-                # Continue without comments if fetch fails (graceful degradation)
+                client.close()
+            except Exception:  # pragma: no cover - best effort cleanup
                 pass
-    finally:
-        try:
-            client.close()
-        except Exception:  # pragma: no cover - best effort cleanup
-            pass
 
-    payloads: List[IssuePayload] = []
-    for issue in issues:
-        key = issue.get("key")
-        if not key:
-            continue
-        try:
-            payloads.append(_issue_to_payload(base_url, issue))  # type: ignore[arg-type]
-        except IssueSyncError:
+
+def _base_jql(project_integration: Any) -> str:
+    """Return the configured JQL, or a project filter built from the project key."""
+    jql = project_integration.config.get("jql") if project_integration.config else None
+    if jql:
+        return jql
+    project_key = project_integration.external_identifier
+    if not project_key:
+        raise IssueSyncError("Jira project integration needs a project key or JQL.")
+    return f'project = "{project_key}"'
+
+
+def _build_async_fetcher(integration: Any) -> AsyncFetcher:
+    """Build the async fetcher used to hydrate comments; same auth as the client."""
+    settings: dict[str, Any] = integration.settings or {}  # type: ignore[assignment]
+    username = (settings.get("username") or "").strip()
+    return build_fetcher(
+        integration,
+        ensure_base_url(integration, integration.base_url),  # type: ignore[arg-type]
+        auth=(username, integration.api_token),  # type: ignore[arg-type]
+    )
+
+
+def _build_sync_client(integration: Any) -> Any:
+    """Build the JIRA client used for issue sync; callers handle import errors."""
+    from jira import JIRA  # type: ignore[import-not-found]
+
+    settings: dict[str, Any] = integration.settings or {}  # type: ignore[assignment]
+    username = (settings.get("username") or "").strip()
+    client = JIRA(
+        server=ensure_base_url(integration, integration.base_url),  # type: ignore[arg-type]
+        basic_auth=(username, integration.api_token),  # type: ignore[arg-type]
+        timeout=get_timeout(integration),
+    )
+    # Search pages and comment hydration share the integration's rate budget
+    govern_session(getattr(client, "_session", None), integration)
+    return client
+
+
+def _iter_search_pages(
+    client: Any,
+    jql: str,
+    *,
+    fields: List[str] = DEFAULT_FIELDS,
+    expand: List[str] = DEFAULT_EXPAND,
+) -> Iterator[List[dict]]:
+    """Yield raw issue lists for every page of a JQL search."""
+    start_at = 0
+    next_token: Optional[str] = None
+    seen_tokens: set[str] = set()
+    search_kwargs: dict[str, Any] = {
+        "maxResults": SEARCH_PAGE_SIZE,
+        "fields": ",".join(fields),
+        "json_result": True,
+    }
+    if expand:
+        search_kwargs["expand"] = ",".join(expand)
+    while True:
+        if next_token:
+            data = client.enhanced_search_issues(
+                jql, nextPageToken=next_token, **search_kwargs
+            )
+        else:
+            data = client.search_issues(
+                jql, startAt=start_at, validate_query=True, **search_kwargs
+            )
+
+        issues = data.get("issues", []) if isinstance(data, dict) else None
+        if not isinstance(issues, list):
+            raise IssueSyncError("Unexpected Jira response payload.")
+        yield issues
+
+        if data.get("isLast") is True or not issues:
+            return
+
+        # Jira Cloud (enhanced search) pages with an opaque token
+        token = data.get("nextPageToken")
+        if token:
+            if token in seen_tokens:
+                return
+            seen_tokens.add(token)
+            next_token = str(token)
             continue
-    return payloads
+        if "isLast" in data:
+            return
+
+        # Jira Server/Data Center pages with startAt offsets
+        start_at += len(issues)
+        total = data.get("total")
+        if isinstance(total, int):
+            if start_at >= total:
+                return
+        elif len(issues) < SEARCH_PAGE_SIZE:
+            return
 
 
 def create_issue(
@@ -848,6 +971,112 @@ def assign_issue(
                 pass
 
 
+def _hydration_workers(settings: dict[str, Any]) -> int:
+    value = settings.get("hydration_concurrency")
+    if value is None:
+        return DEFAULT_HYDRATION_WORKERS
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_HYDRATION_WORKERS
+    return max(1, workers)
+
+
+def _needs_comment_hydration(issue: dict) -> bool:
+    """Return True when a search hit lacks comments or their rendered HTML.
+
+    Jira omits the comment field for some search configurations and truncates it when
+    an issue has more comments than the search page embeds (``total`` > returned).
+    """
+    fields = issue.get("fields")
+    if not isinstance(fields, dict):
+        return True
+    block = fields.get("comment")
+    if not isinstance(block, dict) or not isinstance(block.get("comments"), list):
+        return True
+    entries = block["comments"]
+    total = block.get("total")
+    if isinstance(total, int) and total > len(entries):
+        return True
+    if not entries:
+        return False
+    rendered = issue.get("renderedFields")
+    rendered_block = rendered.get("comment") if isinstance(rendered, dict) else None
+    return not (
+        isinstance(rendered_block, dict)
+        and isinstance(rendered_block.get("comments"), list)
+    )
+
+
+def _hydrate_issue_comments(
+    client: Any,
+    issues: List[dict],
+    max_workers: int,
+    *,
+    fetcher: Optional[AsyncFetcher] = None,
+) -> None:
+    """Fill in comments and rendered HTML for search hits that came back without them.
+
+    Only incomplete issues are re-fetched, in parallel over the already-open client
+    (or in one concurrent batch through ``fetcher`` when async fetching is enabled),
+    so a typical sync costs one request per search page instead of one per issue.
+    """
+    pending = [
+        issue for issue in issues if issue.get("key") and _needs_comment_hydration(issue)
+    ]
+    if not pending:
+        return
+
+    keys = [issue["key"] for issue in pending]
+    if fetcher is not None:
+        hydrated = _fetch_full_issues_async(fetcher, keys)
+    else:
+        hydrated = _fetch_full_issues(client, keys, max_workers)
+    for issue, full_data in zip(pending, hydrated):
+        if full_data is None:
+            continue
+        # Copy comments and renderedFields from full issue data
+        fields = full_data.get("fields", {})
+        if isinstance(fields, dict) and "comment" in fields:
+            issue.setdefault("fields", {})["comment"] = fields["comment"]
+        rendered_fields = full_data.get("renderedFields")
+        if rendered_fields:
+            issue["renderedFields"] = rendered_fields
+
+
+def _fetch_full_issues(
+    client: Any, keys: List[str], max_workers: int
+) -> List[Optional[dict]]:
+    def fetch(issue_key: str) -> Optional[dict]:
+        try:
+            full_issue = client.issue(
+                issue_key,
+                fields=",".join(DEFAULT_FIELDS),
+                expand=",".join(DEFAULT_EXPAND),
+            )
+        except Exception:  # noqa: BLE001
+            # Continue without comments if fetch fails (graceful degradation)
+            return None
+        full_data = getattr(full_issue, "raw", None)
+        return full_data if isinstance(full_data, dict) else None
+
+    workers = min(max_workers, len(keys))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch, keys))
+
+
+def _fetch_full_issues_async(fetcher: AsyncFetcher, keys: List[str]) -> List[Optional[dict]]:
+    params = {"fields": ",".join(DEFAULT_FIELDS), "expand": ",".join(DEFAULT_EXPAND)}
+    results = fetcher.get_many(
+        [FetchRequest(f"rest/api/2/issue/{key}", params) for key in keys]
+    )
+    # Failed fetches leave the issue without comments, as on the threaded path
+    return [
+        result.data if result.ok and isinstance(result.data, dict) else None
+        for result in results
+    ]
+
+
 def _resolve_assignee(fields: dict) -> tuple[Optional[str], Optional[str]]:
     """Resolve assignee display name and account ID from Jira fields.
 
@@ -0,0 +1,331 @@
+"""Per-integration rate-limit governor for provider API calls.
+
+Every ``TenantIntegration`` gets one token bucket shared by all threads that talk to
+it. Requests take a token before they are sent and the provider's rate-limit headers
+(``X-RateLimit-*``, GitLab's ``RateLimit-*`` and ``Retry-After``) are fed back after
+each response:
+
+* when the remaining budget runs low the refill rate is lowered so the rest of the
+  budget is spread evenly until the window resets;
+* a throttled response (429, or 403 with an exhausted budget) pauses the bucket until
+  the provider says it may be retried, halves the request rate and retries the
+  request; the rate recovers gradually as calls succeed again.
+
+Sessions opt in through :func:`govern_session`, which mounts a
+:class:`RateLimitedAdapter` so every request made by the provider client is paced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping, Optional
+
+import requests
+from flask import current_app, has_app_context
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from .utils import parse_datetime
+
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+DEFAULT_MAX_WAIT_SECONDS = 300.0
+# Retries of a single throttled request before the response is handed back
+THROTTLE_RETRIES = 3
+# Pace requests against the provider budget once less than this share is left
+LOW_BUDGET_FRACTION = 0.2
+_MAX_PENALTY = 32.0
+
+_governors: dict[Any, "RateLimitGovernor"] = {}
+_governors_lock = threading.Lock()
+
+
+def _header(headers: Mapping[str, str], *names: str) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Return the reset time as a Unix timestamp (epoch seconds or ISO-8601)."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        parsed = parse_datetime(value)
+        return parsed.timestamp() if parsed else None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the ``Retry-After`` delay in seconds (delta-seconds or HTTP date)."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitGovernor:
+    """Token bucket for one integration, adapted from provider rate-limit headers."""
+
+    def __init__(self, name: str, requests_per_second: float) -> None:
+        self.name = name
+        self.rate = max(0.1, requests_per_second)
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._penalty = 1.0
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def _effective_rate(self) -> float:
+        rate = self.rate / self._penalty
+        if self.remaining is not None and self.limit and self.reset_at:
+            window = self.reset_at - time.time()
+            if window > 0 and self.remaining < self.limit * LOW_BUDGET_FRACTION:
+                rate = min(rate, max(self.remaining, 1) / window)
+        return rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._effective_rate())
+
+    def _take_or_delay(self, waited: float, max_wait: float) -> float:
+        """Take a token and return 0, or return how long to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            delay = self._blocked_until - now
+            if delay <= 0:
+                if self._tokens >= 1 or waited >= max_wait:
+                    self._tokens -= 1
+                    return 0.0
+                delay = (1 - self._tokens) / self._effective_rate()
+            delay = min(delay, max_wait - waited)
+            if delay <= 0:
+                self._tokens -= 1
+                return 0.0
+            return delay
+
+    def acquire(self, max_wait: float = DEFAULT_MAX_WAIT_SECONDS) -> float:
+        """Block until a request may be sent; return the number of seconds waited.
+
+        Waits never exceed ``max_wait`` in total: past that the request is let through
+        and the provider's own response decides what happens.
+        """
+        waited = 0.0
+        while (delay := self._take_or_delay(waited, max_wait)) > 0:
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    async def acquire_async(self, max_wait: float = DEFAULT_MAX_WAIT_SECONDS) -> float:
+        """Like :meth:`acquire`, but waits without blocking the event loop."""
+        waited = 0.0
+        while (delay := self._take_or_delay(waited, max_wait)) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        return waited
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> bool:
+        """Record a response's rate-limit headers; return True when it was throttled."""
+        remaining = _parse_int(
+            _header(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        )
+        limit = _parse_int(_header(headers, "X-RateLimit-Limit", "RateLimit-Limit"))
+        reset_at = _parse_reset(_header(headers, "X-RateLimit-Reset", "RateLimit-Reset"))
+        retry_after = _parse_retry_after(_header(headers, "Retry-After"))
+        throttled = status_code == 429 or (status_code == 403 and remaining == 0)
+
+        with self._lock:
+            if remaining is not None:
+                self.remaining = remaining
+            if limit is not None:
+                self.limit = limit
+            if reset_at is not None:
+                self.reset_at = reset_at
+
+            pause = retry_after
+            if pause is None and (throttled or remaining == 0) and self.reset_at:
+                pause = max(0.0, self.reset_at - time.time())
+            if pause is None and throttled:
+                pause = min(2.0**self.throttled, 60.0)
+            if pause:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+
+            if throttled:
+                self.throttled += 1
+                self._penalty = min(self._penalty * 2, _MAX_PENALTY)
+            else:
+                self._penalty = max(1.0, self._penalty * 0.9)
+        return throttled
+
+    def record_budget(
+        self, remaining: Optional[int], limit: Optional[int], reset_at: Optional[float]
+    ) -> None:
+        """Record a budget reported out of band (e.g. by a client library)."""
+        headers: dict[str, str] = {}
+        for key, value in (
+            ("X-RateLimit-Remaining", remaining),
+            ("X-RateLimit-Limit", limit),
+            ("X-RateLimit-Reset", reset_at),
+        ):
+            if value is not None and not (isinstance(value, int) and value < 0):
+                headers[key] = str(value)
+        self.observe(200, headers)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "name": self.name,
+                "requests_per_second": round(self._effective_rate(), 3),
+                "tokens": round(max(self._tokens, 0.0), 2),
+                "remaining": self.remaining,
+                "limit": self.limit,
+                "reset_at": self.reset_at,
+                "blocked_for_seconds": round(max(0.0, self._blocked_until - now), 1),
+                "throttled": self.throttled,
+            }
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTP adapter that paces requests through a governor and retries throttling."""
+
+    def __init__(
+        self,
+        governor: RateLimitGovernor,
+        *,
+        max_wait: float = DEFAULT_MAX_WAIT_SECONDS,
+        **kwargs: Any,
+    ) -> None:
+        self.governor = governor
+        self.max_wait = max_wait
+        super().__init__(**kwargs)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: bool | str = True,
+        cert: Any = None,
+        proxies: Optional[dict[str, str]] = None,
+    ) -> requests.Response:
+        attempt = 0
+        while True:
+            self.governor.acquire(self.max_wait)
+            response = super().send(
+                request,
+                stream=stream,
+                timeout=timeout,
+                verify=verify,
+                cert=cert,
+                proxies=proxies,
+            )
+            throttled = self.governor.observe(response.status_code, response.headers)
+            if not throttled or attempt >= THROTTLE_RETRIES:
+                return response
+            attempt += 1
+            response.close()
+
+
+def _config_value(name: str, default: float) -> float:
+    if not has_app_context():
+        return default
+    try:
+        return float(current_app.config.get(name) or default)
+    except (TypeError, ValueError):
+        return default
+
+
+def get_governor(integration: Any) -> RateLimitGovernor:
+    """Return the shared governor for a tenant integration, creating it on first use.
+
+    The request rate defaults to ``ISSUE_SYNC_MAX_REQUESTS_PER_SECOND`` and can be
+    overridden per integration with the ``max_requests_per_second`` setting. The rate
+    is read once; call :func:`reset_governor` after the integration is reconfigured.
+    """
+    key = getattr(integration, "id", None) or (
+        f"{getattr(integration, 'provider', '')}:{getattr(integration, 'base_url', '')}"
+    )
+    with _governors_lock:
+        governor = _governors.get(key)
+        if governor is None:
+            settings = getattr(integration, "settings", None) or {}
+            rate = _config_value(
+                "ISSUE_SYNC_MAX_REQUESTS_PER_SECOND", DEFAULT_REQUESTS_PER_SECOND
+            )
+            try:
+                rate = float(settings.get("max_requests_per_second") or rate)
+            except (TypeError, ValueError):
+                pass
+            name = getattr(integration, "name", None) or str(key)
+            governor = RateLimitGovernor(name, rate)
+            _governors[key] = governor
+        return governor
+
+
+def govern_session(session: Any, integration: Any) -> Any:
+    """Mount a rate-limited adapter for ``integration`` on ``session`` and return it.
+
+    Anything that is not a :class:`requests.Session` is returned unchanged.
+    """
+    if not isinstance(session, Session):
+        return session
+    adapter = RateLimitedAdapter(
+        get_governor(integration),
+        max_wait=_config_value(
+            "ISSUE_SYNC_RATE_LIMIT_MAX_WAIT", DEFAULT_MAX_WAIT_SECONDS
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def rate_limit_status() -> dict[str, dict[str, Any]]:
+    """Return the current budget of every governor, keyed by integration."""
+    with _governors_lock:
+        governors = dict(_governors)
+    return {str(key): governor.snapshot() for key, governor in governors.items()}
+
+
+def reset_governor(integration_id: Optional[int]) -> bool:
+    """Forget one integration's governor so its next use picks up new settings.
+
+    Returns True when a governor was dropped.
+    """
+    with _governors_lock:
+        return _governors.pop(integration_id, None) is not None
+
+
+def reset_governors() -> None:
+    """Forget every governor (used in tests)."""
+    with _governors_lock:
+        _governors.clear()
@@ -0,0 +1,235 @@
+"""Reconciliation pass for issues deleted or transferred upstream.
+
+Issue sync only upserts what the provider returns, so an issue deleted or moved to
+another repository upstream would stay in ``external_issues`` forever. This pass asks
+each provider for the IDs of every issue it still has (no bodies or comments) and
+diffs them against the stored ``external_id`` values:
+
+* stored issues missing upstream get ``missing_since`` set and stay visible;
+* issues that show up again have ``missing_since`` cleared;
+* issues still missing after the grace period are copied to
+  ``archived_external_issues`` and removed from the hot table.
+
+The grace period protects against transient provider glitches (permission changes,
+a misconfigured JQL) wiping out pinned issues and session links.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+from flask import current_app
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import undefer
+
+from ...extensions import db
+from ...models import (
+    AISession,
+    ArchivedExternalIssue,
+    ExternalIssue,
+    IssuePlan,
+    PinnedComment,
+    PinnedIssue,
+    ProjectIntegration,
+)
+from . import LIST_IDS_PROVIDER_REGISTRY, IssueSyncError
+from .utils import get_effective_integration
+
+# Bind-parameter friendly chunk size for id IN (...) updates
+_CHUNK_SIZE = 500
+DEFAULT_GRACE_HOURS = 24
+
+
+@dataclass
+class ReconcileResult:
+    """Outcome of reconciling one project integration."""
+
+    project_integration_id: int
+    upstream: int = 0
+    stored: int = 0
+    marked_missing: int = 0
+    restored: int = 0
+    archived: int = 0
+    skipped: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _chunks(values: Iterable[int]) -> Iterable[List[int]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, _CHUNK_SIZE)):
+        yield chunk
+
+
+def _grace_period() -> timedelta:
+    hours = current_app.config.get("ISSUE_RECONCILE_GRACE_HOURS", DEFAULT_GRACE_HOURS)
+    return timedelta(hours=max(0, int(hours or 0)))
+
+
+def fetch_upstream_issue_ids(project_integration: ProjectIntegration) -> set[str]:
+    """Return the external IDs the provider still has for a project integration."""
+    integration = project_integration.integration
+    if integration is None:
+        raise IssueSyncError(
+            "Project integration is missing associated tenant integration."
+        )
+    lister = LIST_IDS_PROVIDER_REGISTRY.get(integration.provider.lower())
+    if lister is None:
+        raise IssueSyncError(
+            f"Reconciliation is not supported for provider '{integration.provider}'."
+        )
+    effective = get_effective_integration(integration, project_integration)
+    try:
+        return set(lister(effective, project_integration))
+    except IssueSyncError:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        error_msg = str(exc) or f"Unknown error: {type(exc).__name__}"
+        raise IssueSyncError(error_msg) from exc
+
+
+def reconcile_project_integration(
+    project_integration: ProjectIntegration,
+    *,
+    now: Optional[datetime] = None,
+) -> ReconcileResult:
+    """Diff upstream issue IDs against stored rows and tombstone or archive the rest."""
+    now = now or datetime.utcnow()
+    result = ReconcileResult(project_integration_id=project_integration.id)
+    upstream = fetch_upstream_issue_ids(project_integration)
+    result.upstream = len(upstream)
+
+    stored = db.session.execute(
+        select(
+            ExternalIssue.id, ExternalIssue.external_id, ExternalIssue.missing_since
+        ).where(ExternalIssue.project_integration_id == project_integration.id)
+    ).all()
+    result.stored = len(stored)
+    if not upstream and stored:
+        # An empty listing is far more likely a credentials or JQL problem than a
+        # project whose every issue was deleted
+        result.skipped = "provider returned no issues"
+        return result
+
+    cutoff = now - _grace_period()
+    newly_missing: List[int] = []
+    restored: List[int] = []
+    expired: List[int] = []
+    for issue_id, external_id, missing_since in stored:
+        if external_id in upstream:
+            if missing_since is not None:
+                restored.append(issue_id)
+        elif missing_since is None:
+            newly_missing.append(issue_id)
+        elif missing_since <= cutoff:
+            expired.append(issue_id)
+
+    for chunk in _chunks(newly_missing):
+        db.session.execute(
+            update(ExternalIssue)
+            .where(ExternalIssue.id.in_(chunk))
+            .values(missing_since=now)
+        )
+    for chunk in _chunks(restored):
+        db.session.execute(
+            update(ExternalIssue)
+            .where(ExternalIssue.id.in_(chunk))
+            .values(missing_since=None)
+        )
+    for chunk in _chunks(expired):
+        _archive_issues(chunk, now)
+
+    db.session.commit()
+    result.marked_missing = len(newly_missing)
+    result.restored = len(restored)
+    result.archived = len(expired)
+    return result
+
+
+def _archive_issues(issue_ids: List[int], now: datetime) -> None:
+    """Copy issues into archived_external_issues and delete them from the hot table."""
+    issues = (
+        ExternalIssue.query.options(
+            undefer(ExternalIssue.comments), undefer(ExternalIssue.raw_payload)
+        )
+        .filter(ExternalIssue.id.in_(issue_ids))
+        .all()
+    )
+    for issue in issues:
+        db.session.add(
+            ArchivedExternalIssue(
+                project_integration_id=issue.project_integration_id,
+                original_issue_id=issue.id,
+                external_id=issue.external_id,
+                title=issue.title,
+                status=issue.status,
+                url=issue.url,
+                snapshot={
+                    "assignee": issue.assignee,
+                    "labels": issue.labels or [],
+                    "comments": issue.comments or [],
+                    "raw_payload": issue.raw_payload,
+                    "external_updated_at": (
+                        issue.external_updated_at.isoformat()
+                        if issue.external_updated_at
+                        else None
+                    ),
+                    "last_seen_at": (
+                        issue.last_seen_at.isoformat() if issue.last_seen_at else None
+                    ),
+                    "manually_assigned": issue.manually_assigned,
+                },
+                missing_since=issue.missing_since,
+                archived_at=now,
+            )
+        )
+        db.session.delete(issue)
+    # SQLite does not enforce ON DELETE CASCADE / SET NULL; without this, pins and
+    # plans would be left orphaned and picked up by a later issue reusing the rowid
+    db.session.execute(delete(PinnedIssue).where(PinnedIssue.issue_id.in_(issue_ids)))
+    db.session.execute(
+        delete(PinnedComment).where(PinnedComment.issue_id.in_(issue_ids))
+    )
+    db.session.execute(delete(IssuePlan).where(IssuePlan.issue_id.in_(issue_ids)))
+    db.session.execute(
+        update(AISession).where(AISession.issue_id.in_(issue_ids)).values(issue_id=None)
+    )
+    db.session.flush()
+
+
+def reconcile_integrations(
+    project_integrations: Iterable[ProjectIntegration],
+) -> Dict[int, ReconcileResult]:
+    """Reconcile several project integrations, logging and skipping failures."""
+    results: Dict[int, ReconcileResult] = {}
+    for project_integration in project_integrations:
+        try:
+            result = reconcile_project_integration(project_integration)
+        except IssueSyncError as exc:
+            db.session.rollback()
+            current_app.logger.warning(
+                "Issue reconciliation failed for project_integration=%s: %s",
+                project_integration.id,
+                exc,
+            )
+            continue
+        results[project_integration.id] = result
+        if result.skipped:
+            current_app.logger.warning(
+                "Skipped issue reconciliation for project_integration=%s: %s",
+                project_integration.id,
+                result.skipped,
+            )
+        elif result.marked_missing or result.restored or result.archived:
+            current_app.logger.info(
+                "Reconciled project_integration=%s: %d missing, %d restored, %d archived",
+                project_integration.id,
+                result.marked_missing,
+                result.restored,
+                result.archived,
+            )
+    return results
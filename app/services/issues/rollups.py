@@ -0,0 +1,183 @@
+"""Maintain the ``issue_daily_stats`` resolution rollup.
+
+The rollup holds what the non-rollup statistics compute from the issues themselves:
+every closed issue counts as one resolution (with its created -> last written hours)
+on the day it was last written. When ``ISSUE_STATS_ROLLUP_ENABLED`` is set, each
+write of an issue takes its resolution back from the day it was last written, if it
+was closed, and adds it to today's row if it is closed now, so reopened issues drop
+out and issues closed when first stored are counted. Issue sync reports the changes
+it writes through :func:`record_resolutions`; ORM inserts, updates and deletes are
+picked up by the mapper hooks at the bottom of this module. ``flask
+rebuild-issue-stats`` seeds the rollup from the existing issues before it is enabled.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+
+from flask import current_app, has_app_context
+from sqlalchemy import CursorResult, event, inspect, insert, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import InstanceState, object_session
+
+from ...models import ExternalIssue, IssueDailyStat
+
+CLOSED_CATEGORY = "Closed"
+
+# (project_integration_id, day, count, resolution hours); a count of -1 takes back
+# the resolution of an issue that was reopened or written again on another day
+Resolution = Tuple[int, date, int, float]
+
+
+def rollups_enabled() -> bool:
+    """Return whether the daily resolution rollup is maintained and read."""
+    return has_app_context() and bool(
+        current_app.config.get("ISSUE_STATS_ROLLUP_ENABLED")
+    )
+
+
+def resolution_hours(created_at: Optional[datetime], resolved_at: datetime) -> float:
+    """Hours between an issue's creation and its resolution (naive UTC datetimes)."""
+    if created_at is None:
+        return 0.0
+    return max((resolved_at - created_at).total_seconds(), 0.0) / 3600
+
+
+def resolution(
+    project_integration_id: int,
+    created_at: Optional[datetime],
+    resolved_at: datetime,
+    count: int = 1,
+) -> Resolution:
+    """Return the rollup entry of an issue last written (closed) at ``resolved_at``.
+
+    Pass ``count=-1`` to take back the entry of an issue that is written again.
+    """
+    return (
+        project_integration_id,
+        resolved_at.date(),
+        count,
+        count * resolution_hours(created_at, resolved_at),
+    )
+
+
+def record_resolutions(connection: Connection, resolutions: Iterable[Resolution]) -> None:
+    """Apply resolutions to their rollup rows, creating rows for new days."""
+    totals: Dict[Tuple[int, date], List[float]] = {}
+    for project_integration_id, day, count, hours in resolutions:
+        total = totals.setdefault((project_integration_id, day), [0, 0.0])
+        total[0] += count
+        total[1] += hours
+
+    table = IssueDailyStat.__table__
+    # Typically one (integration, today) row per sync chunk
+    for (project_integration_id, day), (day_count, day_hours) in totals.items():
+        count = int(day_count)
+        if not count and not day_hours:
+            continue
+        result = connection.execute(
+            update(table)
+            .where(
+                table.c.project_integration_id == project_integration_id,
+                table.c.day == day,
+            )
+            .values(
+                resolved_count=table.c.resolved_count + count,
+                resolution_hours=table.c.resolution_hours + day_hours,
+            )
+        )
+        # A resolution taken back from a day without a row was never counted, as for
+        # issues closed before the rollup was enabled without being seeded
+        if cast(CursorResult, result).rowcount == 0 and count > 0:
+            connection.execute(
+                insert(table).values(
+                    project_integration_id=project_integration_id,
+                    day=day,
+                    resolved_count=count,
+                    resolution_hours=day_hours,
+                )
+            )
+
+
+def _committed_value(state: InstanceState[ExternalIssue], key: str) -> Any:
+    """Return an attribute's value as loaded from the database, or None if unknown."""
+    history = state.attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return None
+
+
+@event.listens_for(ExternalIssue, "before_update")
+def _record_issue_resolution(mapper, connection: Connection, target: ExternalIssue) -> None:
+    if not rollups_enabled():
+        return
+    session = object_session(target)
+    # Objects flushed without column changes are not written, so keep their day
+    if session is None or not session.is_modified(target, include_collections=False):
+        return
+    state: InstanceState[ExternalIssue] = inspect(target)
+    # Unknown when the previous values were never loaded; such writes cannot be
+    # told apart from a re-save of a closed issue, so they are skipped
+    old_category = _committed_value(state, "status_category")
+    old_written_at = _committed_value(state, "updated_at")
+    if old_category is None or old_written_at is None:
+        return
+    created_at = _committed_value(state, "created_at")
+    # ``updated_at`` is only set by onupdate after this hook, unless assigned
+    written_at = (
+        target.updated_at
+        if state.attrs.updated_at.history.added
+        else datetime.utcnow()
+    )
+    resolutions: List[Resolution] = []
+    if old_category == CLOSED_CATEGORY:
+        resolutions.append(
+            resolution(target.project_integration_id, created_at, old_written_at, -1)
+        )
+    if target.status_category == CLOSED_CATEGORY:
+        resolutions.append(
+            resolution(target.project_integration_id, created_at, written_at)
+        )
+    if resolutions:
+        record_resolutions(connection, resolutions)
+
+
+@event.listens_for(ExternalIssue, "after_insert")
+def _record_inserted_issue_resolution(
+    mapper, connection: Connection, target: ExternalIssue
+) -> None:
+    if rollups_enabled() and target.status_category == CLOSED_CATEGORY:
+        record_resolutions(
+            connection,
+            [
+                resolution(
+                    target.project_integration_id, target.created_at, target.updated_at
+                )
+            ],
+        )
+
+
+@event.listens_for(ExternalIssue, "after_delete")
+def _drop_deleted_issue_resolution(
+    mapper, connection: Connection, target: ExternalIssue
+) -> None:
+    if not rollups_enabled():
+        return
+    # The row is gone, so only values loaded before the delete can be read
+    state: InstanceState[ExternalIssue] = inspect(target)
+    written_at = _committed_value(state, "updated_at")
+    if _committed_value(state, "status_category") == CLOSED_CATEGORY and written_at:
+        record_resolutions(
+            connection,
+            [
+                resolution(
+                    target.project_integration_id,
+                    _committed_value(state, "created_at"),
+                    written_at,
+                    -1,
+                )
+            ],
+        )
@@ -4,12 +4,14 @@ import re
 import sys
 from datetime import datetime, timezone
 from types import SimpleNamespace
-from typing import Any, Optional, Protocol
+from typing import Any, Iterable, Optional, Protocol
 from urllib.parse import urlsplit, urlunsplit
 
 import requests
 from requests import HTTPError
 from requests.auth import HTTPBasicAuth
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import undefer
 
 from ...models import ExternalIssue, ProjectIntegration, TenantIntegration
 
@@ -27,6 +29,9 @@ class IntegrationLike(Protocol):
     enabled: bool
 
 DEFAULT_TIMEOUT_SECONDS = 15.0
+# Bind-parameter friendly chunk size for external_id IN (...) lookups
+_STATE_LOOKUP_CHUNK = 500
+DESCRIPTION_EXCERPT_LENGTH = ExternalIssue.description_excerpt.property.columns[0].type.length
 
 _github_module: Any | None = None
 try:  # pragma: no cover - optional dependency
@@ -187,6 +192,48 @@ def get_effective_integration(
     )
 
 
+def load_stored_issue_state(
+    project_integration: Any, external_ids: Iterable[str]
+) -> dict[str, ExternalIssue]:
+    """Return stored issues for the given external IDs, keyed by external ID.
+
+    Fetchers use this to skip re-downloading data that has not changed upstream.
+    Returns an empty mapping when called outside an app context or with a project
+    integration that has not been persisted yet.
+    """
+    from flask import has_app_context
+
+    project_integration_id = getattr(project_integration, "id", None)
+    ids = list(external_ids)
+    if not isinstance(project_integration_id, int) or not ids or not has_app_context():
+        return {}
+
+    stored: dict[str, ExternalIssue] = {}
+    for start in range(0, len(ids), _STATE_LOOKUP_CHUNK):
+        chunk = ids[start : start + _STATE_LOOKUP_CHUNK]
+        # Callers compare raw_payload and reuse stored comments, so load the
+        # deferred JSON columns with the rows instead of one SELECT per issue
+        for issue in ExternalIssue.query.options(
+            undefer(ExternalIssue.raw_payload), undefer(ExternalIssue.comments)
+        ).filter(
+            ExternalIssue.project_integration_id == project_integration_id,
+            ExternalIssue.external_id.in_(chunk),
+        ):
+            stored[issue.external_id] = issue
+    return stored
+
+
+def same_timestamp(left: Optional[datetime], right: Optional[datetime]) -> bool:
+    """Compare timestamps that may differ only in tz-awareness (SQLite drops tzinfo)."""
+    if left is None or right is None:
+        return False
+    if left.tzinfo is None:
+        left = left.replace(tzinfo=timezone.utc)
+    if right.tzinfo is None:
+        right = right.replace(tzinfo=timezone.utc)
+    return left == right
+
+
 def parse_datetime(value: Any) -> Optional[datetime]:
     """Coerce a provider timestamp into an aware UTC datetime."""
     if value is None:
@@ -197,6 +244,9 @@ def parse_datetime(value: Any) -> Optional[datetime]:
         text = value.strip()
         if not text:
             return None
+        if text.endswith(" UTC"):
+            # GitLab webhook payloads use "2024-05-02 08:00:00 UTC"
+            text = text[:-4] + "+00:00"
         if text.endswith("Z"):
             text = text[:-1] + "+00:00"
         elif len(text) > 5 and text[-5] in "+-" and ":" not in text[-5:]:
@@ -371,6 +421,62 @@ def normalize_issue_status(status: Optional[str]) -> tuple[str, str]:
     return slug or "__none__", label or "Unspecified"
 
 
+def issue_status_columns(status: Optional[str]) -> dict[str, str]:
+    """Return the persisted ``status_key`` and ``status_category`` for a raw status."""
+    return {
+        "status_key": normalize_issue_status(status)[0],
+        "status_category": get_status_category(status),
+    }
+
+
+@event.listens_for(ExternalIssue, "before_insert")
+@event.listens_for(ExternalIssue, "before_update")
+def _store_issue_status_columns(mapper, connection, target: ExternalIssue) -> None:
+    # Keeps the normalized columns in step with ``status`` for ORM writes; the bulk
+    # sync upsert writes them itself through issue_status_columns()
+    for column, value in issue_status_columns(target.status).items():
+        if getattr(target, column) != value:
+            setattr(target, column, value)
+
+
+def issue_description_excerpt(
+    raw_payload: Optional[dict[str, Any]], provider: Optional[str]
+) -> Optional[str]:
+    """Return the first characters of an issue description as a single line of text."""
+    # agent_context imports this module, so its description parser is loaded lazily
+    from ..agent_context import extract_payload_description
+
+    description = extract_payload_description(raw_payload, provider)
+    if not description:
+        return None
+    text = " ".join(description.split())
+    if len(text) <= DESCRIPTION_EXCERPT_LENGTH:
+        return text
+    return text[: DESCRIPTION_EXCERPT_LENGTH - 1].rstrip() + "…"
+
+
+@event.listens_for(ExternalIssue, "before_insert")
+@event.listens_for(ExternalIssue, "before_update")
+def _store_issue_description_excerpt(
+    mapper, connection, target: ExternalIssue
+) -> None:
+    # Recomputed only when raw_payload was assigned, so the deferred column is never
+    # loaded just to flush another change
+    if not inspect(target).attrs.raw_payload.history.has_changes():
+        return
+    provider = connection.scalar(
+        select(TenantIntegration.provider)
+        .join(
+            ProjectIntegration,
+            ProjectIntegration.integration_id == TenantIntegration.id,
+        )
+        .where(ProjectIntegration.id == target.project_integration_id)
+    )
+    target.description_excerpt = issue_description_excerpt(
+        target.raw_payload, provider
+    )
+
+
 def test_provider_credentials(
     provider: str,
     api_token: str,
@@ -0,0 +1,406 @@
+"""Webhook ingestion for GitHub, GitLab and Jira issue events.
+
+Provider deliveries are verified against the ``webhook_secret`` stored in the tenant
+integration settings, converted into :class:`IssuePayload` objects and applied with the
+same upsert path as scheduled syncs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, List, Mapping, Optional
+
+from werkzeug.datastructures import Headers
+
+from ...models import ExternalIssue, ProjectIntegration, TenantIntegration
+from . import (
+    IssueCommentPayload,
+    IssuePayload,
+    IssueSyncError,
+    SyncedIssue,
+    apply_issue_payloads,
+    deserialize_issue_comments,
+)
+from .utils import (
+    ensure_base_url,
+    load_stored_issue_state,
+    normalize_assignee_name,
+    parse_datetime,
+)
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_WEBHOOK_PROVIDERS = {"github", "gitlab", "jira"}
+MAX_COMMENTS_PER_ISSUE = 20
+
+
+class WebhookVerificationError(Exception):
+    """Raised when a webhook delivery cannot be authenticated."""
+
+
+@dataclass(slots=True)
+class WebhookEvent:
+    """An issue change extracted from a provider webhook delivery."""
+
+    project_identifier: str
+    issue: IssuePayload
+    comment: Optional[IssueCommentPayload] = None
+    comment_deleted: bool = False
+    assignee_known: bool = True  # False when the delivery omits assignee details
+    assignee_named: bool = True  # False when the assignee arrives as a bare login
+
+
+def verify_webhook_signature(
+    provider: str,
+    integration: TenantIntegration,
+    headers: Mapping[str, str] | Headers,
+    body: bytes,
+    token: Optional[str] = None,
+) -> None:
+    """Authenticate a delivery using the integration's ``webhook_secret``.
+
+    GitHub and Jira Cloud sign the body with HMAC-SHA256 (``X-Hub-Signature-256`` and
+    ``X-Hub-Signature``). GitLab echoes the secret in ``X-Gitlab-Token``. Jira Server
+    cannot sign deliveries, so a ``token`` query parameter is accepted instead.
+
+    Raises:
+        WebhookVerificationError: If no secret is configured or verification fails.
+    """
+    settings = integration.settings or {}
+    secret = str(settings.get("webhook_secret") or "")
+    if not secret:
+        raise WebhookVerificationError("Webhook secret is not configured.")
+
+    if provider == "gitlab":
+        supplied = headers.get("X-Gitlab-Token") or ""
+        if not hmac.compare_digest(supplied.encode(), secret.encode()):
+            raise WebhookVerificationError("Invalid GitLab webhook token.")
+        return
+
+    header = "X-Hub-Signature-256" if provider == "github" else "X-Hub-Signature"
+    signature = headers.get(header)
+    if signature:
+        expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(signature.strip().encode(), expected.encode()):
+            raise WebhookVerificationError("Invalid webhook signature.")
+        return
+
+    if provider == "jira" and token and hmac.compare_digest(token.encode(), secret.encode()):
+        return
+    raise WebhookVerificationError("Missing webhook signature.")
+
+
+def parse_webhook_event(
+    provider: str,
+    integration: TenantIntegration,
+    headers: Mapping[str, str] | Headers,
+    payload: Mapping[str, Any],
+) -> Optional[WebhookEvent]:
+    """Convert a provider delivery into a :class:`WebhookEvent`.
+
+    Returns:
+        The extracted event, or None when the delivery does not concern an issue.
+
+    Raises:
+        IssueSyncError: If the payload is missing required issue fields.
+    """
+    if provider == "github":
+        return _parse_github_event(headers.get("X-GitHub-Event") or "", payload)
+    if provider == "gitlab":
+        return _parse_gitlab_event(payload)
+    if provider == "jira":
+        return _parse_jira_event(integration, payload)
+    raise IssueSyncError(f"Unsupported webhook provider '{provider}'.")
+
+
+def apply_webhook_event(
+    integration: TenantIntegration, event: WebhookEvent
+) -> List[SyncedIssue]:
+    """Upsert the issue carried by ``event`` into every matching project integration.
+
+    Deliveries rarely carry the full comment history, so stored comments are kept and
+    the delivered comment is merged in. The sync cursor is left untouched so the next
+    scheduled pass still picks up changes the webhook did not cover.
+    """
+    project_integrations = [
+        project_integration
+        for project_integration in ProjectIntegration.query.filter_by(
+            integration_id=integration.id
+        ).all()
+        if _receives_event(integration, project_integration, event)
+    ]
+
+    updated: List[SyncedIssue] = []
+    for project_integration in project_integrations:
+        payload = _merge_stored_state(integration, project_integration, event)
+        updated.extend(
+            apply_issue_payloads(project_integration, [payload], mark_synced=False)
+        )
+    return updated
+
+
+def _receives_event(
+    integration: TenantIntegration,
+    project_integration: ProjectIntegration,
+    event: WebhookEvent,
+) -> bool:
+    """Return True when the delivered issue belongs to ``project_integration``.
+
+    Jira project integrations configured with JQL are matched by asking Jira whether
+    the JQL selects the issue; the others by their project identifier.
+    """
+    identifier = event.project_identifier.lower()
+    config = project_integration.config or {}
+    jql = config.get("jql") if (integration.provider or "").lower() == "jira" else None
+    if not jql:
+        return (project_integration.external_identifier or "").lower() == identifier
+    # JQL naming other projects only cannot match; skip the round trip
+    if re.search(r"\bproject\b", jql, re.IGNORECASE) and not re.search(
+        rf"\b{re.escape(identifier)}\b", jql, re.IGNORECASE
+    ):
+        return False
+
+    from .jira import jql_matches_issue
+
+    try:
+        return jql_matches_issue(
+            integration, project_integration, event.issue.external_id
+        )
+    except IssueSyncError as exc:
+        # The next scheduled sync still picks the change up
+        logger.warning(
+            "Could not match Jira webhook issue %s against the JQL of project "
+            "integration %s: %s",
+            event.issue.external_id,
+            project_integration.id,
+            exc,
+        )
+        return False
+
+
+def _merge_stored_state(
+    integration: TenantIntegration,
+    project_integration: ProjectIntegration,
+    event: WebhookEvent,
+) -> IssuePayload:
+    payload = event.issue
+    comments = list(payload.comments)
+    if (
+        comments
+        and event.comment is None
+        and event.assignee_known
+        and event.assignee_named
+    ):
+        return payload
+
+    stored = load_stored_issue_state(project_integration, [payload.external_id])
+    existing = stored.get(payload.external_id)
+    if not comments and existing is not None:
+        comments = deserialize_issue_comments(existing.comments)
+    if not event.assignee_known and existing is not None:
+        payload.assignee = existing.assignee
+    elif not event.assignee_named:
+        payload.assignee = _assignee_display_name(integration, existing, payload)
+
+    comment = event.comment
+    if comment is not None:
+        position = next(
+            (
+                index
+                for index, entry in enumerate(comments)
+                if comment.id and entry.id == comment.id
+            ),
+            None,
+        )
+        if position is not None:
+            comments.pop(position)
+        if not event.comment_deleted:
+            # Stored comments are newest-first for every provider; edits keep their slot
+            comments.insert(position if position is not None else 0, comment)
+    payload.comments = comments[:MAX_COMMENTS_PER_ISSUE]
+    return payload
+
+
+def _assignee_display_name(
+    integration: TenantIntegration,
+    existing: Optional[ExternalIssue],
+    payload: IssuePayload,
+) -> Optional[str]:
+    """Resolve the display name polling stores for an assignee delivered as a login.
+
+    Storing the login instead would flip the assignee between webhook and poll and
+    notify the same person twice.
+    """
+    login = payload.assignee_username or ""
+    if existing is not None and existing.assignee:
+        # REST and GraphQL polls both keep the assignee login in the raw payload
+        stored_raw = existing.raw_payload if isinstance(existing.raw_payload, dict) else {}
+        stored_login = str((stored_raw.get("assignee") or {}).get("login") or "")
+        if stored_login.lower() == login.lower():
+            return existing.assignee
+
+    from .github import resolve_user_display_name
+
+    return normalize_assignee_name(
+        resolve_user_display_name(integration, login) or login
+    )
+
+
+def _parse_github_event(
+    event_name: str, payload: Mapping[str, Any]
+) -> Optional[WebhookEvent]:
+    if event_name not in {"issues", "issue_comment"}:
+        return None
+    issue = payload.get("issue")
+    repository = payload.get("repository") or {}
+    if not isinstance(issue, dict) or issue.get("pull_request"):
+        return None
+    number = issue.get("number")
+    full_name = repository.get("full_name")
+    if number is None or not full_name:
+        raise IssueSyncError("GitHub webhook payload missing issue number or repository.")
+
+    assignee = issue.get("assignee") or {}
+    login = assignee.get("login")
+    issue_payload = IssuePayload(
+        external_id=str(number),
+        title=issue.get("title") or "",
+        status=issue.get("state"),
+        assignee=normalize_assignee_name(assignee.get("name") or login),
+        url=issue.get("html_url"),
+        labels=[
+            str(label.get("name"))
+            for label in issue.get("labels") or []
+            if isinstance(label, dict) and label.get("name")
+        ],
+        external_updated_at=parse_datetime(issue.get("updated_at")),
+        raw=dict(issue),
+        assignee_username=str(login) if login else None,
+    )
+
+    comment = None
+    comment_data = payload.get("comment")
+    if event_name == "issue_comment" and isinstance(comment_data, dict):
+        author = (comment_data.get("user") or {}).get("login")
+        comment_id = comment_data.get("id")
+        comment = IssueCommentPayload(
+            author=str(author) if author else None,
+            body=comment_data.get("body") or "",
+            created_at=parse_datetime(comment_data.get("created_at")),
+            url=comment_data.get("html_url"),
+            id=str(comment_id) if comment_id else None,
+            body_html=comment_data.get("body_html") or None,
+        )
+    return WebhookEvent(
+        project_identifier=str(full_name),
+        issue=issue_payload,
+        comment=comment,
+        comment_deleted=payload.get("action") == "deleted" and comment is not None,
+        assignee_named=not login or bool(assignee.get("name")),
+    )
+
+
+def _parse_gitlab_event(payload: Mapping[str, Any]) -> Optional[WebhookEvent]:
+    kind = payload.get("object_kind")
+    attributes = payload.get("object_attributes") or {}
+    if kind == "issue":
+        issue = attributes
+    elif kind == "note" and attributes.get("noteable_type") == "Issue":
+        issue = payload.get("issue") or {}
+    else:
+        return None
+
+    project = payload.get("project") or {}
+    iid = issue.get("iid")
+    path = project.get("path_with_namespace")
+    if iid is None or not path:
+        raise IssueSyncError("GitLab webhook payload missing issue iid or project path.")
+
+    assignees = payload.get("assignees") or []
+    primary = assignees[0] if assignees and isinstance(assignees[0], dict) else {}
+    username = primary.get("username")
+    labels = payload.get("labels") if kind == "issue" else issue.get("labels")
+    # Keep the raw payload close to the REST shape stored by scheduled syncs
+    raw = {**issue, "web_url": issue.get("url"), "labels": [
+        str(label.get("title")) for label in labels or [] if isinstance(label, dict)
+    ]}
+    # Drop the note count so the next poll refreshes notes instead of trusting it
+    raw.pop("user_notes_count", None)
+    issue_payload = IssuePayload(
+        external_id=str(iid),
+        title=issue.get("title") or "",
+        status=issue.get("state"),
+        assignee=normalize_assignee_name(primary.get("name") or username),
+        url=issue.get("url"),
+        labels=raw["labels"],
+        external_updated_at=parse_datetime(issue.get("updated_at")),
+        raw=raw,
+        assignee_username=str(username) if username else None,
+    )
+
+    comment = None
+    if kind == "note" and not attributes.get("system"):
+        user = payload.get("user") or {}
+        author = user.get("name") or user.get("username")
+        note_id = attributes.get("id")
+        comment = IssueCommentPayload(
+            author=str(author) if author else None,
+            body=attributes.get("note") or "",
+            created_at=parse_datetime(attributes.get("created_at")),
+            url=attributes.get("url"),
+            id=str(note_id) if note_id else None,
+        )
+    return WebhookEvent(
+        project_identifier=str(path),
+        issue=issue_payload,
+        comment=comment,
+        assignee_known="assignees" in payload,
+    )
+
+
+def _parse_jira_event(
+    integration: TenantIntegration, payload: Mapping[str, Any]
+) -> Optional[WebhookEvent]:
+    event_name = str(payload.get("webhookEvent") or "")
+    issue = payload.get("issue")
+    if event_name == "jira:issue_deleted" or not isinstance(issue, dict):
+        return None
+    if not (event_name.startswith("jira:issue_") or event_name.startswith("comment_")):
+        return None
+
+    from .jira import _issue_to_payload
+
+    fields = issue.get("fields") or {}
+    project_key = (fields.get("project") or {}).get("key") or str(
+        issue.get("key") or ""
+    ).rsplit("-", 1)[0]
+    if not project_key:
+        raise IssueSyncError("Jira webhook payload missing project key.")
+    if not integration.base_url:
+        raise IssueSyncError("Jira integration requires a base URL.")
+    base_url = ensure_base_url(integration, integration.base_url)
+    issue_payload = _issue_to_payload(base_url, dict(issue))
+
+    comment = None
+    comment_data = payload.get("comment")
+    if event_name.startswith("comment_") and isinstance(comment_data, dict):
+        author = comment_data.get("author") or {}
+        author_name = author.get("displayName") or author.get("name")
+        comment_id = comment_data.get("id")
+        comment = IssueCommentPayload(
+            author=str(author_name) if author_name else None,
+            body=str(comment_data.get("body") or ""),
+            created_at=parse_datetime(comment_data.get("created")),
+            url=None,
+            id=str(comment_id) if comment_id else None,
+        )
+    return WebhookEvent(
+        project_identifier=str(project_key),
+        issue=issue_payload,
+        comment=comment,
+        comment_deleted=event_name == "comment_deleted",
+    )
@@ -0,0 +1,588 @@
+"""Persistent job queue for long-running operations.
+
+Request handlers enqueue a :class:`~app.models.BackgroundJob` row and return its ID
+instead of running issue syncs, backups, git pulls, AI issue generation or Semaphore
+runs inline. A separate
+``flask jobs-worker`` process claims queued rows and runs them on a thread pool,
+reporting progress back to the row so clients can poll ``/api/v1/jobs/<id>``.
+
+Jobs are claimed with a conditional ``UPDATE ... WHERE status = 'queued'`` so several
+worker processes can share one database. Running jobs carry a heartbeat; jobs whose
+worker died are re-queued (or failed after ``JOB_QUEUE_MAX_ATTEMPTS``) by the worker,
+which checks at startup and then every third of ``JOB_QUEUE_STALE_SECONDS``; web
+processes check before starting a job and the scheduler leader checks periodically.
+
+Cancellation is cooperative: :func:`request_cancel` sets ``cancel_requested`` and the
+next progress report from the handler raises :class:`JobCancelled`. Without the queue,
+:func:`start_job` runs the job on a thread of the web process so it is still tracked;
+such inline jobs cannot be resumed elsewhere, so they fail once their process stops
+sending heartbeats.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Protocol, cast
+
+from flask import Flask, current_app
+from sqlalchemy import CursorResult, select, update
+
+from ..extensions import db
+from ..models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressCallback(Protocol):
+    def __call__(
+        self,
+        percent: int,
+        message: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None: ...
+
+
+JobHandler = Callable[[BackgroundJob, ProgressCallback], Optional[Dict[str, Any]]]
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUS_CANCELLED = "cancelled"
+FINISHED_JOB_STATUSES = frozenset(
+    {JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED, JOB_STATUS_CANCELLED}
+)
+# Marks the worker ID of jobs run on a web process thread by start_job
+INLINE_WORKER_SUFFIX = ":inline"
+
+
+class JobQueueError(Exception):
+    """Raised when a job cannot be enqueued or run."""
+
+
+class JobCancelled(Exception):
+    """Raised from a progress report once cancellation has been requested."""
+
+
+def is_job_queue_enabled() -> bool:
+    """Return True when long-running operations should be enqueued."""
+    return bool(current_app.config.get("JOB_QUEUE_ENABLED", False))
+
+
+def enqueue_job(
+    kind: str, payload: Optional[Dict[str, Any]] = None, *, user_id: Optional[int] = None
+) -> BackgroundJob:
+    """Persist a queued job and commit it so workers can pick it up immediately."""
+    if kind not in JOB_HANDLERS:
+        raise JobQueueError(f"Unknown job kind '{kind}'.")
+    job = BackgroundJob(
+        kind=kind,
+        status=JOB_STATUS_QUEUED,
+        payload=dict(payload or {}),
+        created_by_user_id=user_id,
+    )
+    db.session.add(job)
+    db.session.commit()
+    logger.info("Queued %s job #%d", kind, job.id)
+    return job
+
+
+def claim_next_job(worker_id: str) -> Optional[int]:
+    """Atomically mark the oldest queued job as running and return its ID."""
+    candidates = db.session.scalars(
+        select(BackgroundJob.id)
+        .where(BackgroundJob.status == JOB_STATUS_QUEUED)
+        .order_by(BackgroundJob.id)
+        .limit(5)
+    ).all()
+    for job_id in candidates:
+        if _claim_job(job_id, worker_id):
+            return job_id
+    return None
+
+
+def _claim_job(job_id: int, worker_id: str) -> bool:
+    now = datetime.utcnow()
+    # Another worker may claim the same row first; only one UPDATE can match
+    claimed = db.session.execute(
+        update(BackgroundJob)
+        .where(
+            BackgroundJob.id == job_id,
+            BackgroundJob.status == JOB_STATUS_QUEUED,
+        )
+        .values(
+            status=JOB_STATUS_RUNNING,
+            worker_id=worker_id,
+            started_at=now,
+            heartbeat_at=now,
+            attempts=BackgroundJob.attempts + 1,
+        )
+    )
+    db.session.commit()
+    return cast(CursorResult, claimed).rowcount == 1
+
+
+def start_job(
+    kind: str, payload: Optional[Dict[str, Any]] = None, *, user_id: Optional[int] = None
+) -> BackgroundJob:
+    """Queue a job, or run it on a background thread when no worker is configured.
+
+    Either way the caller gets a tracked row it can poll, stream and cancel.
+    """
+    # Inline jobs have no worker to recover them once their web process is gone
+    recover_stale_jobs()
+    job = enqueue_job(kind, payload, user_id=user_id)
+    if is_job_queue_enabled():
+        return job
+    worker_id = f"{socket.gethostname()}:{os.getpid()}{INLINE_WORKER_SUFFIX}"
+    if not _claim_job(job.id, worker_id):
+        raise JobQueueError(f"Job #{job.id} was claimed by another worker.")
+    db.session.refresh(job)
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    thread = threading.Thread(
+        target=_run_inline,
+        args=(app, job.id, worker_id),
+        name=f"job-{job.id}",
+        daemon=True,
+    )
+    thread.start()
+    return job
+
+
+def request_cancel(job: BackgroundJob) -> BackgroundJob:
+    """Cancel a queued job outright or ask a running one to stop at its next page."""
+    if job.status == JOB_STATUS_QUEUED:
+        # The conditional UPDATE keeps a worker from claiming it in the meantime
+        cancelled = db.session.execute(
+            update(BackgroundJob)
+            .where(
+                BackgroundJob.id == job.id,
+                BackgroundJob.status == JOB_STATUS_QUEUED,
+            )
+            .values(
+                status=JOB_STATUS_CANCELLED,
+                cancel_requested=True,
+                finished_at=datetime.utcnow(),
+            )
+        )
+        if cast(CursorResult, cancelled).rowcount == 1:
+            db.session.commit()
+            db.session.refresh(job)
+            return job
+    if job.status not in FINISHED_JOB_STATUSES:
+        db.session.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job.id)
+            .values(cancel_requested=True)
+        )
+    db.session.commit()
+    db.session.refresh(job)
+    return job
+
+
+def _cancel_requested(job_id: int) -> bool:
+    return bool(
+        db.session.scalar(
+            select(BackgroundJob.cancel_requested).where(BackgroundJob.id == job_id)
+        )
+    )
+
+
+def run_job(job_id: int) -> BackgroundJob:
+    """Run a claimed job to completion and record its result or error."""
+    job = db.session.get(BackgroundJob, job_id)
+    if job is None:
+        raise JobQueueError(f"Job #{job_id} not found.")
+    handler = JOB_HANDLERS.get(job.kind)
+
+    def report_progress(
+        percent: int,
+        message: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        job.progress = max(0, min(100, int(percent)))
+        if message is not None:
+            job.progress_message = message[:255]
+        if details is not None:
+            # Handlers mutate their details in place; a copy marks the column dirty
+            job.result = copy.deepcopy(details)
+        job.heartbeat_at = datetime.utcnow()
+        db.session.commit()
+        if _cancel_requested(job_id):
+            raise JobCancelled(f"Job #{job_id} was cancelled")
+
+    try:
+        if handler is None:
+            raise JobQueueError(f"No handler registered for job kind '{job.kind}'.")
+        result = handler(job, report_progress)
+    except JobCancelled:
+        db.session.rollback()
+        logger.info("Job #%d (%s) cancelled", job_id, job.kind)
+        job = db.session.get(BackgroundJob, job_id)
+        job.status = JOB_STATUS_CANCELLED
+        job.error_message = "Cancelled"
+    except Exception as exc:  # noqa: BLE001 - recorded on the job row
+        db.session.rollback()
+        logger.exception("Job #%d (%s) failed", job_id, job.kind)
+        job = db.session.get(BackgroundJob, job_id)
+        job.status = JOB_STATUS_FAILED
+        job.error_message = (str(exc) or type(exc).__name__)[:1000]
+    else:
+        job.status = JOB_STATUS_SUCCEEDED
+        job.result = result or {}
+        job.progress = 100
+    job.finished_at = datetime.utcnow()
+    db.session.commit()
+    return job
+
+
+def requeue_stale_jobs(stale_after: timedelta, max_attempts: int) -> int:
+    """Re-queue running jobs whose worker stopped sending heartbeats.
+
+    Jobs started inline by a web process that has since exited are failed instead.
+    """
+    cutoff = datetime.utcnow() - stale_after
+    stale_jobs = BackgroundJob.query.filter(
+        BackgroundJob.status == JOB_STATUS_RUNNING,
+        BackgroundJob.heartbeat_at < cutoff,
+    ).all()
+    for job in stale_jobs:
+        inline = (job.worker_id or "").endswith(INLINE_WORKER_SUFFIX)
+        if inline or job.attempts >= max_attempts:
+            job.status = JOB_STATUS_FAILED
+            job.error_message = "Worker stopped responding"
+            job.finished_at = datetime.utcnow()
+        else:
+            job.status = JOB_STATUS_QUEUED
+            job.worker_id = None
+    db.session.commit()
+    return len(stale_jobs)
+
+
+def recover_stale_jobs() -> int:
+    """Apply :func:`requeue_stale_jobs` with the configured staleness and attempts."""
+    return requeue_stale_jobs(
+        timedelta(seconds=_stale_seconds(current_app)),
+        int(current_app.config.get("JOB_QUEUE_MAX_ATTEMPTS", 3) or 1),
+    )
+
+
+def _recover_in_app_context(app: Flask) -> int:
+    with app.app_context():
+        recovered = recover_stale_jobs()
+    if recovered:
+        logger.warning("Recovered %d job(s) from stopped workers", recovered)
+    return recovered
+
+
+def _stale_seconds(app: Flask) -> int:
+    return int(app.config.get("JOB_QUEUE_STALE_SECONDS", 600) or 600)
+
+
+def _touch_running_jobs(worker_id: str) -> None:
+    db.session.execute(
+        update(BackgroundJob)
+        .where(
+            BackgroundJob.worker_id == worker_id,
+            BackgroundJob.status == JOB_STATUS_RUNNING,
+        )
+        .values(heartbeat_at=datetime.utcnow())
+    )
+    db.session.commit()
+
+
+def _run_in_app_context(app: Flask, job_id: int) -> None:
+    with app.app_context():
+        run_job(job_id)
+
+
+def _run_inline(app: Flask, job_id: int, worker_id: str) -> None:
+    """Run a job started by :func:`start_job`, sending heartbeats until it ends."""
+    done = threading.Event()
+    interval = max(1.0, _stale_seconds(app) / 3)
+
+    def send_heartbeats() -> None:
+        while not done.wait(interval):
+            with app.app_context():
+                _touch_running_jobs(worker_id)
+
+    threading.Thread(
+        target=send_heartbeats, name=f"job-{job_id}-heartbeat", daemon=True
+    ).start()
+    try:
+        _run_in_app_context(app, job_id)
+    finally:
+        done.set()
+
+
+def run_worker(
+    app: Flask,
+    *,
+    concurrency: int = 2,
+    poll_interval: float = 2.0,
+    drain: bool = False,
+    stop_event: Optional[threading.Event] = None,
+) -> int:
+    """Claim and run queued jobs until stopped; return the number of jobs run.
+
+    With ``drain=True`` the worker exits once the queue is empty, which is what tests
+    and one-off ``flask jobs-worker --drain`` invocations use.
+    """
+    stop = stop_event or threading.Event()
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    concurrency = max(1, concurrency)
+
+    recovery_interval = max(1.0, _stale_seconds(app) / 3)
+    _recover_in_app_context(app)
+    recovered_at = time.monotonic()
+
+    logger.info("Job worker %s started (concurrency=%d)", worker_id, concurrency)
+    processed = 0
+    active: set[Future] = set()
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="job-worker"
+    ) as executor:
+        while not stop.is_set():
+            active = {future for future in active if not future.done()}
+            claimed = False
+            if time.monotonic() - recovered_at >= recovery_interval:
+                _recover_in_app_context(app)
+                recovered_at = time.monotonic()
+            with app.app_context():
+                if active:
+                    _touch_running_jobs(worker_id)
+                while len(active) < concurrency:
+                    job_id = claim_next_job(worker_id)
+                    if job_id is None:
+                        break
+                    active.add(executor.submit(_run_in_app_context, app, job_id))
+                    processed += 1
+                    claimed = True
+            if drain and not claimed and not active:
+                break
+            stop.wait(0.1 if claimed else poll_interval)
+    logger.info("Job worker %s stopped after %d job(s)", worker_id, processed)
+    return processed
+
+
+def _run_issue_sync(job: BackgroundJob, progress: ProgressCallback) -> Dict[str, Any]:
+    from ..models import ProjectIntegration
+    from .issues import SyncedIssue, sync_project_integration
+    from .sync_scheduler import integration_sync_lock
+
+    payload = job.payload or {}
+    query = ProjectIntegration.query.order_by(ProjectIntegration.id)
+    ids = payload.get("project_integration_ids")
+    if ids:
+        query = query.filter(ProjectIntegration.id.in_(ids))
+    integrations = query.all()
+    force_full = bool(payload.get("force_full"))
+    total = len(integrations)
+
+    # Per-integration progress, stored on the job row after every page
+    runs = [
+        {
+            "project_integration_id": integration.id,
+            "name": _integration_label(integration),
+            "provider": (
+                integration.integration.provider if integration.integration else None
+            ),
+            "status": "pending",
+            "pages": 0,
+            "issues": 0,
+            "elapsed_seconds": 0.0,
+        }
+        for integration in integrations
+    ]
+    details: Dict[str, Any] = {"integration_progress": runs}
+
+    synced = 0
+    issues_updated = 0
+    failed: list[int] = []
+    busy: list[int] = []
+    for index, (integration, run) in enumerate(zip(integrations, runs)):
+        started = time.monotonic()
+        percent = index * 100 // total
+
+        def on_page(page: list[SyncedIssue], run=run, started=started, percent=percent):
+            run["pages"] += 1
+            run["issues"] += len(page)
+            run["elapsed_seconds"] = round(time.monotonic() - started, 1)
+            progress(
+                percent,
+                f"{run['name']}: page {run['pages']} ({run['issues']} issues)",
+                details,
+            )
+
+        run["status"] = "running"
+        progress(percent, f"Syncing {run['name']} ({index + 1}/{total})", details)
+        with integration_sync_lock(current_app, integration.id) as acquired:
+            if not acquired:
+                # A scheduled sync (or another job) is writing the same issues
+                busy.append(run["project_integration_id"])
+                run["status"] = "skipped"
+                run["error"] = "Another sync of this integration is running"
+                continue
+            try:
+                results = sync_project_integration(
+                    integration, force_full=force_full, on_page=on_page
+                )
+            except JobCancelled:
+                raise
+            except Exception as exc:  # noqa: BLE001 - one provider must not stop the run
+                db.session.rollback()
+                logger.warning(
+                    "Issue sync failed for integration %s: %s", integration.id, exc
+                )
+                failed.append(run["project_integration_id"])
+                run["status"] = "failed"
+                run["error"] = str(exc) or type(exc).__name__
+            else:
+                db.session.commit()
+                synced += 1
+                issues_updated += sum(1 for issue in results if issue.changed)
+                run["status"] = "succeeded"
+        run["elapsed_seconds"] = round(time.monotonic() - started, 1)
+
+    return {
+        "integrations": total,
+        "synced": synced,
+        "failed_integration_ids": failed,
+        "busy_integration_ids": busy,
+        "issues_updated": issues_updated,
+        **details,
+    }
+
+
+def _integration_label(project_integration: Any) -> str:
+    integration = project_integration.integration
+    project = project_integration.project
+    parts = [
+        integration.name if integration else None,
+        project.name if project else None,
+    ]
+    return " / ".join(part for part in parts if part) or f"#{project_integration.id}"
+
+
+def _run_backup(job: BackgroundJob, progress: ProgressCallback) -> Dict[str, Any]:
+    from .backup_service import create_backup
+
+    payload = job.payload or {}
+    progress(10, "Creating backup")
+    backup = create_backup(
+        description=payload.get("description"), user_id=job.created_by_user_id
+    )
+    return {
+        "backup_id": backup.id,
+        "filename": backup.filename,
+        "size_bytes": backup.size_bytes,
+    }
+
+
+def _run_git_pull(job: BackgroundJob, progress: ProgressCallback) -> Dict[str, Any]:
+    from ..models import Project, User
+    from .activity_service import ActivityType, ResourceType, log_activity
+    from .git_service import run_git_action
+
+    payload = job.payload or {}
+    project = db.session.get(Project, payload.get("project_id"))
+    if project is None:
+        raise JobQueueError(f"Project {payload.get('project_id')} not found.")
+    user = db.session.get(User, job.created_by_user_id) if job.created_by_user_id else None
+
+    progress(10, f"Pulling {project.name}")
+    output = run_git_action(
+        project, "pull", ref=payload.get("ref"), clean=bool(payload.get("clean")), user=user
+    )
+    log_activity(
+        action_type=ActivityType.GIT_PULL,
+        user_id=job.created_by_user_id,
+        resource_type=ResourceType.PROJECT,
+        resource_id=project.id,
+        resource_name=project.name,
+        status="success",
+        description=f"Git pull on project {project.name}",
+        source=payload.get("source") or "api",
+    )
+    return {"output": output}
+
+
+def _run_ai_issue_preview(
+    job: BackgroundJob, progress: ProgressCallback
+) -> Dict[str, Any]:
+    from .ai_issue_generator import generate_issue_from_description
+
+    payload = job.payload or {}
+    progress(10, "Generating issue preview")
+    started = time.monotonic()
+    issue_data = generate_issue_from_description(
+        payload.get("description") or "",
+        payload.get("ai_tool"),
+        payload.get("issue_type"),
+        user_id=job.created_by_user_id,
+    )
+    return {
+        "issue_data": issue_data,
+        "generation_time": round(time.monotonic() - started, 2),
+    }
+
+
+def _run_semaphore_task(job: BackgroundJob, progress: ProgressCallback) -> Dict[str, Any]:
+    """Start a Semaphore template (unless ``task_id`` is given) and follow the task."""
+    from ..models import Project
+    from .semaphore_client import TERMINAL_STATUSES, SemaphoreTimeoutError
+    from .semaphore_service import get_task_status, run_template
+
+    payload = job.payload or {}
+    project = db.session.get(Project, payload.get("project_id"))
+    if project is None:
+        raise JobQueueError(f"Project {payload.get('project_id')} not found.")
+
+    task_id = payload.get("task_id")
+    if task_id is None:
+        progress(5, f"Starting Semaphore template {payload.get('template_id')}")
+        task = run_template(
+            project,
+            payload.get("template_id"),
+            variables=payload.get("variables"),
+            limit=payload.get("limit"),
+            tags=payload.get("tags"),
+            skip_tags=payload.get("skip_tags"),
+            dry_run=bool(payload.get("dry_run")),
+            diff=bool(payload.get("diff")),
+        )
+        task_id = task.get("id")
+    details: Dict[str, Any] = {"task_id": task_id}
+
+    poll_interval = float(payload.get("poll_interval") or 2.0)
+    timeout = float(payload.get("timeout") or 600)
+    started = time.monotonic()
+    # Polled here rather than through wait_for_task so every check is a heartbeat
+    # and a chance to cancel
+    while True:
+        task = get_task_status(project, task_id)
+        status = (task.get("status") or "").lower()
+        if status in TERMINAL_STATUSES:
+            return {**details, "status": status, "task": task}
+        if time.monotonic() - started > timeout:
+            raise SemaphoreTimeoutError(
+                f"Semaphore task {task_id} did not finish within {timeout} seconds."
+            )
+        progress(10, f"Semaphore task #{task_id}: {status or 'waiting'}", details)
+        time.sleep(poll_interval)
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    "issue_sync": _run_issue_sync,
+    "backup": _run_backup,
+    "git_pull": _run_git_pull,
+    "ai_issue_preview": _run_ai_issue_preview,
+    "semaphore_run": _run_semaphore_task,
+}
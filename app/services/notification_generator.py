@@ -7,14 +7,18 @@ notifications for users based on their preferences.
 from __future__ import annotations
 
 import re
-from typing import Optional
+from collections import defaultdict
+from typing import Any, Iterable, Optional
 
 
-from ..models import ExternalIssue, User, UserIdentityMap
+from ..extensions import db
+from ..models import ExternalIssue, User
+from .identity_index import get_identity_index, lookup_identity
 from .notification_service import (
     NotificationPriority,
     NotificationType,
     create_notification,
+    create_notifications_bulk,
     notify_admins,
 )
 
@@ -22,7 +26,7 @@ from .notification_service import (
 def resolve_user_from_external_identity(
     external_username: str, provider: str, integration_id: Optional[int] = None
 ) -> Optional[User]:
-    """Resolve an external username to a local user via UserIdentityMap.
+    """Resolve an external username to a local user via the shared identity index.
 
     Args:
         external_username: The external username (e.g., GitHub username, Jira account ID)
@@ -32,24 +36,135 @@ def resolve_user_from_external_identity(
     Returns:
         User object if mapping exists, None otherwise
     """
-    # Map provider to the correct column name
-    provider_column_map = {
-        "github": "github_username",
-        "gitlab": "gitlab_username",
-        "jira": "jira_account_id",
+    match = lookup_identity(provider, external_username)
+    if match:
+        return db.session.get(User, match.user_id)
+    return None
+
+
+def resolve_users_from_external_identities(
+    provider: str, external_usernames: Iterable[str]
+) -> dict[str, int]:
+    """Resolve many external usernames of one provider to local user IDs.
+
+    Args:
+        provider: The provider name ('github', 'gitlab', 'jira')
+        external_usernames: External usernames to resolve
+
+    Returns:
+        Dict mapping each resolved external username to a user ID; unmapped
+        usernames are left out
+    """
+    index = get_identity_index()
+    if index is None:
+        return {}
+    resolved: dict[str, int] = {}
+    for username in external_usernames:
+        match = index.lookup(provider, username)
+        if match is not None:
+            resolved[username] = match.user_id
+    return resolved
+
+
+def notify_issue_changes(events: Iterable[tuple]) -> int:
+    """Generate assignment, status-change and mention notifications for many issues.
+
+    This is the batched form of :func:`notify_issue_assigned`,
+    :func:`notify_issue_status_changed` and the mention half of
+    :func:`notify_issue_commented` used by issue sync: identities are resolved
+    from the in-memory identity index, preferences are loaded once and every
+    notification is written with a single insert and commit.
+
+    Args:
+        events: ``("assignee", issue, assignee_username)``,
+            ``("status", issue, old_status, new_status)`` or
+            ``("mention", issue, comment_author, comment_body)`` tuples
+
+    Returns:
+        Number of notifications created
+    """
+    resolved_events: list[tuple[str, ExternalIssue, str, str, tuple]] = []
+    usernames: dict[str, set[str]] = defaultdict(set)
+    for kind, issue, *event_args in events:
+        integration = issue.project_integration.integration
+        provider = integration.provider.lower() if integration else None
+        if not provider:
+            continue
+        if kind == "mention":
+            comment_author = event_args[0]
+            if comment_author:
+                usernames[provider].add(comment_author)
+            for handle in _mention_handles(event_args[1], provider):
+                usernames[provider].add(handle)
+                resolved_events.append(
+                    (kind, issue, provider, handle, tuple(event_args))
+                )
+            continue
+        username = event_args[0] if kind == "assignee" else issue.assignee
+        if not username:
+            continue
+        usernames[provider].add(username)
+        resolved_events.append((kind, issue, provider, username, tuple(event_args)))
+
+    user_ids = {
+        provider: resolve_users_from_external_identities(provider, names)
+        for provider, names in usernames.items()
     }
-    column_name = provider_column_map.get(provider.lower())
-    if not column_name:
-        return None
 
-    # Query using the provider-specific column
-    mapping = UserIdentityMap.query.filter(
-        getattr(UserIdentityMap, column_name) == external_username
-    ).first()
+    notifications: list[dict[str, Any]] = []
+    mentioned: set[tuple[int, int]] = set()
+    for kind, issue, provider, username, details in resolved_events:
+        user_id = user_ids[provider].get(username)
+        if user_id is None:
+            continue
+        project = issue.project_integration.project
+        metadata = {
+            "project_id": project.id if project else None,
+            "project_name": project.name if project else "Unknown",
+            "issue_external_id": issue.external_id,
+            "provider": provider,
+            "integration_id": issue.project_integration.integration.id,
+        }
+        notification = {
+            "user_id": user_id,
+            "resource_type": "issue",
+            "resource_id": issue.id,
+            "resource_url": f"/admin/issues?status=all&highlight={issue.id}",
+            "metadata": metadata,
+        }
+        if kind == "assignee":
+            notification.update(
+                notification_type=NotificationType.ISSUE_ASSIGNED,
+                title=f"Issue assigned: {issue.external_id}",
+                message=issue.title,
+                priority=NotificationPriority.NORMAL,
+            )
+        elif kind == "mention":
+            comment_author, comment_body = details
+            # Skip self-mentions and repeat mentions of one user on one issue
+            if user_id == user_ids[provider].get(comment_author) or (
+                (user_id, issue.id) in mentioned
+            ):
+                continue
+            mentioned.add((user_id, issue.id))
+            metadata["comment_author"] = comment_author
+            notification.update(
+                notification_type=NotificationType.ISSUE_MENTIONED,
+                title=f"You were mentioned in {issue.external_id}",
+                message=_truncate_message(comment_body, 200),
+                priority=NotificationPriority.HIGH,
+            )
+        else:
+            old_status, new_status = details
+            metadata.update(old_status=old_status, new_status=new_status)
+            notification.update(
+                notification_type=NotificationType.ISSUE_STATUS_CHANGED,
+                title=f"Issue {issue.external_id} status changed",
+                message=f"{old_status} → {new_status}",
+            )
+        notifications.append(notification)
 
-    if mapping:
-        return User.query.get(mapping.user_id)
-    return None
+    return create_notifications_bulk(notifications)
 
 
 def notify_issue_assigned(issue: ExternalIssue, assignee_username: str) -> bool:
@@ -434,23 +549,10 @@ def notify_session_error(
     )
 
 
-def _extract_mentions(
-    text: str, provider: str, integration_id: Optional[int] = None
-) -> list[User]:
-    """Extract @mentions from text and resolve to users.
-
-    Args:
-        text: Text containing @mentions
-        provider: Provider name for username resolution
-        integration_id: Optional integration ID
-
-    Returns:
-        List of resolved User objects
-    """
-    users: list[User] = []
-
+def _mention_handles(text: str, provider: str) -> list[str]:
+    """Return the distinct usernames/account IDs @mentioned in ``text``."""
     if not text:
-        return users
+        return []
 
     # Different mention patterns for different providers
     if provider == "jira":
@@ -463,12 +565,32 @@ def _extract_mentions(
         # GitHub/GitLab use @username
         patterns = [r"@([a-zA-Z0-9_-]+)"]
 
+    handles: list[str] = []
     for pattern in patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            user = resolve_user_from_external_identity(match, provider, integration_id)
-            if user and user not in users:
-                users.append(user)
+        for match in re.findall(pattern, text):
+            if match not in handles:
+                handles.append(match)
+    return handles
+
+
+def _extract_mentions(
+    text: str, provider: str, integration_id: Optional[int] = None
+) -> list[User]:
+    """Extract @mentions from text and resolve to users.
+
+    Args:
+        text: Text containing @mentions
+        provider: Provider name for username resolution
+        integration_id: Optional integration ID
+
+    Returns:
+        List of resolved User objects
+    """
+    users: list[User] = []
+    for handle in _mention_handles(text, provider):
+        user = resolve_user_from_external_identity(handle, provider, integration_id)
+        if user and user not in users:
+            users.append(user)
 
     return users
 
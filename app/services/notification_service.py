@@ -6,10 +6,12 @@ as well as utilities for querying and bulk operations.
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 from flask import current_app
+from sqlalchemy import insert
 
 from ..extensions import db
 from ..models import Notification, NotificationPreferences, User
@@ -103,19 +105,9 @@ def create_notification(
 
     # Check user preferences
     prefs = get_or_create_preferences(user_id)
-    if notification_type not in prefs.enabled_types:
+    if not _is_allowed(prefs, notification_type, metadata):
         return None
 
-    # Check if project is muted
-    if metadata and "project_id" in metadata:
-        if metadata["project_id"] in prefs.muted_projects:
-            return None
-
-    # Check if integration is muted
-    if metadata and "integration_id" in metadata:
-        if metadata["integration_id"] in prefs.muted_integrations:
-            return None
-
     notification = Notification(
         user_id=user_id,
         notification_type=notification_type,
@@ -138,6 +130,110 @@ def create_notification(
     return notification
 
 
+def _is_allowed(
+    prefs: NotificationPreferences,
+    notification_type: str,
+    metadata: Optional[dict],
+) -> bool:
+    """Return True if a user's preferences let this notification through."""
+    if notification_type not in prefs.enabled_types:
+        return False
+
+    # Check if project is muted
+    if metadata and "project_id" in metadata:
+        if metadata["project_id"] in prefs.muted_projects:
+            return False
+
+    # Check if integration is muted
+    if metadata and "integration_id" in metadata:
+        if metadata["integration_id"] in prefs.muted_integrations:
+            return False
+    return True
+
+
+def load_preferences(user_ids: Iterable[int]) -> dict[int, NotificationPreferences]:
+    """Load notification preferences for many users with a single query.
+
+    Users without a preferences row get unsaved defaults, so concurrent batches (for
+    example two scheduler syncs) never race on creating the same row.
+
+    Args:
+        user_ids: User IDs to load preferences for
+
+    Returns:
+        Dict mapping user ID to NotificationPreferences
+    """
+    ids = set(user_ids)
+    if not ids:
+        return {}
+    prefs = {
+        pref.user_id: pref
+        for pref in NotificationPreferences.query.filter(
+            NotificationPreferences.user_id.in_(ids)
+        )
+    }
+    for user_id in ids - prefs.keys():
+        prefs[user_id] = NotificationPreferences.create_default(user_id)
+    return prefs
+
+
+def create_notifications_bulk(notifications: Iterable[dict[str, Any]]) -> int:
+    """Create many notifications with one INSERT and one commit.
+
+    Each item takes the keyword arguments of :func:`create_notification`. Preferences
+    are loaded once for all recipients and applied the same way. The insert runs in
+    a savepoint, so a failure is logged without discarding other pending work in the
+    session; this keeps it safe to call from the sync scheduler.
+
+    Args:
+        notifications: Notification keyword-argument dicts
+
+    Returns:
+        Number of notifications created
+    """
+    if not current_app.config.get("NOTIFICATIONS_ENABLED", True):
+        return 0
+    items = list(notifications)
+    if not items:
+        return 0
+
+    prefs = load_preferences(item["user_id"] for item in items)
+    now = datetime.utcnow()
+    rows = []
+    for item in items:
+        metadata = item.get("metadata")
+        if not _is_allowed(prefs[item["user_id"]], item["notification_type"], metadata):
+            continue
+        rows.append(
+            {
+                "user_id": item["user_id"],
+                "notification_type": item["notification_type"],
+                "title": item["title"],
+                "message": item.get("message"),
+                "resource_type": item.get("resource_type"),
+                "resource_id": item.get("resource_id"),
+                "resource_url": item.get("resource_url"),
+                "priority": item.get("priority", NotificationPriority.NORMAL),
+                "metadata_json": json.dumps(metadata) if metadata else None,
+                "is_read": False,
+                "created_at": now,
+                "expires_at": item.get("expires_at"),
+            }
+        )
+
+    if rows:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(Notification), rows)
+        except Exception as exc:  # noqa: BLE001 - notifications must not fail a sync
+            current_app.logger.warning(
+                "Failed to create %d notifications: %s", len(rows), exc
+            )
+            rows = []
+    db.session.commit()
+    return len(rows)
+
+
 def get_user_notifications(
     user_id: int,
     unread_only: bool = False,
@@ -1,15 +1,54 @@
 """Service for generating issue resolution statistics and workflow metrics."""
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
-from sqlalchemy.orm import joinedload
+from sqlalchemy import Row, delete, func, insert, literal_column, select
 
 from ..extensions import db
-from ..models import ExternalIssue, Project, ProjectIntegration, User
-from .issues.utils import get_status_category, is_closed_status
+from ..models import (
+    ExternalIssue,
+    IssueComment,
+    IssueDailyStat,
+    Project,
+    ProjectIntegration,
+    User,
+)
+from .issues.rollups import CLOSED_CATEGORY, rollups_enabled
+
+# Most recent assigned issues listed per contributor
+CONTRIBUTOR_ISSUE_LIMIT = 5
+
+
+def _hours_between(start, end):
+    """SQL expression for the hours between two timestamp columns."""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return (func.julianday(end) - func.julianday(start)) * 24
+    if dialect == "postgresql":
+        return func.extract("epoch", end - start) / 3600
+    # MySQL / MariaDB
+    return func.timestampdiff(literal_column("SECOND"), start, end) / 3600
+
+
+def _apply_scope(query, tenant_id: Optional[int], project_id: Optional[int]):
+    """Restrict a query over external_issues to a project or tenant."""
+    if project_id:
+        query = query.join(
+            ProjectIntegration,
+            ExternalIssue.project_integration_id == ProjectIntegration.id,
+        ).filter(ProjectIntegration.project_id == project_id)
+    elif tenant_id:
+        query = (
+            query.join(
+                ProjectIntegration,
+                ExternalIssue.project_integration_id == ProjectIntegration.id,
+            )
+            .join(Project, ProjectIntegration.project_id == Project.id)
+            .filter(Project.tenant_id == tenant_id)
+        )
+    return query
 
 
 def get_resolution_statistics(
@@ -19,6 +58,10 @@ def get_resolution_statistics(
 ) -> dict[str, Any]:
     """Get statistics on resolved issues.
 
+    Counts and resolution hours are summed per project in SQL, from the
+    ``issue_daily_stats`` rollup when it is enabled and from the closed issues
+    otherwise.
+
     Args:
         tenant_id: Filter by tenant (None for all)
         project_id: Filter by project (None for all)
@@ -27,82 +70,121 @@ def get_resolution_statistics(
     Returns:
         Dictionary containing resolution statistics
     """
-    # Base query for closed issues
-    query = db.session.query(ExternalIssue).options(
-        joinedload(ExternalIssue.project_integration).joinedload(
-            ProjectIntegration.project
+    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    if rollups_enabled():
+        rows = _rollup_resolution_rows(tenant_id, project_id, cutoff_date)
+    else:
+        rows = _issue_resolution_rows(tenant_id, project_id, cutoff_date)
+
+    # Projects sharing a name are reported together
+    totals: dict[str, list[float]] = {}
+    for project_name, count, hours in rows:
+        total = totals.setdefault(project_name or "Unknown", [0, 0.0])
+        total[0] += count or 0
+        total[1] += hours or 0.0
+
+    total_resolved = int(sum(count for count, _ in totals.values()))
+    total_hours = sum(hours for _, hours in totals.values())
+    avg_resolution_time = total_hours / total_resolved if total_resolved else 0
+
+    project_breakdown = {
+        project_name: {
+            "count": int(count),
+            "avg_resolution_time": hours / count if count else 0,
+        }
+        for project_name, (count, hours) in totals.items()
+    }
+
+    return {
+        "total_resolved": total_resolved,
+        "avg_resolution_time_hours": round(avg_resolution_time, 2),
+        "project_breakdown": project_breakdown,
+        "period_days": days,
+    }
+
+
+def _issue_resolution_rows(
+    tenant_id: Optional[int], project_id: Optional[int], cutoff_date: datetime
+) -> Sequence[Row[Optional[str], int, Optional[float]]]:
+    # Issues closed within the date range, using the status category stored at sync
+    hours = _hours_between(ExternalIssue.created_at, ExternalIssue.updated_at)
+    query = (
+        db.session.query(Project.name, func.count(ExternalIssue.id), func.sum(hours))
+        .select_from(ExternalIssue)
+        .outerjoin(
+            ProjectIntegration,
+            ExternalIssue.project_integration_id == ProjectIntegration.id,
+        )
+        .outerjoin(Project, ProjectIntegration.project_id == Project.id)
+        .filter(
+            ExternalIssue.status_category == CLOSED_CATEGORY,
+            ExternalIssue.updated_at >= cutoff_date,
         )
     )
-
-    # Apply filters
     if project_id:
-        query = query.join(ProjectIntegration).filter(
-            ProjectIntegration.project_id == project_id
-        )
+        query = query.filter(ProjectIntegration.project_id == project_id)
     elif tenant_id:
-        query = query.join(ProjectIntegration).join(Project).filter(
-            Project.tenant_id == tenant_id
+        query = query.filter(Project.tenant_id == tenant_id)
+    return query.group_by(Project.id, Project.name).all()
+
+
+def _rollup_resolution_rows(
+    tenant_id: Optional[int], project_id: Optional[int], cutoff_date: datetime
+) -> Sequence[Row[Optional[str], int, Optional[float]]]:
+    # One row per integration and day, however many issues were ever synced
+    query = (
+        db.session.query(
+            Project.name,
+            func.sum(IssueDailyStat.resolved_count),
+            func.sum(IssueDailyStat.resolution_hours),
+        )
+        .select_from(IssueDailyStat)
+        .join(
+            ProjectIntegration,
+            IssueDailyStat.project_integration_id == ProjectIntegration.id,
         )
+        .join(Project, ProjectIntegration.project_id == Project.id)
+        .filter(IssueDailyStat.day >= cutoff_date.date())
+    )
+    if project_id:
+        query = query.filter(ProjectIntegration.project_id == project_id)
+    elif tenant_id:
+        query = query.filter(Project.tenant_id == tenant_id)
+    # Rows of days whose resolutions were all reopened are left at zero
+    return (
+        query.group_by(Project.id, Project.name)
+        .having(func.sum(IssueDailyStat.resolved_count) > 0)
+        .all()
+    )
 
-    # Filter by date range and then by closed status using centralized logic
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
-    query = query.filter(ExternalIssue.updated_at >= cutoff_date)
-    all_recent_issues = query.all()
 
-    # Filter to closed issues using centralized status logic
-    resolved_issues = [
-        issue for issue in all_recent_issues if is_closed_status(issue.status)
-    ]
+def rebuild_issue_daily_stats() -> int:
+    """Recompute ``issue_daily_stats`` from the closed issues; return the row count.
 
-    # Calculate statistics
-    total_resolved = len(resolved_issues)
-    resolution_times: list[float] = []
-    project_breakdown: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {"count": 0, "avg_resolution_time": 0}
+    Each closed issue is counted on the day it was last written, which is what the
+    non-rollup statistics use as its resolution date.
+    """
+    day = func.date(ExternalIssue.updated_at)
+    hours = _hours_between(ExternalIssue.created_at, ExternalIssue.updated_at)
+    source = (
+        select(
+            ExternalIssue.project_integration_id,
+            day,
+            func.count(ExternalIssue.id),
+            func.coalesce(func.sum(hours), 0.0),
+        )
+        .where(ExternalIssue.status_category == CLOSED_CATEGORY)
+        .group_by(ExternalIssue.project_integration_id, day)
     )
-
-    for issue in resolved_issues:
-        # Calculate resolution time
-        if issue.created_at and issue.updated_at:
-            resolution_time_seconds = (issue.updated_at - issue.created_at).total_seconds()
-            resolution_time_hours = resolution_time_seconds / 3600
-            resolution_times.append(resolution_time_hours)
-
-            # Track by project
-            project_name = (
-                issue.project_integration.project.name
-                if issue.project_integration and issue.project_integration.project
-                else "Unknown"
-            )
-            project_breakdown[project_name]["count"] += 1
-
-    # Calculate average resolution time
-    avg_resolution_time = (
-        sum(resolution_times) / len(resolution_times) if resolution_times else 0
+    db.session.execute(delete(IssueDailyStat))
+    db.session.execute(
+        insert(IssueDailyStat).from_select(
+            ["project_integration_id", "day", "resolved_count", "resolution_hours"],
+            source,
+        )
     )
-
-    # Calculate per-project averages
-    for project_name in project_breakdown:
-        project_issue_times = [
-            rt
-            for issue, rt in zip(resolved_issues, resolution_times, strict=False)
-            if (
-                issue.project_integration
-                and issue.project_integration.project
-                and issue.project_integration.project.name == project_name
-            )
-        ]
-        if project_issue_times:
-            project_breakdown[project_name]["avg_resolution_time"] = sum(
-                project_issue_times
-            ) / len(project_issue_times)
-
-    return {
-        "total_resolved": total_resolved,
-        "avg_resolution_time_hours": round(avg_resolution_time, 2),
-        "project_breakdown": dict(project_breakdown),
-        "period_days": days,
-    }
+    db.session.commit()
+    return db.session.query(func.count(IssueDailyStat.id)).scalar() or 0
 
 
 def get_workflow_statistics(
@@ -118,45 +200,30 @@ def get_workflow_statistics(
     Returns:
         Dictionary containing workflow statistics
     """
-    # Base query
-    query = db.session.query(ExternalIssue).options(
-        joinedload(ExternalIssue.project_integration).joinedload(
-            ProjectIntegration.project
-        )
+    # Status distribution with normalized categories (Open, In Progress, Closed),
+    # counted on the (project_integration_id, status_category) index
+    query = db.session.query(
+        ExternalIssue.status_category, func.count(ExternalIssue.id)
+    ).select_from(ExternalIssue)
+    query = _apply_scope(query, tenant_id, project_id)
+    status_counts: dict[str, int] = dict(
+        query.group_by(ExternalIssue.status_category).all()
     )
 
-    # Apply filters
-    if project_id:
-        query = query.join(ProjectIntegration).filter(
-            ProjectIntegration.project_id == project_id
-        )
-    elif tenant_id:
-        query = query.join(ProjectIntegration).join(Project).filter(
-            Project.tenant_id == tenant_id
-        )
-
-    all_issues = query.all()
-
-    # Status distribution with normalized categories (Open, In Progress, Closed)
-    status_counts: dict[str, int] = defaultdict(int)
-    for issue in all_issues:
-        category = get_status_category(issue.status)
-        status_counts[category] += 1
-
     # Open vs closed counts
     open_count = status_counts.get("Open", 0) + status_counts.get("In Progress", 0)
-    closed_count = status_counts.get("Closed", 0)
+    closed_count = status_counts.get(CLOSED_CATEGORY, 0)
     other_count = sum(
         count for status, count in status_counts.items()
-        if status not in ("Open", "In Progress", "Closed")
+        if status not in ("Open", "In Progress", CLOSED_CATEGORY)
     )
 
     return {
-        "total_issues": len(all_issues),
+        "total_issues": sum(status_counts.values()),
         "open_count": open_count,
         "closed_count": closed_count,
         "other_count": other_count,
-        "status_distribution": dict(status_counts),
+        "status_distribution": status_counts,
     }
 
 
@@ -175,80 +242,116 @@ def get_contributor_statistics(
     Returns:
         List of contributor statistics
     """
-    # Base query
-    query = db.session.query(ExternalIssue).options(
-        joinedload(ExternalIssue.project_integration).joinedload(
-            ProjectIntegration.project
-        )
-    )
-
-    # Apply filters
-    if project_id:
-        query = query.join(ProjectIntegration).filter(
-            ProjectIntegration.project_id == project_id
-        )
-    elif tenant_id:
-        query = query.join(ProjectIntegration).join(Project).filter(
-            Project.tenant_id == tenant_id
-        )
-
-    # Filter by date range
     cutoff_date = datetime.utcnow() - timedelta(days=days)
-    query = query.filter(ExternalIssue.updated_at >= cutoff_date)
 
-    issues = query.all()
+    # Issues assigned per contributor
+    assigned_query = db.session.query(
+        ExternalIssue.assignee, func.count(ExternalIssue.id)
+    ).select_from(ExternalIssue)
+    assigned_query = _apply_scope(assigned_query, tenant_id, project_id).filter(
+        ExternalIssue.assignee.is_not(None),
+        ExternalIssue.assignee != "",
+        ExternalIssue.updated_at >= cutoff_date,
+    )
+    assigned_counts: dict[str, int] = dict(
+        assigned_query.group_by(ExternalIssue.assignee).all()
+    )
 
-    # Track contributor activity
-    contributor_stats: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {"assigned_count": 0, "commented_count": 0, "issues": []}
+    # Issues each author commented on, from the issue_comments table
+    commented_query = db.session.query(
+        IssueComment.author, func.count(func.distinct(IssueComment.issue_id))
+    ).join(ExternalIssue, IssueComment.issue_id == ExternalIssue.id)
+    commented_query = _apply_scope(commented_query, tenant_id, project_id).filter(
+        IssueComment.author.is_not(None),
+        IssueComment.author != "",
+        ExternalIssue.updated_at >= cutoff_date,
+    )
+    commented_counts: dict[str, int] = dict(
+        commented_query.group_by(IssueComment.author).all()
     )
 
-    for issue in issues:
-        # Track assignee
-        if issue.assignee:
-            contributor_stats[issue.assignee]["assigned_count"] += 1
-            contributor_stats[issue.assignee]["issues"].append(
-                {
-                    "id": issue.id,
-                    "external_id": issue.external_id,
-                    "title": issue.title,
-                    "status": issue.status,
-                    "url": issue.url,
-                }
+    recent_issues = _recent_assigned_issues(tenant_id, project_id, cutoff_date)
+
+    # Flag contributors that are aiops users to prioritize them
+    names = set(assigned_counts) | set(commented_counts)
+    aiops_users: set[str] = set()
+    if names:
+        email = func.lower(User.email)
+        aiops_users = set(
+            db.session.scalars(
+                select(email).where(email.in_({name.lower() for name in names}))
             )
+        )
 
-        # Track commenters
-        if issue.comments:
-            commenters = set()
-            for comment in issue.comments:
-                if isinstance(comment, dict) and "author" in comment:
-                    author = comment["author"]
-                    if author and author not in commenters:
-                        commenters.add(author)
-                        contributor_stats[author]["commented_count"] += 1
-
-    # Get all aiops users to prioritize them
-    aiops_users = {user.email.lower() for user in db.session.query(User).all()}
-
-    # Convert to list with user type flag
-    result = [
+    result: list[dict[str, Any]] = [
         {
             "contributor": name,
-            "assigned_count": stats["assigned_count"],
-            "commented_count": stats["commented_count"],
-            "total_activity": stats["assigned_count"] + stats["commented_count"],
-            "issues": stats["issues"][:5],  # Limit to 5 recent issues
+            "assigned_count": assigned_counts.get(name, 0),
+            "commented_count": commented_counts.get(name, 0),
+            "total_activity": assigned_counts.get(name, 0)
+            + commented_counts.get(name, 0),
+            "issues": recent_issues.get(name, []),
             "is_aiops_user": name.lower() in aiops_users,
         }
-        for name, stats in contributor_stats.items()
+        for name in names
     ]
 
     # Sort: aiops users first (by activity), then others (by activity)
-    result.sort(key=lambda x: (not x["is_aiops_user"], -x["total_activity"]))
+    result.sort(
+        key=lambda x: (not x["is_aiops_user"], -x["total_activity"], x["contributor"])
+    )
 
     return result
 
 
+def _recent_assigned_issues(
+    tenant_id: Optional[int], project_id: Optional[int], cutoff_date: datetime
+) -> dict[str, list[dict[str, Any]]]:
+    """Return each assignee's most recently updated issues, ranked in SQL."""
+    rank = (
+        func.row_number()
+        .over(
+            partition_by=ExternalIssue.assignee,
+            order_by=(ExternalIssue.updated_at.desc(), ExternalIssue.id.desc()),
+        )
+        .label("rank")
+    )
+    ranked_query = db.session.query(
+        ExternalIssue.id,
+        ExternalIssue.assignee,
+        ExternalIssue.external_id,
+        ExternalIssue.title,
+        ExternalIssue.status,
+        ExternalIssue.url,
+        rank,
+    ).select_from(ExternalIssue)
+    ranked = (
+        _apply_scope(ranked_query, tenant_id, project_id)
+        .filter(
+            ExternalIssue.assignee.is_not(None),
+            ExternalIssue.updated_at >= cutoff_date,
+        )
+        .subquery()
+    )
+
+    issues: dict[str, list[dict[str, Any]]] = {}
+    for row in db.session.execute(
+        select(ranked)
+        .where(ranked.c.rank <= CONTRIBUTOR_ISSUE_LIMIT)
+        .order_by(ranked.c.assignee, ranked.c.rank)
+    ):
+        issues.setdefault(row.assignee, []).append(
+            {
+                "id": row.id,
+                "external_id": row.external_id,
+                "title": row.title,
+                "status": row.status,
+                "url": row.url,
+            }
+        )
+    return issues
+
+
 def get_project_list(tenant_id: Optional[int] = None) -> list[dict[str, Any]]:
     """Get list of projects for filtering.
 
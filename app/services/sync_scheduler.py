@@ -2,14 +2,34 @@
 
 Provides periodic syncing of issues from external providers (GitHub, GitLab, Jira)
 without requiring manual intervention.
+
+With ``ISSUE_SYNC_ADAPTIVE`` enabled the sync job runs every ``ISSUE_SYNC_TICK_SECONDS``
+and only syncs the project integrations that are due. Each integration's interval is
+derived from its recent :class:`~app.models.SyncHistory`: integrations whose issues keep
+changing are synced more often, idle or failing ones back off exponentially.
+
+Every gunicorn worker calls :func:`init_scheduler`, but only the worker holding the
+leader lock file (``instance/scheduler.lock``) runs scheduled jobs. The others stay
+on standby and retry the lock periodically; the kernel releases it when the leader
+exits, so a standby worker takes over within one retry interval.
 """
 
 from __future__ import annotations
 
+import fcntl
+import json
 import logging
+import os
+import queue
+import socket
 import threading
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+from urllib.parse import urlsplit
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -21,6 +41,135 @@ logger = logging.getLogger(__name__)
 _scheduler: Optional[BackgroundScheduler] = None
 _scheduler_lock = threading.Lock()
 
+# Leader election state for this process
+_leader_lock: Optional["_LeaderLock"] = None
+_standby_thread: Optional[threading.Thread] = None
+_standby_stop = threading.Event()
+
+# Recent SyncHistory rows per integration considered when computing its interval
+SYNC_HISTORY_WINDOW = 6
+# Keep at least this many sync durations between two syncs of one integration
+SYNC_DURATION_FACTOR = 4
+# Fetched pages a sync worker may hold ahead of the writer thread
+SYNC_PAGE_BUFFER = 2
+
+# Hosts used for per-host concurrency limits when an integration has no base URL
+_DEFAULT_PROVIDER_HOSTS = {
+    "github": "api.github.com",
+    "gitlab": "gitlab.com",
+}
+
+
+class _LeaderLock:
+    """Exclusive ``flock`` on a file marking the process that owns scheduled jobs.
+
+    The same lock guards each integration's running sync (see
+    :func:`integration_sync_lock`). The lock lives as long as the open file, so it is released by the kernel when the
+    leader exits or crashes; no lease renewal is needed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.acquired_at: Optional[datetime] = None
+        self._handle: Optional[Any] = None
+
+    @property
+    def held(self) -> bool:
+        return self._handle is not None
+
+    def try_acquire(self) -> bool:
+        """Take the lock without blocking; return True if this process is leader."""
+        if self._handle is not None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with ExitStack() as stack:
+            # Closed on every failure path; kept open (and locked) on success
+            handle = stack.enter_context(open(self.path, "a+", encoding="utf-8"))
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return False
+
+            acquired_at = datetime.now(timezone.utc)
+            handle.seek(0)
+            handle.truncate()
+            json.dump(
+                {
+                    "pid": os.getpid(),
+                    "hostname": socket.gethostname(),
+                    "acquired_at": acquired_at.isoformat(),
+                },
+                handle,
+            )
+            handle.flush()
+            stack.pop_all()
+        self.acquired_at = acquired_at
+        self._handle = handle
+        return True
+
+    def release(self) -> None:
+        if self._handle is None:
+            return
+        try:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._handle.close()
+            self._handle = None
+            self.acquired_at = None
+
+    def held_elsewhere(self) -> bool:
+        """Return True when another process currently holds the lock."""
+        if self._handle is not None or not self.path.exists():
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as probe:
+                try:
+                    fcntl.flock(probe.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+                except OSError:
+                    return True
+                fcntl.flock(probe.fileno(), fcntl.LOCK_UN)
+        except OSError:
+            return False
+        return False
+
+    def owner(self) -> Optional[dict]:
+        """Return the pid/hostname recorded by the current or last leader."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+
+def _get_leader_lock(app: Flask) -> _LeaderLock:
+    global _leader_lock
+
+    path = Path(
+        app.config.get("SCHEDULER_LOCK_FILE")
+        or Path(app.instance_path) / "scheduler.lock"
+    )
+    if _leader_lock is None or _leader_lock.path != path:
+        if _leader_lock is not None:
+            _leader_lock.release()
+        _leader_lock = _LeaderLock(path)
+    return _leader_lock
+
+
+@contextmanager
+def integration_sync_lock(app: Flask, project_integration_id: int) -> Iterator[bool]:
+    """Hold the sync lock of one project integration for the duration of the block.
+
+    Yields False, without waiting, when another sync of the integration (scheduled,
+    or a background job in any worker process) already holds it.
+    """
+    lock = _LeaderLock(
+        Path(app.instance_path) / "sync-locks" / f"{project_integration_id}.lock"
+    )
+    try:
+        yield lock.try_acquire()
+    finally:
+        lock.release()
+
 
 def get_scheduler() -> Optional[BackgroundScheduler]:
     """Get the global scheduler instance."""
@@ -30,11 +179,14 @@ def get_scheduler() -> Optional[BackgroundScheduler]:
 def init_scheduler(app: Flask) -> Optional[BackgroundScheduler]:
     """Initialize and start the background scheduler.
 
+    Only the process that wins the leader lock starts the scheduler; the others keep a
+    standby thread that takes over when the leader goes away.
+
     Args:
         app: Flask application instance
 
     Returns:
-        BackgroundScheduler instance or None if disabled
+        BackgroundScheduler instance or None if disabled or on standby
     """
     global _scheduler
 
@@ -51,189 +203,277 @@ def init_scheduler(app: Flask) -> Optional[BackgroundScheduler]:
             logger.info("Automatic sync and Slack polling are both disabled")
             return None
 
-        # Get configuration
-        sync_interval = app.config.get("ISSUE_SYNC_INTERVAL", 900)  # 15 minutes default
-        sync_on_startup = app.config.get("ISSUE_SYNC_ON_STARTUP", True)
-        slack_poll_interval = app.config.get("SLACK_POLL_INTERVAL", 300)  # 5 minutes default
+        if not _get_leader_lock(app).try_acquire():
+            logger.info(
+                "Scheduler leadership held by another process; pid %d on standby",
+                os.getpid(),
+            )
+            _start_standby(app)
+            return None
 
-        logger.info(
-            "Initializing scheduler (issue_sync=%s, slack_poll=%s)",
-            issue_sync_enabled,
-            slack_poll_enabled,
-        )
+        return _start_scheduler(app)
 
-        # Create scheduler
-        _scheduler = BackgroundScheduler(
-            daemon=True,
-            job_defaults={
-                "coalesce": True,  # Combine missed runs into one
-                "max_instances": 1,  # Only one instance of each job at a time
-                "misfire_grace_time": 60,  # Allow 60s grace for missed jobs
-            },
-        )
 
-        # Add the issue sync job if enabled
-        if issue_sync_enabled:
-            _scheduler.add_job(
-                func=_run_sync_all,
-                trigger=IntervalTrigger(seconds=sync_interval),
-                id="issue_sync_all",
-                name="Sync all issues from external providers",
-                replace_existing=True,
-                kwargs={"app": app},
-            )
-            logger.info("Issue sync job added (interval=%ds)", sync_interval)
+def _start_scheduler(app: Flask) -> BackgroundScheduler:
+    """Create and start the scheduler; the caller holds ``_scheduler_lock``."""
+    global _scheduler
+
+    issue_sync_enabled = app.config.get("ISSUE_SYNC_ENABLED", False)
+    slack_poll_enabled = app.config.get("SLACK_POLL_ENABLED", False)
+
+    # Get configuration
+    sync_on_startup = app.config.get("ISSUE_SYNC_ON_STARTUP", True)
+    slack_poll_interval = app.config.get("SLACK_POLL_INTERVAL", 300)  # 5 minutes default
 
-        # Add Slack polling job if enabled
-        if slack_poll_enabled:
+    logger.info(
+        "Initializing scheduler (issue_sync=%s, slack_poll=%s)",
+        issue_sync_enabled,
+        slack_poll_enabled,
+    )
+
+    # Create scheduler
+    _scheduler = BackgroundScheduler(
+        daemon=True,
+        job_defaults={
+            "coalesce": True,  # Combine missed runs into one
+            "max_instances": 1,  # Only one instance of each job at a time
+            "misfire_grace_time": 60,  # Allow 60s grace for missed jobs
+        },
+    )
+
+    # Add the issue sync job if enabled
+    if issue_sync_enabled:
+        _add_sync_job(app)
+        reconcile_interval = int(app.config.get("ISSUE_RECONCILE_INTERVAL", 0) or 0)
+        if reconcile_interval > 0:
             _scheduler.add_job(
-                func=_run_slack_poll,
-                trigger=IntervalTrigger(seconds=slack_poll_interval),
-                id="slack_poll_all",
-                name="Poll Slack channels for issue triggers",
+                func=_run_reconcile_all,
+                trigger=IntervalTrigger(seconds=reconcile_interval),
+                id="issue_reconcile_all",
+                name="Reconcile issues deleted or moved upstream",
                 replace_existing=True,
                 kwargs={"app": app},
             )
-            logger.info("Slack poll job added (interval=%ds)", slack_poll_interval)
+            logger.info("Issue reconcile job added (interval=%ds)", reconcile_interval)
+
+    # Add Slack polling job if enabled
+    if slack_poll_enabled:
+        _scheduler.add_job(
+            func=_run_slack_poll,
+            trigger=IntervalTrigger(seconds=slack_poll_interval),
+            id="slack_poll_all",
+            name="Poll Slack channels for issue triggers",
+            replace_existing=True,
+            kwargs={"app": app},
+        )
+        logger.info("Slack poll job added (interval=%ds)", slack_poll_interval)
 
-        # Start the scheduler
-        _scheduler.start()
-        logger.info("Background scheduler started")
+    # Fail inline jobs of stopped web processes even when no job worker runs
+    stale_seconds = int(app.config.get("JOB_QUEUE_STALE_SECONDS", 600) or 600)
+    _scheduler.add_job(
+        func=_run_job_recovery,
+        trigger=IntervalTrigger(seconds=max(60, stale_seconds // 3)),
+        id="job_queue_recovery",
+        name="Recover background jobs of stopped workers",
+        replace_existing=True,
+        kwargs={"app": app},
+    )
 
-        # Run initial sync if configured
-        if issue_sync_enabled and sync_on_startup:
-            # Delay initial sync by 30 seconds to let the app fully start
-            _scheduler.add_job(
-                func=_run_sync_all,
-                trigger="date",
-                run_date=datetime.now() + timedelta(seconds=30),
-                id="issue_sync_startup",
-                name="Initial issue sync on startup",
-                kwargs={"app": app},
-            )
-            logger.info("Scheduled initial issue sync in 30 seconds")
+    # Start the scheduler
+    _scheduler.start()
+    logger.info("Background scheduler started")
+
+    # Run initial sync if configured
+    if issue_sync_enabled and sync_on_startup:
+        # Delay initial sync by 30 seconds to let the app fully start
+        _scheduler.add_job(
+            func=_run_sync_all,
+            trigger="date",
+            run_date=datetime.now() + timedelta(seconds=30),
+            id="issue_sync_startup",
+            name="Initial issue sync on startup",
+            kwargs={"app": app, "only_due": _is_adaptive(app)},
+        )
+        logger.info("Scheduled initial issue sync in 30 seconds")
+
+    return _scheduler
+
+
+def _is_adaptive(app: Flask) -> bool:
+    return bool(app.config.get("ISSUE_SYNC_ADAPTIVE", False))
+
+
+def _add_sync_job(app: Flask) -> None:
+    """Add (or replace) the recurring issue sync job on the running scheduler.
+
+    In adaptive mode the job ticks every ``ISSUE_SYNC_TICK_SECONDS`` and syncs only due
+    integrations; otherwise it syncs everything every ``ISSUE_SYNC_INTERVAL`` seconds.
+    """
+    sync_interval = int(app.config.get("ISSUE_SYNC_INTERVAL", 900) or 900)
+    adaptive = _is_adaptive(app)
+    if adaptive:
+        tick = int(app.config.get("ISSUE_SYNC_TICK_SECONDS", 60) or 60)
+        job_interval = max(1, min(tick, sync_interval))
+    else:
+        job_interval = sync_interval
+    _scheduler.add_job(
+        func=_run_sync_all,
+        trigger=IntervalTrigger(seconds=job_interval),
+        id="issue_sync_all",
+        name="Sync all issues from external providers",
+        replace_existing=True,
+        kwargs={"app": app, "only_due": adaptive},
+    )
+    logger.info(
+        "Issue sync job added (interval=%ds, adaptive=%s)", job_interval, adaptive
+    )
 
-        return _scheduler
+
+def _start_standby(app: Flask) -> None:
+    """Start the thread that retries the leader lock; the caller holds ``_scheduler_lock``."""
+    global _standby_thread
+
+    if _standby_thread is not None and _standby_thread.is_alive():
+        return
+    interval = max(1, int(app.config.get("SCHEDULER_LEADER_RETRY_SECONDS", 30) or 1))
+    _standby_stop.clear()
+    _standby_thread = threading.Thread(
+        target=_standby_loop,
+        args=(app, interval),
+        name="scheduler-standby",
+        daemon=True,
+    )
+    _standby_thread.start()
+
+
+def _standby_loop(app: Flask, interval: int) -> None:
+    """Take over scheduled jobs once the current leader releases its lock."""
+    while not _standby_stop.wait(interval):
+        if _try_take_over(app):
+            return
+
+
+def _try_take_over(app: Flask) -> bool:
+    """One standby retry: start the scheduler if the leader lock is free.
+
+    Returns True once this process runs the scheduler.
+    """
+    with _scheduler_lock:
+        if _scheduler is not None:
+            return True
+        if not _get_leader_lock(app).try_acquire():
+            return False
+        logger.info("Scheduler leadership taken over by pid %d", os.getpid())
+        _start_scheduler(app)
+        return True
 
 
 def shutdown_scheduler() -> None:
-    """Shutdown the scheduler gracefully."""
+    """Shutdown the scheduler gracefully and give up leadership."""
     global _scheduler
 
+    _standby_stop.set()
     with _scheduler_lock:
         if _scheduler is not None:
             logger.info("Shutting down issue sync scheduler...")
             _scheduler.shutdown(wait=True)
             _scheduler = None
             logger.info("Issue sync scheduler stopped")
+        if _leader_lock is not None:
+            _leader_lock.release()
 
 
-def _run_sync_all(app: Flask) -> dict:
+def _run_sync_all(app: Flask, *, only_due: bool = False) -> dict:
     """Run sync for all enabled project integrations.
 
+    With ``only_due`` set (the adaptive scheduled job), integrations whose next due
+    time from :func:`get_sync_schedule` lies in the future are skipped and counted in
+    ``results["skipped"]``; manual triggers sync everything.
+
+    Provider fetches run concurrently on a thread pool bounded by
+    ``ISSUE_SYNC_MAX_CONCURRENT`` and by a per-host limit
+    (``ISSUE_SYNC_MAX_PER_HOST``, overridable per tenant integration through the
+    ``max_concurrent_syncs`` setting). Database writes stay on the calling thread,
+    which acts as the single writer so SQLite never sees concurrent transactions.
+    Workers hand pages over through bounded :class:`_PageStream` queues, so at most
+    ``SYNC_PAGE_BUFFER`` pages per running fetch are held in memory. Integrations
+    whose sync lock is held elsewhere, e.g. by a background sync job, are counted in
+    ``results["busy"]`` and left alone.
+
     Args:
         app: Flask application instance
+        only_due: Skip integrations that are not due yet
 
     Returns:
         Dict with sync results summary
     """
     with app.app_context():
-        from ..extensions import db
-        from ..models import ProjectIntegration, SyncHistory
-        from .issues import IssueSyncError, sync_project_integration
-        from .notification_generator import notify_sync_error
-
-        # Get all enabled project integrations
-        project_integrations = (
-            ProjectIntegration.query.join(ProjectIntegration.integration)
-            .filter(ProjectIntegration.integration.has(enabled=True))
-            .filter(ProjectIntegration.auto_sync_enabled == True)  # noqa: E712
-            .all()
-        )
+        from .issues import IssueSyncError, prepare_issue_fetch
+
+        project_integrations = _auto_sync_integrations()
+        skipped = 0
+        if only_due and project_integrations:
+            schedule = _compute_schedule(app, project_integrations, datetime.utcnow())
+            due = [pi for pi in project_integrations if schedule[pi.id]["due"]]
+            skipped = len(project_integrations) - len(due)
+            project_integrations = due
 
         if not project_integrations:
-            logger.debug("No project integrations configured for auto-sync")
-            return {"total": 0, "success": 0, "failed": 0}
+            logger.debug("No project integrations due for auto-sync")
+            results = {"total": 0, "success": 0, "failed": 0}
+            if only_due:
+                results["skipped"] = skipped
+            return results
+
+        max_workers = max(1, int(app.config.get("ISSUE_SYNC_MAX_CONCURRENT", 3) or 1))
+        per_host_default = max(1, int(app.config.get("ISSUE_SYNC_MAX_PER_HOST", 2) or 1))
 
         logger.info(
-            "Starting auto-sync for %d project integrations", len(project_integrations)
+            "Starting auto-sync for %d project integrations (max_concurrent=%d)",
+            len(project_integrations),
+            max_workers,
         )
 
         results = {"total": len(project_integrations), "success": 0, "failed": 0}
-
-        for pi in project_integrations:
-            try:
-                start_time = datetime.utcnow()
-                updated_issues = sync_project_integration(pi)
-                duration = (datetime.utcnow() - start_time).total_seconds()
-
-                # Record success in sync history
-                history = SyncHistory(
-                    project_integration_id=pi.id,
-                    status="success",
-                    issues_updated=len(updated_issues),
-                    duration_seconds=duration,
-                )
-                db.session.add(history)
-                db.session.commit()
-
-                results["success"] += 1
-                logger.info(
-                    "Synced %d issues for %s/%s in %.2fs",
-                    len(updated_issues),
-                    pi.project.name if pi.project else "?",
-                    pi.integration.name if pi.integration else "?",
-                    duration,
-                )
-
-            except IssueSyncError as e:
-                results["failed"] += 1
-                error_msg = str(e)
-
-                # Record failure in sync history
-                history = SyncHistory(
-                    project_integration_id=pi.id,
-                    status="failed",
-                    error_message=error_msg[:1000],  # Truncate long errors
-                )
-                db.session.add(history)
-                db.session.commit()
-
-                logger.error(
-                    "Failed to sync %s/%s: %s",
-                    pi.project.name if pi.project else "?",
-                    pi.integration.name if pi.integration else "?",
-                    error_msg,
-                )
-
-                # Send notification to admins on failure
+        if only_due:
+            results["skipped"] = skipped
+        pending: dict[int, Any] = {}
+        jobs = []
+        busy = 0
+        # Sync locks are held until every stream has been written
+        with ExitStack() as sync_locks:
+            for pi in project_integrations:
+                if not sync_locks.enter_context(integration_sync_lock(app, pi.id)):
+                    logger.info(
+                        "Skipping integration %s: a sync is already running", pi.id
+                    )
+                    busy += 1
+                    continue
                 try:
-                    notify_sync_error(
-                        project_id=pi.project_id,
-                        project_name=pi.project.name if pi.project else "Unknown",
-                        integration_id=pi.integration_id,
-                        provider=pi.integration.provider if pi.integration else "Unknown",
-                        error_message=error_msg,
+                    job = prepare_issue_fetch(pi, detach=True)
+                except IssueSyncError as e:
+                    _record_sync_failure(pi, e, results)
+                    continue
+                pending[pi.id] = pi
+                jobs.append(job)
+            if busy:
+                results["busy"] = busy
+
+            host_limits = _HostLimiter(per_host_default)
+            ready: queue.Queue = queue.Queue()
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="issue-sync"
+            ) as executor:
+                for job in _interleave_by_host(jobs):
+                    stream = _PageStream(job, ready)
+                    executor.submit(_fetch_in_worker, app, stream, host_limits)
+                # Streams are written in the order their first page arrives, one at a
+                # time, on this thread
+                for _ in jobs:
+                    stream = ready.get()
+                    _apply_sync_result(
+                        pending[stream.job.project_integration_id], stream, results
                     )
-                except Exception as notify_err:
-                    logger.warning("Failed to send sync error notification: %s", notify_err)
-
-            except Exception as e:
-                results["failed"] += 1
-                logger.exception(
-                    "Unexpected error syncing %s/%s",
-                    pi.project.name if pi.project else "?",
-                    pi.integration.name if pi.integration else "?",
-                )
-
-                # Record failure
-                history = SyncHistory(
-                    project_integration_id=pi.id,
-                    status="failed",
-                    error_message=str(e)[:1000],
-                )
-                db.session.add(history)
-                db.session.commit()
 
         logger.info(
             "Auto-sync completed: %d/%d successful, %d failed",
@@ -245,6 +485,400 @@ def _run_sync_all(app: Flask) -> dict:
         return results
 
 
+def _auto_sync_integrations() -> list:
+    """Return the enabled project integrations that take part in auto-sync."""
+    from ..models import ProjectIntegration
+
+    return (
+        ProjectIntegration.query.join(ProjectIntegration.integration)
+        .filter(ProjectIntegration.integration.has(enabled=True))
+        .filter(ProjectIntegration.auto_sync_enabled == True)  # noqa: E712
+        .all()
+    )
+
+
+def compute_sync_interval(
+    history: list, *, base: float, minimum: float, maximum: float
+) -> float:
+    """Return the number of seconds to wait after the latest sync in ``history``.
+
+    ``history`` holds an integration's most recent SyncHistory rows, newest first.
+    Every consecutive sync at the head of the history that changed issues halves
+    ``base``; every consecutive idle or failed sync doubles it. The result is at least
+    ``SYNC_DURATION_FACTOR`` times the last sync's duration and is clamped to
+    ``[minimum, maximum]``.
+    """
+    if not history:
+        return float(minimum)
+
+    def _active(entry: Any) -> bool:
+        return entry.status == "success" and (entry.issues_updated or 0) > 0
+
+    latest_active = _active(history[0])
+    streak = 0
+    for entry in history:
+        if _active(entry) != latest_active:
+            break
+        streak += 1
+
+    interval = base / 2**streak if latest_active else base * 2**streak
+    interval = max(interval, (history[0].duration_seconds or 0) * SYNC_DURATION_FACTOR)
+    return float(min(max(interval, minimum), maximum))
+
+
+def _interval_bounds(app: Flask, pi: Any) -> tuple[float, float]:
+    """Return the (min, max) interval for ``pi``, honouring its config overrides."""
+    config = pi.config or {}
+    bounds = []
+    for key, setting, default in (
+        ("sync_min_interval", "ISSUE_SYNC_MIN_INTERVAL", 120),
+        ("sync_max_interval", "ISSUE_SYNC_MAX_INTERVAL", 21600),
+    ):
+        value = app.config.get(setting, default) or default
+        try:
+            value = int(config.get(key) or value)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring invalid %s=%r on integration %s", key, config[key], pi.id)
+        bounds.append(max(1, int(value)))
+    minimum, maximum = bounds
+    return float(minimum), float(max(minimum, maximum))
+
+
+def _recent_history(project_integration_ids: list[int]) -> dict[int, list]:
+    """Load the last ``SYNC_HISTORY_WINDOW`` SyncHistory rows per integration."""
+    from sqlalchemy import func, select
+
+    from ..models import SyncHistory
+
+    history: dict[int, list] = {pi_id: [] for pi_id in project_integration_ids}
+    if not project_integration_ids:
+        return history
+
+    order = (SyncHistory.created_at.desc(), SyncHistory.id.desc())
+    ranked = (
+        select(
+            SyncHistory.id,
+            func.row_number()
+            .over(partition_by=SyncHistory.project_integration_id, order_by=order)
+            .label("position"),
+        )
+        .where(SyncHistory.project_integration_id.in_(project_integration_ids))
+        .subquery()
+    )
+    rows = (
+        SyncHistory.query.join(ranked, ranked.c.id == SyncHistory.id)
+        .filter(ranked.c.position <= SYNC_HISTORY_WINDOW)
+        .order_by(SyncHistory.project_integration_id, *order)
+        .all()
+    )
+    for row in rows:
+        history[row.project_integration_id].append(row)
+    return history
+
+
+def _compute_schedule(app: Flask, project_integrations: list, now: datetime) -> dict:
+    """Return interval, last sync and next due time for each project integration."""
+    base = int(app.config.get("ISSUE_SYNC_INTERVAL", 900) or 900)
+    history = _recent_history([pi.id for pi in project_integrations])
+    schedule: dict[int, dict] = {}
+    for pi in project_integrations:
+        entries = history[pi.id]
+        minimum, maximum = _interval_bounds(app, pi)
+        interval = compute_sync_interval(
+            entries, base=base, minimum=minimum, maximum=maximum
+        )
+        last_sync = entries[0].created_at if entries else None
+        next_due = last_sync + timedelta(seconds=interval) if last_sync else now
+        schedule[pi.id] = {
+            "interval_seconds": int(interval),
+            "last_sync": last_sync,
+            "next_due": next_due,
+            "due": next_due <= now,
+        }
+    return schedule
+
+
+def get_sync_schedule(app: Flask) -> list[dict]:
+    """Describe when each auto-synced project integration is next due.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        List of dicts with the integration, its current interval and next due time,
+        soonest first
+    """
+    with app.app_context():
+        project_integrations = _auto_sync_integrations()
+        schedule = _compute_schedule(app, project_integrations, datetime.utcnow())
+        entries = []
+        for pi in project_integrations:
+            item = schedule[pi.id]
+            entries.append({
+                "project_integration_id": pi.id,
+                "project": pi.project.name if pi.project else None,
+                "integration": pi.integration.name if pi.integration else None,
+                "interval_seconds": item["interval_seconds"],
+                "last_sync": item["last_sync"].isoformat() if item["last_sync"] else None,
+                "next_due": item["next_due"].isoformat(),
+                "due": item["due"],
+            })
+        entries.sort(key=lambda entry: entry["next_due"])
+        return entries
+
+
+def _run_reconcile_all(app: Flask) -> dict:
+    """Run the reconciliation pass for every auto-synced project integration.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        Dict with reconciliation totals
+    """
+    with app.app_context():
+        from .issues.reconcile import reconcile_integrations
+
+        project_integrations = _auto_sync_integrations()
+        results = reconcile_integrations(project_integrations)
+        summary = {
+            "total": len(project_integrations),
+            "reconciled": sum(1 for r in results.values() if not r.skipped),
+            "failed": len(project_integrations) - len(results),
+            "marked_missing": sum(r.marked_missing for r in results.values()),
+            "restored": sum(r.restored for r in results.values()),
+            "archived": sum(r.archived for r in results.values()),
+        }
+        logger.info(
+            "Issue reconciliation completed: %d/%d integrations, %d missing, %d archived",
+            summary["reconciled"],
+            summary["total"],
+            summary["marked_missing"],
+            summary["archived"],
+        )
+        return summary
+
+
+def _host_key(integration: Any) -> str:
+    """Return the ``provider:host`` key used for per-host concurrency limits."""
+    provider = (getattr(integration, "provider", None) or "unknown").lower()
+    base_url = (getattr(integration, "base_url", None) or "").strip()
+    host = urlsplit(base_url).netloc or base_url or _DEFAULT_PROVIDER_HOSTS.get(
+        provider, provider
+    )
+    return f"{provider}:{host.lower()}"
+
+
+def _interleave_by_host(jobs: list) -> list:
+    """Order jobs round-robin across hosts so one busy host cannot fill the pool."""
+    buckets: dict[str, list] = {}
+    for job in jobs:
+        buckets.setdefault(_host_key(job.integration), []).append(job)
+    ordered: list = []
+    remaining = list(buckets.values())
+    while remaining:
+        for bucket in list(remaining):
+            ordered.append(bucket.pop(0))
+            if not bucket:
+                remaining.remove(bucket)
+    return ordered
+
+
+class _HostLimiter:
+    """Lazily created semaphores bounding concurrent fetches per provider host."""
+
+    def __init__(self, default_limit: int) -> None:
+        self._default_limit = default_limit
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def for_integration(self, integration: Any) -> threading.BoundedSemaphore:
+        key = _host_key(integration)
+        with self._lock:
+            semaphore = self._semaphores.get(key)
+            if semaphore is None:
+                settings = getattr(integration, "settings", None) or {}
+                try:
+                    limit = int(settings.get("max_concurrent_syncs") or self._default_limit)
+                except (TypeError, ValueError):
+                    limit = self._default_limit
+                semaphore = threading.BoundedSemaphore(max(1, limit))
+                self._semaphores[key] = semaphore
+            return semaphore
+
+
+class _PageStream:
+    """Bounded hand-off of one fetch job's pages from a pool thread to the writer.
+
+    The stream announces itself on ``ready`` with its first item, so the writer
+    picks up integrations in the order their data arrives. Iterating it yields pages
+    until the fetch finishes and re-raises a fetch failure on the writer thread.
+    """
+
+    _END = object()
+
+    def __init__(self, job: Any, ready: queue.Queue) -> None:
+        self.job = job
+        self.started = time.monotonic()
+        self._ready = ready
+        self._pages: queue.Queue = queue.Queue(maxsize=SYNC_PAGE_BUFFER)
+        self._announced = False
+        self._cancelled = threading.Event()
+
+    def put(self, item: Any) -> bool:
+        """Queue a page, blocking while the buffer is full; False once cancelled."""
+        while not self._cancelled.is_set():
+            try:
+                self._pages.put(item, timeout=0.5)
+            except queue.Full:
+                continue
+            if not self._announced:
+                self._announced = True
+                self._ready.put(self)
+            return True
+        return False
+
+    def finish(self) -> None:
+        self.put(self._END)
+
+    def fail(self, error: Exception) -> None:
+        self.put(error)
+
+    def cancel(self) -> None:
+        """Stop the producer; called when the writer gives up on this stream."""
+        self._cancelled.set()
+
+    def __iter__(self):
+        while True:
+            item = self._pages.get()
+            if item is self._END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+def _fetch_in_worker(app: Flask, stream: _PageStream, host_limits: _HostLimiter) -> None:
+    """Fetch a prepared job's pages on a pool thread and stream them to the writer."""
+    from .issues import iter_issue_pages
+
+    try:
+        with host_limits.for_integration(stream.job.integration):
+            with app.app_context():
+                stream.started = time.monotonic()
+                for page in iter_issue_pages(stream.job):
+                    if not stream.put(page):
+                        return
+    except Exception as e:  # noqa: BLE001 - re-raised on the writer thread
+        stream.fail(e)
+    else:
+        stream.finish()
+
+
+def _apply_sync_result(pi: Any, stream: _PageStream, results: dict) -> None:
+    """Upsert streamed pages and record a successful SyncHistory entry."""
+    from ..extensions import db
+    from ..models import SyncHistory
+    from .issues import apply_issue_pages
+
+    try:
+        synced_issues = apply_issue_pages(pi, stream)
+        changed_count = sum(1 for issue in synced_issues if issue.changed)
+        duration = time.monotonic() - stream.started
+
+        # Record success in sync history
+        history = SyncHistory(
+            project_integration_id=pi.id,
+            status="success",
+            issues_updated=changed_count,
+            duration_seconds=duration,
+        )
+        db.session.add(history)
+        db.session.commit()
+    except Exception as e:  # noqa: BLE001 - recorded per integration
+        stream.cancel()
+        db.session.rollback()
+        _record_sync_failure(pi, e, results)
+        return
+
+    results["success"] += 1
+    logger.info(
+        "Synced %d issues (%d changed) for %s/%s in %.2fs",
+        len(synced_issues),
+        changed_count,
+        pi.project.name if pi.project else "?",
+        pi.integration.name if pi.integration else "?",
+        duration,
+    )
+
+
+def _record_sync_failure(pi: Any, error: Exception, results: dict) -> None:
+    """Record a failed sync in SyncHistory and notify admins for provider errors."""
+    from ..extensions import db
+    from ..models import SyncHistory
+    from .issues import IssueSyncError
+    from .notification_generator import notify_sync_error
+
+    results["failed"] += 1
+    error_msg = str(error)
+
+    # Record failure in sync history
+    history = SyncHistory(
+        project_integration_id=pi.id,
+        status="failed",
+        error_message=error_msg[:1000],  # Truncate long errors
+    )
+    db.session.add(history)
+    db.session.commit()
+
+    if not isinstance(error, IssueSyncError):
+        logger.error(
+            "Unexpected error syncing %s/%s: %s",
+            pi.project.name if pi.project else "?",
+            pi.integration.name if pi.integration else "?",
+            error_msg,
+            exc_info=error,
+        )
+        return
+
+    logger.error(
+        "Failed to sync %s/%s: %s",
+        pi.project.name if pi.project else "?",
+        pi.integration.name if pi.integration else "?",
+        error_msg,
+    )
+
+    # Send notification to admins on failure
+    try:
+        notify_sync_error(
+            project_id=pi.project_id,
+            project_name=pi.project.name if pi.project else "Unknown",
+            integration_id=pi.integration_id,
+            provider=pi.integration.provider if pi.integration else "Unknown",
+            error_message=error_msg,
+        )
+    except Exception as notify_err:
+        logger.warning("Failed to send sync error notification: %s", notify_err)
+
+
+def _run_job_recovery(app: Flask) -> int:
+    """Re-queue or fail background jobs whose worker stopped sending heartbeats.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        Number of recovered jobs
+    """
+    with app.app_context():
+        from .job_queue import recover_stale_jobs
+
+        recovered = recover_stale_jobs()
+        if recovered:
+            logger.warning("Recovered %d background job(s) from stopped workers", recovered)
+        return recovered
+
+
 def _run_slack_poll(app: Flask) -> dict:
     """Poll all Slack integrations for messages with trigger reactions.
 
@@ -330,12 +964,21 @@ def get_scheduler_status() -> dict:
     """
     global _scheduler
 
+    from .issues.client_pool import client_pool_status
+    from .issues.rate_limit import rate_limit_status
+
     if _scheduler is None:
+        leader = get_leader_status()
+        # A standby worker reports the scheduler as running when another process leads
         return {
-            "running": False,
+            "running": leader["role"] == "standby" and leader["leader_active"],
             "enabled": False,
             "next_run": None,
             "jobs": [],
+            "adaptive": False,
+            "leader": leader,
+            "rate_limits": rate_limit_status(),
+            "client_pool": client_pool_status(),
         }
 
     jobs = []
@@ -355,6 +998,45 @@ def get_scheduler_status() -> dict:
         "enabled": True,
         "next_run": next_run.isoformat() if next_run else None,
         "jobs": jobs,
+        "adaptive": bool(main_job and main_job.kwargs.get("only_due")),
+        "leader": get_leader_status(),
+        "rate_limits": rate_limit_status(),
+        "client_pool": client_pool_status(),
+    }
+
+
+def get_leader_status() -> dict:
+    """Describe this process's role in scheduler leader election.
+
+    Returns:
+        Dict with the role (``leader``, ``standby`` or ``none``), this process's pid
+        and the pid/hostname recorded by the current leader
+    """
+    lock = _leader_lock
+    if lock is None:
+        return {
+            "role": "none",
+            "pid": os.getpid(),
+            "leader_active": False,
+            "leader": None,
+            "acquired_at": None,
+            "lock_file": None,
+        }
+
+    if lock.held:
+        role = "leader"
+        active = True
+    else:
+        standby = _standby_thread is not None and _standby_thread.is_alive()
+        role = "standby" if standby else "none"
+        active = lock.held_elsewhere()
+    return {
+        "role": role,
+        "pid": os.getpid(),
+        "leader_active": active,
+        "leader": lock.owner() if active else None,
+        "acquired_at": lock.acquired_at.isoformat() if lock.acquired_at else None,
+        "lock_file": str(lock.path),
     }
 
 
@@ -421,8 +1103,20 @@ def reconfigure_scheduler(enabled: bool, interval_minutes: int) -> None:
             return
 
         interval_seconds = interval_minutes * 60
+        app = current_app._get_current_object()
+        # Adaptive scheduling starts from this interval when computing due times
+        app.config["ISSUE_SYNC_INTERVAL"] = interval_seconds
 
         if _scheduler is None:
+            if not _get_leader_lock(app).try_acquire():
+                # Another worker owns scheduled jobs; it keeps its schedule until it
+                # restarts and reads the saved settings
+                logger.info(
+                    "Scheduler leadership held by another process; not starting "
+                    "a scheduler in pid %d",
+                    os.getpid(),
+                )
+                return
             # Need to start a new scheduler
             logger.info(
                 "Starting issue sync scheduler (interval=%d minutes)",
@@ -437,14 +1131,7 @@ def reconfigure_scheduler(enabled: bool, interval_minutes: int) -> None:
                 },
             )
 
-            _scheduler.add_job(
-                func=_run_sync_all,
-                trigger=IntervalTrigger(seconds=interval_seconds),
-                id="issue_sync_all",
-                name="Sync all issues from external providers",
-                replace_existing=True,
-                kwargs={"app": current_app._get_current_object()},
-            )
+            _add_sync_job(app)
 
             _scheduler.start()
             logger.info("Issue sync scheduler started with %d minute interval", interval_minutes)
@@ -454,8 +1141,5 @@ def reconfigure_scheduler(enabled: bool, interval_minutes: int) -> None:
                 "Updating issue sync scheduler interval to %d minutes",
                 interval_minutes,
             )
-            _scheduler.reschedule_job(
-                job_id="issue_sync_all",
-                trigger=IntervalTrigger(seconds=interval_seconds),
-            )
+            _add_sync_job(app)
             logger.info("Issue sync scheduler interval updated")
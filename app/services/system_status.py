@@ -904,6 +904,7 @@ def check_sync_scheduler() -> dict[str, Any]:
                     "running": True,
                     "interval_minutes": interval // 60,
                     "next_run": status.get("next_run"),
+                    "leader": status.get("leader"),
                 }
             }
 
@@ -12,6 +12,7 @@ from flask import current_app
 
 from ..extensions import db
 from ..models import User, UserIdentityMap
+from . import identity_index  # noqa: F401 - commits below invalidate the shared index
 
 
 class UserIdentityError(Exception):
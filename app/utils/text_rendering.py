@@ -534,71 +534,23 @@ def _convert_jira_markup_to_html(text: str) -> str:
     return html
 
 
-# Cache for Jira account ID to user name lookups
-_jira_user_cache: dict[str, str] = {}
-_jira_user_cache_loaded = False
-
-
-def _load_jira_user_cache() -> None:
-    """Load Jira account ID to user name mappings from database."""
-    global _jira_user_cache, _jira_user_cache_loaded
-    if _jira_user_cache_loaded:
-        return
-
+def _identity_index():
+    """Return the shared identity index, or None outside an app context."""
     try:
         # Import here to avoid circular imports
-        from flask import current_app
-        from app.models import User, UserIdentityMap
-
-        # Only load if we're in an app context
-        if not current_app:
-            return
+        from app.services.identity_index import get_identity_index
 
-        # Query all user identity mappings with Jira account IDs
-        mappings = (
-            UserIdentityMap.query
-            .join(User)
-            .filter(UserIdentityMap.jira_account_id.isnot(None))
-            .all()
-        )
-        for mapping in mappings:
-            if mapping.jira_account_id and mapping.user:
-                # Store both the full account ID and partial matches
-                account_id = mapping.jira_account_id
-                user_name = mapping.user.name or mapping.user.email or "User"
-                _jira_user_cache[account_id] = user_name
-                # Also store by the numeric prefix (e.g., "557058")
-                if ':' in account_id:
-                    prefix = account_id.split(':')[0]
-                    if prefix not in _jira_user_cache:
-                        _jira_user_cache[prefix] = user_name
-
-        _jira_user_cache_loaded = True
+        return get_identity_index()
     except Exception:
-        # If we can't load the cache, we'll fall back to showing IDs
-        pass
+        # If we can't load the index, we'll fall back to showing IDs
+        return None
 
 
 def _resolve_jira_user(account_id: str) -> str | None:
     """Resolve a Jira account ID to a user name."""
-    _load_jira_user_cache()
-
-    # Try exact match first
-    if account_id in _jira_user_cache:
-        return _jira_user_cache[account_id]
-
-    # Try matching by numeric prefix (e.g., "557058" from "557058:uuid")
-    if ':' in account_id:
-        prefix = account_id.split(':')[0]
-        if prefix in _jira_user_cache:
-            return _jira_user_cache[prefix]
-
-        # Try matching by any account ID that starts with the same prefix
-        for cached_id, name in _jira_user_cache.items():
-            if cached_id.startswith(prefix + ':') or cached_id == prefix:
-                return name
-
-    return None
+    index = _identity_index()
+    match = index.lookup_jira(account_id) if index is not None else None
+    return match.display_name if match else None
 
 
 def _convert_jira_mentions(text: str) -> str:
@@ -635,86 +587,18 @@ def _convert_jira_mentions(text: str) -> str:
     return _JIRA_MENTION_PATTERN.sub(replace_mention, text)
 
 
-# GitHub username cache
-_github_user_cache: dict[str, str] = {}
-_github_user_cache_loaded = False
-
-
-def _load_github_user_cache() -> None:
-    """Load GitHub username to display name mappings from database."""
-    global _github_user_cache, _github_user_cache_loaded
-    if _github_user_cache_loaded:
-        return
-
-    try:
-        from flask import current_app
-        from app.models import User, UserIdentityMap
-
-        if not current_app:
-            return
-
-        mappings = (
-            UserIdentityMap.query
-            .join(User)
-            .filter(UserIdentityMap.github_username.isnot(None))
-            .all()
-        )
-        for mapping in mappings:
-            if mapping.github_username and mapping.user:
-                username = mapping.github_username.lower()
-                display_name = mapping.user.name or mapping.user.email or mapping.github_username
-                _github_user_cache[username] = display_name
-
-        _github_user_cache_loaded = True
-    except Exception:
-        pass
-
-
 def _resolve_github_user(username: str) -> str | None:
     """Resolve a GitHub username to a display name."""
-    _load_github_user_cache()
-    return _github_user_cache.get(username.lower())
-
-
-# GitLab username cache
-_gitlab_user_cache: dict[str, str] = {}
-_gitlab_user_cache_loaded = False
-
-
-def _load_gitlab_user_cache() -> None:
-    """Load GitLab username to display name mappings from database."""
-    global _gitlab_user_cache, _gitlab_user_cache_loaded
-    if _gitlab_user_cache_loaded:
-        return
-
-    try:
-        from flask import current_app
-        from app.models import User, UserIdentityMap
-
-        if not current_app:
-            return
-
-        mappings = (
-            UserIdentityMap.query
-            .join(User)
-            .filter(UserIdentityMap.gitlab_username.isnot(None))
-            .all()
-        )
-        for mapping in mappings:
-            if mapping.gitlab_username and mapping.user:
-                username = mapping.gitlab_username.lower()
-                display_name = mapping.user.name or mapping.user.email or mapping.gitlab_username
-                _gitlab_user_cache[username] = display_name
-
-        _gitlab_user_cache_loaded = True
-    except Exception:
-        pass
+    index = _identity_index()
+    match = index.lookup("github", username) if index is not None else None
+    return match.display_name if match else None
 
 
 def _resolve_gitlab_user(username: str) -> str | None:
     """Resolve a GitLab username to a display name."""
-    _load_gitlab_user_cache()
-    return _gitlab_user_cache.get(username.lower())
+    index = _identity_index()
+    match = index.lookup("gitlab", username) if index is not None else None
+    return match.display_name if match else None
 
 
 def _convert_at_mentions(text: str) -> str:
@@ -8,6 +8,7 @@ from urllib.parse import urlparse
 
 import click
 from rich.console import Console
+from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt
 from rich.table import Table
@@ -386,6 +387,7 @@ def issues_pinned(ctx: click.Context, output: Optional[str]) -> None:
 @click.option("--project", help="Filter by project ID or name")
 @click.option("--tenant", help="Filter by tenant ID or slug")
 @click.option("--assignee", help="Filter by assignee name")
+@click.option("--labels", help="Comma-separated labels (matches any)")
 @click.option("--limit", type=int, help="Limit number of results")
 @click.option("--output", "-o", type=click.Choice(["table", "json", "yaml"]), help="Output format")
 @click.pass_context
@@ -396,6 +398,7 @@ def issues_list(
     project: Optional[str],
     tenant: Optional[str],
     assignee: Optional[str],
+    labels: Optional[str],
     limit: Optional[int],
     output: Optional[str],
 ) -> None:
@@ -422,6 +425,7 @@ def issues_list(
             tenant_id=tenant_id,
             assignee=assignee,
             limit=limit,
+            labels=[label.strip() for label in labels.split(",")] if labels else None,
         )
         # Show only the most relevant columns for list view
         # Title first to ensure it renders with priority
@@ -924,6 +928,12 @@ def issues_assign(ctx: click.Context, issue_id: int, user: Optional[int]) -> Non
 @click.option("--project", help="Project ID or name to sync")
 @click.option("--integration", type=int, help="Integration ID to sync")
 @click.option("--force-full", is_flag=True, help="Force full sync (ignore last sync time)")
+@click.option(
+    "--follow",
+    "-f",
+    is_flag=True,
+    help="Run as a background job and stream per-integration progress (Ctrl+C cancels)",
+)
 @click.option("--output", "-o", type=click.Choice(["table", "json", "yaml"]), help="Output format")
 @click.pass_context
 def issues_sync(
@@ -932,6 +942,7 @@ def issues_sync(
     project: Optional[str],
     integration: Optional[int],
     force_full: bool,
+    follow: bool,
     output: Optional[str],
 ) -> None:
     """Synchronize issues from external providers (GitHub, GitLab, Jira).
@@ -941,6 +952,7 @@ def issues_sync(
         aiops issues sync --tenant example        # Sync issues for a tenant
         aiops issues sync --project aiops        # Sync issues for a project
         aiops issues sync --force-full           # Force full sync
+        aiops issues sync --follow               # Stream progress, Ctrl+C cancels
     """
     client = get_client(ctx)
     config: Config = ctx.obj["config"]
@@ -962,7 +974,14 @@ def issues_sync(
             integration_id=integration,
             project_id=project_id,
             force_full=force_full,
+            background=follow,
         )
+        if result.get("job_id"):
+            if follow:
+                _follow_job(client, result["job_id"])
+            else:
+                _print_queued_job(result)
+            return
 
         # Display results
         synced = result.get("synced", 0)
@@ -1637,6 +1656,9 @@ def git_pull(ctx: click.Context, project: str, ref: Optional[str]) -> None:
     try:
         project_id = resolve_project_id(client, project)
         result = client.git_pull(project_id, ref)
+        if result.get("job_id"):
+            _print_queued_job(result)
+            return
         console.print("[green]Pull successful![/green]")
         if result.get("message"):
             console.print(result["message"])
@@ -3391,6 +3413,9 @@ def backup_create(ctx: click.Context, description: Optional[str], output: Option
     try:
         console.print("[yellow]Creating database backup...[/yellow]")
         result = client.create_backup(description=description)
+        if result.get("job_id"):
+            _print_queued_job(result)
+            return
 
         backup = result.get("backup", {})
         console.print(f"[green]✓[/green] {result.get('message', 'Backup created')}")
@@ -3565,6 +3590,227 @@ def backup_delete(ctx: click.Context, backup_id: int, yes: bool) -> None:
         sys.exit(1)
 
 
+# ============================================================================
+# JOBS COMMANDS
+# ============================================================================
+
+_FINISHED_JOB_STATUSES = {"succeeded", "failed", "cancelled"}
+
+
+def _print_queued_job(result: dict[str, Any]) -> None:
+    """Report a long-running operation that the server queued as a background job."""
+    job_id = result.get("job_id")
+    console.print(f"[green]✓[/green] {result.get('message', f'Job #{job_id} queued')}")
+    console.print(f"[dim]Follow progress with: aiops jobs watch {job_id}[/dim]")
+
+
+def _job_progress_table(job: dict[str, Any]) -> Table:
+    """Render a job's per-integration progress as reported by issue sync jobs."""
+    table = Table(
+        title=f"Job #{job.get('id')} {job.get('status')} {job.get('progress', 0)}%",
+        caption=job.get("progress_message") or None,
+    )
+    table.add_column("Integration", style="blue")
+    table.add_column("Provider", style="cyan", no_wrap=True)
+    table.add_column("Status")
+    table.add_column("Pages", justify="right")
+    table.add_column("Issues", style="green", justify="right")
+    table.add_column("Elapsed", justify="right")
+    status_styles = {"succeeded": "green", "failed": "red", "running": "yellow"}
+    for run in (job.get("result") or {}).get("integration_progress", []):
+        status = run.get("status", "")
+        style = status_styles.get(status, "dim")
+        table.add_row(
+            run.get("name", ""),
+            run.get("provider") or "",
+            f"[{style}]{status}[/{style}]",
+            str(run.get("pages", 0)),
+            str(run.get("issues", 0)),
+            f"{run.get('elapsed_seconds', 0):.1f}s",
+        )
+    return table
+
+
+def _report_finished_job(job: dict[str, Any]) -> None:
+    """Print a finished job's outcome and exit non-zero unless it succeeded."""
+    job_id = job.get("id")
+    status = job.get("status")
+    if status == "failed":
+        error_console.print(f"[red]✗[/red] Job #{job_id} failed: {job.get('error_message')}")
+        sys.exit(1)
+    if status == "cancelled":
+        error_console.print(f"[yellow]⚠[/yellow] Job #{job_id} was cancelled")
+        sys.exit(1)
+    if status not in _FINISHED_JOB_STATUSES:
+        error_console.print(
+            f"[yellow]Lost the progress stream for job #{job_id} ({status}); "
+            f"resume with: aiops jobs watch {job_id}[/yellow]"
+        )
+        sys.exit(1)
+    console.print(f"[green]✓[/green] Job #{job_id} succeeded")
+
+
+def _follow_job(client: APIClient, job_id: int) -> None:
+    """Stream a job's progress until it finishes; Ctrl+C requests cancellation."""
+    job: dict[str, Any] = {"id": job_id, "status": "queued"}
+    try:
+        with Live(_job_progress_table(job), console=console, refresh_per_second=4) as live:
+            for _event, job in client.stream_job_events(job_id):
+                live.update(_job_progress_table(job))
+    except KeyboardInterrupt:
+        try:
+            client.cancel_job(job_id)
+        except APIError as exc:
+            error_console.print(f"[red]Error:[/red] {exc}")
+            sys.exit(1)
+        error_console.print(
+            f"[yellow]Cancellation requested for job #{job_id}; "
+            "it stops after the current page[/yellow]"
+        )
+        sys.exit(130)
+    except APIError as exc:
+        error_console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+    _report_finished_job(job)
+
+
+@cli.group()
+def jobs() -> None:
+    """Background job commands (queued syncs, backups, git pulls)."""
+
+
+@jobs.command(name="list")
+@click.option(
+    "--status",
+    type=click.Choice(["queued", "running", "succeeded", "failed", "cancelled"]),
+    help="Filter by status",
+)
+@click.option("--kind", help="Filter by job kind (issue_sync, backup, git_pull)")
+@click.option("--limit", type=int, default=20, show_default=True, help="Maximum jobs to show")
+@click.option("--output", "-o", type=click.Choice(["table", "json", "yaml"]), help="Output format")
+@click.pass_context
+def jobs_list(
+    ctx: click.Context,
+    status: Optional[str],
+    kind: Optional[str],
+    limit: int,
+    output: Optional[str],
+) -> None:
+    """List background jobs, newest first."""
+    client = get_client(ctx)
+    config: Config = ctx.obj["config"]
+    output_format = output or config.output_format
+
+    try:
+        jobs_data = client.list_jobs(status=status, kind=kind, limit=limit)
+        format_output(
+            jobs_data,
+            output_format,
+            console,
+            title="Jobs",
+            columns=["id", "kind", "status", "progress", "progress_message"],
+        )
+    except APIError as exc:
+        error_console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+
+
+@jobs.command(name="get")
+@click.argument("job_id", type=int)
+@click.option("--output", "-o", type=click.Choice(["table", "json", "yaml"]), help="Output format")
+@click.pass_context
+def jobs_get(ctx: click.Context, job_id: int, output: Optional[str]) -> None:
+    """Show a background job's status and result."""
+    client = get_client(ctx)
+    config: Config = ctx.obj["config"]
+    output_format = output or config.output_format
+
+    try:
+        format_output(client.get_job(job_id), output_format, console)
+    except APIError as exc:
+        error_console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+
+
+@jobs.command(name="watch")
+@click.argument("job_id", type=int)
+@click.option("--interval", type=float, default=2.0, show_default=True, help="Seconds between polls")
+@click.option("--timeout", type=int, default=0, help="Give up after this many seconds (0 = no limit)")
+@click.pass_context
+def jobs_watch(ctx: click.Context, job_id: int, interval: float, timeout: int) -> None:
+    """Follow a background job until it finishes.
+
+    Exits with status 1 if the job fails, is cancelled or the timeout is reached.
+
+    Example:
+        aiops jobs watch 42
+    """
+    client = get_client(ctx)
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task(f"Job #{job_id}", total=None)
+            while True:
+                job = client.get_job(job_id)
+                message = job.get("progress_message") or ""
+                progress.update(
+                    task,
+                    description=(
+                        f"Job #{job_id} [cyan]{job.get('kind')}[/cyan] "
+                        f"{job.get('status')} {job.get('progress', 0)}% {message}"
+                    ),
+                )
+                if job.get("status") in _FINISHED_JOB_STATUSES:
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    progress.stop()
+                    error_console.print(
+                        f"[yellow]Timed out waiting for job #{job_id} ({job.get('status')})[/yellow]"
+                    )
+                    sys.exit(1)
+                time.sleep(interval)
+    except APIError as exc:
+        error_console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+
+    _report_finished_job(job)
+    if job.get("result"):
+        format_output(job["result"], "yaml", console)
+
+
+@jobs.command(name="cancel")
+@click.argument("job_id", type=int)
+@click.pass_context
+def jobs_cancel(ctx: click.Context, job_id: int) -> None:
+    """Cancel a background job.
+
+    Queued jobs are cancelled immediately; running jobs stop after their current
+    page of work.
+
+    Example:
+        aiops jobs cancel 42
+    """
+    client = get_client(ctx)
+
+    try:
+        job = client.cancel_job(job_id)
+    except APIError as exc:
+        error_console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+    if job.get("status") == "cancelled":
+        console.print(f"[green]✓[/green] Job #{job_id} cancelled")
+    else:
+        console.print(
+            f"[green]✓[/green] Cancellation requested for job #{job_id} "
+            f"({job.get('status')})"
+        )
+
+
 # ============================================================================
 # AGENTS COMMANDS
 # ============================================================================
@@ -1,6 +1,7 @@
 """API client for AIops REST API."""
 
-from typing import Any, Optional
+import json as jsonlib
+from typing import Any, Iterator, Optional
 
 import requests
 
@@ -249,9 +250,11 @@ class APIClient:
         tenant_id: Optional[int] = None,
         assignee: Optional[str] = None,
         limit: Optional[int] = None,
+        labels: Optional[list[str]] = None,
+        page_size: int = 200,
     ) -> list[dict[str, Any]]:
-        """List issues."""
-        params = {}
+        """List issues, following ``next_cursor`` until ``limit`` issues are fetched."""
+        params: dict[str, Any] = {}
         if status:
             params["status"] = status
         if provider:
@@ -262,10 +265,23 @@ class APIClient:
             params["tenant_id"] = tenant_id
         if assignee:
             params["assignee"] = assignee
-        if limit:
-            params["limit"] = limit
-        data = self.get("issues", params=params)
-        return data.get("issues", [])
+        if labels:
+            params["labels"] = ",".join(labels)
+
+        issues: list[dict[str, Any]] = []
+        cursor: Optional[str] = None
+        while True:
+            page_limit = page_size
+            if limit:
+                page_limit = min(page_size, limit - len(issues))
+            page_params = {**params, "limit": page_limit}
+            if cursor:
+                page_params["cursor"] = cursor
+            data = self.get("issues", params=page_params)
+            issues.extend(data.get("issues", []))
+            cursor = data.get("next_cursor")
+            if not cursor or (limit and len(issues) >= limit):
+                return issues
 
     def get_issue(self, issue_id: int) -> dict[str, Any]:
         """Get issue details."""
@@ -350,6 +366,7 @@ class APIClient:
         integration_id: Optional[int] = None,
         project_id: Optional[int] = None,
         force_full: bool = False,
+        background: bool = False,
     ) -> dict[str, Any]:
         """Synchronize issues from external providers.
 
@@ -358,11 +375,14 @@ class APIClient:
             integration_id: Limit sync to a specific tenant integration
             project_id: Limit sync to a specific project
             force_full: Force full sync (default: False)
+            background: Run as a background job and return its ID (default: False)
 
         Returns:
-            Sync result with statistics
+            Sync result with statistics, or the queued job when run in the background
         """
-        payload = {"force_full": force_full}
+        payload: dict[str, Any] = {"force_full": force_full}
+        if background:
+            payload["background"] = True
         if tenant_id is not None:
             payload["tenant_id"] = tenant_id
         if integration_id is not None:
@@ -833,6 +853,80 @@ class APIClient:
         """
         return self.get("system/status")
 
+    # Background jobs
+    def list_jobs(
+        self,
+        status: Optional[str] = None,
+        kind: Optional[str] = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """List background jobs, newest first."""
+        params: dict[str, Any] = {"limit": limit}
+        if status:
+            params["status"] = status
+        if kind:
+            params["kind"] = kind
+        result = self.get("jobs", params=params)
+        return result.get("jobs", [])
+
+    def get_job(self, job_id: int) -> dict[str, Any]:
+        """Get a background job's status, progress and result."""
+        result = self.get(f"jobs/{job_id}")
+        return result.get("job", {})
+
+    def cancel_job(self, job_id: int) -> dict[str, Any]:
+        """Cancel a queued job or ask a running one to stop."""
+        result = self.post(f"jobs/{job_id}/cancel")
+        return result.get("job", {})
+
+    def stream_job_events(
+        self, job_id: int, interval: float = 1.0
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield ``(event, job)`` pairs from a job's server-sent event stream.
+
+        The server ends each stream after a while with a ``reconnect`` event; a new
+        stream is opened then, so this only ends after the ``done`` event for a
+        finished job.
+        """
+        url = f"{self.base_url}/api/v1/jobs/{job_id}/events"
+        reconnect = True
+        try:
+            while reconnect:
+                reconnect = False
+                with self.session.get(
+                    url,
+                    params={"interval": interval},
+                    headers={"Accept": "text/event-stream"},
+                    stream=True,
+                ) as response:
+                    response.raise_for_status()
+                    event = "message"
+                    data_lines: list[str] = []
+                    for line in response.iter_lines(decode_unicode=True):
+                        if line is None:
+                            continue
+                        if line.startswith(":"):
+                            continue  # keep-alive comment
+                        if line.startswith("event:"):
+                            event = line[len("event:"):].strip()
+                        elif line.startswith("data:"):
+                            data_lines.append(line[len("data:"):].strip())
+                        elif not line and data_lines:
+                            job = jsonlib.loads("\n".join(data_lines))
+                            if event == "reconnect":
+                                reconnect = True
+                                event = "progress"
+                            yield event, job
+                            event, data_lines = "message", []
+        except requests.exceptions.HTTPError as exc:
+            try:
+                error_msg = exc.response.json().get("error", str(exc))
+            except Exception:  # noqa: BLE001
+                error_msg = str(exc)
+            raise APIError(error_msg, exc.response.status_code) from exc
+        except requests.exceptions.RequestException as exc:
+            raise APIError(f"Request failed: {exc}") from exc
+
     # Backup management
     def create_backup(self, description: str | None = None) -> dict[str, Any]:
         """Create a new database backup.
@@ -0,0 +1,31 @@
+"""Add the (updated_at, id) index used to page through external_issues.
+
+Revision ID: 394b3273b73f
+Revises: e4a9c7d1b386
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "394b3273b73f"
+down_revision = "e4a9c7d1b386"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index the keyset pagination order of the issues API."""
+    with op.batch_alter_table("external_issues", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_external_issues_updated_at_id",
+            ["updated_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade():
+    """Drop the keyset pagination index."""
+    with op.batch_alter_table("external_issues", schema=None) as batch_op:
+        batch_op.drop_index("ix_external_issues_updated_at_id")
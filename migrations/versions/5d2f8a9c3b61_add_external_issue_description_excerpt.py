@@ -0,0 +1,184 @@
+"""Add description_excerpt to external_issues for list views.
+
+Revision ID: 5d2f8a9c3b61
+Revises: b81f4c2e6a37
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5d2f8a9c3b61"
+down_revision = "b81f4c2e6a37"
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 500
+_EXCERPT_LENGTH = 512
+
+
+def upgrade():
+    """Store a plain-text description excerpt and backfill existing rows."""
+    with op.batch_alter_table("external_issues", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("description_excerpt", sa.String(length=512), nullable=True)
+        )
+
+    _backfill_description_excerpts()
+
+
+# Frozen copy of the description lookup in app.services.agent_context, so replaying
+# this revision never imports the live models. Atlassian documents are flattened to
+# plain text; the excerpt collapses whitespace, so only Markdown markers are lost
+def _document_text(node):
+    if isinstance(node, list):
+        return " ".join(filter(None, (_document_text(child) for child in node)))
+    if not isinstance(node, dict):
+        return node if isinstance(node, str) else ""
+    content = node.get("content") or []
+    if node.get("type") in {"paragraph", "heading"}:
+        # Inline nodes are concatenated; blocks are separated by whitespace
+        return "".join(_document_text(child) for child in content)
+    if node.get("type") == "text":
+        return node.get("text") or ""
+    if node.get("type") == "hardBreak":
+        return " "
+    attrs = node.get("attrs") or {}
+    if node.get("type") == "inlineCard":
+        return attrs.get("url") or ""
+    if node.get("type") in {"emoji", "mention"}:
+        return (
+            attrs.get("text")
+            or attrs.get("shortName")
+            or attrs.get("displayName")
+            or ""
+        )
+    return _document_text(content)
+
+
+def _text_value(value, allow_document=False):
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, dict):
+        if allow_document and value.get("type") == "doc":
+            return _document_text(value).strip() or None
+        for key in ("text", "body", "description", "value", "content"):
+            if key in value:
+                text = _text_value(value.get(key), allow_document)
+                if text:
+                    return text
+        return None
+    if isinstance(value, list):
+        parts = [_text_value(item, allow_document) for item in value]
+        return "\n".join(part for part in parts if part).strip() or None
+    return None
+
+
+def _search_nested_text(source):
+    if isinstance(source, dict):
+        for key, value in source.items():
+            lowered = key.lower()
+            if "description" in lowered or "body" in lowered:
+                text = _text_value(value, "description" in lowered)
+                if text:
+                    return text
+        values = source.values()
+    elif isinstance(source, list):
+        values = source
+    else:
+        return None
+    for value in values:
+        text = _search_nested_text(value)
+        if text:
+            return text
+    return None
+
+
+def _description(payload, provider):
+    if not payload or not isinstance(payload, dict):
+        return None
+    provider = (provider or "").lower()
+    if provider == "github":
+        return _text_value(payload.get("body"))
+    if provider == "gitlab":
+        return _text_value(payload.get("description"))
+    if provider == "jira":
+        fields = (
+            payload.get("fields") if isinstance(payload.get("fields"), dict) else {}
+        )
+        rendered = payload.get("renderedFields")
+        rendered = rendered if isinstance(rendered, dict) else {}
+        return (
+            _text_value(fields.get("description"), True)
+            or _text_value(rendered.get("description"))
+            or _search_nested_text(payload)
+        )
+    for key in ("description", "body", "content", "details"):
+        text = _text_value(payload.get(key))
+        if text:
+            return text
+    return _search_nested_text(payload)
+
+
+def _description_excerpt(raw_payload, provider):
+    text = " ".join((_description(raw_payload, provider) or "").split())
+    if len(text) <= _EXCERPT_LENGTH:
+        return text or None
+    return text[: _EXCERPT_LENGTH - 1].rstrip() + "…"
+
+
+def _backfill_description_excerpts():
+    bind = op.get_bind()
+    issues = sa.table(
+        "external_issues",
+        sa.column("id", sa.Integer),
+        sa.column("project_integration_id", sa.Integer),
+        sa.column("raw_payload", sa.JSON),
+        sa.column("description_excerpt", sa.String),
+    )
+    links = sa.table(
+        "project_integrations",
+        sa.column("id", sa.Integer),
+        sa.column("integration_id", sa.Integer),
+    )
+    integrations = sa.table(
+        "tenant_integrations",
+        sa.column("id", sa.Integer),
+        sa.column("provider", sa.String),
+    )
+    update = (
+        issues.update()
+        .where(issues.c.id == sa.bindparam("issue_id"))
+        .values(description_excerpt=sa.bindparam("excerpt"))
+    )
+    last_id = 0
+    while True:
+        batch = bind.execute(
+            sa.select(issues.c.id, issues.c.raw_payload, integrations.c.provider)
+            .select_from(
+                issues.outerjoin(
+                    links, links.c.id == issues.c.project_integration_id
+                ).outerjoin(integrations, integrations.c.id == links.c.integration_id)
+            )
+            .where(issues.c.id > last_id)
+            .order_by(issues.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not batch:
+            break
+        rows = [
+            {"issue_id": issue_id, "excerpt": excerpt}
+            for issue_id, raw_payload, provider in batch
+            if (excerpt := _description_excerpt(raw_payload, provider))
+        ]
+        if rows:
+            bind.execute(update, rows)
+        last_id = batch[-1][0]
+
+
+def downgrade():
+    """Drop the description excerpt."""
+    with op.batch_alter_table("external_issues", schema=None) as batch_op:
+        batch_op.drop_column("description_excerpt")
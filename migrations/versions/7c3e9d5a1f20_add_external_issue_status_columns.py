@@ -0,0 +1,181 @@
+"""Add normalized status_key and status_category to external_issues.
+
+Revision ID: 7c3e9d5a1f20
+Revises: 394b3273b73f
+Create Date: 2026-10-17
+"""
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7c3e9d5a1f20"
+down_revision = "394b3273b73f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Store the normalized status of each issue and backfill existing rows."""
+    with op.batch_alter_table("external_issues", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "status_key",
+                sa.String(length=128),
+                nullable=False,
+                server_default="__none__",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "status_category",
+                sa.String(length=32),
+                nullable=False,
+                server_default="Open",
+            )
+        )
+
+    _backfill_status_columns()
+
+    with op.batch_alter_table("external_issues", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_external_issues_integration_status_key",
+            ["project_integration_id", "status_key"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_external_issues_integration_status_category",
+            ["project_integration_id", "status_category", "updated_at"],
+            unique=False,
+        )
+
+
+# Frozen copy of the status normalization rules in app.services.issues.utils as of
+# this revision, so replaying the migration does not depend on the live app code
+_OPEN_TOKENS = {
+    "open",
+    "opened",
+    "offen",
+    "todo",
+    "doing",
+    "backlog",
+    "triage",
+    "ready",
+    "progress",
+    "review",
+    "active",
+    "blocked",
+    "pending",
+}
+_OPEN_PHRASES = {
+    "to do",
+    "in progress",
+    "in review",
+    "under review",
+    "ready for work",
+    "ready for review",
+    "needs review",
+    "awaiting review",
+}
+_CLOSED_TOKENS = {
+    "closed",
+    "done",
+    "resolved",
+    "fixed",
+    "complete",
+    "completed",
+    "finished",
+    "merged",
+    "shipped",
+    "deployed",
+    "released",
+    "cancelled",
+    "canceled",
+    "rejected",
+    "declined",
+}
+_CLOSED_PHRASES = {
+    "ready for release",
+    "ready for deploy",
+    "ready for deployment",
+    "won't fix",
+    "wont fix",
+    "won't do",
+    "won't merge",
+    "no longer needed",
+}
+_IN_PROGRESS_TOKENS = {
+    "progress",
+    "doing",
+    "review",
+    "active",
+    "blocked",
+    "pending",
+    "offen",
+}
+_IN_PROGRESS_PHRASES = {
+    "in progress",
+    "in review",
+    "under review",
+    "ready for review",
+    "needs review",
+    "awaiting review",
+}
+
+
+def _status_columns(status):
+    raw = (status or "").strip()
+    if not raw:
+        return {"status_key": "__none__", "status_category": "Open"}
+    normalized = re.sub(r"\s+", " ", raw.replace("_", " ").replace("-", " ").strip())
+    lower = normalized.lower()
+    tokens = [token for token in re.split(r"[^\w]+", lower) if token]
+
+    is_open = lower in _OPEN_PHRASES or any(t in _OPEN_TOKENS for t in tokens)
+    is_closed = lower in _CLOSED_PHRASES or any(t in _CLOSED_TOKENS for t in tokens)
+    if is_open:
+        key = "open"
+    elif is_closed:
+        key = "closed"
+    else:
+        key = "_".join(tokens) or "__none__"
+
+    if is_closed:
+        category = "Closed"
+    elif lower in _IN_PROGRESS_PHRASES or any(
+        token in _IN_PROGRESS_TOKENS for token in tokens
+    ):
+        category = "In Progress"
+    else:
+        category = "Open"
+    return {"status_key": key, "status_category": category}
+
+
+def _backfill_status_columns():
+    # Raw statuses repeat heavily, so normalize each distinct value once and
+    # update all of its rows with one statement
+    bind = op.get_bind()
+    issues = sa.table(
+        "external_issues",
+        sa.column("status", sa.String),
+        sa.column("status_key", sa.String),
+        sa.column("status_category", sa.String),
+    )
+    statuses = [row[0] for row in bind.execute(sa.select(issues.c.status).distinct())]
+    for status in statuses:
+        condition = (
+            issues.c.status.is_(None) if status is None else issues.c.status == status
+        )
+        bind.execute(issues.update().where(condition).values(**_status_columns(status)))
+
+
+def downgrade():
+    """Drop the normalized status columns."""
+    with op.batch_alter_table("external_issues", schema=None) as batch_op:
+        batch_op.drop_index("ix_external_issues_integration_status_category")
+        batch_op.drop_index("ix_external_issues_integration_status_key")
+        batch_op.drop_column("status_category")
+        batch_op.drop_column("status_key")
@@ -0,0 +1,47 @@
+"""Add the issue_daily_stats resolution rollup.
+
+Revision ID: 9e4b7c1d2a58
+Revises: 5d2f8a9c3b61
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9e4b7c1d2a58"
+down_revision = "5d2f8a9c3b61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the per-day resolution totals; `flask rebuild-issue-stats` fills them."""
+    op.create_table(
+        "issue_daily_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_integration_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("resolved_count", sa.Integer(), nullable=False),
+        sa.Column("resolution_hours", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["project_integration_id"],
+            ["project_integrations.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "project_integration_id", "day", name="uq_issue_daily_stats_integration_day"
+        ),
+    )
+    with op.batch_alter_table("issue_daily_stats", schema=None) as batch_op:
+        batch_op.create_index("ix_issue_daily_stats_day", ["day"], unique=False)
+
+
+def downgrade():
+    """Drop the resolution rollup."""
+    with op.batch_alter_table("issue_daily_stats", schema=None) as batch_op:
+        batch_op.drop_index("ix_issue_daily_stats_day")
+
+    op.drop_table("issue_daily_stats")
@@ -0,0 +1,29 @@
+"""Add content_hash column to external_issues.
+
+Revision ID: b7d41c9e2f03
+Revises: 697ef65dfbb7
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b7d41c9e2f03"
+down_revision = "697ef65dfbb7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add content_hash so issue sync can skip unchanged rows."""
+    op.add_column(
+        "external_issues",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade():
+    """Remove content_hash column."""
+    op.drop_column("external_issues", "content_hash")
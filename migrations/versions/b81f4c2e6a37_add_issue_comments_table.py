@@ -0,0 +1,161 @@
+"""Add the issue_comments table and fill it from external_issues.comments.
+
+Revision ID: b81f4c2e6a37
+Revises: 7c3e9d5a1f20
+Create Date: 2026-10-17
+"""
+
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b81f4c2e6a37"
+down_revision = "7c3e9d5a1f20"
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 500
+
+
+def upgrade():
+    """Store issue comments as rows so they can be queried and indexed."""
+    op.create_table(
+        "issue_comments",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("issue_id", sa.Integer(), nullable=False),
+        sa.Column("external_id", sa.String(length=64), nullable=True),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("author", sa.String(length=255), nullable=True),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("body_html", sa.Text(), nullable=True),
+        sa.Column("url", sa.String(length=1024), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["issue_id"], ["external_issues.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("issue_comments", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_issue_comments_issue_created", ["issue_id", "created_at"], unique=False
+        )
+        batch_op.create_index("ix_issue_comments_author", ["author"], unique=False)
+        batch_op.create_index(
+            "ix_issue_comments_created_at", ["created_at"], unique=False
+        )
+
+    _backfill_issue_comments()
+
+
+# Frozen copy of app.services.issues.comments.comment_rows and the timestamp
+# parsing it relies on, so replaying this revision never imports the live models
+def _parse_timestamp(value):
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value.strip():
+        text = value.strip()
+        if text.endswith(" UTC"):
+            text = text[:-4] + "+00:00"
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        elif text[-5:-4] in ("+", "-") and text[-4:].isdigit():
+            text = f"{text[:-5]}{text[-5:-2]}:{text[-2:]}"
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            for fmt in (
+                "%Y-%m-%dT%H:%M:%S.%f",
+                "%Y-%m-%dT%H:%M:%S",
+                "%Y-%m-%d %H:%M:%S.%f",
+                "%Y-%m-%d %H:%M:%S",
+                "%Y-%m-%d %H:%M",
+            ):
+                try:
+                    parsed = datetime.strptime(text, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                return None
+    else:
+        return None
+    if parsed.tzinfo is None:
+        return parsed
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _truncate(value, length):
+    if value is None:
+        return None
+    return str(value)[:length]
+
+
+def _comment_rows(issue_id, issue_comments):
+    rows = []
+    for position, comment in enumerate(issue_comments or []):
+        if not isinstance(comment, dict):
+            continue
+        rows.append(
+            {
+                "issue_id": issue_id,
+                "external_id": _truncate(comment.get("id"), 64),
+                "position": position,
+                "author": _truncate(comment.get("author"), 255),
+                "body": comment.get("body") or "",
+                "body_html": comment.get("body_html"),
+                "url": _truncate(comment.get("url"), 1024),
+                "created_at": _parse_timestamp(comment.get("created_at")),
+            }
+        )
+    return rows
+
+
+def _backfill_issue_comments():
+    bind = op.get_bind()
+    issues = sa.table(
+        "external_issues",
+        sa.column("id", sa.Integer),
+        sa.column("comments", sa.JSON),
+    )
+    comments = sa.table(
+        "issue_comments",
+        sa.column("issue_id", sa.Integer),
+        sa.column("external_id", sa.String),
+        sa.column("position", sa.Integer),
+        sa.column("author", sa.String),
+        sa.column("body", sa.Text),
+        sa.column("body_html", sa.Text),
+        sa.column("url", sa.String),
+        sa.column("created_at", sa.DateTime),
+    )
+    last_id = 0
+    while True:
+        batch = bind.execute(
+            sa.select(issues.c.id, issues.c.comments)
+            .where(issues.c.id > last_id)
+            .order_by(issues.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not batch:
+            break
+        rows = [
+            row
+            for issue_id, issue_comments in batch
+            for row in _comment_rows(issue_id, issue_comments)
+        ]
+        if rows:
+            bind.execute(comments.insert(), rows)
+        last_id = batch[-1][0]
+
+
+def downgrade():
+    """Drop issue_comments; the JSON comments on external_issues are kept."""
+    with op.batch_alter_table("issue_comments", schema=None) as batch_op:
+        batch_op.drop_index("ix_issue_comments_created_at")
+        batch_op.drop_index("ix_issue_comments_author")
+        batch_op.drop_index("ix_issue_comments_issue_created")
+
+    op.drop_table("issue_comments")
@@ -0,0 +1,64 @@
+"""Add background_jobs table for the persistent job queue.
+
+Revision ID: c5e8a1f47d92
+Revises: b7d41c9e2f03
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c5e8a1f47d92"
+down_revision = "b7d41c9e2f03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create background_jobs table."""
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("progress", sa.Integer(), nullable=False),
+        sa.Column("progress_message", sa.String(length=255), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("worker_id", sa.String(length=128), nullable=True),
+        sa.Column("created_by_user_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["created_by_user_id"], ["users.id"], ondelete="SET NULL"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("background_jobs", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_background_jobs_status"), ["status"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_background_jobs_created_by_user_id"),
+            ["created_by_user_id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_background_jobs_created_at"), ["created_at"], unique=False
+        )
+
+
+def downgrade():
+    """Drop background_jobs table."""
+    with op.batch_alter_table("background_jobs", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_background_jobs_created_at"))
+        batch_op.drop_index(batch_op.f("ix_background_jobs_created_by_user_id"))
+        batch_op.drop_index(batch_op.f("ix_background_jobs_status"))
+
+    op.drop_table("background_jobs")
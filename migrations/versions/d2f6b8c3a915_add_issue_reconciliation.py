@@ -0,0 +1,64 @@
+"""Add missing_since to external_issues and the archived_external_issues table.
+
+Revision ID: d2f6b8c3a915
+Revises: c5e8a1f47d92
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d2f6b8c3a915"
+down_revision = "c5e8a1f47d92"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Track issues missing upstream and archive them out of external_issues."""
+    op.add_column(
+        "external_issues",
+        sa.Column("missing_since", sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        "archived_external_issues",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_integration_id", sa.Integer(), nullable=False),
+        sa.Column("original_issue_id", sa.Integer(), nullable=False),
+        sa.Column("external_id", sa.String(length=128), nullable=False),
+        sa.Column("title", sa.String(length=512), nullable=False),
+        sa.Column("status", sa.String(length=128), nullable=True),
+        sa.Column("url", sa.String(length=1024), nullable=True),
+        sa.Column("snapshot", sa.JSON(), nullable=False),
+        sa.Column("missing_since", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["project_integration_id"], ["project_integrations.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("archived_external_issues", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_archived_external_issues_project_integration_id"),
+            ["project_integration_id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_archived_external_issues_archived_at"),
+            ["archived_at"],
+            unique=False,
+        )
+
+
+def downgrade():
+    """Drop archived_external_issues and the missing_since column."""
+    with op.batch_alter_table("archived_external_issues", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_archived_external_issues_archived_at"))
+        batch_op.drop_index(
+            batch_op.f("ix_archived_external_issues_project_integration_id")
+        )
+
+    op.drop_table("archived_external_issues")
+    op.drop_column("external_issues", "missing_since")
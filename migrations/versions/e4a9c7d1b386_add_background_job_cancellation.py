@@ -0,0 +1,35 @@
+"""Add cancel_requested to background_jobs.
+
+Revision ID: e4a9c7d1b386
+Revises: d2f6b8c3a915
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e4a9c7d1b386"
+down_revision = "d2f6b8c3a915"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Let running jobs be cancelled cooperatively."""
+    with op.batch_alter_table("background_jobs", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "cancel_requested",
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.false(),
+            )
+        )
+
+
+def downgrade():
+    """Drop cancel_requested from background_jobs."""
+    with op.batch_alter_table("background_jobs", schema=None) as batch_op:
+        batch_op.drop_column("cancel_requested")
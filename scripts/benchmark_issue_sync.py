@@ -0,0 +1,764 @@
+#!/usr/bin/env python3
+"""
+Benchmark issue sync end to end against a local stub provider server.
+
+The stub server replays synthetic GitHub (GraphQL), GitLab (REST) and Jira (REST)
+responses for a configurable number of issues and comments, with optional per-request
+latency. Each provider is first synced cold with ``sync_project_integration``; then
+``_run_sync_all`` re-syncs every integration the way the scheduler does. For every
+step the report shows wall time, HTTP requests served, database writes (statements
+and rows) and the process's peak RSS, so regressions are visible across commits.
+
+Run with:
+    python scripts/benchmark_issue_sync.py --issues 1000 --comments 0-50
+    python scripts/benchmark_issue_sync.py --providers gitlab --issues 50000 --latency-ms 20
+    python scripts/benchmark_issue_sync.py --issues 5000 --async-fetch --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event
+
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models import (
+    ExternalIssue,
+    Project,
+    ProjectIntegration,
+    Tenant,
+    TenantIntegration,
+    User,
+)
+
+PROVIDERS = ("github", "gitlab", "jira")
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# Comments Jira embeds in search results; issues with more are hydrated one by one
+JIRA_EMBEDDED_COMMENTS = 20
+AUTHORS = [f"user-{index:02d}" for index in range(25)]
+FILLER = (
+    "Steps to reproduce, expected and actual behaviour, logs and a proposed fix. "
+) * 6
+
+
+@dataclass
+class Scale:
+    """Size of the synthetic dataset each stub provider serves."""
+
+    issues: int = 1000
+    min_comments: int = 0
+    max_comments: int = 10
+    latency: float = 0.0
+    seed: int = 1
+
+    def comment_count(self, number: int) -> int:
+        rng = random.Random(self.seed * 1_000_003 + number)
+        return rng.randint(self.min_comments, self.max_comments)
+
+
+def _timestamp(number: int, offset_seconds: int = 0) -> str:
+    value = BASE_TIME + timedelta(minutes=number, seconds=offset_seconds)
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _comment(number: int, index: int) -> dict[str, Any]:
+    return {
+        "id": number * 1000 + index,
+        "author": AUTHORS[(number + index) % len(AUTHORS)],
+        "body": f"Comment {index} on issue {number}. {FILLER[:160]}",
+        "created_at": _timestamp(number, index),
+    }
+
+
+def _numbers_newest_first(scale: Scale, offset: int, limit: int) -> range:
+    """Issue numbers for one page of a listing ordered by updated_at descending."""
+    start = scale.issues - offset
+    stop = max(start - limit, 0)
+    return range(start, stop, -1)
+
+
+# --- GitHub -----------------------------------------------------------------------
+
+
+def _github_node(scale: Scale, number: int, comment_limit: int) -> dict[str, Any]:
+    total = scale.comment_count(number)
+    comments = [
+        _comment(number, index) for index in range(max(0, total - comment_limit), total)
+    ]
+    author = AUTHORS[number % len(AUTHORS)]
+    closed = number % 3 == 0
+    return {
+        "databaseId": 10_000_000 + number,
+        "number": number,
+        "title": f"Synthetic issue {number}",
+        "body": FILLER,
+        "bodyHTML": f"<p>{FILLER}</p>",
+        "state": "CLOSED" if closed else "OPEN",
+        "url": f"https://github.example/bench/repo/issues/{number}",
+        "createdAt": _timestamp(number),
+        "updatedAt": _timestamp(number),
+        "closedAt": _timestamp(number) if closed else None,
+        "author": {"login": author},
+        "labels": {"nodes": [{"name": "bug"}, {"name": f"area-{number % 7}"}]},
+        "assignees": {"nodes": [{"login": author, "name": author.title()}]},
+        "comments": {
+            "totalCount": total,
+            "nodes": [
+                {
+                    "databaseId": comment["id"],
+                    "body": comment["body"],
+                    "bodyHTML": f"<p>{comment['body']}</p>",
+                    "createdAt": comment["created_at"],
+                    "url": f"https://github.example/bench/repo/issues/{number}#c{comment['id']}",
+                    "author": {"login": comment["author"]},
+                }
+                for comment in comments
+            ],
+        },
+    }
+
+
+def _github_graphql(scale: Scale, body: dict[str, Any]) -> dict[str, Any]:
+    variables = body.get("variables") or {}
+    offset = int(variables.get("cursor") or 0)
+    ids_only = "pageSize" not in variables
+    page_size = 100 if ids_only else int(variables.get("pageSize") or 50)
+    numbers = _numbers_newest_first(scale, offset, page_size)
+    if ids_only:
+        nodes = [{"number": number} for number in numbers]
+    else:
+        comment_limit = int(variables.get("commentCount") or 20)
+        nodes = [_github_node(scale, number, comment_limit) for number in numbers]
+    end = offset + len(nodes)
+    return {
+        "data": {
+            "repository": {
+                "issues": {
+                    "pageInfo": {
+                        "hasNextPage": end < scale.issues,
+                        "endCursor": str(end),
+                    },
+                    "nodes": nodes,
+                }
+            }
+        }
+    }
+
+
+# --- GitLab -----------------------------------------------------------------------
+
+
+def _gitlab_issue(scale: Scale, number: int) -> dict[str, Any]:
+    author = AUTHORS[number % len(AUTHORS)]
+    return {
+        "id": 20_000_000 + number,
+        "iid": number,
+        "project_id": 1,
+        "title": f"Synthetic issue {number}",
+        "description": FILLER,
+        "state": "closed" if number % 3 == 0 else "opened",
+        "labels": ["bug", f"area-{number % 7}"],
+        "created_at": _timestamp(number),
+        "updated_at": _timestamp(number),
+        "web_url": f"https://gitlab.example/bench/repo/-/issues/{number}",
+        "author": {"username": author, "name": author.title()},
+        "assignee": {"username": author, "name": author.title()},
+        "assignees": [{"username": author, "name": author.title()}],
+        "user_notes_count": scale.comment_count(number),
+    }
+
+
+def _gitlab_notes(scale: Scale, number: int) -> list[dict[str, Any]]:
+    notes = [
+        {
+            "id": comment["id"],
+            "system": False,
+            "body": comment["body"],
+            "author": {
+                "username": comment["author"],
+                "name": comment["author"].title(),
+            },
+            "created_at": comment["created_at"],
+        }
+        for comment in (
+            _comment(number, index) for index in range(scale.comment_count(number))
+        )
+    ]
+    notes.reverse()
+    return notes
+
+
+# --- Jira -------------------------------------------------------------------------
+
+
+def _jira_issue(
+    scale: Scale, number: int, comment_limit: Optional[int]
+) -> dict[str, Any]:
+    total = scale.comment_count(number)
+    shown = total if comment_limit is None else min(total, comment_limit)
+    comments = [_comment(number, index) for index in range(shown)]
+    author = AUTHORS[number % len(AUTHORS)]
+    done = number % 3 == 0
+    return {
+        "id": str(30_000_000 + number),
+        "key": f"BENCH-{number}",
+        "fields": {
+            "summary": f"Synthetic issue {number}",
+            "status": {
+                "name": "Done" if done else "In Progress",
+                "statusCategory": {"key": "done" if done else "indeterminate"},
+            },
+            "assignee": {
+                "displayName": author.title(),
+                "accountId": f"557058:{author}",
+            },
+            "updated": _timestamp(number),
+            "labels": ["bug", f"area-{number % 7}"],
+            "description": FILLER,
+            "comment": {
+                "comments": [
+                    {
+                        "id": str(comment["id"]),
+                        "author": {
+                            "displayName": comment["author"].title(),
+                            "accountId": f"557058:{comment['author']}",
+                        },
+                        "body": comment["body"],
+                        "created": comment["created_at"],
+                    }
+                    for comment in comments
+                ],
+                "maxResults": shown,
+                "total": total,
+            },
+        },
+        "renderedFields": {
+            "description": f"<p>{FILLER}</p>",
+            "comment": {
+                "comments": [
+                    {"id": str(comment["id"]), "body": f"<p>{comment['body']}</p>"}
+                    for comment in comments
+                ]
+            },
+        },
+    }
+
+
+# --- Stub server ------------------------------------------------------------------
+
+
+class StubProviderServer(ThreadingHTTPServer):
+    """Keep-alive HTTP server replaying synthetic provider responses.
+
+    Paths are prefixed with the provider name (``/github``, ``/gitlab``, ``/jira``) so
+    one server can back all three integrations.
+    """
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, scale: Scale) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.scale = scale
+        self.lock = threading.Lock()
+        self.requests: dict[str, int] = {}
+        self.unhandled: list[str] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, provider: str) -> None:
+        with self.lock:
+            self.requests[provider] = self.requests.get(provider, 0) + 1
+
+    def reset(self) -> None:
+        with self.lock:
+            self.requests = {}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; Nagle plus delayed ACKs would add
+    # ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+    server: StubProviderServer
+
+    _GITLAB_PROJECT = re.compile(r"^/gitlab/api/v4/projects/([^/]+)$")
+    _GITLAB_ISSUES = re.compile(r"^/gitlab/api/v4/projects/([^/]+)/issues$")
+    _GITLAB_NOTES = re.compile(r"^/gitlab/api/v4/projects/([^/]+)/issues/(\d+)/notes$")
+    _JIRA_ISSUE = re.compile(r"^/jira/rest/api/2/issue/BENCH-(\d+)$")
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        provider = parts.path.strip("/").split("/", 1)[0]
+        self.server.count(provider)
+        if self.server.scale.latency:
+            time.sleep(self.server.scale.latency)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        handler = getattr(self, f"_{provider}", None)
+        response = handler(method, parts.path, query, body) if handler else None
+        if response is None:
+            with self.server.lock:
+                self.server.unhandled.append(f"{method} {self.path}")
+            response = (404, {}, {"message": "not found"})
+        status, headers, payload = response
+        data = b"" if status == 304 else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _github(self, method: str, path: str, query: dict, body: bytes):
+        scale = self.server.scale
+        if method == "POST" and path == "/github/graphql":
+            return 200, {}, _github_graphql(scale, json.loads(body or b"{}"))
+        if method == "GET" and path == "/github/repos/bench/repo/issues":
+            # Probe for the most recently updated issue (see http_cache.py)
+            etag = f'"bench-{scale.seed}-{scale.issues}"'
+            if self.headers.get("If-None-Match") == etag:
+                return 304, {"ETag": etag}, None
+            newest = {"number": scale.issues, "updated_at": _timestamp(scale.issues)}
+            return 200, {"ETag": etag}, [newest] if scale.issues else []
+        return None
+
+    def _paged(
+        self, path: str, query: dict, total: int, build: Callable[[int, int], list]
+    ):
+        """Page-numbered listing with GitLab's pagination headers and Link header."""
+        per_page = max(1, min(int(query.get("per_page") or 20), 100))
+        page = max(1, int(query.get("page") or 1))
+        total_pages = max(1, -(-total // per_page))
+        headers = {
+            "X-Page": str(page),
+            "X-Per-Page": str(per_page),
+            "X-Total": str(total),
+            "X-Total-Pages": str(total_pages),
+            "X-Next-Page": str(page + 1) if page < total_pages else "",
+        }
+        if page < total_pages:
+            next_query = urlencode({**query, "page": page + 1})
+            host = self.headers.get("Host") or self.server.url.split("//", 1)[1]
+            headers["Link"] = f'<http://{host}{path}?{next_query}>; rel="next"'
+        return 200, headers, build((page - 1) * per_page, per_page)
+
+    def _gitlab(self, method: str, path: str, query: dict, body: bytes):
+        scale = self.server.scale
+        if method != "GET":
+            return None
+        if match := self._GITLAB_NOTES.match(path):
+            number = int(match.group(2))
+            notes = _gitlab_notes(scale, number)
+            return self._paged(
+                path,
+                query,
+                len(notes),
+                lambda offset, limit: notes[offset : offset + limit],
+            )
+        if self._GITLAB_ISSUES.match(path):
+            return self._paged(
+                path,
+                query,
+                scale.issues,
+                lambda offset, limit: [
+                    _gitlab_issue(scale, number)
+                    for number in _numbers_newest_first(scale, offset, limit)
+                ],
+            )
+        if match := self._GITLAB_PROJECT.match(path):
+            ref = unquote(match.group(1))
+            return 200, {}, {"id": 1, "path_with_namespace": ref, "name": ref}
+        return None
+
+    def _jira(self, method: str, path: str, query: dict, body: bytes):
+        scale = self.server.scale
+        if method != "GET":
+            return None
+        if path == "/jira/rest/api/2/serverInfo":
+            return (
+                200,
+                {},
+                {
+                    "baseUrl": f"{self.server.url}/jira",
+                    "version": "9.12.0",
+                    "versionNumbers": [9, 12, 0],
+                    "deploymentType": "Server",
+                    "buildNumber": 912000,
+                    "serverTitle": "Benchmark Jira",
+                },
+            )
+        if path == "/jira/rest/api/2/field":
+            return 200, {}, []
+        if path == "/jira/rest/api/2/search":
+            start_at = int(query.get("startAt") or 0)
+            max_results = int(query.get("maxResults") or 50)
+            ids_only = (query.get("fields") or "") == "key"
+            issues = [
+                {"key": f"BENCH-{number}"}
+                if ids_only
+                else _jira_issue(scale, number, JIRA_EMBEDDED_COMMENTS)
+                for number in _numbers_newest_first(scale, start_at, max_results)
+            ]
+            return (
+                200,
+                {},
+                {
+                    "startAt": start_at,
+                    "maxResults": max_results,
+                    "total": scale.issues,
+                    "issues": issues,
+                },
+            )
+        if match := self._JIRA_ISSUE.match(path):
+            return 200, {}, _jira_issue(scale, int(match.group(1)), None)
+        return None
+
+
+def start_stub_server(scale: Scale) -> StubProviderServer:
+    server = StubProviderServer(scale)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# --- Measurement ------------------------------------------------------------------
+
+
+class WriteCounter:
+    """Count INSERT/UPDATE/DELETE statements and the rows sent with them.
+
+    Bulk upserts may be split into several batches by SQLAlchemy; each logical
+    statement is counted once, with one row per parameter set.
+    """
+
+    def __init__(self, engine: Any) -> None:
+        self.statements = 0
+        self.rows = 0
+        self._seen: weakref.WeakSet[Any] = weakref.WeakSet()
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+
+    def _after_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if statement.lstrip()[:6].upper() not in {"INSERT", "UPDATE", "DELETE"}:
+            return
+        if context is not None:
+            if context in self._seen:
+                return
+            self._seen.add(context)
+        self.statements += 1
+        if executemany and context is not None:
+            self.rows += len(context.compiled_parameters)
+        else:
+            self.rows += max(cursor.rowcount or 0, 0)
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.rows = 0
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one benchmark step."""
+
+    name: str
+    issues: int
+    wall_seconds: float
+    requests: int
+    db_write_statements: int
+    db_rows_written: int
+    peak_rss_mb: float
+    details: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BenchmarkOptions:
+    scale: Scale = field(default_factory=Scale)
+    providers: tuple[str, ...] = PROVIDERS
+    async_fetch: bool = False
+    database_url: Optional[str] = None
+    workdir: Optional[Path] = None
+
+
+def _benchmark_app(options: BenchmarkOptions, workdir: Path):
+    class _Config(Config):
+        TESTING = True
+        WTF_CSRF_ENABLED = False
+        ISSUE_SYNC_ENABLED = False
+        SLACK_POLL_ENABLED = False
+        SQLALCHEMY_DATABASE_URI = (
+            options.database_url or f"sqlite:///{workdir / 'bench.db'}"
+        )
+        REPO_STORAGE_PATH = str(workdir / "repos")
+        ISSUE_SYNC_ASYNC_FETCH = options.async_fetch
+        # Measure the sync, not the governor's default pacing
+        ISSUE_SYNC_MAX_REQUESTS_PER_SECOND = 100_000
+
+    return create_app(_Config, instance_path=workdir / "instance")
+
+
+_EXTERNAL_IDENTIFIERS = {
+    "github": "bench/repo",
+    "gitlab": "bench/repo",
+    "jira": "BENCH",
+}
+
+
+def _seed(
+    server: StubProviderServer, providers: tuple[str, ...], workdir: Path
+) -> dict[str, int]:
+    owner = User(
+        email="bench@example.com", name="Bench", password_hash="x", is_admin=True
+    )
+    tenant = Tenant(name="bench", description="Benchmark tenant")
+    db.session.add_all([owner, tenant])
+    project_integration_ids: dict[str, int] = {}
+    for provider in providers:
+        project = Project(
+            name=f"bench-{provider}",
+            repo_url=f"git@example.com/bench-{provider}.git",
+            default_branch="main",
+            tenant=tenant,
+            owner=owner,
+            local_path=str(workdir / "repos" / f"bench-{provider}"),
+        )
+        integration = TenantIntegration(
+            tenant=tenant,
+            provider=provider,
+            name=f"Benchmark {provider}",
+            api_token="bench-token",
+            base_url=f"{server.url}/{provider}",
+            enabled=True,
+            settings={
+                "username": "bench@example.com",
+                "max_requests_per_second": 100_000,
+            },
+        )
+        project_integration = ProjectIntegration(
+            project=project,
+            integration=integration,
+            external_identifier=_EXTERNAL_IDENTIFIERS[provider],
+            config={},
+        )
+        db.session.add_all([project, integration, project_integration])
+        db.session.flush()
+        project_integration_ids[provider] = project_integration.id
+    db.session.commit()
+    return project_integration_ids
+
+
+def _measure(
+    name: str,
+    server: StubProviderServer,
+    writes: WriteCounter,
+    step: Callable[[], dict[str, Any]],
+) -> BenchmarkResult:
+    server.reset()
+    writes.reset()
+    started = time.perf_counter()
+    details = step()
+    wall = time.perf_counter() - started
+    return BenchmarkResult(
+        name=name,
+        issues=int(details.pop("issues", 0)),
+        wall_seconds=round(wall, 3),
+        requests=sum(server.requests.values()),
+        db_write_statements=writes.statements,
+        db_rows_written=writes.rows,
+        peak_rss_mb=peak_rss_mb(),
+        details=details,
+    )
+
+
+def run_benchmark(options: BenchmarkOptions) -> list[BenchmarkResult]:
+    """Cold-sync each provider, then re-sync everything through ``_run_sync_all``."""
+    from app.services.issues import sync_project_integration
+    from app.services.issues.rate_limit import reset_governors
+    from app.services.sync_scheduler import _run_sync_all
+
+    with tempfile.TemporaryDirectory(prefix="aiops-bench-") as tmp:
+        workdir = options.workdir or Path(tmp)
+        server = start_stub_server(options.scale)
+        reset_governors()
+        try:
+            app = _benchmark_app(options, workdir)
+            results: list[BenchmarkResult] = []
+            with app.app_context():
+                db.create_all()
+                writes = WriteCounter(db.engine)
+                ids = _seed(server, options.providers, workdir)
+
+                for provider in options.providers:
+
+                    def cold_sync(provider: str = provider) -> dict[str, Any]:
+                        project_integration = db.session.get(
+                            ProjectIntegration, ids[provider]
+                        )
+                        synced = sync_project_integration(
+                            project_integration, force_full=True
+                        )
+                        db.session.commit()
+                        return {"issues": len(synced)}
+
+                    results.append(
+                        _measure(
+                            f"sync_project_integration[{provider}]",
+                            server,
+                            writes,
+                            cold_sync,
+                        )
+                    )
+                    db.session.expunge_all()
+
+            def resync_all() -> dict[str, Any]:
+                summary = _run_sync_all(app)
+                with app.app_context():
+                    summary["issues"] = ExternalIssue.query.count()
+                return summary
+
+            with app.app_context():
+                results.append(_measure("_run_sync_all", server, writes, resync_all))
+                db.session.remove()
+                db.engine.dispose()
+            if server.unhandled:
+                results[-1].details["unhandled_requests"] = sorted(
+                    set(server.unhandled)
+                )[:20]
+            return results
+        finally:
+            reset_governors()
+            server.shutdown()
+            server.server_close()
+
+
+def _parse_comments(value: str) -> tuple[int, int]:
+    low, _, high = value.partition("-")
+    minimum = int(low)
+    maximum = int(high) if high else minimum
+    if minimum < 0 or maximum < minimum:
+        raise argparse.ArgumentTypeError("expected N or MIN-MAX with 0 <= MIN <= MAX")
+    return minimum, maximum
+
+
+def _print_table(results: list[BenchmarkResult]) -> None:
+    header = f"{'step':<36} {'issues':>7} {'wall s':>8} {'requests':>9} {'writes':>7} {'rows':>8} {'peak MB':>8}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result.name:<36} {result.issues:>7} {result.wall_seconds:>8.2f} "
+            f"{result.requests:>9} {result.db_write_statements:>7} "
+            f"{result.db_rows_written:>8} {result.peak_rss_mb:>8.1f}"
+        )
+        if result.details:
+            print(f"  {json.dumps(result.details, default=str)}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--issues", type=int, default=1000, help="Issues per provider")
+    parser.add_argument(
+        "--comments",
+        type=_parse_comments,
+        default=(0, 10),
+        help="Comments per issue, N or MIN-MAX",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Latency per request"
+    )
+    parser.add_argument(
+        "--providers",
+        default=",".join(PROVIDERS),
+        help="Comma-separated providers to sync",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Seed for comment counts")
+    parser.add_argument(
+        "--async-fetch", action="store_true", help="Use the async fetch layer"
+    )
+    parser.add_argument(
+        "--database-url", help="Database to sync into (default: temporary SQLite)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print results as JSON lines"
+    )
+    args = parser.parse_args(argv)
+
+    providers = tuple(p.strip() for p in args.providers.split(",") if p.strip())
+    unknown = sorted(set(providers) - set(PROVIDERS))
+    if unknown:
+        parser.error(f"unknown providers: {', '.join(unknown)}")
+
+    options = BenchmarkOptions(
+        scale=Scale(
+            issues=args.issues,
+            min_comments=args.comments[0],
+            max_comments=args.comments[1],
+            latency=args.latency_ms / 1000.0,
+            seed=args.seed,
+        ),
+        providers=providers,
+        async_fetch=args.async_fetch,
+        database_url=args.database_url,
+    )
+    results = run_benchmark(options)
+    if args.json:
+        for result in results:
+            print(json.dumps(result.to_dict(), default=str))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import secrets
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import bcrypt
@@ -10,7 +11,16 @@ import pytest
 
 from app import create_app, db
 from app.config import Config
-from app.models import APIKey, Tenant, User
+from app.models import (
+    APIKey,
+    ExternalIssue,
+    IssueComment,
+    Project,
+    ProjectIntegration,
+    Tenant,
+    TenantIntegration,
+    User,
+)
 from app.security import hash_password
 
 
@@ -87,6 +97,64 @@ def auth_headers(api_key_value):
     }
 
 
+@pytest.fixture()
+def commented_issues(app, tmp_path: Path):
+    """Create three GitHub issues with two comments each, alternating authors."""
+    base = datetime(2024, 10, 1, 12, 0, 0)
+    with app.app_context():
+        tenant = Tenant.query.filter_by(name="test-tenant").one()
+        user = User.query.filter_by(email="test@example.com").one()
+        project = Project(
+            name="comments-project",
+            repo_url="https://example.com/comments.git",
+            default_branch="main",
+            local_path=str(tmp_path / "repos" / "comments"),
+            tenant=tenant,
+            owner=user,
+        )
+        integration = TenantIntegration(
+            tenant=tenant,
+            provider="github",
+            name="GitHub",
+            api_token="token",
+            enabled=True,
+        )
+        link = ProjectIntegration(
+            project=project,
+            integration=integration,
+            external_identifier="org/repo",
+            config={},
+        )
+        db.session.add_all([project, integration, link])
+        for number in range(1, 4):
+            db.session.add(
+                ExternalIssue(
+                    project_integration=link,
+                    external_id=str(number),
+                    title=f"Issue {number}",
+                    status="open",
+                    assignee="carol" if number == 1 else None,
+                    comments=[
+                        {
+                            "id": f"{number}-{position}",
+                            "author": "alice" if position == 0 else "bob",
+                            "body": f"Comment {position} on issue {number}",
+                            "created_at": (
+                                base + timedelta(hours=number, minutes=position)
+                            ).isoformat() + "Z",
+                        }
+                        for position in range(2)
+                    ],
+                )
+            )
+        db.session.commit()
+        # An issue without comments must not show up anywhere
+        db.session.add(
+            ExternalIssue(project_integration=link, external_id="4", title="Quiet")
+        )
+        db.session.commit()
+
+
 class TestCommunicationsAPI:
     """Test communications API endpoints."""
 
@@ -141,3 +209,105 @@ class TestCommunicationsAPI:
         assert response.status_code == 200
         data = response.get_json()
         assert data["pagination"]["limit"] == 500
+
+    def test_communications_page_over_comments(
+        self, client, auth_headers, commented_issues
+    ):
+        """Comments are paged individually, newest first."""
+        response = client.get(
+            "/api/v1/communications?limit=4&offset=1", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["pagination"]["total"] == 6
+        assert data["pagination"]["count"] == 4
+        assert [item["comment"]["id"] for item in data["communications"]] == [
+            "3-0",
+            "2-1",
+            "2-0",
+            "1-1",
+        ]
+        first = data["communications"][0]
+        assert first["issue_external_id"] == "3"
+        assert first["comment"]["author"]["remote_name"] == "alice"
+        assert first["comment"]["created_at"] == "2024-10-01T15:00:00+00:00"
+
+    def test_communications_filter_by_author(
+        self, client, auth_headers, commented_issues
+    ):
+        """The author filter returns only that author's comments."""
+        response = client.get(
+            "/api/v1/communications?author=bob&sort=oldest", headers=auth_headers
+        )
+        data = response.get_json()
+        assert data["pagination"]["total"] == 3
+        assert [item["comment"]["id"] for item in data["communications"]] == [
+            "1-1",
+            "2-1",
+            "3-1",
+        ]
+
+    def test_threads_load_comments_from_table(
+        self, client, auth_headers, commented_issues
+    ):
+        """Threads only include commented issues and list comments in order."""
+        response = client.get(
+            "/api/v1/communications/threads", headers=auth_headers
+        )
+        data = response.get_json()
+        assert data["pagination"]["total"] == 3
+        for thread in data["threads"]:
+            assert thread["comment_count"] == 2
+            assert [c["author"]["remote_name"] for c in thread["comments"]] == [
+                "alice",
+                "bob",
+            ]
+
+    def test_authors_are_counted(self, client, auth_headers, commented_issues):
+        """Authors carry their comment counts; assignees are listed too."""
+        response = client.get(
+            "/api/v1/communications/authors", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.get_json()["authors"] == [
+            {"display_name": "alice", "remote_name": "alice", "comment_count": 3},
+            {"display_name": "bob", "remote_name": "bob", "comment_count": 3},
+            {"display_name": "carol", "remote_name": None, "comment_count": 0},
+        ]
+
+    def test_comment_rows_follow_issue_updates(self, app, commented_issues):
+        """Editing or deleting an issue through the ORM keeps its rows in step."""
+        with app.app_context():
+            issue = ExternalIssue.query.filter_by(external_id="1").one()
+            issue.comments = [{"id": "1-9", "author": "dave", "body": "Only one"}]
+            db.session.commit()
+            assert [
+                (row.external_id, row.author)
+                for row in IssueComment.query.filter_by(issue_id=issue.id)
+            ] == [("1-9", "dave")]
+
+            db.session.delete(issue)
+            db.session.commit()
+            assert IssueComment.query.count() == 4
+
+    def test_pin_comment_checks_comment_table(
+        self, client, auth_headers, commented_issues, app
+    ):
+        """Pinning looks the comment up in the table and lists it back."""
+        with app.app_context():
+            issue_id = ExternalIssue.query.filter_by(external_id="2").one().id
+
+        missing = client.post(
+            f"/api/v1/issues/{issue_id}/comments/9-9/pin", headers=auth_headers
+        )
+        assert missing.status_code == 404
+
+        response = client.post(
+            f"/api/v1/issues/{issue_id}/comments/2-1/pin", headers=auth_headers
+        )
+        assert response.status_code == 201
+
+        pinned = client.get("/api/v1/comments/pinned", headers=auth_headers)
+        [entry] = pinned.get_json()["pinned_comments"]
+        assert entry["comment"]["author"] == "bob"
+        assert entry["comment"]["body"] == "Comment 1 on issue 2"
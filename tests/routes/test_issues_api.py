@@ -0,0 +1,203 @@
+"""Tests for the issue listing API."""
+
+from __future__ import annotations
+
+import secrets
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import bcrypt
+import pytest
+
+from aiops_cli.client import APIClient
+from app import create_app, db
+from app.config import Config
+from app.models import (
+    APIKey,
+    ExternalIssue,
+    Project,
+    ProjectIntegration,
+    Tenant,
+    TenantIntegration,
+    User,
+)
+from app.security import hash_password
+
+
+class IssuesApiTestConfig(Config):
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+    ISSUE_SYNC_ENABLED = False
+    SLACK_POLL_ENABLED = False
+
+
+@pytest.fixture()
+def app_and_key(tmp_path: Path):
+    api_key_str = f"aiops_{secrets.token_hex(16)}"
+    key_hash = bcrypt.hashpw(api_key_str.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+    class _Config(IssuesApiTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'issues-api.db'}"
+
+    application = create_app(_Config)
+
+    with application.app_context():
+        db.create_all()
+
+        user = User(
+            email="reader@example.com",
+            name="Reader",
+            password_hash=hash_password("password123"),
+            is_admin=False,
+        )
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(
+            APIKey(
+                user_id=user.id,
+                name="test-key",
+                key_hash=key_hash,
+                key_prefix=api_key_str[:12],
+                scopes=["read"],
+            )
+        )
+
+        base = datetime(2024, 10, 1, 12, 0, 0)
+        for index, (tenant_name, provider) in enumerate(
+            [("alpha", "github"), ("beta", "jira")]
+        ):
+            tenant = Tenant(name=tenant_name, description=tenant_name.title())
+            project = Project(
+                name=f"{tenant_name}-project",
+                repo_url=f"https://example.com/{tenant_name}.git",
+                default_branch="main",
+                local_path=str(tmp_path / "repos" / tenant_name),
+                tenant=tenant,
+                owner=user,
+            )
+            integration = TenantIntegration(
+                tenant=tenant,
+                provider=provider.title(),
+                name=f"{provider} integration",
+                api_token="token",
+                enabled=True,
+            )
+            link = ProjectIntegration(
+                project=project,
+                integration=integration,
+                external_identifier=f"{tenant_name}/repo",
+                config={},
+            )
+            db.session.add_all([tenant, project, integration, link])
+            for number in range(1, 11):
+                db.session.add(
+                    ExternalIssue(
+                        project_integration=link,
+                        external_id=f"{tenant_name}-{number}",
+                        title=f"Issue {number}",
+                        status="In Progress" if number % 2 else "Done",
+                        assignee="Sam Smith" if number <= 3 else None,
+                        labels=["bug", "ui"] if number % 3 == 0 else ["feature"],
+                        raw_payload={"number": number},
+                        # Pairs of issues share a timestamp to exercise the id tie-break
+                        updated_at=base + timedelta(minutes=index * 10 + number // 2),
+                    )
+                )
+        db.session.commit()
+
+    return application, api_key_str
+
+
+@pytest.fixture()
+def client(app_and_key):
+    return app_and_key[0].test_client()
+
+
+@pytest.fixture()
+def auth_headers(app_and_key):
+    return {"Authorization": f"Bearer {app_and_key[1]}"}
+
+
+def _external_ids(client, auth_headers, query: str) -> list[str]:
+    response = client.get(f"/api/v1/issues?{query}", headers=auth_headers)
+    assert response.status_code == 200
+    return [issue["external_id"] for issue in response.get_json()["issues"]]
+
+
+def test_filters_run_in_sql(client, auth_headers):
+    assert _external_ids(client, auth_headers, "status=open&provider=jira") == [
+        "beta-9",
+        "beta-7",
+        "beta-5",
+        "beta-3",
+        "beta-1",
+    ]
+    assert _external_ids(client, auth_headers, "status=closed&provider=github") == [
+        "alpha-10",
+        "alpha-8",
+        "alpha-6",
+        "alpha-4",
+        "alpha-2",
+    ]
+    assert _external_ids(client, auth_headers, "assignee=smith&provider=github") == [
+        "alpha-3",
+        "alpha-2",
+        "alpha-1",
+    ]
+    assert _external_ids(client, auth_headers, "labels=ui,missing&provider=jira") == [
+        "beta-9",
+        "beta-6",
+        "beta-3",
+    ]
+    response = client.get("/api/v1/issues?labels=bug", headers=auth_headers)
+    assert response.get_json()["total"] == 6
+
+
+def test_cursor_pagination_walks_every_issue_once(client, auth_headers):
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        query = "limit=3" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(f"/api/v1/issues?{query}", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["total"] == 20
+        assert data["count"] <= 3
+        seen.extend(issue["external_id"] for issue in data["issues"])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 7
+    assert len(seen) == len(set(seen)) == 20
+    assert seen == _external_ids(client, auth_headers, "")
+    assert seen[:3] == ["beta-10", "beta-9", "beta-8"]
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers):
+    response = client.get("/api/v1/issues?cursor=not-a-cursor", headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Invalid cursor"
+
+
+def test_cli_client_follows_next_cursor(client, auth_headers, monkeypatch):
+    requests_seen: list[dict] = []
+
+    def fake_get(self, path, params=None):
+        requests_seen.append(dict(params or {}))
+        response = client.get(f"/api/v1/{path}", query_string=params, headers=auth_headers)
+        return response.get_json()
+
+    monkeypatch.setattr(APIClient, "get", fake_get)
+    api = APIClient("http://aiops.test", "unused")
+
+    issues = api.list_issues(status="open", page_size=4)
+    limited = api.list_issues(limit=6, page_size=4)
+
+    assert len(issues) == 10
+    assert all(issue["status_key"] == "open" for issue in issues)
+    assert [params["limit"] for params in requests_seen] == [4, 4, 4, 4, 2]
+    assert len(limited) == 6
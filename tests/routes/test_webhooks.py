@@ -0,0 +1,445 @@
+"""Tests for issue provider webhook endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from app import create_app, db
+from app.config import Config
+from app.models import (
+    ExternalIssue,
+    Notification,
+    Project,
+    ProjectIntegration,
+    Tenant,
+    TenantIntegration,
+    User,
+    UserIdentityMap,
+)
+from app.security import hash_password
+from app.services.issues import apply_issue_payloads
+from app.services.issues import github as github_service
+from app.services.issues import jira as jira_service
+
+SECRET = "hook-secret"
+
+
+class WebhookTestConfig(Config):
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+
+
+@pytest.fixture()
+def app(tmp_path: Path):
+    class _Config(WebhookTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        REPO_STORAGE_PATH = str(tmp_path / "repos")
+
+    application = create_app(_Config)
+    with application.app_context():
+        db.create_all()
+        user = User(
+            email="owner@example.com",
+            name="Owner",
+            password_hash=hash_password("secret123"),
+            is_admin=True,
+        )
+        tenant = Tenant(name="tenant-a", description="Tenant A")
+        db.session.add_all([user, tenant])
+        for provider, identifier, base_url in (
+            ("github", "org/repo", None),
+            ("gitlab", "group/demo", None),
+            ("jira", "OPS", "https://example.atlassian.net"),
+        ):
+            project = Project(
+                name=f"{provider}-project",
+                repo_url=f"git@example.com/{provider}.git",
+                default_branch="main",
+                tenant=tenant,
+                owner=user,
+                local_path=str(tmp_path / "repos" / provider),
+            )
+            integration = TenantIntegration(
+                tenant=tenant,
+                provider=provider,
+                name=provider.title(),
+                api_token="token",
+                base_url=base_url,
+                enabled=True,
+                settings={"webhook_secret": SECRET, "username": "bot@example.com"},
+            )
+            db.session.add(
+                ProjectIntegration(
+                    project=project,
+                    integration=integration,
+                    external_identifier=identifier,
+                    config={},
+                )
+            )
+        db.session.commit()
+    return application
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+def _integration_id(app, provider: str) -> int:
+    with app.app_context():
+        return TenantIntegration.query.filter_by(provider=provider).one().id
+
+
+def _github_headers(body: bytes, event: str) -> dict[str, str]:
+    digest = hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+    return {
+        "Content-Type": "application/json",
+        "X-GitHub-Event": event,
+        "X-Hub-Signature-256": f"sha256={digest}",
+    }
+
+
+GITHUB_ISSUE = {
+    "number": 42,
+    "title": "Webhook driven",
+    "state": "open",
+    "html_url": "https://github.com/org/repo/issues/42",
+    "body": "Details",
+    "labels": [{"name": "bug"}],
+    "assignee": {"login": "dev"},
+    "updated_at": "2024-05-01T12:00:00Z",
+}
+
+
+def test_github_issue_comment_webhook_upserts_issue(app, client):
+    integration_id = _integration_id(app, "github")
+    with app.app_context():
+        project_integration = ProjectIntegration.query.filter_by(
+            external_identifier="org/repo"
+        ).one()
+        db.session.add(
+            ExternalIssue(
+                project_integration_id=project_integration.id,
+                external_id="42",
+                title="Old title",
+                comments=[
+                    {
+                        "id": "1",
+                        "author": "alice",
+                        "body": "earlier",
+                        "url": None,
+                        "created_at": "2024-04-01T00:00:00+00:00",
+                    }
+                ],
+            )
+        )
+        db.session.commit()
+
+    body = json.dumps(
+        {
+            "action": "created",
+            "issue": GITHUB_ISSUE,
+            "comment": {
+                "id": 2,
+                "body": "new comment",
+                "user": {"login": "bob"},
+                "created_at": "2024-05-01T12:00:00Z",
+                "html_url": "https://github.com/org/repo/issues/42#issuecomment-2",
+            },
+            "repository": {"full_name": "Org/Repo"},
+        }
+    ).encode()
+
+    response = client.post(
+        f"/api/v1/webhooks/github/{integration_id}",
+        data=body,
+        headers=_github_headers(body, "issue_comment"),
+    )
+
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()["external_id"] == "42"
+    with app.app_context():
+        issue = ExternalIssue.query.filter_by(external_id="42").one()
+        assert issue.title == "Webhook driven"
+        assert issue.labels == ["bug"]
+        assert [comment["body"] for comment in issue.comments] == ["new comment", "earlier"]
+        assert issue.project_integration.last_synced_at is None
+
+
+def _poll_github_issue(app, updated_at: str) -> None:
+    """Apply issue 42 the way a scheduled GraphQL poll does."""
+    node = {
+        "number": 42,
+        "title": "Webhook driven",
+        "state": "OPEN",
+        "url": GITHUB_ISSUE["html_url"],
+        "updatedAt": updated_at,
+        "labels": {"nodes": [{"name": "bug"}]},
+        "assignees": {"nodes": [{"login": "dev", "name": "Dev Person"}]},
+        "comments": {"nodes": [], "totalCount": 0},
+    }
+    with app.app_context():
+        project_integration = ProjectIntegration.query.filter_by(
+            external_identifier="org/repo"
+        ).one()
+        apply_issue_payloads(
+            project_integration, [github_service._graphql_node_to_payload(node)]
+        )
+
+
+def _post_github_issue_event(client, integration_id: int) -> None:
+    body = json.dumps(
+        {"action": "labeled", "issue": GITHUB_ISSUE, "repository": {"full_name": "org/repo"}}
+    ).encode()
+    response = client.post(
+        f"/api/v1/webhooks/github/{integration_id}",
+        data=body,
+        headers=_github_headers(body, "issues"),
+    )
+    assert response.status_code == 200, response.get_json()
+
+
+def _map_github_login(app, login: str) -> None:
+    with app.app_context():
+        owner = User.query.filter_by(email="owner@example.com").one()
+        db.session.add(UserIdentityMap(user=owner, github_username=login))
+        db.session.commit()
+
+
+def _assigned_notifications(app) -> int:
+    with app.app_context():
+        return Notification.query.filter_by(notification_type="issue.assigned").count()
+
+
+def test_github_webhook_keeps_polled_assignee_name(app, client, monkeypatch):
+    integration_id = _integration_id(app, "github")
+    _map_github_login(app, "dev")
+    monkeypatch.setattr(
+        github_service,
+        "resolve_user_display_name",
+        lambda *args: pytest.fail("stored assignee should be reused"),
+    )
+
+    _poll_github_issue(app, "2024-05-01T11:00:00Z")
+    _post_github_issue_event(client, integration_id)
+    _poll_github_issue(app, "2024-05-01T13:00:00Z")
+
+    assert _assigned_notifications(app) == 1
+    with app.app_context():
+        assert ExternalIssue.query.filter_by(external_id="42").one().assignee == (
+            "Dev Person"
+        )
+
+
+def test_github_webhook_then_poll_notifies_new_assignee_once(
+    app, client, monkeypatch
+):
+    integration_id = _integration_id(app, "github")
+    _map_github_login(app, "dev")
+    lookups = []
+    monkeypatch.setattr(
+        github_service,
+        "resolve_user_display_name",
+        lambda integration, login: lookups.append(login) or "Dev Person",
+    )
+
+    _post_github_issue_event(client, integration_id)
+    with app.app_context():
+        assert ExternalIssue.query.filter_by(external_id="42").one().assignee == (
+            "Dev Person"
+        )
+    _poll_github_issue(app, "2024-05-01T13:00:00Z")
+
+    assert lookups == ["dev"]
+    assert _assigned_notifications(app) == 1
+
+
+def test_github_webhook_rejects_bad_signature(app, client):
+    integration_id = _integration_id(app, "github")
+    body = json.dumps({"issue": GITHUB_ISSUE, "repository": {"full_name": "org/repo"}})
+
+    response = client.post(
+        f"/api/v1/webhooks/github/{integration_id}",
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-GitHub-Event": "issues",
+            "X-Hub-Signature-256": "sha256=deadbeef",
+        },
+    )
+
+    assert response.status_code == 401
+    with app.app_context():
+        assert ExternalIssue.query.count() == 0
+
+
+def test_github_webhook_ignores_pull_requests(app, client):
+    integration_id = _integration_id(app, "github")
+    body = json.dumps(
+        {
+            "issue": {**GITHUB_ISSUE, "pull_request": {"url": "https://example"}},
+            "repository": {"full_name": "org/repo"},
+        }
+    ).encode()
+
+    response = client.post(
+        f"/api/v1/webhooks/github/{integration_id}",
+        data=body,
+        headers=_github_headers(body, "issues"),
+    )
+
+    assert response.status_code == 202
+
+
+def test_gitlab_issue_hook_requires_token(app, client):
+    integration_id = _integration_id(app, "gitlab")
+    payload = {
+        "object_kind": "issue",
+        "project": {"path_with_namespace": "group/demo"},
+        "object_attributes": {
+            "iid": 7,
+            "title": "From GitLab",
+            "state": "closed",
+            "url": "https://gitlab.com/group/demo/-/issues/7",
+            "updated_at": "2024-05-02 08:00:00 UTC",
+        },
+        "labels": [{"title": "backend"}],
+        "assignees": [{"username": "gl-dev", "name": "GitLab Dev"}],
+    }
+
+    rejected = client.post(
+        f"/api/v1/webhooks/gitlab/{integration_id}",
+        json=payload,
+        headers={"X-Gitlab-Token": "wrong"},
+    )
+    assert rejected.status_code == 401
+
+    response = client.post(
+        f"/api/v1/webhooks/gitlab/{integration_id}",
+        json=payload,
+        headers={"X-Gitlab-Token": SECRET},
+    )
+
+    assert response.status_code == 200
+    with app.app_context():
+        issue = ExternalIssue.query.filter_by(external_id="7").one()
+        assert issue.status == "closed"
+        assert issue.labels == ["backend"]
+        assert issue.assignee == "GitLab Dev"
+        assert issue.external_updated_at.replace(tzinfo=timezone.utc) == datetime(
+            2024, 5, 2, 8, tzinfo=timezone.utc
+        )
+
+
+def test_jira_comment_webhook_with_query_token(app, client):
+    integration_id = _integration_id(app, "jira")
+    payload = {
+        "webhookEvent": "comment_created",
+        "issue": {
+            "key": "OPS-3",
+            "fields": {
+                "summary": "Jira webhook",
+                "status": {"name": "In Progress"},
+                "project": {"key": "OPS"},
+                "labels": [],
+                "updated": "2024-05-03T10:00:00.000+0000",
+            },
+        },
+        "comment": {
+            "id": "10001",
+            "body": "Looking into it",
+            "author": {"displayName": "Jira User"},
+            "created": "2024-05-03T10:00:00.000+0000",
+            "updated": "2024-05-04T09:00:00.000+0000",
+        },
+    }
+
+    response = client.post(
+        f"/api/v1/webhooks/jira/{integration_id}?token={SECRET}", json=payload
+    )
+
+    assert response.status_code == 200
+    with app.app_context():
+        issue = ExternalIssue.query.filter_by(external_id="OPS-3").one()
+        assert issue.url == "https://example.atlassian.net/browse/OPS-3"
+        assert [comment["author"] for comment in issue.comments] == ["Jira User"]
+        # Edits must not move a comment's creation time
+        assert issue.comments[0]["created_at"].startswith("2024-05-03T10:00:00")
+
+
+def test_jira_webhook_reaches_project_integrations_configured_with_jql(
+    app, client, monkeypatch
+):
+    with app.app_context():
+        jira = TenantIntegration.query.filter_by(provider="jira").one()
+        owner = User.query.one()
+        for name, jql in (
+            ("backend", "project = OPS AND labels = backend"),
+            ("other", 'project = "WEB"'),
+        ):
+            db.session.add(
+                ProjectIntegration(
+                    project=Project(
+                        name=name,
+                        repo_url=f"git@example.com/{name}.git",
+                        default_branch="main",
+                        tenant=jira.tenant,
+                        owner=owner,
+                        local_path=f"/tmp/{name}",
+                    ),
+                    integration=jira,
+                    external_identifier=f"{name}-board",
+                    config={"jql": jql},
+                )
+            )
+        db.session.commit()
+        jira_id = jira.id
+
+    searched = []
+
+    def fake_search(integration, jql):
+        searched.append(jql)
+        return ["OPS-3"]
+
+    monkeypatch.setattr(jira_service, "_search_issue_keys", fake_search)
+    payload = {
+        "webhookEvent": "jira:issue_updated",
+        "issue": {
+            "key": "OPS-3",
+            "fields": {
+                "summary": "Jira webhook",
+                "status": {"name": "In Progress"},
+                "project": {"key": "OPS"},
+                "labels": ["backend"],
+                "updated": "2024-05-03T10:00:00.000+0000",
+            },
+        },
+    }
+
+    response = client.post(f"/api/v1/webhooks/jira/{jira_id}?token={SECRET}", json=payload)
+
+    assert response.status_code == 200
+    # Only the JQL that can select OPS issues is checked against Jira
+    assert searched == ['(project = OPS AND labels = backend) AND key = "OPS-3"']
+    with app.app_context():
+        projects = sorted(
+            issue.project_integration.project.name
+            for issue in ExternalIssue.query.filter_by(external_id="OPS-3")
+        )
+        assert projects == ["backend", "jira-project"]
+
+
+def test_webhook_provider_mismatch_returns_404(app, client):
+    integration_id = _integration_id(app, "gitlab")
+    response = client.post(
+        f"/api/v1/webhooks/github/{integration_id}",
+        json={},
+        headers={"X-GitHub-Event": "issues"},
+    )
+    assert response.status_code == 404
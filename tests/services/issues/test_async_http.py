@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from app.services.issues import gitlab as gitlab_service
+from app.services.issues import rate_limit
+from app.services.issues.async_http import AsyncFetcher, FetchRequest
+
+
+class FakeProviderServer(ThreadingHTTPServer):
+    """Local HTTP/1.1 server with keep-alive, per-request latency and canned routes.
+
+    ``routes`` maps a path to ``handler(query) -> (status, headers, body)``; unknown
+    paths echo the path back as JSON.
+    """
+
+    daemon_threads = True
+    # The default backlog of 5 drops bursts of concurrent connects
+    request_queue_size = 128
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeProviderHandler)
+        self.latency = 0.0
+        self.routes: dict = {}
+        self.paths: list[str] = []
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _FakeProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeProviderServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:
+        server = self.server
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        with server.lock:
+            server.paths.append(parts.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            if server.latency:
+                time.sleep(server.latency)
+            route = server.routes.get(parts.path)
+            if route is None:
+                status, headers, body = 200, {}, {"path": parts.path, "query": query}
+            else:
+                status, headers, body = route(query)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_provider():
+    server = FakeProviderServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fan_out_overlaps_requests_over_keep_alive_connections(fake_provider):
+    fake_provider.latency = 0.02
+    requests = [FetchRequest(f"/items/{n}", key=n) for n in range(200)]
+    fetcher = AsyncFetcher(fake_provider.url, concurrency=20)
+    try:
+        results = fetcher.get_many(requests)
+        connections = fake_provider.connections
+        # A second batch reuses the open connections instead of dialling new ones
+        fetcher.get_many(requests[:20])
+    finally:
+        fetcher.close()
+
+    assert [result.request.key for result in results] == list(range(200))
+    assert all(result.ok for result in results)
+    assert results[7].data["path"] == "/items/7"
+    # Overlap and reuse are asserted directly; wall-clock throughput is left to
+    # scripts/benchmark_issue_sync.py, as it is unreliable on a busy test runner
+    assert 1 < fake_provider.max_in_flight <= 20
+    assert connections <= 20
+    assert fake_provider.connections == connections
+
+
+def test_get_pages_requests_remaining_pages_concurrently(fake_provider):
+    def issues(query):
+        page = int(query["page"])
+        return 200, {"X-Total-Pages": "5"}, [{"iid": page * 10 + n} for n in range(2)]
+
+    fake_provider.routes["/issues"] = issues
+    fake_provider.latency = 0.05
+    fetcher = AsyncFetcher(fake_provider.url, concurrency=8)
+    try:
+        pages = fetcher.get_pages("/issues", {"per_page": 2})
+    finally:
+        fetcher.close()
+
+    assert [page.request.params["page"] for page in pages] == [1, 2, 3, 4, 5]
+    assert [issue["iid"] for page in pages for issue in page.data][:4] == [10, 11, 20, 21]
+    # Page 1 first, then pages 2-5 together rather than one after another
+    assert fake_provider.max_in_flight > 1
+
+
+def test_throttled_requests_are_retried_and_errors_reported(fake_provider):
+    attempts = {"count": 0}
+
+    def throttled(query):
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            return 429, {"Retry-After": "0"}, {"message": "slow down"}
+        return 200, {}, {"ok": True}
+
+    fake_provider.routes["/throttled"] = throttled
+    fake_provider.routes["/missing"] = lambda query: (404, {}, {"message": "404"})
+    governor = rate_limit.RateLimitGovernor("fake", 1000)
+    fetcher = AsyncFetcher(fake_provider.url, governor=governor)
+    try:
+        ok, missing = fetcher.get_many([FetchRequest("/throttled"), FetchRequest("/missing")])
+    finally:
+        fetcher.close()
+
+    assert ok.ok and ok.data == {"ok": True}
+    assert attempts["count"] == 2
+    assert governor.snapshot()["throttled"] == 1
+    assert (missing.ok, missing.status_code, missing.error) == (False, 404, "HTTP 404")
+
+
+def test_gitlab_fetch_issues_uses_async_pages_and_notes(fake_provider, monkeypatch):
+    rate_limit.reset_governors()
+    # Only the project lookup goes through python-gitlab
+    project = SimpleNamespace(id=7)
+    client = SimpleNamespace(projects=SimpleNamespace(get=lambda ref: project))
+    monkeypatch.setattr(gitlab_service, "get_client", lambda integration, factory: client)
+
+    def issues(query):
+        page = int(query["page"])
+        iids = [page * 2 - 1, page * 2]
+        return (
+            200,
+            {"X-Total-Pages": "3"},
+            [
+                {
+                    "iid": iid,
+                    "title": f"Issue {iid}",
+                    "state": "opened",
+                    "labels": ["bug"],
+                    "updated_at": "2024-10-10T12:00:00Z",
+                    "web_url": f"{fake_provider.url}/group/demo/-/issues/{iid}",
+                }
+                for iid in iids
+            ],
+        )
+
+    def notes(iid):
+        return lambda query: (
+            200,
+            {},
+            [
+                {"id": 2, "system": True, "body": "changed the label", "author": {}},
+                {
+                    "id": 1,
+                    "system": False,
+                    "body": f"Note on {iid}",
+                    "author": {"name": "Reviewer"},
+                    "created_at": "2024-10-10T12:00:00Z",
+                },
+            ],
+        )
+
+    fake_provider.routes["/api/v4/projects/7/issues"] = issues
+    for iid in range(1, 7):
+        fake_provider.routes[f"/api/v4/projects/7/issues/{iid}/notes"] = notes(iid)
+
+    integration = SimpleNamespace(
+        id=None,
+        provider="gitlab",
+        name="Fake GitLab",
+        api_token="token",
+        base_url=fake_provider.url,
+        settings={"async_fetch": True, "max_requests_per_second": 1000},
+    )
+    project_integration = SimpleNamespace(id=None, external_identifier="group/demo")
+
+    payloads = gitlab_service.fetch_issues(integration, project_integration)
+    rate_limit.reset_governors()
+
+    assert [payload.external_id for payload in payloads] == ["1", "2", "3", "4", "5", "6"]
+    assert [comment.body for comment in payloads[4].comments] == ["Note on 5"]
+    assert payloads[4].comments[0].author == "Reviewer"
+    assert payloads[0].labels == ["bug"]
+    assert sum(path.endswith("/notes") for path in fake_provider.paths) == 6
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+from app import create_app
+from app.config import Config
+from app.services.issues import client_pool
+from app.services.issues import gitlab as gitlab_service
+
+
+class ClientPoolTestConfig(Config):
+    TESTING = True
+    ISSUE_SYNC_ENABLED = False
+    SLACK_POLL_ENABLED = False
+
+
+def _init_app(tmp_path, **overrides):
+    class _Config(ClientPoolTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'pool.db'}"
+
+    for key, value in overrides.items():
+        setattr(_Config, key, value)
+    return create_app(_Config)
+
+
+def _integration(**overrides):
+    values = {
+        "id": 3,
+        "provider": "gitlab",
+        "api_token": "token-a",
+        "base_url": "https://gitlab.example",
+        "settings": {},
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class _FakeClient:
+    def __init__(self, integration):
+        self.token = integration.api_token
+        self.closed = False
+        self.projects = SimpleNamespace(get=self._get_project)
+
+    def _get_project(self, ref):
+        return SimpleNamespace(issues=SimpleNamespace(list=lambda **kwargs: []))
+
+    def close(self):
+        self.closed = True
+
+
+def test_projects_on_the_same_credentials_share_one_client(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    built = []
+
+    def fake_build(integration, base_url=None):
+        client = _FakeClient(integration)
+        built.append(client)
+        return client
+
+    monkeypatch.setattr(gitlab_service, "_build_client", fake_build)
+    monkeypatch.setattr(gitlab_service, "_issues_unchanged", lambda *args: False)
+
+    with app.app_context():
+        for index in range(3):
+            project_integration = SimpleNamespace(
+                id=index, external_identifier=f"group/project-{index}", config={}
+            )
+            gitlab_service.fetch_issues(_integration(), project_integration)
+        assert len(built) == 1
+
+        # A rotated token never reuses the client built for the old one
+        gitlab_service.fetch_issues(
+            _integration(api_token="token-b"),
+            SimpleNamespace(id=9, external_identifier="group/other", config={}),
+        )
+        assert [client.token for client in built] == ["token-a", "token-b"]
+        assert client_pool.client_pool_status()["clients"] == 2
+
+        assert client_pool.invalidate_clients(3) == 2
+        assert all(client.closed for client in built)
+
+
+def test_idle_clients_expire_after_ttl():
+    pool = client_pool.ClientPool(ttl=0.05)
+    first = pool.get(_integration(), _FakeClient)
+
+    assert pool.get(_integration(), _FakeClient) is first
+    time.sleep(0.1)
+    second = pool.get(_integration(), _FakeClient)
+
+    assert second is not first
+    assert first.closed
+    assert pool.stats()["clients"] == 1
+
+
+def test_pooling_can_be_disabled(tmp_path):
+    app = _init_app(tmp_path, ISSUE_SYNC_CLIENT_TTL=0)
+
+    with app.app_context():
+        first = client_pool.get_client(_integration(), _FakeClient)
+        assert client_pool.get_client(_integration(), _FakeClient) is not first
+        assert client_pool.is_pooled() is False
+
+    # Outside an app context clients are never cached
+    assert client_pool.get_client(_integration(), _FakeClient) is not first
@@ -219,3 +219,165 @@ def test_create_issue_requires_summary():
             project_integration,
             IssueCreateRequest(summary=""),
         )
+
+
+class _FakeGraphQLResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+
+def _graphql_issue(number: int, **overrides):
+    node = {
+        "databaseId": 1000 + number,
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "Body text",
+        "bodyHTML": "<p>Body text</p>",
+        "state": "OPEN",
+        "url": f"https://github.com/org/repo/issues/{number}",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "closedAt": None,
+        "author": {"login": "reporter"},
+        "labels": {"nodes": [{"name": "bug"}]},
+        "assignees": {"nodes": [{"login": "dev", "name": "Dev Eloper"}]},
+        "comments": {
+            "totalCount": 2,
+            "nodes": [
+                {
+                    "databaseId": 1,
+                    "body": "older",
+                    "bodyHTML": "<p>older</p>",
+                    "createdAt": "2024-01-01T01:00:00Z",
+                    "url": "https://github.com/org/repo/issues/1#c1",
+                    "author": {"login": "alice"},
+                },
+                {
+                    "databaseId": 2,
+                    "body": "newer",
+                    "bodyHTML": "<p>newer</p>",
+                    "createdAt": "2024-01-01T02:00:00Z",
+                    "url": "https://github.com/org/repo/issues/1#c2",
+                    "author": {"login": "bob"},
+                },
+            ],
+        },
+    }
+    node.update(overrides)
+    return node
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.headers = {}
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def post(self, url, json=None, timeout=None):
+        self.calls.append({"url": url, "variables": dict(json["variables"])})
+        return self.responses.pop(0)
+
+
+def test_fetch_issues_graphql_pages_with_comments(monkeypatch):
+    def _page(nodes, has_next, cursor):
+        return _FakeGraphQLResponse(
+            {
+                "data": {
+                    "repository": {
+                        "issues": {
+                            "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                            "nodes": nodes,
+                        }
+                    }
+                }
+            }
+        )
+
+    session = _FakeSession(
+        [
+            _page([_graphql_issue(1)], True, "cursor-1"),
+            _page([_graphql_issue(2, state="CLOSED", assignees={"nodes": []})], False, None),
+        ]
+    )
+    monkeypatch.setattr(github_service.requests, "Session", lambda: session)
+    monkeypatch.setattr(
+        github_service,
+        "_build_client",
+        lambda *_args, **_kwargs: pytest.fail("REST client should not be used"),
+    )
+
+    integration = SimpleNamespace(api_token="token", settings={}, base_url=None)
+    project_integration = SimpleNamespace(external_identifier="org/repo", config={})
+
+    payloads = github_service.fetch_issues_graphql(
+        integration, project_integration, datetime(2024, 1, 1)
+    )
+
+    assert [payload.external_id for payload in payloads] == ["1", "2"]
+    assert session.headers["Authorization"] == "bearer token"
+    assert session.calls[0]["url"] == "https://api.github.com/graphql"
+    assert session.calls[0]["variables"]["since"] == "2024-01-01T00:00:00+00:00"
+    assert session.calls[1]["variables"]["cursor"] == "cursor-1"
+
+    first = payloads[0]
+    assert first.status == "open"
+    assert first.labels == ["bug"]
+    assert first.assignee_username == "dev"
+    assert first.raw["body"] == "Body text"
+    assert [comment.body for comment in first.comments] == ["newer", "older"]
+    assert payloads[1].status == "closed"
+    assert payloads[1].assignee is None
+
+
+def test_fetch_issues_graphql_falls_back_to_rest(monkeypatch):
+    session = _FakeSession([_FakeGraphQLResponse({}, status_code=404)])
+    monkeypatch.setattr(github_service.requests, "Session", lambda: session)
+    repo = FakeRepo(
+        [
+            FakeGithubIssue(
+                number=7,
+                title="Legacy",
+                state="open",
+                html_url="https://ghe.example.com/org/repo/issues/7",
+                labels=[],
+                assignee=None,
+            )
+        ]
+    )
+    _install_fake_client(monkeypatch, repo)
+
+    integration = SimpleNamespace(
+        api_token="token", settings={}, base_url="https://ghe.example.com/api/v3"
+    )
+    project_integration = SimpleNamespace(external_identifier="org/repo", config={})
+
+    payloads = github_service.fetch_issues_graphql(integration, project_integration)
+
+    assert session.calls[0]["url"] == "https://ghe.example.com/api/graphql"
+    assert [payload.external_id for payload in payloads] == ["7"]
+
+
+def test_fetch_issues_graphql_reports_query_errors(monkeypatch):
+    session = _FakeSession(
+        [
+            _FakeGraphQLResponse(
+                {"data": None, "errors": [{"message": "Could not resolve to a Repository"}]}
+            )
+        ]
+    )
+    monkeypatch.setattr(github_service.requests, "Session", lambda: session)
+    integration = SimpleNamespace(api_token="token", settings={}, base_url=None)
+    project_integration = SimpleNamespace(external_identifier="org/missing", config={})
+
+    with pytest.raises(IssueSyncError, match="Could not resolve"):
+        github_service.fetch_issues_graphql(integration, project_integration)
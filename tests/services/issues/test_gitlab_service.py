@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 
 import pytest
+from sqlalchemy import event
 
 from app.services.issues import IssueCreateRequest, IssueSyncError
 from app.services.issues import gitlab as gitlab_service
@@ -227,3 +228,141 @@ def test_create_issue_requires_summary():
             project_integration,
             IssueCreateRequest(summary=""),
         )
+
+
+class _NotesIssue(FakeIssue):
+    """FakeIssue with a notes manager that records list() calls."""
+
+    def __init__(self, calls: list, **kwargs):
+        super().__init__(**kwargs)
+
+        def list_notes(**_):
+            calls.append(kwargs["iid"])
+            return [
+                SimpleNamespace(
+                    id=kwargs["iid"] * 10,
+                    system=False,
+                    author={"name": "Reviewer"},
+                    body="Fresh note",
+                    created_at="2024-10-10T12:00:00Z",
+                    web_url=None,
+                )
+            ]
+
+        self.notes = SimpleNamespace(list=list_notes)
+
+
+def test_fetch_issues_skips_notes_for_unchanged_issues(tmp_path, monkeypatch):
+    from app import create_app, db
+    from app.config import Config
+    from app.models import (
+        ExternalIssue,
+        Project,
+        ProjectIntegration,
+        Tenant,
+        TenantIntegration,
+        User,
+    )
+
+    class _Config(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'gitlab.db'}"
+        REPO_STORAGE_PATH = str(tmp_path / "repos")
+
+    app = create_app(_Config)
+    with app.app_context():
+        db.create_all()
+        user = User(email="owner@example.com", name="Owner", password_hash="x")
+        tenant = Tenant(name="tenant-a")
+        project = Project(
+            name="demo",
+            repo_url="git@example.com/demo.git",
+            tenant=tenant,
+            owner=user,
+            local_path=str(tmp_path / "repos" / "demo"),
+        )
+        integration = TenantIntegration(
+            tenant=tenant, provider="gitlab", name="GitLab", api_token="token"
+        )
+        project_integration = ProjectIntegration(
+            project=project, integration=integration, external_identifier="group/demo"
+        )
+        stored_comment = {
+            "id": "1",
+            "author": "Alice",
+            "body": "Stored note",
+            "url": None,
+            "created_at": "2024-10-01T09:00:00+00:00",
+        }
+        db.session.add_all(
+            [
+                ExternalIssue(
+                    project_integration=project_integration,
+                    external_id=str(iid),
+                    title=f"Issue {iid}",
+                    external_updated_at=datetime(2024, 10, 10, 12, 0),
+                    raw_payload={"iid": iid, "user_notes_count": 1},
+                    comments=[stored_comment],
+                )
+                for iid in (1, 2)
+            ]
+        )
+        db.session.commit()
+
+        calls: list = []
+        issues = [
+            # Unchanged: same updated_at and note count
+            _NotesIssue(
+                calls,
+                iid=1,
+                title="Issue 1",
+                state="opened",
+                updated_at="2024-10-10T12:00:00Z",
+                user_notes_count=1,
+                labels=[],
+            ),
+            # New note: note count moved
+            _NotesIssue(
+                calls,
+                iid=2,
+                title="Issue 2",
+                state="opened",
+                updated_at="2024-10-10T12:00:00Z",
+                user_notes_count=2,
+                labels=[],
+            ),
+            # Never seen before
+            _NotesIssue(
+                calls,
+                iid=3,
+                title="Issue 3",
+                state="opened",
+                updated_at="2024-10-11T12:00:00Z",
+                user_notes_count=1,
+                labels=[],
+            ),
+        ]
+        _install_fake_client(monkeypatch, issues=issues)
+
+        assert project_integration.id  # reload the committed link up front
+        statements: list = []
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _count)
+        try:
+            payloads = gitlab_service.fetch_issues(
+                SimpleNamespace(api_token="token", settings={}, base_url=None),
+                project_integration,
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _count)
+
+    assert sorted(calls) == [2, 3]
+    # Stored state, including the deferred JSON columns, comes from one query
+    assert len(statements) == 1
+    by_id = {payload.external_id: payload for payload in payloads}
+    assert [c.body for c in by_id["1"].comments] == ["Stored note"]
+    assert [c.body for c in by_id["2"].comments] == ["Fresh note"]
+    assert [c.body for c in by_id["3"].comments] == ["Fresh note"]
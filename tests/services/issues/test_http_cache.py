@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app import create_app
+from app.config import Config
+from app.services.issues import github as github_service
+from app.services.issues import http_cache
+
+URL = "https://api.github.com/repos/org/repo/issues?per_page=1"
+
+
+class _Config(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    return create_app(_Config, instance_path=tmp_path / "instance")
+
+
+class _Response:
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _install_responses(monkeypatch, responses):
+    calls = []
+
+    def fake_get(url, headers=None, timeout=None):
+        calls.append(dict(headers or {}))
+        return responses.pop(0)
+
+    monkeypatch.setattr(http_cache.requests, "get", fake_get)
+    return calls
+
+
+def _integration():
+    return SimpleNamespace(id=1, api_token="token", settings={}, base_url=None)
+
+
+def test_probe_short_circuits_once_validators_are_trusted(app, monkeypatch):
+    calls = _install_responses(
+        monkeypatch, [_Response(200, {"ETag": 'W/"abc"'}), _Response(304)]
+    )
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with app.app_context():
+        first = http_cache.probe_unchanged(
+            _integration(),
+            SimpleNamespace(last_synced_at=since),
+            URL,
+            headers={"Authorization": "token token"},
+            since=since,
+        )
+        # The sync that followed the first probe completed and advanced the cursor
+        synced = SimpleNamespace(
+            last_synced_at=datetime.now(timezone.utc) + timedelta(seconds=1)
+        )
+        second = http_cache.probe_unchanged(
+            _integration(), synced, URL, headers={}, since=since
+        )
+
+    assert first is False
+    assert second is True
+    assert "If-None-Match" not in calls[0]
+    assert calls[1]["If-None-Match"] == 'W/"abc"'
+
+
+def test_probe_ignores_validators_from_incomplete_sync(app, monkeypatch):
+    _install_responses(monkeypatch, [_Response(200, {"ETag": '"v1"'}), _Response(304)])
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    stale = SimpleNamespace(last_synced_at=since)
+    with app.app_context():
+        http_cache.probe_unchanged(_integration(), stale, URL, headers={}, since=since)
+        # last_synced_at never moved past the recorded validators, so refetch
+        assert (
+            http_cache.probe_unchanged(_integration(), stale, URL, headers={}, since=since)
+            is False
+        )
+        assert http_cache.get_validators(1, URL)["etag"] == '"v1"'
+
+
+def test_probe_skipped_for_full_sync(app, monkeypatch):
+    calls = _install_responses(monkeypatch, [])
+    with app.app_context():
+        assert (
+            http_cache.probe_unchanged(
+                _integration(), SimpleNamespace(last_synced_at=None), URL, headers={}, since=None
+            )
+            is False
+        )
+    assert calls == []
+
+
+def test_github_iter_issue_pages_skips_fetch_when_unchanged(monkeypatch):
+    monkeypatch.setattr(github_service, "probe_unchanged", lambda *args, **kwargs: True)
+    monkeypatch.setattr(
+        github_service.requests,
+        "Session",
+        lambda: pytest.fail("GraphQL should not be queried"),
+    )
+    pages = list(
+        github_service.iter_issue_pages(
+            _integration(),
+            SimpleNamespace(external_identifier="org/repo", config={}),
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+    )
+    assert pages == []
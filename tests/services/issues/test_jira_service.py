@@ -737,3 +737,217 @@ def test_create_issue_fetches_comments(monkeypatch):
     assert captured["comments_for_created_issue"] == "DEVOPS-8"
     assert len(payload.comments) == 1
     assert payload.comments[0].body == "Attribution comment"
+
+
+def _search_hit(key: str, comment_block: Any = None, rendered: Any = None) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {
+        "summary": f"Issue {key}",
+        "status": {"name": "Open"},
+        "assignee": None,
+        "updated": "2024-10-01T12:34:00.000+0000",
+        "labels": [],
+    }
+    if comment_block is not None:
+        fields["comment"] = comment_block
+    hit: Dict[str, Any] = {"key": key, "fields": fields}
+    if rendered is not None:
+        hit["renderedFields"] = rendered
+    return hit
+
+
+def test_fetch_issues_skips_hydration_when_search_has_comments(monkeypatch):
+    """Search hits that already embed comments must not trigger per-issue requests."""
+    issue_calls: List[str] = []
+    comment = {
+        "id": "1",
+        "author": {"displayName": "Alice"},
+        "body": "Looks good",
+        "created": "2024-10-01T10:00:00.000+0000",
+    }
+
+    class FakeJIRA:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql_str: str, **kwargs: Any) -> Dict[str, Any]:
+            return {
+                "issues": [
+                    _search_hit(
+                        f"DEVOPS-{index}",
+                        {"comments": [comment], "total": 1},
+                        {"comment": {"comments": [{"id": "1", "body": "<p>Looks good</p>"}]}},
+                    )
+                    for index in range(5)
+                ]
+                + [_search_hit("DEVOPS-9", {"comments": [], "total": 0})]
+            }
+
+        def issue(self, issue_key: str, **kwargs: Any) -> Any:
+            issue_calls.append(issue_key)
+            raise AssertionError("issue() should not be called")
+
+        def close(self):
+            pass
+
+    _install_fake_jira(monkeypatch, FakeJIRA)
+
+    integration = SimpleNamespace(
+        base_url="https://example.atlassian.net",
+        api_token="token-123",
+        settings={"username": "user@example.com"},
+    )
+    project_integration = SimpleNamespace(config={}, external_identifier="DEVOPS")
+
+    results = jira_service.fetch_issues(integration, project_integration)
+
+    assert issue_calls == []
+    assert len(results) == 6
+    assert results[0].comments[0].body_html == "<p>Looks good</p>"
+
+
+def test_fetch_issues_hydrates_only_truncated_comments(monkeypatch):
+    """Issues whose embedded comment list is truncated are re-fetched individually."""
+    issue_calls: List[str] = []
+
+    class FakeIssue:
+        def __init__(self, raw_data: dict):
+            self.raw = raw_data
+
+    def _comment(index: int) -> Dict[str, Any]:
+        return {
+            "id": str(index),
+            "author": {"displayName": "User"},
+            "body": f"Comment {index}",
+            "created": "2024-10-01T10:00:00.000+0000",
+        }
+
+    class FakeJIRA:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql_str: str, **kwargs: Any) -> Dict[str, Any]:
+            return {
+                "issues": [
+                    _search_hit("DEVOPS-1", {"comments": [], "total": 0}),
+                    _search_hit("DEVOPS-2", {"comments": [_comment(1)], "total": 3}),
+                ]
+            }
+
+        def issue(self, issue_key: str, **kwargs: Any) -> FakeIssue:
+            issue_calls.append(issue_key)
+            return FakeIssue(
+                _search_hit(
+                    issue_key,
+                    {"comments": [_comment(i) for i in range(3)], "total": 3},
+                )
+            )
+
+        def close(self):
+            pass
+
+    _install_fake_jira(monkeypatch, FakeJIRA)
+
+    integration = SimpleNamespace(
+        base_url="https://example.atlassian.net",
+        api_token="token-123",
+        settings={"username": "user@example.com", "hydration_concurrency": 2},
+    )
+    project_integration = SimpleNamespace(config={}, external_identifier="DEVOPS")
+
+    results = jira_service.fetch_issues(integration, project_integration)
+
+    assert issue_calls == ["DEVOPS-2"]
+    by_key = {payload.external_id: payload for payload in results}
+    assert by_key["DEVOPS-1"].comments == []
+    assert len(by_key["DEVOPS-2"].comments) == 3
+
+
+def test_iter_issue_pages_follows_start_at_until_total(monkeypatch):
+    """Server/Data Center searches page with startAt until ``total`` is reached."""
+    calls: List[int] = []
+    total = 250
+
+    class FakeJIRA:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql_str: str, *, startAt: int, maxResults: int, **kwargs: Any):
+            calls.append(startAt)
+            end = min(startAt + maxResults, total)
+            return {
+                "startAt": startAt,
+                "maxResults": maxResults,
+                "total": total,
+                "issues": [
+                    _search_hit(f"DEVOPS-{index}", {"comments": [], "total": 0})
+                    for index in range(startAt, end)
+                ],
+            }
+
+        def close(self):
+            pass
+
+    _install_fake_jira(monkeypatch, FakeJIRA)
+
+    integration = SimpleNamespace(
+        base_url="https://jira.example.com",
+        api_token="token-123",
+        settings={"username": "user@example.com"},
+    )
+    project_integration = SimpleNamespace(config={}, external_identifier="DEVOPS")
+
+    pages = list(jira_service.iter_issue_pages(integration, project_integration))
+
+    assert calls == [0, 100, 200]
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert pages[-1][-1].external_id == "DEVOPS-249"
+
+
+def test_iter_issue_pages_follows_next_page_token(monkeypatch):
+    """Jira Cloud's enhanced search pages with nextPageToken until isLast."""
+    tokens: List[str] = []
+
+    class FakeJIRA:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def search_issues(self, jql_str: str, **kwargs: Any):
+            return {
+                "issues": [_search_hit("DEVOPS-1", {"comments": [], "total": 0})],
+                "nextPageToken": "page-2",
+                "isLast": False,
+            }
+
+        def enhanced_search_issues(self, jql_str: str, *, nextPageToken: str, **kwargs: Any):
+            tokens.append(nextPageToken)
+            if nextPageToken == "page-2":
+                return {
+                    "issues": [_search_hit("DEVOPS-2", {"comments": [], "total": 0})],
+                    "nextPageToken": "page-3",
+                    "isLast": False,
+                }
+            return {
+                "issues": [_search_hit("DEVOPS-3", {"comments": [], "total": 0})],
+                "isLast": True,
+            }
+
+        def close(self):
+            pass
+
+    _install_fake_jira(monkeypatch, FakeJIRA)
+
+    integration = SimpleNamespace(
+        base_url="https://example.atlassian.net",
+        api_token="token-123",
+        settings={"username": "user@example.com"},
+    )
+    project_integration = SimpleNamespace(config={}, external_identifier="DEVOPS")
+
+    results = jira_service.fetch_issues(integration, project_integration)
+
+    assert tokens == ["page-2", "page-3"]
+    assert [payload.external_id for payload in results] == [
+        "DEVOPS-1",
+        "DEVOPS-2",
+        "DEVOPS-3",
+    ]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.services.issues import rate_limit
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b""
+    response._content_consumed = True
+    return response
+
+
+def test_governor_reads_github_and_gitlab_headers():
+    governor = rate_limit.RateLimitGovernor("gh", 10)
+    reset_at = time.time() + 600
+    throttled = governor.observe(
+        200,
+        {
+            "X-RateLimit-Remaining": "4200",
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Reset": str(int(reset_at)),
+        },
+    )
+    assert throttled is False
+    assert governor.snapshot()["remaining"] == 4200
+
+    governor.observe(200, {"RateLimit-Remaining": "10", "RateLimit-Limit": "2000"})
+    snapshot = governor.snapshot()
+    assert snapshot["remaining"] == 10
+    assert snapshot["limit"] == 2000
+    # With little budget left the rate is spread over the rest of the window
+    assert snapshot["requests_per_second"] < 0.1
+
+
+def test_governor_pauses_and_slows_down_after_throttling():
+    governor = rate_limit.RateLimitGovernor("jira", 8)
+
+    assert governor.observe(429, {"Retry-After": "30"}) is True
+    snapshot = governor.snapshot()
+    assert snapshot["blocked_for_seconds"] >= 29
+    assert snapshot["requests_per_second"] == 4
+    assert snapshot["throttled"] == 1
+
+    # An exhausted GitHub budget is reported as 403 and counts as throttling too
+    assert governor.observe(403, {"X-RateLimit-Remaining": "0"}) is True
+    assert governor.observe(403, {"X-RateLimit-Remaining": "12"}) is False
+
+
+def test_acquire_never_waits_longer_than_max_wait():
+    governor = rate_limit.RateLimitGovernor("gh", 1)
+    governor.observe(429, {"Retry-After": "120"})
+
+    started = time.monotonic()
+    waited = governor.acquire(max_wait=0.05)
+
+    assert 0.04 <= waited <= 0.2
+    assert time.monotonic() - started < 1
+
+
+def test_adapter_retries_throttled_requests(monkeypatch):
+    responses = [
+        _response(429, {"Retry-After": "0"}),
+        _response(200, {"X-RateLimit-Remaining": "99", "X-RateLimit-Limit": "100"}),
+    ]
+    sent = []
+
+    def fake_send(self, request, **kwargs):
+        sent.append(request.url)
+        return responses.pop(0)
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    governor = rate_limit.RateLimitGovernor("gitlab", 50)
+    session = requests.Session()
+    session.mount("https://", rate_limit.RateLimitedAdapter(governor))
+
+    response = session.get("https://gitlab.example/api/v4/projects/1/issues")
+
+    assert response.status_code == 200
+    assert len(sent) == 2
+    assert governor.snapshot()["remaining"] == 99
+
+
+def test_get_governor_is_shared_per_integration_and_reported():
+    rate_limit.reset_governors()
+    integration = SimpleNamespace(
+        id=7, name="Jira", provider="jira", settings={"max_requests_per_second": 2}
+    )
+    try:
+        first = rate_limit.get_governor(integration)
+        assert rate_limit.get_governor(SimpleNamespace(**vars(integration))) is first
+        assert first.rate == 2
+        assert rate_limit.rate_limit_status()["7"]["name"] == "Jira"
+
+        session = rate_limit.govern_session(requests.Session(), integration)
+        assert isinstance(session.get_adapter("https://x"), rate_limit.RateLimitedAdapter)
+    finally:
+        rate_limit.reset_governors()
+
+
+def test_reset_governor_picks_up_a_changed_rate_setting():
+    rate_limit.reset_governors()
+    integration = SimpleNamespace(
+        id=8, name="GitHub", provider="github", settings={"max_requests_per_second": 2}
+    )
+    try:
+        assert rate_limit.get_governor(integration).rate == 2
+
+        integration.settings = {"max_requests_per_second": 5}
+        assert rate_limit.get_governor(integration).rate == 2
+
+        assert rate_limit.reset_governor(8) is True
+        assert rate_limit.get_governor(integration).rate == 5
+        assert rate_limit.reset_governor(99) is False
+    finally:
+        rate_limit.reset_governors()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app import create_app, db
+from app.config import Config
+from app.models import (
+    AISession,
+    ArchivedExternalIssue,
+    ExternalIssue,
+    IssuePlan,
+    PinnedComment,
+    PinnedIssue,
+    Project,
+    ProjectIntegration,
+    Tenant,
+    TenantIntegration,
+    User,
+)
+from app.security import hash_password
+from app.services.issues import LIST_IDS_PROVIDER_REGISTRY
+from app.services.issues.reconcile import reconcile_project_integration
+
+
+class ReconcileTestConfig(Config):
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+    ISSUE_RECONCILE_GRACE_HOURS = 24
+
+
+def _init_app(tmp_path: Path):
+    class _Config(ReconcileTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'reconcile.db'}"
+        REPO_STORAGE_PATH = str(tmp_path / "repos")
+
+    return create_app(_Config)
+
+
+def _seed(tmp_path: Path, external_ids: list[str]) -> ProjectIntegration:
+    user = User(
+        email="owner@example.com",
+        name="Owner",
+        password_hash=hash_password("secret123"),
+        is_admin=True,
+    )
+    tenant = Tenant(name="tenant-a", description="Tenant A")
+    project = Project(
+        name="demo",
+        repo_url="git@example.com/demo.git",
+        default_branch="main",
+        tenant=tenant,
+        owner=user,
+        local_path=str(tmp_path / "repos" / "demo"),
+    )
+    integration = TenantIntegration(
+        tenant=tenant,
+        provider="gitlab",
+        name="GitLab Cloud",
+        api_token="token-123",
+        enabled=True,
+        settings={},
+    )
+    project_integration = ProjectIntegration(
+        project=project,
+        integration=integration,
+        external_identifier="group/demo",
+        config={},
+    )
+    db.session.add_all([user, tenant, project, integration, project_integration])
+    for external_id in external_ids:
+        db.session.add(
+            ExternalIssue(
+                project_integration=project_integration,
+                external_id=external_id,
+                title=f"Issue {external_id}",
+                status="opened",
+                labels=["bug"],
+                comments=[],
+            )
+        )
+    db.session.commit()
+    return project_integration
+
+
+def test_reconcile_tombstones_restores_and_archives(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    upstream = {"ids": ["1", "2"]}
+    monkeypatch.setitem(
+        LIST_IDS_PROVIDER_REGISTRY,
+        "gitlab",
+        lambda integration, project_integration: list(upstream["ids"]),
+    )
+
+    with app.app_context():
+        db.create_all()
+        project_integration = _seed(tmp_path, ["1", "2", "3", "4"])
+        now = datetime.utcnow()
+
+        result = reconcile_project_integration(project_integration, now=now)
+        assert (result.upstream, result.marked_missing, result.archived) == (2, 2, 0)
+        missing = {
+            issue.external_id: issue.missing_since for issue in ExternalIssue.query.all()
+        }
+        assert missing == {"1": None, "2": None, "3": now, "4": now}
+
+        # Issue 3 comes back (e.g. transferred back); issue 4 stays gone past the grace
+        upstream["ids"] = ["1", "2", "3"]
+        later = now + timedelta(hours=25)
+        result = reconcile_project_integration(project_integration, now=later)
+        assert (result.restored, result.archived, result.marked_missing) == (1, 1, 0)
+
+        remaining = ExternalIssue.query.order_by(ExternalIssue.external_id).all()
+        assert [issue.external_id for issue in remaining] == ["1", "2", "3"]
+        assert all(issue.missing_since is None for issue in remaining)
+        archived = ArchivedExternalIssue.query.one()
+        assert archived.external_id == "4"
+        assert archived.missing_since == now
+        assert archived.snapshot["labels"] == ["bug"]
+
+
+def test_reconcile_skips_empty_upstream_listing(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    monkeypatch.setitem(
+        LIST_IDS_PROVIDER_REGISTRY, "gitlab", lambda integration, project_integration: []
+    )
+
+    with app.app_context():
+        db.create_all()
+        project_integration = _seed(tmp_path, ["1", "2"])
+
+        result = reconcile_project_integration(project_integration)
+
+        assert result.skipped
+        assert ExternalIssue.query.filter(ExternalIssue.missing_since.isnot(None)).count() == 0
+
+
+def test_archiving_clears_pins_plans_and_session_links(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    monkeypatch.setitem(
+        LIST_IDS_PROVIDER_REGISTRY,
+        "gitlab",
+        lambda integration, project_integration: ["1"],
+    )
+
+    with app.app_context():
+        db.create_all()
+        project_integration = _seed(tmp_path, ["1", "2"])
+        user = User.query.one()
+        gone = ExternalIssue.query.filter_by(external_id="2").one()
+        gone_id = gone.id
+        db.session.add_all(
+            [
+                PinnedIssue(user_id=user.id, issue_id=gone.id),
+                PinnedComment(user_id=user.id, issue_id=gone.id, comment_id="c1"),
+                IssuePlan(issue_id=gone.id, content="# Plan"),
+                AISession(
+                    project_id=project_integration.project_id,
+                    user_id=user.id,
+                    issue_id=gone.id,
+                    tool="claude",
+                    session_id="session-1",
+                ),
+            ]
+        )
+        db.session.commit()
+
+        now = datetime.utcnow()
+        reconcile_project_integration(project_integration, now=now)
+        result = reconcile_project_integration(
+            project_integration, now=now + timedelta(hours=25)
+        )
+        assert result.archived == 1
+
+        # SQLite enforces neither the CASCADE nor the SET NULL
+        assert PinnedIssue.query.count() == 0
+        assert PinnedComment.query.count() == 0
+        assert IssuePlan.query.count() == 0
+        assert AISession.query.one().issue_id is None
+
+        # A new issue reusing the archived issue's rowid inherits nothing
+        reused = ExternalIssue(
+            project_integration=project_integration,
+            external_id="5",
+            title="Issue 5",
+            status="opened",
+        )
+        db.session.add(reused)
+        db.session.commit()
+        assert reused.id == gone_id
+        assert PinnedIssue.query.filter_by(issue_id=reused.id).count() == 0
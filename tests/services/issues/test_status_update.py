@@ -96,6 +96,8 @@ def test_update_issue_status_trims_and_sets_value(app):
 
         refreshed = _get_issue()
         assert refreshed.status == "In Progress"
+        assert refreshed.status_key == "open"
+        assert refreshed.status_category == "In Progress"
 
 
 def test_update_issue_status_allows_clearing(app):
@@ -106,6 +108,7 @@ def test_update_issue_status_allows_clearing(app):
 
         refreshed = _get_issue()
         assert refreshed.status is None
+        assert (refreshed.status_key, refreshed.status_category) == ("__none__", "Open")
 
 
 def test_update_issue_status_enforces_length(app):
@@ -4,21 +4,30 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List
 
+import pytest
+
 from app import create_app, db
 from app.config import Config
 from app.models import (
     ExternalIssue,
+    IssueComment,
+    Notification,
+    NotificationPreferences,
     Project,
     ProjectIntegration,
     Tenant,
     TenantIntegration,
     User,
+    UserIdentityMap,
 )
 from app.security import hash_password
+from app.services import issues as issues_module
 from app.services.issues import (
+    PAGED_PROVIDER_REGISTRY,
     PROVIDER_REGISTRY,
     IssueCommentPayload,
     IssuePayload,
+    IssueSyncError,
     sync_project_integration,
 )
 
@@ -124,6 +133,7 @@ def test_sync_project_integration_creates_and_updates(tmp_path, monkeypatch):
         issue = ExternalIssue.query.filter_by(external_id="123").one()
         assert issue.title == "First issue"
         assert issue.status == "opened"
+        assert (issue.status_key, issue.status_category) == ("open", "Open")
         assert issue.assignee == "alice"
         assert issue.last_seen_at is not None
         assert project_integration.last_synced_at is not None
@@ -143,6 +153,7 @@ def test_sync_project_integration_creates_and_updates(tmp_path, monkeypatch):
         issue = ExternalIssue.query.filter_by(external_id="123").one()
         assert issue.title == "First issue (updated)"
         assert issue.status == "closed"
+        assert (issue.status_key, issue.status_category) == ("closed", "Closed")
         assert issue.assignee == "bob"
         assert issue.labels == ["bug"]
         assert issue.external_updated_at == datetime(2024, 1, 2, tzinfo=timezone.utc)
@@ -182,3 +193,352 @@ def test_sync_issues_command_invokes_service(tmp_path, monkeypatch):
     assert captured["ids"] == [project_integration_id]
     assert "[gitlab]" in result.output
     assert "Issue synchronization completed." in result.output
+
+
+def test_sync_project_integration_upserts_pages_as_they_arrive(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        user, tenant, project, integration, project_integration = _seed_project(
+            tmp_path
+        )
+        db.session.add_all([user, tenant, project, integration, project_integration])
+        db.session.commit()
+
+        def _payload(external_id: str) -> IssuePayload:
+            return IssuePayload(
+                external_id=external_id,
+                title=f"Issue {external_id}",
+                status="opened",
+                assignee=None,
+                url=None,
+                labels=[],
+                external_updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                raw={},
+            )
+
+        seen_before_second_page: List[int] = []
+
+        def paged_fetch(*_):
+            yield [_payload("1"), _payload("2")]
+            seen_before_second_page.append(
+                ExternalIssue.query.filter_by(
+                    project_integration_id=project_integration.id
+                ).count()
+            )
+            yield [_payload("3")]
+
+        monkeypatch.setitem(PAGED_PROVIDER_REGISTRY, "gitlab", paged_fetch)
+        synced = sync_project_integration(project_integration)
+
+        assert [issue.external_id for issue in synced] == ["1", "2", "3"]
+        assert seen_before_second_page == [2]
+        assert project_integration.last_synced_at is not None
+
+
+def test_sync_project_integration_page_failure_keeps_cursor(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        user, tenant, project, integration, project_integration = _seed_project(
+            tmp_path
+        )
+        db.session.add_all([user, tenant, project, integration, project_integration])
+        db.session.add(UserIdentityMap(user=user, gitlab_username="alice"))
+        db.session.commit()
+
+        def paged_fetch(*_):
+            yield [
+                IssuePayload(
+                    external_id="1",
+                    title="Issue 1",
+                    status="opened",
+                    assignee="alice",
+                    url=None,
+                    labels=[],
+                    external_updated_at=None,
+                    raw={},
+                )
+            ]
+            raise RuntimeError("connection reset")
+
+        monkeypatch.setitem(PAGED_PROVIDER_REGISTRY, "gitlab", paged_fetch)
+        with pytest.raises(IssueSyncError, match="connection reset"):
+            sync_project_integration(project_integration)
+
+        assert project_integration.last_synced_at is None
+        # Notifications for the page applied before the failure are dropped
+        assert Notification.query.count() == 0
+
+
+def test_apply_issue_payloads_skips_unchanged_rows_in_chunks(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        user, tenant, project, integration, project_integration = _seed_project(
+            tmp_path
+        )
+        db.session.add_all([user, tenant, project, integration, project_integration])
+        db.session.commit()
+
+        def _payload(external_id: str, title: str) -> IssuePayload:
+            return IssuePayload(
+                external_id=external_id,
+                title=title,
+                status="opened",
+                assignee=None,
+                url=None,
+                labels=["bug"],
+                external_updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                raw={"iid": external_id},
+            )
+
+        monkeypatch.setattr(issues_module, "UPSERT_CHUNK_SIZE", 2)
+        first = issues_module.apply_issue_payloads(
+            project_integration, [_payload(str(i), f"Issue {i}") for i in range(5)]
+        )
+        db.session.commit()
+        assert len(first) == 5
+        assert all(issue.changed for issue in first)
+        assert ExternalIssue.query.count() == 5
+
+        stamped = {
+            issue.external_id: issue.updated_at for issue in ExternalIssue.query.all()
+        }
+        second = issues_module.apply_issue_payloads(
+            project_integration,
+            [_payload(str(i), f"Issue {i}") for i in range(4)]
+            + [_payload("4", "Issue 4 renamed")],
+        )
+        db.session.commit()
+
+        changed = {issue.external_id for issue in second if issue.changed}
+        assert changed == {"4"}
+        db.session.expire_all()
+        refreshed = {issue.external_id: issue for issue in ExternalIssue.query.all()}
+        assert refreshed["4"].title == "Issue 4 renamed"
+        assert all(
+            refreshed[external_id].updated_at == stamped[external_id]
+            for external_id in ("0", "1", "2", "3")
+        )
+
+
+def test_sync_restores_upstream_values_over_local_edits(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        user, tenant, project, integration, project_integration = _seed_project(
+            tmp_path
+        )
+        db.session.add_all([user, tenant, project, integration, project_integration])
+        db.session.commit()
+
+        payload = IssuePayload(
+            external_id="7",
+            title="Upstream issue",
+            status="opened",
+            assignee=None,
+            url=None,
+            labels=[],
+            external_updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            raw={"iid": 7},
+        )
+        monkeypatch.setitem(
+            PROVIDER_REGISTRY,
+            "gitlab",
+            lambda integration, project_integration, since=None: [payload],
+        )
+
+        sync_project_integration(project_integration)
+        db.session.commit()
+        issue = ExternalIssue.query.one()
+        issue_id = issue.id
+
+        # The same payload comes back after a local edit: the row is rewritten
+        issues_module.update_issue_status(issue_id, "In Review")
+        db.session.commit()
+        assert db.session.get(ExternalIssue, issue_id).content_hash is None
+        sync_project_integration(project_integration)
+        db.session.commit()
+        db.session.expire_all()
+        issue = db.session.get(ExternalIssue, issue_id)
+        assert issue.status == "opened"
+        assert issue.content_hash is not None
+
+        # force_full rewrites rows even when the stored hash still matches
+        db.session.execute(
+            ExternalIssue.__table__.update().values(title="Edited behind the ORM")
+        )
+        db.session.commit()
+        synced = sync_project_integration(project_integration)
+        assert [item.changed for item in synced] == [False]
+        synced = sync_project_integration(project_integration, force_full=True)
+        db.session.commit()
+        db.session.expire_all()
+        assert db.session.get(ExternalIssue, issue_id).title == "Upstream issue"
+
+
+def test_sync_writes_notifications_in_one_batch(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        user, tenant, project, integration, project_integration = _seed_project(
+            tmp_path
+        )
+        muted = User(
+            email="muted@example.com",
+            name="Muted",
+            password_hash=hash_password("secret123"),
+        )
+        db.session.add_all(
+            [user, muted, tenant, project, integration, project_integration]
+        )
+        db.session.add_all(
+            [
+                UserIdentityMap(user=user, gitlab_username="alice"),
+                UserIdentityMap(user=muted, gitlab_username="bob"),
+            ]
+        )
+        db.session.flush()
+        prefs = NotificationPreferences.create_default(muted.id)
+        prefs.muted_projects = [project.id]
+        db.session.add(prefs)
+        db.session.commit()
+
+        def _payload(external_id: str, assignee: str, status: str) -> IssuePayload:
+            return IssuePayload(
+                external_id=external_id,
+                title=f"Issue {external_id}",
+                status=status,
+                assignee=assignee,
+                url=None,
+                labels=[],
+                external_updated_at=None,
+                raw={},
+            )
+
+        issues_module.apply_issue_payloads(
+            project_integration,
+            [_payload("1", "alice", "opened"), _payload("2", "bob", "opened")],
+        )
+        db.session.commit()
+
+        commits = []
+        original_commit = db.session.commit
+        monkeypatch.setattr(
+            db.session, "commit", lambda: commits.append(1) or original_commit()
+        )
+        issues_module.apply_issue_payloads(
+            project_integration,
+            [_payload("1", "alice", "closed"), _payload("3", "alice", "opened")]
+            + [_payload(str(i), "carol", "opened") for i in range(4, 10)],
+        )
+
+        assert len(commits) == 1
+        notifications = Notification.query.filter_by(user_id=user.id).all()
+        assert sorted(n.notification_type for n in notifications) == [
+            "issue.assigned",
+            "issue.assigned",
+            "issue.status_changed",
+        ]
+        # Muted project: nothing for bob; unmapped carol gets nothing either
+        assert Notification.query.count() == 3
+
+
+def test_sync_mirrors_comments_and_notifies_new_mentions(tmp_path):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        user, tenant, project, integration, project_integration = _seed_project(
+            tmp_path
+        )
+        db.session.add_all([user, tenant, project, integration, project_integration])
+        db.session.add(UserIdentityMap(user=user, gitlab_username="alice"))
+        db.session.commit()
+
+        def _payload(*comments: IssueCommentPayload) -> IssuePayload:
+            return IssuePayload(
+                external_id="1",
+                title="Issue 1",
+                status="opened",
+                assignee=None,
+                url=None,
+                labels=[],
+                external_updated_at=None,
+                raw={},
+                comments=list(comments),
+            )
+
+        first = IssueCommentPayload(
+            id="c1",
+            author="bob",
+            body="Hi @alice",
+            created_at=datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc),
+            url=None,
+        )
+        second = IssueCommentPayload(
+            id="c2",
+            author="bob",
+            body="Ping @alice and @carol",
+            created_at=datetime(2024, 1, 2, 9, 0, tzinfo=timezone.utc),
+            url=None,
+        )
+
+        issues_module.apply_issue_payloads(project_integration, [_payload(first)])
+        db.session.commit()
+        issue = ExternalIssue.query.one()
+        assert [
+            (row.external_id, row.author, row.created_at)
+            for row in IssueComment.query.filter_by(issue_id=issue.id)
+        ] == [("c1", "bob", datetime(2024, 1, 1, 9, 0))]
+        # Comments on a brand-new issue are history, not fresh mentions
+        assert Notification.query.count() == 0
+
+        issues_module.apply_issue_payloads(
+            project_integration, [_payload(first, second)]
+        )
+        db.session.commit()
+        assert [
+            row.external_id
+            for row in IssueComment.query.order_by(IssueComment.position)
+        ] == ["c1", "c2"]
+        [notification] = Notification.query.all()
+        assert notification.user_id == user.id
+        assert notification.notification_type == "issue.mentioned"
+        assert notification.resource_id == issue.id
+
+
+def test_sync_stores_description_excerpt(tmp_path):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        user, tenant, project, integration, project_integration = _seed_project(
+            tmp_path
+        )
+        db.session.add_all([user, tenant, project, integration, project_integration])
+        db.session.commit()
+
+        description = "First line\n\n" + "word " * 200
+        issues_module.apply_issue_payloads(
+            project_integration,
+            [
+                IssuePayload(
+                    external_id="1",
+                    title="Issue 1",
+                    status="opened",
+                    assignee=None,
+                    url=None,
+                    labels=[],
+                    external_updated_at=None,
+                    raw={"description": description},
+                )
+            ],
+        )
+        db.session.commit()
+        db.session.expunge_all()
+
+        issue = ExternalIssue.query.one()
+        assert issue.description_excerpt.startswith("First line word word")
+        assert issue.description_excerpt.endswith("…")
+        assert len(issue.description_excerpt) <= 512
+        assert issue.raw_payload == {"description": description}
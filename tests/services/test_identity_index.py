@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sqlalchemy import update
+
+from app import create_app, db
+from app.config import Config
+from app.models import User, UserIdentityMap
+from app.security import hash_password
+from app.services import identity_index
+from app.services.notification_generator import resolve_user_from_external_identity
+from app.services.user_identity_service import update_identity_map
+from app.utils.text_rendering import _resolve_jira_user
+
+
+class IdentityIndexTestConfig(Config):
+    TESTING = True
+    ISSUE_SYNC_ENABLED = False
+    SLACK_POLL_ENABLED = False
+
+
+def _init_app(tmp_path: Path, **overrides):
+    class _Config(IdentityIndexTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'identity.db'}"
+        REPO_STORAGE_PATH = str(tmp_path / "repos")
+
+    for key, value in overrides.items():
+        setattr(_Config, key, value)
+    app = create_app(_Config)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def _seed_user(email: str, name: str) -> User:
+    user = User(email=email, name=name, password_hash=hash_password("secret123"))
+    db.session.add(user)
+    db.session.flush()
+    return user
+
+
+def test_index_resolves_every_provider_from_one_build(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        alice = _seed_user("alice@example.com", "Alice")
+        db.session.add(
+            UserIdentityMap(
+                user_id=alice.id,
+                github_username="Alice-GH",
+                gitlab_username="alice",
+                jira_account_id="557058:abc-123",
+            )
+        )
+        db.session.commit()
+
+        builds = []
+        build = identity_index._build_index
+        monkeypatch.setattr(
+            identity_index, "_build_index", lambda v: builds.append(v) or build(v)
+        )
+
+        assert resolve_user_from_external_identity("alice-gh", "github").id == alice.id
+        assert resolve_user_from_external_identity("alice", "gitlab").id == alice.id
+        assert resolve_user_from_external_identity("557058:abc-123", "jira").id == alice.id
+        assert resolve_user_from_external_identity("alice", "bitbucket") is None
+        assert _resolve_jira_user("557058:other-device") == "Alice"
+        assert len(builds) == 1
+
+
+def test_index_is_invalidated_by_local_and_remote_changes(tmp_path):
+    app = _init_app(tmp_path, IDENTITY_INDEX_CHECK_SECONDS=0)
+    with app.app_context():
+        alice = _seed_user("alice@example.com", "Alice")
+        update_identity_map(alice.id, github_username="alice")
+        db.session.commit()
+        assert identity_index.lookup_identity("github", "alice").user_id == alice.id
+
+        # An edit committed through the ORM bumps the version
+        update_identity_map(alice.id, github_username="alice2")
+        db.session.commit()
+        assert identity_index.lookup_identity("github", "alice") is None
+        assert identity_index.lookup_identity("github", "alice2").display_name == "Alice"
+
+        # A bulk UPDATE (as another process would do) is caught by the fingerprint
+        db.session.execute(
+            update(UserIdentityMap)
+            .where(UserIdentityMap.user_id == alice.id)
+            .values(github_username="alice3")
+        )
+        db.session.commit()
+        assert identity_index.lookup_identity("github", "alice3").user_id == alice.id
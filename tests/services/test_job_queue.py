@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+import secrets
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import bcrypt
+from sqlalchemy import update
+
+from app import create_app, db
+from app.config import Config
+from app.models import (
+    APIKey,
+    BackgroundJob,
+    ExternalIssue,
+    Project,
+    ProjectIntegration,
+    Tenant,
+    TenantIntegration,
+    User,
+)
+from app.security import hash_password
+from app.services import job_queue, sync_scheduler
+from app.services.issues import PAGED_PROVIDER_REGISTRY, IssuePayload
+
+
+class JobQueueTestConfig(Config):
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+    ISSUE_SYNC_ENABLED = False
+    SLACK_POLL_ENABLED = False
+
+
+def _init_app(tmp_path: Path, **overrides):
+    class _Config(JobQueueTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'jobs.db'}"
+        REPO_STORAGE_PATH = str(tmp_path / "repos")
+
+    for key, value in overrides.items():
+        setattr(_Config, key, value)
+    app = create_app(_Config, instance_path=tmp_path / "instance")
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def test_worker_runs_queued_jobs_and_records_results(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+
+    def fake_handler(job, progress):
+        if job.payload.get("fail"):
+            raise RuntimeError("boom")
+        progress(50, "halfway")
+        return {"echo": job.payload["value"]}
+
+    monkeypatch.setitem(job_queue.JOB_HANDLERS, "backup", fake_handler)
+    with app.app_context():
+        ok = job_queue.enqueue_job("backup", {"value": 3})
+        failing = job_queue.enqueue_job("backup", {"fail": True})
+        ok_id, failing_id = ok.id, failing.id
+
+    processed = job_queue.run_worker(app, concurrency=2, poll_interval=0.01, drain=True)
+
+    assert processed == 2
+    with app.app_context():
+        ok = db.session.get(BackgroundJob, ok_id)
+        failing = db.session.get(BackgroundJob, failing_id)
+        assert ok.status == "succeeded"
+        assert ok.result == {"echo": 3}
+        assert ok.progress == 100
+        assert ok.progress_message == "halfway"
+        assert ok.attempts == 1
+        assert failing.status == "failed"
+        assert failing.error_message == "boom"
+        assert failing.finished_at is not None
+
+
+def test_stale_running_jobs_are_requeued_or_failed(tmp_path):
+    app = _init_app(tmp_path)
+    stale = datetime.utcnow() - timedelta(hours=1)
+    with app.app_context():
+        retry = BackgroundJob(
+            kind="backup", status="running", attempts=1, heartbeat_at=stale, worker_id="w"
+        )
+        exhausted = BackgroundJob(
+            kind="backup", status="running", attempts=3, heartbeat_at=stale, worker_id="w"
+        )
+        fresh = BackgroundJob(
+            kind="backup",
+            status="running",
+            attempts=1,
+            heartbeat_at=datetime.utcnow(),
+            worker_id="w",
+        )
+        db.session.add_all([retry, exhausted, fresh])
+        db.session.commit()
+
+        assert job_queue.requeue_stale_jobs(timedelta(minutes=10), max_attempts=3) == 2
+        assert retry.status == "queued"
+        assert retry.worker_id is None
+        assert exhausted.status == "failed"
+        assert fresh.status == "running"
+
+        assert job_queue.claim_next_job("worker-a") == retry.id
+        assert job_queue.claim_next_job("worker-b") is None
+
+
+def _seed_sync_target(tmp_path: Path) -> str:
+    """Create an admin with an API key and one GitHub project integration."""
+    api_key = f"aiops_{secrets.token_hex(16)}"
+    user = User(
+        email="admin@example.com",
+        name="Admin",
+        password_hash=hash_password("secret123"),
+        is_admin=True,
+    )
+    tenant = Tenant(name="tenant-a", description="Tenant A")
+    project = Project(
+        name="demo",
+        repo_url="git@example.com/demo.git",
+        default_branch="main",
+        tenant=tenant,
+        owner=user,
+        local_path=str(tmp_path / "repos" / "demo"),
+    )
+    integration = TenantIntegration(
+        tenant=tenant, provider="github", name="GitHub", api_token="token"
+    )
+    db.session.add_all([user, tenant, project, integration])
+    db.session.flush()
+    db.session.add(
+        ProjectIntegration(
+            project=project, integration=integration, external_identifier="org/demo"
+        )
+    )
+    db.session.commit()
+    db.session.add(
+        APIKey(
+            user_id=user.id,
+            name="test-key",
+            key_hash=bcrypt.hashpw(api_key.encode(), bcrypt.gensalt()).decode(),
+            key_prefix=api_key[:12],
+            scopes=["read", "write", "admin"],
+        )
+    )
+    db.session.commit()
+    return api_key
+
+
+def _payload(number: int) -> IssuePayload:
+    return IssuePayload(
+        external_id=str(number),
+        title=f"Issue {number}",
+        status="open",
+        assignee=None,
+        url=None,
+        labels=[],
+        external_updated_at=None,
+        raw={},
+    )
+
+
+def test_sync_endpoint_returns_job_id_when_queue_enabled(tmp_path):
+    app = _init_app(tmp_path, JOB_QUEUE_ENABLED=True)
+    with app.app_context():
+        api_key = _seed_sync_target(tmp_path)
+
+    client = app.test_client()
+    headers = {"X-API-Key": api_key}
+    response = client.post("/api/v1/issues/sync", json={"force_full": True}, headers=headers)
+
+    assert response.status_code == 202
+    body = response.get_json()
+    assert body["job"]["kind"] == "issue_sync"
+    assert body["job"]["payload"]["force_full"] is True
+
+    status = client.get(body["status_url"], headers=headers)
+    assert status.status_code == 200
+    assert status.get_json()["job"]["status"] == "queued"
+
+    cancel = client.post(f"/api/v1/jobs/{body['job_id']}/cancel", headers=headers)
+    assert cancel.status_code == 202
+    assert cancel.get_json()["job"]["status"] == "cancelled"
+    assert client.post(f"/api/v1/jobs/{body['job_id']}/cancel", headers=headers).status_code == 409
+
+    events = client.get(body["events_url"], headers=headers)
+    assert events.mimetype == "text/event-stream"
+    assert events.get_data(as_text=True).startswith("event: done")
+
+
+def test_issue_sync_reports_pages_and_stops_when_cancelled(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    fetched = []
+
+    def fake_pager(integration, project_integration, since):
+        for page in range(1, 6):
+            if page == 3:
+                # The cancel lands mid-fetch; the page is applied, no further one is read
+                db.session.execute(
+                    update(BackgroundJob).values(cancel_requested=True)
+                )
+                db.session.commit()
+            fetched.append(page)
+            yield [_payload(page * 10 + offset) for offset in range(2)]
+
+    monkeypatch.setitem(PAGED_PROVIDER_REGISTRY, "github", fake_pager)
+    with app.app_context():
+        _seed_sync_target(tmp_path)
+        job = job_queue.enqueue_job("issue_sync", {})
+        job_id = job.id
+        assert job_queue.claim_next_job("worker-a") == job_id
+
+        job = job_queue.run_job(job_id)
+
+        assert job.status == "cancelled"
+        assert fetched == [1, 2, 3]
+        (run,) = job.result["integration_progress"]
+        assert (run["status"], run["pages"], run["issues"]) == ("running", 3, 6)
+        # Pages already applied stay; the cursor only moves after a complete read
+        assert ExternalIssue.query.count() == 6
+        assert ProjectIntegration.query.one().last_synced_at is None
+
+
+def test_ai_issue_preview_job_feeds_assisted_issue_creation(tmp_path, monkeypatch):
+    from app.services import ai_issue_generator, issues as issues_module
+
+    app = _init_app(tmp_path, JOB_QUEUE_ENABLED=True)
+    generated = {"title": "Add export", "description": "Export issues", "labels": []}
+    monkeypatch.setattr(
+        ai_issue_generator,
+        "generate_issue_from_description",
+        lambda description, ai_tool, issue_type, user_id=None: dict(generated),
+    )
+    monkeypatch.setattr(
+        issues_module,
+        "create_issue_for_project_integration",
+        lambda **kwargs: IssuePayload(
+            external_id="42",
+            title=kwargs["summary"],
+            status="open",
+            assignee=None,
+            url="https://github.com/org/demo/issues/42",
+            labels=[],
+            external_updated_at=None,
+            raw={},
+        ),
+    )
+    with app.app_context():
+        api_key = _seed_sync_target(tmp_path)
+        link = ProjectIntegration.query.one()
+        project_id, integration_id = link.project_id, link.id
+
+    client = app.test_client()
+    headers = {"X-API-Key": api_key}
+    response = client.post(
+        "/api/v1/issues/preview-assisted",
+        json={
+            "project_id": project_id,
+            "integration_id": integration_id,
+            "description": "export issues",
+            "ai_tool": "claude",
+        },
+        headers=headers,
+    )
+    assert response.status_code == 202
+    job_id = response.get_json()["job_id"]
+
+    confirm = {"preview_job_id": job_id}
+    # Not generated yet
+    assert client.post(
+        "/api/v1/issues/create-assisted", json=confirm, headers=headers
+    ).status_code == 409
+
+    with app.app_context():
+        assert job_queue.claim_next_job("worker-a") == job_id
+        job = job_queue.run_job(job_id)
+        assert job.status == "succeeded"
+        assert job.result["issue_data"] == generated
+
+    created = client.post("/api/v1/issues/create-assisted", json=confirm, headers=headers)
+    assert created.status_code == 201
+    assert created.get_json()["title"] == "Add export"
+    # A preview creates one issue only
+    assert client.post(
+        "/api/v1/issues/create-assisted", json=confirm, headers=headers
+    ).status_code == 409
+    with app.app_context():
+        assert ExternalIssue.query.count() == 1
+
+
+def test_semaphore_run_job_follows_the_task_until_it_finishes(tmp_path, monkeypatch):
+    from app.services import semaphore_service
+
+    app = _init_app(tmp_path)
+    statuses = iter(["waiting", "running", "success"])
+    started = []
+    monkeypatch.setattr(
+        semaphore_service,
+        "run_template",
+        lambda project, template_id, **kwargs: started.append(template_id) or {"id": 7},
+    )
+    monkeypatch.setattr(
+        semaphore_service,
+        "get_task_status",
+        lambda project, task_id: {"id": task_id, "status": next(statuses)},
+    )
+    with app.app_context():
+        _seed_sync_target(tmp_path)
+        job = job_queue.enqueue_job(
+            "semaphore_run",
+            {"project_id": Project.query.one().id, "template_id": 3, "poll_interval": 0},
+        )
+        job_id = job.id
+        assert job_queue.claim_next_job("worker-a") == job_id
+
+        job = job_queue.run_job(job_id)
+
+        assert job.status == "succeeded"
+        assert started == [3]
+        assert job.result["task_id"] == 7
+        assert job.result["status"] == "success"
+
+
+def test_inline_jobs_of_a_stopped_web_process_fail_once_recovered(tmp_path):
+    app = _init_app(tmp_path)
+    stale = datetime.utcnow() - timedelta(hours=1)
+    with app.app_context():
+        api_key = _seed_sync_target(tmp_path)
+        orphaned = BackgroundJob(
+            kind="issue_sync",
+            status="running",
+            attempts=1,
+            heartbeat_at=stale,
+            worker_id="web-1:1234:inline",
+        )
+        alive = BackgroundJob(
+            kind="issue_sync",
+            status="running",
+            attempts=1,
+            heartbeat_at=datetime.utcnow(),
+            worker_id="web-1:5678:inline",
+        )
+        db.session.add_all([orphaned, alive])
+        db.session.commit()
+        orphaned_id, alive_id = orphaned.id, alive.id
+
+    client = app.test_client()
+    headers = {"X-API-Key": api_key}
+    # Reads never write; recovery runs in the worker, the scheduler and start_job
+    job = client.get(f"/api/v1/jobs/{orphaned_id}", headers=headers).get_json()["job"]
+    assert job["status"] == "running"
+
+    assert sync_scheduler._run_job_recovery(app) == 1
+    job = client.get(f"/api/v1/jobs/{orphaned_id}", headers=headers).get_json()["job"]
+    assert job["status"] == "failed"
+    assert job["error_message"] == "Worker stopped responding"
+    listed = client.get("/api/v1/jobs?status=running", headers=headers).get_json()
+    assert [job["id"] for job in listed["jobs"]] == [alive_id]
+
+
+def test_job_event_stream_ends_with_reconnect_after_its_lifetime(tmp_path):
+    app = _init_app(tmp_path, JOB_QUEUE_ENABLED=True, JOB_EVENTS_MAX_SECONDS=0.01)
+    with app.app_context():
+        api_key = _seed_sync_target(tmp_path)
+        job_id = job_queue.enqueue_job("backup").id
+
+    client = app.test_client()
+    events = client.get(
+        f"/api/v1/jobs/{job_id}/events", headers={"X-API-Key": api_key}
+    ).get_data(as_text=True)
+
+    assert events.startswith("event: progress")
+    assert "event: reconnect" in events
+    assert "event: done" not in events
+
+
+def test_issue_sync_job_skips_an_integration_that_is_already_syncing(
+    tmp_path, monkeypatch
+):
+    from app.services.sync_scheduler import integration_sync_lock
+
+    app = _init_app(tmp_path)
+    fetched = []
+
+    def fake_pager(integration, project_integration, since):
+        fetched.append(project_integration.id)
+        yield [_payload(1)]
+
+    monkeypatch.setitem(PAGED_PROVIDER_REGISTRY, "github", fake_pager)
+    with app.app_context():
+        _seed_sync_target(tmp_path)
+        link_id = ProjectIntegration.query.one().id
+        job = job_queue.enqueue_job("issue_sync", {})
+        job_id = job.id
+        assert job_queue.claim_next_job("worker-a") == job_id
+
+        # e.g. the scheduler is syncing the integration right now
+        with integration_sync_lock(app, link_id) as acquired:
+            assert acquired
+            job = job_queue.run_job(job_id)
+
+        assert job.status == "succeeded"
+        assert fetched == []
+        assert job.result["busy_integration_ids"] == [link_id]
+        assert job.result["integration_progress"][0]["status"] == "skipped"
+
+        job = job_queue.enqueue_job("issue_sync", {})
+        job_queue.claim_next_job("worker-a")
+        assert job_queue.run_job(job.id).result["synced"] == 1
+        assert fetched == [link_id]
@@ -2,69 +2,112 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from types import SimpleNamespace
+from pathlib import Path
 
 import pytest
 
+from app import create_app, db
+from app.config import Config
+from app.models import (
+    ExternalIssue,
+    IssueDailyStat,
+    Project,
+    ProjectIntegration,
+    Tenant,
+    TenantIntegration,
+    User,
+)
+from app.security import hash_password
+from app.services import issues as issues_module
+from app.services.issues import IssuePayload
 from app.services.statistics_service import (
     get_contributor_statistics,
     get_project_list,
     get_resolution_statistics,
     get_workflow_statistics,
+    rebuild_issue_daily_stats,
 )
 
 
-@pytest.fixture
-def mock_db_session(monkeypatch):
-    """Mock database session."""
-    queries = {}
-
-    class MockQuery:
-        def __init__(self, model_name):
-            self.model_name = model_name
-            self._filters = []
-            self._joins = []
-            self._options = []
-
-        def filter(self, *args):
-            self._filters.extend(args)
-            return self
-
-        def join(self, *args):
-            self._joins.extend(args)
-            return self
-
-        def options(self, *args):
-            self._options.extend(args)
-            return self
-
-        def order_by(self, *args):
-            return self
-
-        def all(self):
-            return queries.get(self.model_name, [])
-
-        def first(self):
-            results = self.all()
-            return results[0] if results else None
-
-    class MockSession:
-        def query(self, model):
-            model_name = model.__name__ if hasattr(model, "__name__") else str(model)
-            return MockQuery(model_name)
-
-    mock_session = MockSession()
-    queries["_session"] = mock_session
-    return queries
+class StatisticsTestConfig(Config):
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+    ISSUE_SYNC_ENABLED = False
+    SLACK_POLL_ENABLED = False
 
 
-def test_get_resolution_statistics_empty(mock_db_session, monkeypatch):
+@pytest.fixture
+def app(tmp_path: Path):
+    class _Config(StatisticsTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'statistics.db'}"
+
+    application = create_app(_Config)
+    with application.app_context():
+        db.create_all()
+        yield application
+        db.session.remove()
+
+
+def _add_project(name: str, tenant_name: str = "Test Tenant") -> ProjectIntegration:
+    owner = User.query.filter_by(email="owner@example.com").first()
+    if owner is None:
+        owner = User(
+            email="owner@example.com",
+            name="Owner",
+            password_hash=hash_password("secret123"),
+        )
+    tenant = Tenant.query.filter_by(name=tenant_name).first() or Tenant(
+        name=tenant_name, description=tenant_name
+    )
+    project = Project(
+        name=name,
+        repo_url=f"https://example.com/{name}.git",
+        default_branch="main",
+        local_path=f"/tmp/{name}",
+        tenant=tenant,
+        owner=owner,
+    )
+    integration = TenantIntegration(
+        tenant=tenant,
+        provider="github",
+        name=f"{name} GitHub",
+        api_token="token",
+        enabled=True,
+    )
+    link = ProjectIntegration(
+        project=project,
+        integration=integration,
+        external_identifier=f"org/{name}",
+        config={},
+    )
+    db.session.add_all([owner, tenant, project, integration, link])
+    db.session.commit()
+    return link
+
+
+def _add_issue(link: ProjectIntegration, external_id: str, **values) -> ExternalIssue:
+    updated_at = values.pop("updated_at", None)
+    issue = ExternalIssue(
+        project_integration=link,
+        external_id=external_id,
+        title=values.pop("title", f"Issue {external_id}"),
+        **values,
+    )
+    db.session.add(issue)
+    db.session.commit()
+    if updated_at is not None:
+        # updated_at is stamped on every ORM write, so pin it with a core UPDATE
+        db.session.execute(
+            ExternalIssue.__table__.update()
+            .where(ExternalIssue.__table__.c.id == issue.id)
+            .values(updated_at=updated_at)
+        )
+        db.session.commit()
+    return issue
+
+
+def test_get_resolution_statistics_empty(app):
     """Test resolution statistics with no issues."""
-    from app import services
-
-    monkeypatch.setattr(services.statistics_service.db, "session", mock_db_session["_session"])
-    mock_db_session["ExternalIssue"] = []
-
     stats = get_resolution_statistics(days=30)
 
     assert stats["total_resolved"] == 0
@@ -73,55 +116,47 @@ def test_get_resolution_statistics_empty(mock_db_session, monkeypatch):
     assert stats["period_days"] == 30
 
 
-def test_get_resolution_statistics_with_issues(mock_db_session, monkeypatch):
+def test_get_resolution_statistics_with_issues(app):
     """Test resolution statistics with resolved issues."""
-    from app import services
-
-    monkeypatch.setattr(services.statistics_service.db, "session", mock_db_session["_session"])
-
-    # Create mock issues
     now = datetime.utcnow()
-    project_mock = SimpleNamespace(name="Test Project", tenant=SimpleNamespace(name="Test Tenant"))
-    project_integration_mock = SimpleNamespace(project=project_mock)
-
-    issues = [
-        SimpleNamespace(
-            id=1,
-            external_id="1",
-            title="Issue 1",
-            status="closed",
-            created_at=now - timedelta(hours=24),
-            updated_at=now,
-            project_integration=project_integration_mock,
-        ),
-        SimpleNamespace(
-            id=2,
-            external_id="2",
-            title="Issue 2",
-            status="resolved",
-            created_at=now - timedelta(hours=48),
-            updated_at=now,
-            project_integration=project_integration_mock,
-        ),
-    ]
-
-    mock_db_session["ExternalIssue"] = issues
+    link = _add_project("Test Project")
+    other = _add_project("Other Project")
+    _add_issue(
+        link, "1", status="closed", created_at=now - timedelta(hours=24), updated_at=now
+    )
+    _add_issue(
+        link, "2", status="resolved", created_at=now - timedelta(hours=48), updated_at=now
+    )
+    _add_issue(
+        other, "3", status="done", created_at=now - timedelta(hours=6), updated_at=now
+    )
+    # Still open, and closed before the window: neither counts
+    _add_issue(link, "4", status="open", created_at=now - timedelta(hours=5))
+    _add_issue(
+        link,
+        "5",
+        status="closed",
+        created_at=now - timedelta(days=90),
+        updated_at=now - timedelta(days=60),
+    )
 
     stats = get_resolution_statistics(days=30)
 
-    assert stats["total_resolved"] == 2
-    assert stats["avg_resolution_time_hours"] == 36.0  # (24 + 48) / 2
-    assert "Test Project" in stats["project_breakdown"]
+    assert stats["total_resolved"] == 3
+    assert stats["avg_resolution_time_hours"] == 26.0  # (24 + 48 + 6) / 3
     assert stats["project_breakdown"]["Test Project"]["count"] == 2
+    assert stats["project_breakdown"]["Test Project"]["avg_resolution_time"] == (
+        pytest.approx(36.0, abs=0.01)
+    )
+    assert stats["project_breakdown"]["Other Project"]["count"] == 1
 
+    project_only = get_resolution_statistics(project_id=other.project_id, days=30)
+    assert project_only["total_resolved"] == 1
+    assert list(project_only["project_breakdown"]) == ["Other Project"]
 
-def test_get_workflow_statistics_empty(mock_db_session, monkeypatch):
-    """Test workflow statistics with no issues."""
-    from app import services
-
-    monkeypatch.setattr(services.statistics_service.db, "session", mock_db_session["_session"])
-    mock_db_session["ExternalIssue"] = []
 
+def test_get_workflow_statistics_empty(app):
+    """Test workflow statistics with no issues."""
     stats = get_workflow_statistics()
 
     assert stats["total_issues"] == 0
@@ -130,33 +165,20 @@ def test_get_workflow_statistics_empty(mock_db_session, monkeypatch):
     assert stats["status_distribution"] == {}
 
 
-def test_get_workflow_statistics_with_issues(mock_db_session, monkeypatch):
+def test_get_workflow_statistics_with_issues(app):
     """Test workflow statistics with various issue statuses."""
-    from app import services
-
-    monkeypatch.setattr(services.statistics_service.db, "session", mock_db_session["_session"])
-
-    project_mock = SimpleNamespace(name="Test Project", tenant=SimpleNamespace(name="Test Tenant"))
-    project_integration_mock = SimpleNamespace(project=project_mock)
-
-    issues = [
-        SimpleNamespace(
-            id=1, status="open", project_integration=project_integration_mock
-        ),
-        SimpleNamespace(
-            id=2, status="open", project_integration=project_integration_mock
-        ),
-        SimpleNamespace(
-            id=3, status="closed", project_integration=project_integration_mock
-        ),
-        SimpleNamespace(
-            id=4, status="in_progress", project_integration=project_integration_mock
-        ),
-    ]
-
-    mock_db_session["ExternalIssue"] = issues
-
-    stats = get_workflow_statistics()
+    link = _add_project("Test Project")
+    other = _add_project("Elsewhere", tenant_name="Other Tenant")
+    for external_id, status in [
+        ("1", "open"),
+        ("2", "open"),
+        ("3", "closed"),
+        ("4", "in_progress"),
+    ]:
+        _add_issue(link, external_id, status=status)
+    _add_issue(other, "5", status="closed")
+
+    stats = get_workflow_statistics(tenant_id=link.project.tenant_id)
 
     assert stats["total_issues"] == 4
     assert stats["open_count"] == 3  # open + in_progress
@@ -164,109 +186,221 @@ def test_get_workflow_statistics_with_issues(mock_db_session, monkeypatch):
     assert stats["status_distribution"]["Open"] == 2
     assert stats["status_distribution"]["Closed"] == 1
     assert stats["status_distribution"]["In Progress"] == 1
+    assert get_workflow_statistics()["total_issues"] == 5
 
 
-def test_get_contributor_statistics_empty(mock_db_session, monkeypatch):
+def test_get_contributor_statistics_empty(app):
     """Test contributor statistics with no issues."""
-    from app import services
-
-    monkeypatch.setattr(services.statistics_service.db, "session", mock_db_session["_session"])
-    mock_db_session["ExternalIssue"] = []
-
-    stats = get_contributor_statistics(days=30)
+    assert get_contributor_statistics(days=30) == []
 
-    assert stats == []
 
-
-def test_get_contributor_statistics_with_activity(mock_db_session, monkeypatch):
+def test_get_contributor_statistics_with_activity(app):
     """Test contributor statistics with assigned issues and comments."""
-    from app import services
-
-    monkeypatch.setattr(services.statistics_service.db, "session", mock_db_session["_session"])
-
-    now = datetime.utcnow()
-    project_mock = SimpleNamespace(name="Test Project", tenant=SimpleNamespace(name="Test Tenant"))
-    project_integration_mock = SimpleNamespace(project=project_mock)
-
-    issues = [
-        SimpleNamespace(
-            id=1,
-            external_id="1",
-            title="Issue 1",
-            status="open",
-            assignee="user1@example.com",
-            url="https://example.com/issue/1",
-            comments=[{"author": "user1@example.com", "body": "Comment 1"}],
-            updated_at=now,
-            project_integration=project_integration_mock,
-        ),
-        SimpleNamespace(
-            id=2,
-            external_id="2",
-            title="Issue 2",
-            status="closed",
-            assignee="user2@example.com",
-            url="https://example.com/issue/2",
-            comments=[
-                {"author": "user1@example.com", "body": "Comment 2"},
-                {"author": "user2@example.com", "body": "Comment 3"},
-            ],
-            updated_at=now,
-            project_integration=project_integration_mock,
-        ),
-    ]
-
-    mock_db_session["ExternalIssue"] = issues
+    link = _add_project("Test Project")
+    _add_issue(
+        link,
+        "1",
+        status="open",
+        assignee="user1@example.com",
+        url="https://example.com/issue/1",
+        comments=[{"id": "c1", "author": "user1@example.com", "body": "Comment 1"}],
+    )
+    _add_issue(
+        link,
+        "2",
+        status="closed",
+        assignee="user2@example.com",
+        url="https://example.com/issue/2",
+        comments=[
+            {"id": "c2", "author": "user1@example.com", "body": "Comment 2"},
+            {"id": "c3", "author": "user2@example.com", "body": "Comment 3"},
+            {"id": "c4", "author": "user2@example.com", "body": "Comment 4"},
+        ],
+    )
 
     stats = get_contributor_statistics(days=30)
 
-    # user1 has 1 assigned + 2 comments = 3 total activity
-    # user2 has 1 assigned + 1 comment = 2 total activity
+    # user1 has 1 assigned + 2 commented issues = 3 total activity
+    # user2 has 1 assigned + 1 commented issue = 2 total activity
     assert len(stats) == 2
     assert stats[0]["contributor"] == "user1@example.com"
     assert stats[0]["total_activity"] == 3
+    assert stats[0]["issues"][0]["external_id"] == "1"
     assert stats[1]["contributor"] == "user2@example.com"
     assert stats[1]["total_activity"] == 2
 
 
-def test_get_project_list_empty(mock_db_session, monkeypatch):
-    """Test project list with no projects."""
-    from app import services
+def test_contributor_statistics_list_five_recent_issues_and_flag_users(app):
+    link = _add_project("Test Project")
+    now = datetime.utcnow()
+    for number in range(7):
+        _add_issue(
+            link,
+            str(number),
+            assignee="Owner@example.com",
+            updated_at=now - timedelta(hours=number),
+        )
+    _add_issue(link, "outsider", assignee="someone@example.com")
 
-    monkeypatch.setattr(services.statistics_service.db, "session", mock_db_session["_session"])
-    mock_db_session["Project"] = []
+    stats = get_contributor_statistics(days=30)
 
-    projects = get_project_list()
+    assert [entry["contributor"] for entry in stats] == [
+        "Owner@example.com",
+        "someone@example.com",
+    ]
+    assert stats[0]["is_aiops_user"] is True
+    assert stats[0]["assigned_count"] == 7
+    assert [issue["external_id"] for issue in stats[0]["issues"]] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
 
-    assert projects == []
 
+def test_resolution_statistics_read_the_rollup_maintained_by_sync(app):
+    app.config["ISSUE_STATS_ROLLUP_ENABLED"] = True
+    link = _add_project("Test Project")
+
+    def _payload(external_id: str, status: str) -> IssuePayload:
+        return IssuePayload(
+            external_id=external_id,
+            title=f"Issue {external_id}",
+            status=status,
+            assignee=None,
+            url=None,
+            labels=[],
+            external_updated_at=None,
+            raw={},
+        )
+
+    issues_module.apply_issue_payloads(
+        link, [_payload("1", "open"), _payload("2", "open"), _payload("3", "closed")]
+    )
+    db.session.commit()
+    # Already closed when first seen
+    assert IssueDailyStat.query.one().resolved_count == 1
+
+    issues_module.apply_issue_payloads(
+        link, [_payload("1", "closed"), _payload("2", "open")]
+    )
+    db.session.commit()
+    # ORM status changes are rolled up as well
+    issue = ExternalIssue.query.filter_by(external_id="2").one()
+    issue.status = "done"
+    db.session.commit()
+    # Saving a closed issue again does not count it twice
+    issue.title = "Renamed"
+    db.session.commit()
+
+    [row] = IssueDailyStat.query.all()
+    assert row.project_integration_id == link.id
+    assert row.day == datetime.utcnow().date()
+    assert row.resolved_count == 3
+
+    stats = get_resolution_statistics(days=7)
+    assert stats["total_resolved"] == 3
+    assert stats["project_breakdown"]["Test Project"]["count"] == 3
+
+
+def test_resolution_rollup_agrees_with_issue_statistics_after_reopening(app):
+    app.config["ISSUE_STATS_ROLLUP_ENABLED"] = True
+    link = _add_project("Test Project")
+
+    def _payload(external_id: str, status: str) -> IssuePayload:
+        return IssuePayload(
+            external_id=external_id,
+            title=f"Issue {external_id}",
+            status=status,
+            assignee=None,
+            url=None,
+            labels=[],
+            external_updated_at=None,
+            raw={},
+        )
+
+    def _sync(*payloads: IssuePayload) -> None:
+        issues_module.apply_issue_payloads(link, list(payloads))
+        db.session.commit()
+
+    def _stats() -> dict:
+        stats = get_resolution_statistics(days=7)
+        # Creation and write times of a new row differ by microseconds in SQL
+        for project in stats["project_breakdown"].values():
+            project["avg_resolution_time"] = round(project["avg_resolution_time"], 2)
+        return stats
+
+    def _assert_agree(total_resolved: int) -> None:
+        rolled_up = _stats()
+        app.config["ISSUE_STATS_ROLLUP_ENABLED"] = False
+        try:
+            assert rolled_up == _stats()
+        finally:
+            app.config["ISSUE_STATS_ROLLUP_ENABLED"] = True
+        assert rolled_up["total_resolved"] == total_resolved
+
+    _sync(_payload("1", "open"), _payload("2", "closed"))
+    _assert_agree(1)
+
+    db.session.execute(
+        ExternalIssue.__table__.update()
+        .where(ExternalIssue.__table__.c.external_id == "1")
+        .values(created_at=datetime.utcnow() - timedelta(hours=10))
+    )
+    db.session.commit()
+    _sync(_payload("1", "closed"), _payload("2", "open"))
+    _assert_agree(1)
+    assert get_resolution_statistics(days=7)["avg_resolution_time_hours"] == 10.0
+
+    # Reopened through the ORM, then a new issue that is already closed
+    issue = ExternalIssue.query.filter_by(external_id="1").one()
+    issue.status = "open"
+    db.session.commit()
+    _assert_agree(0)
+
+    _sync(_payload("3", "closed"))
+    _assert_agree(1)
+
+
+def test_rebuild_issue_daily_stats_matches_issue_statistics(app):
+    now = datetime.utcnow()
+    link = _add_project("Test Project")
+    _add_issue(
+        link, "1", status="closed", created_at=now - timedelta(hours=10), updated_at=now
+    )
+    _add_issue(
+        link,
+        "2",
+        status="closed",
+        created_at=now - timedelta(days=3),
+        updated_at=now - timedelta(days=2),
+    )
+    _add_issue(link, "3", status="open")
+
+    expected = get_resolution_statistics(days=30)
+    assert rebuild_issue_daily_stats() == 2
+
+    app.config["ISSUE_STATS_ROLLUP_ENABLED"] = True
+    assert get_resolution_statistics(days=30) == expected
+    assert expected["total_resolved"] == 2
+    assert expected["avg_resolution_time_hours"] == 17.0  # (10 + 24) / 2
+
+
+def test_get_project_list_empty(app):
+    """Test project list with no projects."""
+    assert get_project_list() == []
 
-def test_get_project_list_with_projects(mock_db_session, monkeypatch):
-    """Test project list with multiple projects."""
-    from app import services
-
-    monkeypatch.setattr(services.statistics_service.db, "session", mock_db_session["_session"])
-
-    projects = [
-        SimpleNamespace(
-            id=1,
-            name="Project A",
-            tenant=SimpleNamespace(name="Tenant 1"),
-        ),
-        SimpleNamespace(
-            id=2,
-            name="Project B",
-            tenant=SimpleNamespace(name="Tenant 1"),
-        ),
-    ]
 
-    mock_db_session["Project"] = projects
+def test_get_project_list_with_projects(app):
+    """Test project list with multiple projects."""
+    _add_project("Project B", tenant_name="Tenant 1")
+    _add_project("Project A", tenant_name="Tenant 1")
 
     result = get_project_list()
 
     assert len(result) == 2
-    assert result[0]["id"] == 1
     assert result[0]["name"] == "Project A"
     assert result[0]["tenant_name"] == "Tenant 1"
-    assert result[1]["id"] == 2
     assert result[1]["name"] == "Project B"
+    assert result[1]["tenant_name"] == "Tenant 1"
@@ -0,0 +1,434 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from app import create_app, db
+from app.config import Config
+from app.models import (
+    ExternalIssue,
+    Project,
+    ProjectIntegration,
+    SyncHistory,
+    Tenant,
+    TenantIntegration,
+    User,
+)
+from app.security import hash_password
+from app.services import sync_scheduler
+from app.services import issues as issues_module
+from app.services.issues import (
+    PAGED_PROVIDER_REGISTRY,
+    PROVIDER_REGISTRY,
+    IssuePayload,
+    IssueSyncError,
+)
+
+
+class SchedulerTestConfig(Config):
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+    ISSUE_SYNC_ENABLED = False
+    SLACK_POLL_ENABLED = False
+
+
+def _init_app(tmp_path: Path, **overrides):
+    class _Config(SchedulerTestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'scheduler.db'}"
+        REPO_STORAGE_PATH = str(tmp_path / "repos")
+
+    for key, value in overrides.items():
+        setattr(_Config, key, value)
+    return create_app(_Config, instance_path=tmp_path / "instance")
+
+
+def _seed(tmp_path: Path, count: int, *, base_urls: list[str] | None = None):
+    user = User(
+        email="owner@example.com",
+        name="Owner",
+        password_hash=hash_password("secret123"),
+        is_admin=True,
+    )
+    tenant = Tenant(name="tenant-a", description="Tenant A")
+    db.session.add_all([user, tenant])
+    for index in range(count):
+        project = Project(
+            name=f"demo-{index}",
+            repo_url=f"git@example.com/demo-{index}.git",
+            default_branch="main",
+            tenant=tenant,
+            owner=user,
+            local_path=str(tmp_path / "repos" / f"demo-{index}"),
+        )
+        base_url = base_urls[index] if base_urls else None
+        integration = TenantIntegration(
+            tenant=tenant,
+            provider="gitlab",
+            name=f"GitLab {index}",
+            api_token="token-123",
+            base_url=base_url,
+            enabled=True,
+            settings={},
+        )
+        db.session.add(
+            ProjectIntegration(
+                project=project,
+                integration=integration,
+                external_identifier=f"group/demo-{index}",
+                config={},
+            )
+        )
+    db.session.commit()
+
+
+def _payload(external_id: str) -> IssuePayload:
+    return IssuePayload(
+        external_id=external_id,
+        title=f"Issue {external_id}",
+        status="opened",
+        assignee=None,
+        url=None,
+        labels=[],
+        external_updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        raw={},
+    )
+
+
+def test_run_sync_all_fetches_concurrently_and_records_history(tmp_path, monkeypatch):
+    app = _init_app(tmp_path, ISSUE_SYNC_MAX_CONCURRENT=4, ISSUE_SYNC_MAX_PER_HOST=4)
+    with app.app_context():
+        db.create_all()
+        _seed(tmp_path, 4)
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "threads": set()}
+
+    def fake_fetch(integration, project_integration, since):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            state["threads"].add(threading.get_ident())
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return [_payload(project_integration.external_identifier)]
+
+    monkeypatch.setitem(PROVIDER_REGISTRY, "gitlab", fake_fetch)
+
+    results = sync_scheduler._run_sync_all(app)
+
+    assert results == {"total": 4, "success": 4, "failed": 0}
+    assert state["peak"] > 1
+    assert threading.get_ident() not in state["threads"]
+    with app.app_context():
+        assert ExternalIssue.query.count() == 4
+        history = SyncHistory.query.all()
+        assert len(history) == 4
+        assert all(entry.status == "success" for entry in history)
+        assert all(entry.issues_updated == 1 for entry in history)
+        assert all(entry.duration_seconds >= 0.05 for entry in history)
+
+
+def test_run_sync_all_respects_per_host_limit(tmp_path, monkeypatch):
+    app = _init_app(tmp_path, ISSUE_SYNC_MAX_CONCURRENT=4, ISSUE_SYNC_MAX_PER_HOST=1)
+    with app.app_context():
+        db.create_all()
+        _seed(tmp_path, 3, base_urls=["https://git.example.com"] * 3)
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_fetch(integration, project_integration, since):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return []
+
+    monkeypatch.setitem(PROVIDER_REGISTRY, "gitlab", fake_fetch)
+
+    results = sync_scheduler._run_sync_all(app)
+
+    assert results["success"] == 3
+    assert state["peak"] == 1
+
+
+def test_run_sync_all_records_failures_per_integration(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        _seed(tmp_path, 2)
+
+    def fake_fetch(integration, project_integration, since):
+        if project_integration.external_identifier.endswith("0"):
+            raise IssueSyncError("GitLab API error: 503")
+        return [_payload("1")]
+
+    notified = []
+    monkeypatch.setitem(PROVIDER_REGISTRY, "gitlab", fake_fetch)
+    monkeypatch.setattr(
+        "app.services.notification_generator.notify_sync_error",
+        lambda **kwargs: notified.append(kwargs),
+    )
+
+    results = sync_scheduler._run_sync_all(app)
+
+    assert results == {"total": 2, "success": 1, "failed": 1}
+    assert len(notified) == 1
+    with app.app_context():
+        failed = SyncHistory.query.filter_by(status="failed").one()
+        assert failed.error_message == "GitLab API error: 503"
+
+
+def test_run_sync_all_reports_only_changed_issues(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        _seed(tmp_path, 1)
+
+    monkeypatch.setitem(
+        PROVIDER_REGISTRY,
+        "gitlab",
+        lambda integration, project_integration, since: [_payload("1"), _payload("2")],
+    )
+
+    sync_scheduler._run_sync_all(app)
+    sync_scheduler._run_sync_all(app)
+
+    with app.app_context():
+        history = SyncHistory.query.order_by(SyncHistory.id).all()
+        assert [entry.issues_updated for entry in history] == [2, 0]
+        assert all(issue.content_hash for issue in ExternalIssue.query.all())
+
+
+def test_run_sync_all_streams_pages_to_the_writer(tmp_path, monkeypatch):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        _seed(tmp_path, 1)
+
+    state = {"produced": 0, "written": 0, "ahead": []}
+
+    def fake_pager(integration, project_integration, since):
+        for page in range(8):
+            state["produced"] += 1
+            yield [_payload(f"{page}-{index}") for index in range(3)]
+
+    original_upsert = issues_module._upsert_issue_chunk
+
+    def tracking_upsert(*args, **kwargs):
+        state["written"] += 1
+        state["ahead"].append(state["produced"] - state["written"])
+        return original_upsert(*args, **kwargs)
+
+    monkeypatch.setitem(PAGED_PROVIDER_REGISTRY, "gitlab", fake_pager)
+    monkeypatch.setattr(issues_module, "_upsert_issue_chunk", tracking_upsert)
+
+    results = sync_scheduler._run_sync_all(app)
+
+    assert results == {"total": 1, "success": 1, "failed": 0}
+    # The fetcher never runs more than the buffer (plus the page in hand) ahead
+    assert max(state["ahead"]) <= sync_scheduler.SYNC_PAGE_BUFFER + 1
+    with app.app_context():
+        assert ExternalIssue.query.count() == 24
+        assert ProjectIntegration.query.one().last_synced_at is not None
+
+
+def test_run_sync_all_stops_the_fetch_when_a_page_fails_to_apply(
+    tmp_path, monkeypatch
+):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        _seed(tmp_path, 1)
+
+    produced = []
+
+    def fake_pager(integration, project_integration, since):
+        for page in range(50):
+            produced.append(page)
+            yield [_payload(str(page))]
+
+    def failing_upsert(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setitem(PAGED_PROVIDER_REGISTRY, "gitlab", fake_pager)
+    monkeypatch.setattr(issues_module, "_upsert_issue_chunk", failing_upsert)
+
+    results = sync_scheduler._run_sync_all(app)
+
+    assert results == {"total": 1, "success": 0, "failed": 1}
+    assert len(produced) < 50
+    with app.app_context():
+        assert ExternalIssue.query.count() == 0
+        assert SyncHistory.query.one().error_message == "disk full"
+
+
+def test_run_sync_all_leaves_integrations_with_a_running_sync_alone(
+    tmp_path, monkeypatch
+):
+    app = _init_app(tmp_path)
+    with app.app_context():
+        db.create_all()
+        _seed(tmp_path, 2)
+        busy_id, free_id = [pi.id for pi in ProjectIntegration.query.order_by("id")]
+
+    fetched = []
+
+    def fake_fetch(integration, project_integration, since):
+        fetched.append(project_integration.id)
+        return [_payload(project_integration.external_identifier)]
+
+    monkeypatch.setitem(PROVIDER_REGISTRY, "gitlab", fake_fetch)
+
+    # e.g. a background sync job started from the UI in another worker
+    with sync_scheduler.integration_sync_lock(app, busy_id) as acquired:
+        assert acquired
+        results = sync_scheduler._run_sync_all(app)
+
+    assert results == {"total": 2, "success": 1, "failed": 0, "busy": 1}
+    assert fetched == [free_id]
+    # Released again once the scheduled run is over
+    with sync_scheduler.integration_sync_lock(app, free_id) as acquired:
+        assert acquired
+
+
+def _history(*updates, status="success", duration=1.0):
+    return [
+        SyncHistory(status=status, issues_updated=count, duration_seconds=duration)
+        for count in updates
+    ]
+
+
+def test_compute_sync_interval_adapts_to_change_rate():
+    bounds = {"base": 900, "minimum": 120, "maximum": 21600}
+
+    assert sync_scheduler.compute_sync_interval([], **bounds) == 120
+    # Consecutive syncs with changes halve the interval, down to the minimum
+    assert sync_scheduler.compute_sync_interval(_history(3), **bounds) == 450
+    assert sync_scheduler.compute_sync_interval(_history(3, 5, 0), **bounds) == 225
+    assert sync_scheduler.compute_sync_interval(_history(1, 1, 1, 1), **bounds) == 120
+    # Idle syncs back off exponentially, up to the maximum
+    assert sync_scheduler.compute_sync_interval(_history(0, 0, 4), **bounds) == 3600
+    assert sync_scheduler.compute_sync_interval(_history(0, 0, 0, 0, 0), **bounds) == 21600
+    # Failures back off as well
+    failed = _history(0, status="failed")
+    assert sync_scheduler.compute_sync_interval(failed, **bounds) == 1800
+    # A slow sync is never rescheduled sooner than a few durations later
+    slow = _history(9, duration=200.0)
+    assert sync_scheduler.compute_sync_interval(slow, **bounds) == 800
+
+
+def test_run_sync_all_only_due_skips_recently_synced_integrations(tmp_path, monkeypatch):
+    app = _init_app(tmp_path, ISSUE_SYNC_INTERVAL=900)
+    with app.app_context():
+        db.create_all()
+        _seed(tmp_path, 3)
+        integrations = ProjectIntegration.query.order_by(ProjectIntegration.id).all()
+        ten_minutes_ago = datetime.utcnow() - timedelta(minutes=10)
+        # Busy integration: last sync changed issues, so it is due after 450s
+        db.session.add(
+            SyncHistory(
+                project_integration_id=integrations[0].id,
+                status="success",
+                issues_updated=5,
+                created_at=ten_minutes_ago,
+            )
+        )
+        # Idle integration: not due for 1800s
+        db.session.add(
+            SyncHistory(
+                project_integration_id=integrations[1].id,
+                status="success",
+                issues_updated=0,
+                created_at=ten_minutes_ago,
+            )
+        )
+        # Same idle history, but its configured maximum makes it due
+        integrations[2].config = {"sync_max_interval": 300}
+        db.session.add(
+            SyncHistory(
+                project_integration_id=integrations[2].id,
+                status="success",
+                issues_updated=0,
+                created_at=ten_minutes_ago,
+            )
+        )
+        db.session.commit()
+        expected = {integrations[0].external_identifier, integrations[2].external_identifier}
+
+        schedule = {
+            entry["project_integration_id"]: entry
+            for entry in sync_scheduler.get_sync_schedule(app)
+        }
+        assert schedule[integrations[1].id]["interval_seconds"] == 1800
+        assert schedule[integrations[1].id]["due"] is False
+
+    fetched = []
+
+    def fake_fetch(integration, project_integration, since):
+        fetched.append(project_integration.external_identifier)
+        return []
+
+    monkeypatch.setitem(PROVIDER_REGISTRY, "gitlab", fake_fetch)
+
+    results = sync_scheduler._run_sync_all(app, only_due=True)
+
+    assert results == {"total": 2, "success": 2, "failed": 0, "skipped": 1}
+    assert set(fetched) == expected
+
+
+def test_leader_lock_is_exclusive_until_released(tmp_path):
+    path = tmp_path / "scheduler.lock"
+    leader = sync_scheduler._LeaderLock(path)
+    standby = sync_scheduler._LeaderLock(path)
+
+    assert leader.try_acquire() is True
+    assert standby.try_acquire() is False
+    assert standby.held_elsewhere() is True
+    assert standby.owner()["pid"] == os.getpid()
+
+    leader.release()
+    assert standby.held_elsewhere() is False
+    assert standby.try_acquire() is True
+    standby.release()
+
+
+def test_standby_worker_takes_over_when_leader_exits(tmp_path):
+    app = _init_app(
+        tmp_path,
+        ISSUE_SYNC_ENABLED=True,
+        ISSUE_SYNC_ON_STARTUP=False,
+        SCHEDULER_LOCK_FILE=str(tmp_path / "scheduler.lock"),
+        # The standby thread never wakes up during the test; retries are driven below
+        SCHEDULER_LEADER_RETRY_SECONDS=3600,
+    )
+    other_worker = sync_scheduler._LeaderLock(tmp_path / "scheduler.lock")
+    assert other_worker.try_acquire()
+    try:
+        assert sync_scheduler.init_scheduler(app) is None
+        status = sync_scheduler.get_scheduler_status()
+        assert status["leader"]["role"] == "standby"
+        assert status["running"] is True
+        assert sync_scheduler._try_take_over(app) is False
+
+        other_worker.release()
+        assert sync_scheduler._try_take_over(app) is True
+
+        assert sync_scheduler.get_scheduler() is not None
+        status = sync_scheduler.get_scheduler_status()
+        assert status["leader"]["role"] == "leader"
+        assert status["leader"]["leader"]["pid"] == os.getpid()
+        assert {job["id"] for job in status["jobs"]} == {
+            "issue_sync_all",
+            "issue_reconcile_all",
+            "job_queue_recovery",
+        }
+    finally:
+        sync_scheduler.shutdown_scheduler()
+        other_worker.release()
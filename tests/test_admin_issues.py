@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+from sqlalchemy import inspect
 
 from app import create_app, db
 from app.config import Config
@@ -303,6 +304,28 @@ def test_issue_comments_rendered(client, login_admin):
     assert "Please attach the latest slow query logs." in body
 
 
+def test_issue_list_renders_excerpts_until_an_issue_is_opened(client, login_admin, app):
+    with app.app_context():
+        issue = ExternalIssue.query.filter_by(external_id="ISSUE-001").one()
+        issue_id = issue.id
+        assert issue.description_excerpt == (
+            "Enable InnoDB page tracking for faster incremental backups. "
+            "- Set innodb_page_tracking=ON in my.cnf "
+            "- Schedule incremental xtrabackup run"
+        )
+        # Loading the issue left the JSON blobs in the database
+        assert "raw_payload" not in inspect(issue).dict
+        assert "comments" not in inspect(issue).dict
+
+    listing = client.get("/admin/issues").get_data(as_text=True)
+    assert "Show full description and comments" in listing
+    assert "1 comment" in listing
+    assert "Please attach the latest slow query logs." not in listing
+
+    detail = client.get(f"/admin/issues?issue_id={issue_id}").get_data(as_text=True)
+    assert "Please attach the latest slow query logs." in detail
+
+
 def test_project_filter_dropdown_present(client, login_admin):
     response = client.get("/admin/issues")
     assert response.status_code == 200